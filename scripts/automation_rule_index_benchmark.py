@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Benchmark automation rule evaluation throughput against rule count.
+
+Seeds a disposable hub with N enabled event rules (most keyed on an equality
+``repo_id`` filter, some with ``in`` filters that cannot be bucketed), then
+measures ``AutomationRuleEngine.enqueue_jobs_for_event`` events/second two
+ways: with the compiled rule index warm, and with the index cache cleared
+before every event, which reloads and recompiles every rule from SQLite like
+the engine did before the index existed. Events target repos no rule
+watches, so the numbers isolate matching cost from job inserts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_REPO_ROOT = _SCRIPT_DIR.parent
+sys.path.insert(0, str(_REPO_ROOT / "src"))
+
+from codex_autorunner.core.automation import (  # noqa: E402
+    AutomationEvent,
+    AutomationRule,
+    AutomationRuleEngine,
+    AutomationStore,
+)
+from codex_autorunner.core.automation.engine import (  # noqa: E402
+    clear_rule_index_cache,
+)
+from codex_autorunner.core.automation.models import (  # noqa: E402
+    EXECUTOR_AGENT_TASK_TURN,
+    TARGET_POLICY_HUB,
+    TRIGGER_KIND_EVENT,
+)
+
+DEFAULT_RULE_COUNTS = (10, 100, 500)
+DEFAULT_EVENTS = 300
+DEFAULT_MIN_SPEEDUP = 5.0
+_EVENT_TYPES = (
+    "scm.github.pull_request.opened",
+    "scm.github.pull_request_review.submitted",
+    "scm.github.check_run.completed",
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure automation rule evaluation events/second with and without "
+            "the compiled rule index."
+        )
+    )
+    parser.add_argument(
+        "--rules",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_RULE_COUNTS),
+        help="Rule counts to measure (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=DEFAULT_EVENTS,
+        help="Events evaluated per measurement (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--min-speedup",
+        type=float,
+        default=DEFAULT_MIN_SPEEDUP,
+        help="Fail when the indexed path is not this many times faster at the "
+        "largest rule count.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Optional path for the JSON report.",
+    )
+    return parser
+
+
+def _seed_rules(store: AutomationStore, rule_count: int) -> None:
+    for index in range(rule_count):
+        if index % 10 == 9:
+            filters: dict[str, Any] = {"author": {"in": [f"bot-{index}"]}}
+        else:
+            filters = {"repo_id": f"repo-{index}", "pr.number": {"eq": index}}
+        store.upsert_rule(
+            AutomationRule.create(
+                rule_id=f"rule-{index:05d}",
+                name=f"Rule {index}",
+                trigger_kind=TRIGGER_KIND_EVENT,
+                trigger={"event_types": [_EVENT_TYPES[index % len(_EVENT_TYPES)]]},
+                filters=filters,
+                target_policy=TARGET_POLICY_HUB,
+                target={"repo_id": "{{ event.repo_id }}"},
+                executor_kind=EXECUTOR_AGENT_TASK_TURN,
+                executor={"message": "Handle PR {{ pr.number }}"},
+                policy={"dedupe_key": "{{ event.event_id }}"},
+            )
+        )
+
+
+def _events(count: int) -> list[AutomationEvent]:
+    return [
+        AutomationEvent.create(
+            event_id=f"event-{index}",
+            event_type=_EVENT_TYPES[index % len(_EVENT_TYPES)],
+            observed_at="2026-01-01T00:00:00Z",
+            source="github",
+            repo_id=f"unwatched-{index}",
+            payload={"pr": {"number": index}, "author": "dev"},
+        )
+        for index in range(count)
+    ]
+
+
+def _events_per_second(
+    engine: AutomationRuleEngine, events: list[AutomationEvent], *, cold: bool
+) -> float:
+    started = time.perf_counter()
+    for event in events:
+        if cold:
+            clear_rule_index_cache()
+        result = engine.enqueue_jobs_for_event(event)
+        if result.matched_rules:
+            raise RuntimeError(f"benchmark event unexpectedly matched: {event}")
+    elapsed = time.perf_counter() - started
+    return round(len(events) / max(elapsed, 1e-9), 1)
+
+
+def _measure(hub_root: Path, *, rule_count: int, event_count: int) -> dict[str, Any]:
+    store = AutomationStore(hub_root, durable=False)
+    _seed_rules(store, rule_count)
+    engine = AutomationRuleEngine(store)
+    events = _events(event_count)
+    cold = _events_per_second(engine, events, cold=True)
+    clear_rule_index_cache()
+    engine.enqueue_jobs_for_event(events[0])
+    indexed = _events_per_second(engine, events, cold=False)
+    return {
+        "rules": rule_count,
+        "uncached_events_per_second": cold,
+        "indexed_events_per_second": indexed,
+        "speedup": round(indexed / max(cold, 1e-9), 2),
+    }
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    rule_counts = sorted({int(count) for count in args.rules})
+    if not rule_counts or rule_counts[0] < 1:
+        print("automation-rule-index-benchmark: --rules must be positive")
+        return 2
+    event_count = max(1, int(args.events))
+
+    results: list[dict[str, Any]] = []
+    for rule_count in rule_counts:
+        with tempfile.TemporaryDirectory(prefix="car-rule-index-bench-") as tmpdir:
+            results.append(
+                _measure(Path(tmpdir), rule_count=rule_count, event_count=event_count)
+            )
+        clear_rule_index_cache()
+    passed = results[-1]["speedup"] >= args.min_speedup
+    report = {
+        "events": event_count,
+        "min_speedup": args.min_speedup,
+        "results": results,
+        "passed": passed,
+    }
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+
+    print(f"events={event_count}  (events/second)")
+    print(f"{'rules':>7} {'uncached':>10} {'indexed':>10} {'speedup':>8}")
+    for result in results:
+        print(
+            f"{result['rules']:>7} {result['uncached_events_per_second']:>10.1f} "
+            f"{result['indexed_events_per_second']:>10.1f} {result['speedup']:>7.2f}x"
+        )
+    print(
+        "PASS"
+        if passed
+        else f"FAIL: indexed evaluation less than {args.min_speedup}x faster"
+    )
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Benchmark chat index projection latency as the managed-thread count grows.
+
+Seeds a deterministic large hub per chat count, then measures the full
+projection rebuild, steady-state ``chat_index_snapshot`` reads, and reads right
+after a single thread or journal change. With incremental projection the last
+two should stay roughly flat while the rebuild grows with the hub.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_REPO_ROOT = _SCRIPT_DIR.parent
+sys.path.insert(0, str(_REPO_ROOT))
+sys.path.insert(0, str(_REPO_ROOT / "src"))
+
+from tests.chat_surface_lab.web_responsiveness_budgets import (  # noqa: E402
+    seed_large_web_hub,
+)
+
+from codex_autorunner.core.orchestration import (  # noqa: E402
+    SQLiteChatSurfaceEventJournal,
+)
+from codex_autorunner.core.orchestration.chat_surface_read_model import (  # noqa: E402
+    ChatSurfaceReadService,
+)
+from codex_autorunner.core.orchestration.sqlite import (  # noqa: E402
+    open_orchestration_sqlite,
+)
+
+DEFAULT_CHAT_COUNTS = (250, 1000, 4000)
+DEFAULT_SAMPLES = 15
+DEFAULT_MAX_GROWTH = 3.0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Seed disposable hubs of increasing size and measure chat index "
+            "projection rebuild, steady-state, and single-change read latency."
+        )
+    )
+    parser.add_argument(
+        "--chat-counts",
+        default=",".join(str(count) for count in DEFAULT_CHAT_COUNTS),
+        help="Comma-separated managed-thread counts to seed (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=DEFAULT_SAMPLES,
+        help="Timed reads per measurement (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        default=DEFAULT_MAX_GROWTH,
+        help=(
+            "Fail when steady-state or single-change median latency at the "
+            "largest count exceeds this multiple of the smallest count."
+        ),
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Optional path for the JSON report.",
+    )
+    return parser
+
+
+def _timed_ms(fn: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000.0
+
+
+def _touch_thread(hub_root: Path, thread_id: str, sample: int) -> None:
+    with open_orchestration_sqlite(hub_root, durable=True, migrate=True) as conn:
+        with conn:
+            conn.execute(
+                """
+                UPDATE orch_thread_targets
+                   SET runtime_status = ?,
+                       updated_at = ?
+                 WHERE thread_target_id = ?
+                """,
+                (
+                    "running" if sample % 2 == 0 else "idle",
+                    f"2026-05-12T00:00:{sample % 60:02d}Z",
+                    thread_id,
+                ),
+            )
+
+
+def _measure_chat_count(
+    hub_root: Path, *, chat_count: int, samples: int
+) -> dict[str, Any]:
+    seed_large_web_hub(
+        hub_root,
+        chat_count=chat_count,
+        repo_count=max(1, chat_count // 10),
+        worktree_count=max(1, chat_count // 5),
+        ticket_run_group_count=max(1, chat_count // 12),
+        timeline_event_count=10,
+        journal_event_count=min(320, chat_count),
+    )
+    service = ChatSurfaceReadService(hub_root, durable=True)
+    journal = SQLiteChatSurfaceEventJournal(hub_root, durable=True)
+
+    def snapshot() -> None:
+        service.chat_index_snapshot(view="all", limit=50)
+
+    rebuild_ms = _timed_ms(service.rebuild_chat_index_projection)
+    snapshot()
+    steady = [_timed_ms(snapshot) for _ in range(samples)]
+
+    thread_change: list[float] = []
+    for sample in range(samples):
+        _touch_thread(hub_root, f"thread-{(sample * 7) % chat_count:05d}", sample)
+        thread_change.append(_timed_ms(snapshot))
+
+    event_change: list[float] = []
+    for sample in range(samples):
+        thread_id = f"thread-{(sample * 11) % chat_count:05d}"
+        journal.append_event(
+            idempotency_key=f"benchmark-event-{chat_count}-{sample}",
+            event_type="execution.progress",
+            surface_kind="pma",
+            surface_key=thread_id,
+            managed_thread_id=thread_id,
+            status="running",
+            source_kind="benchmark",
+        )
+        event_change.append(_timed_ms(snapshot))
+
+    status = service.chat_index_projection_status()
+    return {
+        "chat_count": chat_count,
+        "row_count": status["row_count"],
+        "rebuild_ms": round(rebuild_ms, 3),
+        "steady_snapshot_ms": round(statistics.median(steady), 3),
+        "thread_change_snapshot_ms": round(statistics.median(thread_change), 3),
+        "event_change_snapshot_ms": round(statistics.median(event_change), 3),
+        "needs_refresh_after_run": status["needs_refresh"],
+    }
+
+
+def _growth(results: list[dict[str, Any]], key: str) -> float:
+    smallest = float(results[0][key]) or 1e-9
+    return round(float(results[-1][key]) / smallest, 3)
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    chat_counts = sorted(
+        {int(raw) for raw in str(args.chat_counts).split(",") if raw.strip()}
+    )
+    if not chat_counts or chat_counts[0] < 1:
+        print("chat-index-projection-benchmark: --chat-counts must be positive")
+        return 2
+    samples = max(1, int(args.samples))
+
+    results: list[dict[str, Any]] = []
+    for chat_count in chat_counts:
+        with tempfile.TemporaryDirectory(prefix="car-chat-index-bench-") as tmpdir:
+            results.append(
+                _measure_chat_count(
+                    Path(tmpdir) / "hub", chat_count=chat_count, samples=samples
+                )
+            )
+
+    growth = {
+        key: _growth(results, key)
+        for key in (
+            "rebuild_ms",
+            "steady_snapshot_ms",
+            "thread_change_snapshot_ms",
+            "event_change_snapshot_ms",
+        )
+    }
+    passed = all(
+        growth[key] <= args.max_growth
+        for key in ("steady_snapshot_ms", "thread_change_snapshot_ms")
+    )
+    report = {
+        "samples": samples,
+        "max_growth": args.max_growth,
+        "results": results,
+        "growth": growth,
+        "passed": passed,
+    }
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+
+    print(
+        f"{'chats':>7} {'rows':>7} {'rebuild':>10} {'steady':>9} "
+        f"{'thread':>9} {'event':>9}  (ms, median of {samples})"
+    )
+    for result in results:
+        print(
+            f"{result['chat_count']:>7} {result['row_count']:>7} "
+            f"{result['rebuild_ms']:>10.1f} {result['steady_snapshot_ms']:>9.2f} "
+            f"{result['thread_change_snapshot_ms']:>9.2f} "
+            f"{result['event_change_snapshot_ms']:>9.2f}"
+        )
+    print(
+        "growth largest/smallest: "
+        + ", ".join(f"{key}={value}x" for key, value in growth.items())
+    )
+    print("PASS" if passed else f"FAIL: latency grew more than {args.max_growth}x")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
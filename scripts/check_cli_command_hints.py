@@ -132,8 +132,19 @@ _PROSE_TAIL = frozenset(
 
 
 def _command_children(command: Any) -> dict[str, click.Command]:
-    commands = getattr(command, "commands", None)
-    return commands if isinstance(commands, dict) else {}
+    list_commands = getattr(command, "list_commands", None)
+    if not callable(list_commands):
+        return {}
+    # Resolve through the group API so lazily registered commands are included.
+    # Typer may vendor its own click, so build the context from the group's module.
+    context_cls = getattr(sys.modules.get(type(command).__module__), "Context", None)
+    ctx = (context_cls or click.Context)(command)
+    children: dict[str, click.Command] = {}
+    for name in list_commands(ctx):
+        child = command.get_command(ctx, name)
+        if child is not None:
+            children[name] = child
+    return children
 
 
 def _load_cli() -> tuple[Any, frozenset[str]]:
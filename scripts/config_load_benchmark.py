@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Benchmark per-call ``load_hub_config`` / ``load_repo_config`` cost.
+
+Seeds a disposable hub with many manifest repos (each with a repo override),
+backdates every config source so the stat-keyed config cache trusts it, then
+measures median per-call latency three ways: cold (cache cleared before every
+call), warm (repeat calls against unchanged files), and after touching one
+repo override, which must only rebuild that repo's entry.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_REPO_ROOT = _SCRIPT_DIR.parent
+sys.path.insert(0, str(_REPO_ROOT / "src"))
+
+import yaml  # noqa: E402
+
+from codex_autorunner.bootstrap import seed_hub_files  # noqa: E402
+from codex_autorunner.core.config import (  # noqa: E402
+    REPO_OVERRIDE_FILENAME,
+    clear_config_cache,
+    config_cache_stats,
+    load_hub_config,
+    load_repo_config,
+)
+from codex_autorunner.manifest import load_manifest, save_manifest  # noqa: E402
+
+DEFAULT_REPO_COUNT = 200
+DEFAULT_SAMPLES = 200
+DEFAULT_MIN_SPEEDUP = 5.0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Seed a disposable hub with many repos and measure cold, warm, and "
+            "single-edit config load latency."
+        )
+    )
+    parser.add_argument(
+        "--repos",
+        type=int,
+        default=DEFAULT_REPO_COUNT,
+        help="Manifest repos to seed (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=DEFAULT_SAMPLES,
+        help="Timed loads per measurement (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--min-speedup",
+        type=float,
+        default=DEFAULT_MIN_SPEEDUP,
+        help="Fail when warm repo loads are not this many times faster than cold.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Optional path for the JSON report.",
+    )
+    return parser
+
+
+def _timed_ms(fn: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000.0
+
+
+def _backdate(path: Path) -> None:
+    past = time.time() - 60
+    os.utime(path, (past, past))
+
+
+def _seed_hub(hub_root: Path, repo_count: int) -> list[Path]:
+    seed_hub_files(hub_root)
+    hub = load_hub_config(hub_root)
+    manifest = load_manifest(hub.manifest_path, hub.root)
+    repo_roots: list[Path] = []
+    for index in range(repo_count):
+        repo_root = hub.repos_root / f"repo-{index:04d}"
+        (repo_root / ".git").mkdir(parents=True)
+        override = repo_root / REPO_OVERRIDE_FILENAME
+        override.parent.mkdir(parents=True)
+        override.write_text(
+            yaml.safe_dump({"runner": {"sleep_seconds": 5 + index % 7}}),
+            encoding="utf-8",
+        )
+        manifest.ensure_repo(hub.root, repo_root)
+        repo_roots.append(repo_root)
+    save_manifest(hub.manifest_path, manifest, hub.root)
+    for path in hub_root.rglob("*"):
+        if path.is_file():
+            _backdate(path)
+    return repo_roots
+
+
+def _median_ms(samples: list[float]) -> float:
+    return round(statistics.median(samples), 3)
+
+
+def _measure(hub_root: Path, *, repo_count: int, samples: int) -> dict[str, Any]:
+    repo_roots = _seed_hub(hub_root, repo_count)
+
+    def pick(sample: int) -> Path:
+        return repo_roots[(sample * 7) % len(repo_roots)]
+
+    cold_hub: list[float] = []
+    cold_repo: list[float] = []
+    for sample in range(samples):
+        clear_config_cache()
+        cold_hub.append(_timed_ms(lambda: load_hub_config(hub_root)))
+        clear_config_cache()
+        repo_root = pick(sample)
+        cold_repo.append(_timed_ms(partial(load_repo_config, repo_root)))
+
+    clear_config_cache()
+    for repo_root in repo_roots:
+        load_repo_config(repo_root)
+    warm_hub = [_timed_ms(lambda: load_hub_config(hub_root)) for _ in range(samples)]
+    warm_repo: list[float] = []
+    for sample in range(samples):
+        repo_root = pick(sample)
+        warm_repo.append(_timed_ms(partial(load_repo_config, repo_root)))
+
+    after_edit: list[float] = []
+    for sample in range(samples):
+        repo_root = pick(sample)
+        override = repo_root / REPO_OVERRIDE_FILENAME
+        override.write_text(
+            yaml.safe_dump({"runner": {"sleep_seconds": 100 + sample}}),
+            encoding="utf-8",
+        )
+        _backdate(override)
+        after_edit.append(_timed_ms(partial(load_repo_config, repo_root)))
+
+    return {
+        "repo_count": repo_count,
+        "cold_hub_ms": _median_ms(cold_hub),
+        "warm_hub_ms": _median_ms(warm_hub),
+        "cold_repo_ms": _median_ms(cold_repo),
+        "warm_repo_ms": _median_ms(warm_repo),
+        "repo_after_edit_ms": _median_ms(after_edit),
+        "cache": config_cache_stats().to_dict(),
+    }
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    repo_count = int(args.repos)
+    if repo_count < 1:
+        print("config-load-benchmark: --repos must be positive")
+        return 2
+    samples = max(1, int(args.samples))
+
+    with tempfile.TemporaryDirectory(prefix="car-config-bench-") as tmpdir:
+        result = _measure(Path(tmpdir) / "hub", repo_count=repo_count, samples=samples)
+    speedup = round(result["cold_repo_ms"] / max(result["warm_repo_ms"], 1e-9), 3)
+    passed = speedup >= args.min_speedup
+    report = {
+        "samples": samples,
+        "min_speedup": args.min_speedup,
+        "result": result,
+        "repo_speedup": speedup,
+        "passed": passed,
+    }
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+
+    print(f"repos={repo_count}  (ms, median of {samples})")
+    print(f"{'':18} {'cold':>9} {'warm':>9} {'edited':>9}")
+    print(
+        f"{'load_hub_config':18} {result['cold_hub_ms']:>9.2f} "
+        f"{result['warm_hub_ms']:>9.3f} {'-':>9}"
+    )
+    print(
+        f"{'load_repo_config':18} {result['cold_repo_ms']:>9.2f} "
+        f"{result['warm_repo_ms']:>9.3f} {result['repo_after_edit_ms']:>9.2f}"
+    )
+    print(f"repo speedup warm/cold: {speedup}x")
+    print(
+        "PASS" if passed else f"FAIL: warm loads less than {args.min_speedup}x faster"
+    )
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
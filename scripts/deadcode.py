@@ -84,6 +84,9 @@ def _python_name_token_counts(py_files: Sequence[Path]) -> Dict[str, int]:
 
 def _python_exported_names(tree: ast.Module) -> Set[str]:
     exported: Set[str] = set()
+    # Module-level tables such as ``__all__ = sorted(_LAZY_EXPORTS)`` export
+    # the keys of a dict literal assigned earlier in the module.
+    module_values: Dict[str, ast.AST] = {}
     for node in tree.body:
         value: Optional[ast.AST] = None
         if isinstance(node, ast.Assign):
@@ -92,27 +95,49 @@ def _python_exported_names(tree: ast.Module) -> Set[str]:
                 for target in node.targets
             ):
                 value = node.value
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    module_values[target.id] = node.value
         elif isinstance(node, ast.AnnAssign):
             if isinstance(node.target, ast.Name) and node.target.id == "__all__":
                 value = node.value
+            if isinstance(node.target, ast.Name) and node.value is not None:
+                module_values[node.target.id] = node.value
         elif isinstance(node, ast.AugAssign):
             if isinstance(node.target, ast.Name) and node.target.id == "__all__":
                 value = node.value
         if value is not None:
-            exported.update(_python_string_literals(value))
+            exported.update(_python_string_literals(value, module_values))
     return exported
 
 
-def _python_string_literals(node: ast.AST) -> Set[str]:
+def _python_string_literals(
+    node: ast.AST, module_values: Optional[Dict[str, ast.AST]] = None
+) -> Set[str]:
     values: Set[str] = set()
     if isinstance(node, ast.Constant) and isinstance(node.value, str):
         values.add(node.value)
     elif isinstance(node, (ast.List, ast.Tuple, ast.Set)):
         for element in node.elts:
-            values.update(_python_string_literals(element))
+            values.update(_python_string_literals(element, module_values))
+    elif isinstance(node, ast.Dict):
+        for key in node.keys:
+            if key is not None:
+                values.update(_python_string_literals(key, module_values))
     elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
-        values.update(_python_string_literals(node.left))
-        values.update(_python_string_literals(node.right))
+        values.update(_python_string_literals(node.left, module_values))
+        values.update(_python_string_literals(node.right, module_values))
+    elif isinstance(node, ast.Call) and len(node.args) == 1:
+        # ``sorted(...)``, ``list(...)`` and similar wrappers.
+        values.update(_python_string_literals(node.args[0], module_values))
+    elif isinstance(node, ast.Name) and module_values:
+        resolved = module_values.get(node.id)
+        if resolved is not None:
+            values.update(
+                _python_string_literals(
+                    resolved, {k: v for k, v in module_values.items() if k != node.id}
+                )
+            )
     return values
 
 
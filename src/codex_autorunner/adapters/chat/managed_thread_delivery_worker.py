@@ -4,10 +4,18 @@ This module provides the production loop that runs inside Discord and Telegram
 runtime lifecycles. On each tick the worker:
 
 1. Runs a recovery sweep to reclaim expired claims and abandon exhausted records.
-2. Claims the next due delivery record via the engine.
-3. Hands the claimed record to the surface adapter for transport.
+2. Claims a batch of due delivery records via the engine.
+3. Hands each claimed record to the surface adapter for transport.
 4. Records the adapter result back into the engine.
 
+Claimed records are delivered concurrently (up to ``max_concurrent_deliveries``)
+through one lane per conversation, so replies to the same surface stay in claim
+order. Engine calls run in a worker thread to keep SQLite off the event loop,
+and the loop wakes as soon as a new delivery intent commits instead of waiting
+for the next poll: in any process on the hub when the worker is given
+``hub_root`` (via the orchestration notification bus), otherwise in this
+process only.
+
 The worker never decides retry policy or terminal state — that belongs to the
 engine. The worker is purely an executor that bridges the engine and adapter.
 """
@@ -15,9 +23,14 @@ engine. The worker is purely an executor that bridges the engine and adapter.
 from __future__ import annotations
 
 import asyncio
+import collections
 import logging
+import math
+import time
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Optional
 
 from ...core.logging_utils import log_event
@@ -27,15 +40,25 @@ from ...core.orchestration.compatibility import (
 )
 from ...core.orchestration.managed_thread_delivery import (
     ManagedThreadDeliveryAttemptResult,
+    ManagedThreadDeliveryClaim,
     ManagedThreadDeliveryEngine,
     ManagedThreadDeliveryOutcome,
+    ManagedThreadDeliveryRecord,
     ManagedThreadDeliveryRecoverySweepResult,
 )
+from ...core.orchestration.managed_thread_delivery_ledger import (
+    add_delivery_intent_listener,
+    remove_delivery_intent_listener,
+)
+from ...core.orchestration.notification_bus import delivery_topic, subscribe
 from .managed_thread_delivery import ManagedThreadDeliveryAdapter
 
 _DEFAULT_POLL_INTERVAL_SECONDS = 5.0
 _DEFAULT_RECOVERY_INTERVAL_TICKS = 12
 _DEFAULT_ADAPTER_TIMEOUT_SECONDS = 120.0
+_DEFAULT_MAX_CONCURRENT_DELIVERIES = 4
+_DEFAULT_CLAIM_BATCH_SIZE = 4
+_LATENCY_SAMPLE_MAX = 512
 
 
 @dataclass
@@ -50,6 +73,22 @@ class ManagedThreadDeliveryWorkerStats:
     errors: int = 0
     incompatible_runtime_detected: bool = False
     last_compatibility: Optional[CompatibilityEvaluation] = None
+    # Claimed deliveries waiting in a conversation lane or in flight.
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+    wakeups: int = 0
+    claim_to_delivery_ms: collections.deque[float] = field(
+        default_factory=lambda: collections.deque(maxlen=_LATENCY_SAMPLE_MAX)
+    )
+
+    def claim_to_delivery_percentiles(self) -> dict[str, Optional[float]]:
+        """Return p50/p95/p99 claim-to-delivery latency over recent deliveries."""
+        samples = sorted(self.claim_to_delivery_ms)
+        return {
+            "p50": _percentile(samples, 50),
+            "p95": _percentile(samples, 95),
+            "p99": _percentile(samples, 99),
+        }
 
 
 @dataclass
@@ -57,6 +96,8 @@ class ManagedThreadDeliveryWorkerConfig:
     poll_interval_seconds: float = _DEFAULT_POLL_INTERVAL_SECONDS
     recovery_interval_ticks: int = _DEFAULT_RECOVERY_INTERVAL_TICKS
     adapter_timeout_seconds: float = _DEFAULT_ADAPTER_TIMEOUT_SECONDS
+    max_concurrent_deliveries: int = _DEFAULT_MAX_CONCURRENT_DELIVERIES
+    claim_batch_size: int = _DEFAULT_CLAIM_BATCH_SIZE
 
 
 class ManagedThreadDeliveryWorker:
@@ -70,8 +111,10 @@ class ManagedThreadDeliveryWorker:
         logger: logging.Logger,
         config: Optional[ManagedThreadDeliveryWorkerConfig] = None,
         engine_factory: Optional[Callable[[], ManagedThreadDeliveryEngine]] = None,
+        hub_root: Optional[Path] = None,
     ) -> None:
         self._engine = engine
+        self._hub_root = hub_root
         self._engine_factory = engine_factory
         self._adapter = adapter
         self._logger = logger
@@ -79,6 +122,11 @@ class ManagedThreadDeliveryWorker:
         self._stats = ManagedThreadDeliveryWorkerStats()
         self._tick_count: int = 0
         self._parked_for_incompatible_runtime = False
+        self._lanes: dict[
+            str, collections.deque[tuple[ManagedThreadDeliveryClaim, float]]
+        ] = {}
+        self._lane_tasks: dict[str, asyncio.Task[None]] = {}
+        self._wake_event: Optional[asyncio.Event] = None
 
     @property
     def stats(self) -> ManagedThreadDeliveryWorkerStats:
@@ -89,16 +137,12 @@ class ManagedThreadDeliveryWorker:
         return self._adapter.adapter_key
 
     async def run_once(self) -> None:
-        """Execute one claim-deliver-record cycle, plus recovery if due."""
-        if self._parked_for_incompatible_runtime:
-            return
-        self._tick_count += 1
-        try:
-            if self._tick_count % self._config.recovery_interval_ticks == 0:
-                await self._run_recovery_sweep()
-            await self._claim_and_deliver_one()
-        except SchemaCompatibilityError as exc:
-            self._park_incompatible_runtime(exc.evaluation)
+        """Execute one claim-deliver-record cycle, plus recovery if due.
+
+        Waits until every claimed delivery has been recorded.
+        """
+        await self._run_tick()
+        await self._drain_lanes()
 
     async def run_loop(self) -> None:
         """Run the worker loop until cancelled."""
@@ -109,11 +153,40 @@ class ManagedThreadDeliveryWorker:
             adapter_key=self._adapter.adapter_key,
             poll_interval_seconds=self._config.poll_interval_seconds,
             recovery_interval_ticks=self._config.recovery_interval_ticks,
+            max_concurrent_deliveries=self._config.max_concurrent_deliveries,
+            claim_batch_size=self._config.claim_batch_size,
         )
+        loop = asyncio.get_running_loop()
+        self._wake_event = asyncio.Event()
+
+        def _on_intent(record: ManagedThreadDeliveryRecord) -> None:
+            if record.target.adapter_key != self._adapter.adapter_key:
+                return
+            try:
+                loop.call_soon_threadsafe(self.wake)
+            except RuntimeError:
+                pass
+
+        def _on_ring(_topic: str) -> None:
+            try:
+                loop.call_soon_threadsafe(self.wake)
+            except RuntimeError:
+                pass
+
+        unsubscribe: Optional[Callable[[], None]] = None
+        if self._hub_root is not None:
+            # The bus also dispatches rings from this process, so it replaces
+            # the in-process intent listener rather than adding to it.
+            unsubscribe = subscribe(
+                self._hub_root, delivery_topic(self._adapter.adapter_key), _on_ring
+            )
+        else:
+            add_delivery_intent_listener(_on_intent)
         try:
             while not self._parked_for_incompatible_runtime:
+                claimed = 0
                 try:
-                    await self.run_once()
+                    claimed = await self._run_tick()
                     if self._parked_for_incompatible_runtime:
                         break
                 except asyncio.CancelledError:
@@ -127,8 +200,17 @@ class ManagedThreadDeliveryWorker:
                         adapter_key=self._adapter.adapter_key,
                         exc=exc,
                     )
-                await asyncio.sleep(self._config.poll_interval_seconds)
+                if claimed and self._free_slots() > 0:
+                    # Keep claiming while work turns up and slots remain.
+                    continue
+                await self._wait_for_wake(self._config.poll_interval_seconds)
         finally:
+            if unsubscribe is not None:
+                unsubscribe()
+            else:
+                remove_delivery_intent_listener(_on_intent)
+            await self._cancel_lanes()
+            self._wake_event = None
             log_event(
                 self._logger,
                 logging.INFO,
@@ -140,14 +222,63 @@ class ManagedThreadDeliveryWorker:
                 deliveries_retried=self._stats.deliveries_retried,
                 deliveries_abandoned=self._stats.deliveries_abandoned,
                 errors=self._stats.errors,
+                peak_queue_depth=self._stats.peak_queue_depth,
+                claim_to_delivery_ms=self._stats.claim_to_delivery_percentiles(),
                 incompatible_runtime_detected=self._stats.incompatible_runtime_detected,
             )
 
-    async def _claim_and_deliver_one(self) -> None:
-        engine = self._current_engine()
-        claim = engine.claim_next_delivery(adapter_key=self._adapter.adapter_key)
-        if claim is None:
+    def wake(self) -> None:
+        """Skip the rest of the current poll interval and claim now."""
+        if self._wake_event is not None:
+            self._stats.wakeups += 1
+            self._wake_event.set()
+
+    async def _wait_for_wake(self, timeout: float) -> None:
+        event = self._wake_event
+        if event is None:
+            await asyncio.sleep(timeout)
             return
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        event.clear()
+
+    async def _run_tick(self) -> int:
+        """Run recovery if due, then claim and dispatch up to one batch."""
+        if self._parked_for_incompatible_runtime:
+            return 0
+        self._tick_count += 1
+        try:
+            if self._tick_count % self._config.recovery_interval_ticks == 0:
+                await self._run_recovery_sweep()
+            limit = min(max(1, self._config.claim_batch_size), self._free_slots())
+            if limit <= 0:
+                return 0
+            claims = await asyncio.to_thread(self._claim_batch, limit)
+        except SchemaCompatibilityError as exc:
+            self._park_incompatible_runtime(exc.evaluation)
+            return 0
+        for claim, claimed_at in claims:
+            self._dispatch(claim, claimed_at)
+        return len(claims)
+
+    def _free_slots(self) -> int:
+        return max(1, self._config.max_concurrent_deliveries) - self._stats.queue_depth
+
+    def _claim_batch(
+        self, limit: int
+    ) -> list[tuple[ManagedThreadDeliveryClaim, float]]:
+        engine = self._current_engine()
+        claims: list[tuple[ManagedThreadDeliveryClaim, float]] = []
+        for _ in range(limit):
+            claim = engine.claim_next_delivery(adapter_key=self._adapter.adapter_key)
+            if claim is None:
+                break
+            claims.append((claim, time.monotonic()))
+        return claims
+
+    def _dispatch(self, claim: ManagedThreadDeliveryClaim, claimed_at: float) -> None:
         self._stats.claims_processed += 1
         record = claim.record
         log_event(
@@ -160,6 +291,94 @@ class ManagedThreadDeliveryWorker:
             adapter_key=self._adapter.adapter_key,
             attempt_count=record.attempt_count,
         )
+        key = _conversation_key(record)
+        self._lanes.setdefault(key, collections.deque()).append((claim, claimed_at))
+        self._stats.queue_depth += 1
+        self._stats.peak_queue_depth = max(
+            self._stats.peak_queue_depth, self._stats.queue_depth
+        )
+        if key not in self._lane_tasks:
+            self._lane_tasks[key] = asyncio.create_task(self._run_lane(key))
+
+    async def _run_lane(self, key: str) -> None:
+        lane = self._lanes[key]
+        try:
+            while lane and not self._parked_for_incompatible_runtime:
+                claim, claimed_at = lane.popleft()
+                try:
+                    await self._deliver_claim(claim, claimed_at)
+                except SchemaCompatibilityError as exc:
+                    self._park_incompatible_runtime(exc.evaluation)
+                except Exception as exc:
+                    self._stats.errors += 1
+                    log_event(
+                        self._logger,
+                        logging.WARNING,
+                        "chat.managed_thread.delivery_worker.tick_failed",
+                        adapter_key=self._adapter.adapter_key,
+                        delivery_id=claim.record.delivery_id,
+                        exc=exc,
+                    )
+                finally:
+                    self._stats.queue_depth -= 1
+        except asyncio.CancelledError:
+            self._release_claims(lane)
+            raise
+        finally:
+            self._stats.queue_depth -= len(lane)
+            lane.clear()
+            self._lanes.pop(key, None)
+            self._lane_tasks.pop(key, None)
+            if self._wake_event is not None:
+                # A freed slot may let the loop claim more work.
+                self._wake_event.set()
+
+    def _release_claims(
+        self, lane: collections.deque[tuple[ManagedThreadDeliveryClaim, float]]
+    ) -> None:
+        engine = self._current_engine()
+        for claim, _claimed_at in lane:
+            _record_attempt_safely(
+                engine,
+                claim.record.delivery_id,
+                claim.claim_token,
+                ManagedThreadDeliveryAttemptResult(
+                    outcome=ManagedThreadDeliveryOutcome.RETRY,
+                    error="delivery_worker_cancelled",
+                ),
+                self._logger,
+                adapter_key=self._adapter.adapter_key,
+            )
+
+    async def _drain_lanes(self) -> None:
+        while self._lane_tasks:
+            await asyncio.gather(
+                *list(self._lane_tasks.values()), return_exceptions=True
+            )
+
+    async def _cancel_lanes(self) -> None:
+        tasks = list(self._lane_tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _deliver_claim(
+        self, claim: ManagedThreadDeliveryClaim, claimed_at: float
+    ) -> None:
+        record = claim.record
+        if _claim_expired(claim):
+            # The recovery sweep re-queues expired claims; delivering under a
+            # stale lease could race another worker that reclaimed it.
+            log_event(
+                self._logger,
+                logging.WARNING,
+                "chat.managed_thread.delivery_worker.claim_expired",
+                delivery_id=record.delivery_id,
+                adapter_key=self._adapter.adapter_key,
+            )
+            return
+        engine = self._current_engine()
         try:
             try:
                 result = await asyncio.wait_for(
@@ -192,7 +411,8 @@ class ManagedThreadDeliveryWorker:
                 error=str(exc) or exc.__class__.__name__,
             )
 
-        _record_attempt_safely(
+        await asyncio.to_thread(
+            _record_attempt_safely,
             self._current_engine(),
             record.delivery_id,
             claim.claim_token,
@@ -200,12 +420,20 @@ class ManagedThreadDeliveryWorker:
             self._logger,
             adapter_key=self._adapter.adapter_key,
         )
+        if result.outcome in (
+            ManagedThreadDeliveryOutcome.DELIVERED,
+            ManagedThreadDeliveryOutcome.DUPLICATE,
+        ):
+            self._stats.claim_to_delivery_ms.append(
+                (time.monotonic() - claimed_at) * 1000.0
+            )
         self._update_stats_for_outcome(result)
 
     async def _run_recovery_sweep(self) -> None:
         try:
-            sweep_result = self._current_engine().recovery_sweep(
-                adapter_key=self._adapter.adapter_key
+            sweep_result = await asyncio.to_thread(
+                self._current_engine().recovery_sweep,
+                adapter_key=self._adapter.adapter_key,
             )
         except SchemaCompatibilityError:
             raise
@@ -277,6 +505,34 @@ class ManagedThreadDeliveryWorker:
         )
 
 
+def _conversation_key(record: ManagedThreadDeliveryRecord) -> str:
+    return record.target.surface_key or record.managed_thread_id
+
+
+def _claim_expired(claim: ManagedThreadDeliveryClaim) -> bool:
+    try:
+        expires_at = datetime.fromisoformat(claim.claim_expires_at)
+    except (TypeError, ValueError):
+        return False
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at <= datetime.now(timezone.utc)
+
+
+def _percentile(sorted_values: list[float], p: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    idx = p / 100.0 * (len(sorted_values) - 1)
+    lower = int(math.floor(idx))
+    upper = int(math.ceil(idx))
+    if lower == upper:
+        return round(sorted_values[lower], 1)
+    frac = idx - lower
+    return round(
+        sorted_values[lower] + frac * (sorted_values[upper] - sorted_values[lower]), 1
+    )
+
+
 def _record_attempt_safely(
     engine: ManagedThreadDeliveryEngine,
     delivery_id: str,
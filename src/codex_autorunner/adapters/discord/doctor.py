@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import time
 from pathlib import Path
 from typing import Any, Optional
 
@@ -29,6 +30,7 @@ from .constants import (
     DISCORD_INTENT_GUILDS,
     DISCORD_INTENT_MESSAGE_CONTENT,
 )
+from .rate_limits import RATE_LIMIT_SNAPSHOT_FILENAME, read_rate_limit_snapshot
 
 RECOMMENDED_BOT_PERMISSIONS_INTEGER = "2322563695115328"
 
@@ -442,9 +444,66 @@ def discord_doctor_checks(config: HubConfig) -> list[DoctorCheck]:
         )
     )
 
+    rate_limit_check = _rate_limit_snapshot_check(
+        state_file.with_name(RATE_LIMIT_SNAPSHOT_FILENAME)
+    )
+    if rate_limit_check is not None:
+        checks.append(rate_limit_check)
+
     return checks
 
 
+def _rate_limit_snapshot_check(snapshot_path: Path) -> Optional[DoctorCheck]:
+    snapshot = read_rate_limit_snapshot(snapshot_path)
+    if snapshot is None:
+        return None
+    stats = snapshot.get("stats")
+    stats = stats if isinstance(stats, dict) else {}
+    buckets = snapshot.get("buckets")
+    buckets = buckets if isinstance(buckets, list) else []
+    written_at = snapshot.get("written_at")
+    age = (
+        f"{max(0, int(time.time() - written_at))}s ago"
+        if isinstance(written_at, (int, float))
+        else "at an unknown time"
+    )
+    exhausted = [
+        bucket
+        for bucket in buckets
+        if isinstance(bucket, dict)
+        and bucket.get("remaining") == 0
+        and (bucket.get("reset_after_seconds") or 0) > 0
+    ]
+    lines = [
+        f"Discord REST rate limits (snapshot written {age}): "
+        f"{stats.get('buckets_tracked', 0)} buckets tracked, "
+        f"{stats.get('exhausted_buckets', 0)} exhausted, "
+        f"{stats.get('preemptive_waits_total', 0)} pre-emptive waits, "
+        f"{stats.get('rate_limited_total', 0)} 429s "
+        f"({stats.get('global_rate_limited_total', 0)} global)."
+    ]
+    for bucket in exhausted[:5]:
+        routes = ", ".join(bucket.get("routes") or []) or bucket.get("bucket")
+        lines.append(
+            f"- {bucket.get('major') or 'unscoped'}: {routes} "
+            f"resets in {bucket.get('reset_after_seconds')}s"
+        )
+    global_hits = stats.get("global_rate_limited_total") or 0
+    return DoctorCheck(
+        name="Discord REST rate limits",
+        passed=True,
+        message="\n".join(lines),
+        check_id="discord.rate_limits",
+        severity="warning" if global_hits else "info",
+        fix=(
+            "Reduce bot-wide REST traffic (progress edits, typing indicators) or "
+            "spread bound channels across fewer concurrent turns."
+            if global_hits
+            else None
+        ),
+    )
+
+
 def _resolve_state_file(root: Path, raw_state_file: object) -> Path:
     if isinstance(raw_state_file, str) and raw_state_file.strip():
         return (root / raw_state_file).resolve()
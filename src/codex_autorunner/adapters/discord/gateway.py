@@ -29,6 +29,10 @@ else:
 
 
 FATAL_GATEWAY_CLOSE_CODES = {4004, 4010, 4011, 4012, 4013, 4014}
+# Close codes after which the session cannot be resumed and must re-IDENTIFY.
+NON_RESUMABLE_GATEWAY_CLOSE_CODES = {4007, 4009} | FATAL_GATEWAY_CLOSE_CODES
+INVALID_SESSION_MIN_DELAY_SECONDS = 1.0
+INVALID_SESSION_JITTER_SECONDS = 4.0
 DISCORD_DISPATCH_QUEUE_MAXSIZE = 1
 DISCORD_DISPATCH_CALLBACK_MAX_IN_FLIGHT = 8
 
@@ -57,6 +61,15 @@ def build_identify_payload(*, bot_token: str, intents: int) -> dict[str, Any]:
     }
 
 
+def build_resume_payload(
+    *, bot_token: str, session_id: str, sequence: int
+) -> dict[str, Any]:
+    return {
+        "op": 6,
+        "d": {"token": bot_token, "session_id": session_id, "seq": sequence},
+    }
+
+
 def parse_gateway_frame(frame: str | bytes | dict[str, Any]) -> GatewayFrame:
     if isinstance(frame, bytes):
         frame = frame.decode("utf-8")
@@ -117,6 +130,49 @@ class GatewayReconnectDecision:
     fatal_reason: Optional[str] = None
     cause: str = "unknown"
     close_code: Optional[int] = None
+    resumable: bool = True
+
+
+@dataclass
+class GatewaySessionState:
+    """Gateway session kept across reconnects so the client can RESUME."""
+
+    session_id: Optional[str] = None
+    resume_gateway_url: Optional[str] = None
+    sequence: Optional[int] = None
+
+    @property
+    def resumable(self) -> bool:
+        return bool(self.session_id) and self.sequence is not None
+
+    def invalidate(self) -> None:
+        self.session_id = None
+        self.resume_gateway_url = None
+        self.sequence = None
+
+
+@dataclass(frozen=True)
+class GatewaySessionStats:
+    identifies_total: int
+    resumes_total: int
+    resumes_succeeded_total: int
+    invalid_sessions_total: int
+    replayed_dispatches_total: int
+    last_reconnect_latency_ms: Optional[float]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "identifies_total": self.identifies_total,
+            "resumes_total": self.resumes_total,
+            "resumes_succeeded_total": self.resumes_succeeded_total,
+            "invalid_sessions_total": self.invalid_sessions_total,
+            "replayed_dispatches_total": self.replayed_dispatches_total,
+            "last_reconnect_latency_ms": (
+                round(self.last_reconnect_latency_ms, 3)
+                if self.last_reconnect_latency_ms is not None
+                else None
+            ),
+        }
 
 
 class GatewayReconnectPolicy:
@@ -149,6 +205,7 @@ class GatewayReconnectPolicy:
             fatal_reason=f"gateway_close_code={close_code}" if is_fatal else None,
             cause="connection_closed",
             close_code=close_code,
+            resumable=close_code not in NON_RESUMABLE_GATEWAY_CLOSE_CODES,
         )
 
     def classify_permanent_error(
@@ -531,14 +588,35 @@ class DiscordGatewayClient:
         self._intents = intents
         self._logger = logger
         self._gateway_url = gateway_url
-        self._sequence: Optional[int] = None
+        self._session = GatewaySessionState()
         self._last_heartbeat_ack: Optional[float] = None
         self._ready_in_connection = False
+        self._disconnected_at: Optional[float] = None
+        self._identifies_total = 0
+        self._resumes_total = 0
+        self._resumes_succeeded_total = 0
+        self._invalid_sessions_total = 0
+        self._replayed_dispatches_total = 0
+        self._last_reconnect_latency_ms: Optional[float] = None
         self._stop_event = asyncio.Event()
         self._heartbeat_task: Optional[asyncio.Task[None]] = None
         self._active_dispatch_worker: Optional[GatewayDispatchWorker] = None
         self._websocket: Any = None
 
+    @property
+    def _sequence(self) -> Optional[int]:
+        return self._session.sequence
+
+    def session_stats(self) -> GatewaySessionStats:
+        return GatewaySessionStats(
+            identifies_total=self._identifies_total,
+            resumes_total=self._resumes_total,
+            resumes_succeeded_total=self._resumes_succeeded_total,
+            invalid_sessions_total=self._invalid_sessions_total,
+            replayed_dispatches_total=self._replayed_dispatches_total,
+            last_reconnect_latency_ms=self._last_reconnect_latency_ms,
+        )
+
     async def stop(self) -> None:
         self._stop_event.set()
         await self._cancel_heartbeat()
@@ -608,6 +686,8 @@ class DiscordGatewayClient:
                 decision = reconnect_policy.classify_connection_closed(exc)
                 fatal_failure = decision.is_fatal
                 fatal_reason = decision.fatal_reason
+                if not decision.resumable:
+                    self._session.invalidate()
                 logging_utils.log_event(
                     self._logger,
                     logging.WARNING,
@@ -616,6 +696,7 @@ class DiscordGatewayClient:
                     fatal=decision.is_fatal,
                     cause=decision.cause,
                     close_code=decision.close_code,
+                    resumable=decision.resumable,
                 )
                 if decision.should_halt:
                     self._logger.error(
@@ -640,6 +721,7 @@ class DiscordGatewayClient:
                 self._logger.warning("Discord gateway error; reconnecting: %s", exc)
             finally:
                 self._websocket = None
+                self._disconnected_at = asyncio.get_running_loop().time()
                 await self._cancel_heartbeat()
                 if self._active_dispatch_worker is not None:
                     worker = self._active_dispatch_worker
@@ -653,6 +735,7 @@ class DiscordGatewayClient:
                     established_session=established_session,
                     ready_seen=self._ready_in_connection,
                     fatal_failure=fatal_failure,
+                    resumable=self._session.resumable,
                 )
 
             if self._stop_event.is_set():
@@ -674,6 +757,11 @@ class DiscordGatewayClient:
             await asyncio.sleep(backoff)
 
     async def _resolve_gateway_url(self) -> str:
+        resume_url = self._session.resume_gateway_url
+        if self._session.resumable and resume_url:
+            if "?" in resume_url:
+                return resume_url
+            return f"{resume_url.rstrip('/')}/?v=10&encoding=json"
         if self._gateway_url:
             return self._gateway_url
         async with DiscordRestClient(bot_token=self._bot_token) as rest:
@@ -704,11 +792,30 @@ class DiscordGatewayClient:
         self._heartbeat_task = asyncio.create_task(
             self._heartbeat_loop(websocket, float(heartbeat_ms) / 1000.0)
         )
-        await websocket.send(
-            json.dumps(
-                build_identify_payload(bot_token=self._bot_token, intents=self._intents)
+        session = self._session
+        resuming = session.resumable
+        if resuming:
+            assert session.session_id is not None and session.sequence is not None
+            self._resumes_total += 1
+            await websocket.send(
+                json.dumps(
+                    build_resume_payload(
+                        bot_token=self._bot_token,
+                        session_id=session.session_id,
+                        sequence=session.sequence,
+                    )
+                )
             )
-        )
+        else:
+            self._identifies_total += 1
+            await websocket.send(
+                json.dumps(
+                    build_identify_payload(
+                        bot_token=self._bot_token, intents=self._intents
+                    )
+                )
+            )
+        replayed_dispatches = 0
         established_session = False
         dispatch_worker = GatewayDispatchWorker(logger=self._logger)
         dispatch_worker.start(on_dispatch, self._stop_event)
@@ -722,12 +829,24 @@ class DiscordGatewayClient:
                     break
                 frame = parse_gateway_frame(raw_message)
                 if frame.s is not None:
-                    self._sequence = frame.s
+                    session.sequence = frame.s
 
                 if frame.op == 0:
                     if frame.t == "READY":
                         established_session = True
                         self._ready_in_connection = True
+                        self._remember_ready_session(frame.d)
+                        self._record_session_established("identified", 0)
+                    elif frame.t == "RESUMED":
+                        established_session = True
+                        self._ready_in_connection = True
+                        self._resumes_succeeded_total += 1
+                        self._record_session_established("resumed", replayed_dispatches)
+                        resuming = False
+                    elif resuming and frame.t:
+                        # Events Discord replays between RESUME and RESUMED.
+                        replayed_dispatches += 1
+                        self._replayed_dispatches_total += 1
                     if frame.t and isinstance(frame.d, dict):
                         enqueued = await dispatch_worker.enqueue(frame.t, frame.d)
                         if not enqueued:
@@ -735,7 +854,7 @@ class DiscordGatewayClient:
                     continue
                 if frame.op == 1:
                     await websocket.send(
-                        json.dumps({"op": 1, "d": self._sequence})
+                        json.dumps({"op": 1, "d": session.sequence})
                     )  # heartbeat request
                     continue
                 if frame.op == 11:
@@ -745,7 +864,22 @@ class DiscordGatewayClient:
                     self._logger.info("Discord gateway requested reconnect")
                     return established_session
                 if frame.op == 9:
-                    self._logger.warning("Discord gateway reported invalid session")
+                    self._invalid_sessions_total += 1
+                    can_resume = frame.d is True
+                    if not can_resume:
+                        session.invalidate()
+                    self._logger.warning(
+                        "Discord gateway reported invalid session (resumable=%s)",
+                        can_resume,
+                    )
+                    if not can_resume:
+                        # Discord asks clients to wait 1-5s before re-identifying.
+                        with contextlib.suppress(asyncio.TimeoutError):
+                            await asyncio.wait_for(
+                                self._stop_event.wait(),
+                                timeout=INVALID_SESSION_MIN_DELAY_SECONDS
+                                + random.random() * INVALID_SESSION_JITTER_SECONDS,
+                            )
                     return established_session
 
             return established_session
@@ -756,11 +890,40 @@ class DiscordGatewayClient:
                 self._active_dispatch_worker = None
                 await dispatch_worker.cancel()
 
+    def _remember_ready_session(self, payload: Any) -> None:
+        data = payload if isinstance(payload, dict) else {}
+        session_id = data.get("session_id")
+        resume_url = data.get("resume_gateway_url")
+        self._session.session_id = session_id if isinstance(session_id, str) else None
+        self._session.resume_gateway_url = (
+            resume_url if isinstance(resume_url, str) and resume_url else None
+        )
+
+    def _record_session_established(self, mode: str, replayed_dispatches: int) -> None:
+        latency_ms: Optional[float] = None
+        if self._disconnected_at is not None:
+            latency_ms = (
+                asyncio.get_running_loop().time() - self._disconnected_at
+            ) * 1000.0
+            self._last_reconnect_latency_ms = latency_ms
+            self._disconnected_at = None
+        logging_utils.log_event(
+            self._logger,
+            logging.INFO,
+            f"discord.gateway.session.{mode}",
+            reconnect_latency_ms=(
+                round(latency_ms, 3) if latency_ms is not None else None
+            ),
+            replayed_dispatches=replayed_dispatches,
+            resumes_total=self._resumes_total,
+            identifies_total=self._identifies_total,
+        )
+
     async def _heartbeat_loop(self, websocket: Any, interval_seconds: float) -> None:
         try:
             while not self._stop_event.is_set():
                 await asyncio.sleep(interval_seconds)
-                await websocket.send(json.dumps({"op": 1, "d": self._sequence}))
+                await websocket.send(json.dumps({"op": 1, "d": self._session.sequence}))
         except asyncio.CancelledError:
             raise
 
@@ -0,0 +1,334 @@
+"""Discord REST rate-limit bucket tracking.
+
+Discord assigns every route a rate-limit bucket and reports it on each
+response through ``X-RateLimit-Bucket``, ``X-RateLimit-Remaining`` and
+``X-RateLimit-Reset-After``. Buckets are scoped by the route's major
+parameter (channel, guild, or webhook), so two bound channels never share a
+budget even though they hit the same route template.
+
+:class:`DiscordRateLimiter` learns route-to-bucket mappings from those
+headers, reserves a slot before each request, and waits up front when the
+bucket is already exhausted instead of spending a request on a 429. A
+global 429 pauses every request until it expires; bucket-scoped 429s only
+pause their own bucket, so independent channels keep flowing in parallel.
+
+When given a snapshot path the limiter periodically writes its bucket state
+as JSON so ``car doctor`` can report it from outside the bot process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from ...core.utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_SNAPSHOT_FILENAME = "discord_rate_limits.json"
+_SNAPSHOT_INTERVAL_SECONDS = 5.0
+_SNAPSHOT_MAX_BUCKETS = 20
+_MAX_TRACKED_BUCKETS = 2048
+_MAJOR_PARAMETER_ROOTS = frozenset({"channels", "guilds", "webhooks", "interactions"})
+_ID_SEGMENT_RE = re.compile(r"^\d{5,}$")
+
+
+def discord_route(method: str, path: str) -> tuple[str, str]:
+    """Return ``(route, major)`` for a REST request path.
+
+    ``route`` is the method plus the path template with ids replaced, and
+    ``major`` is the major parameter that scopes the route's bucket.
+    """
+    segments = [segment for segment in path.split("?", 1)[0].split("/") if segment]
+    template: list[str] = []
+    major = ""
+    index = 0
+    while index < len(segments):
+        segment = segments[index]
+        template.append(segment)
+        if (
+            not major
+            and segment in _MAJOR_PARAMETER_ROOTS
+            and index + 1 < len(segments)
+        ):
+            major = f"{segment}/{segments[index + 1]}"
+            template.append(f"{{{segment}}}")
+            index += 2
+            if segment in {"webhooks", "interactions"} and index < len(segments):
+                # Webhook and interaction tokens belong to the major parameter.
+                major = f"{major}/{segments[index]}"
+                template.append("{token}")
+                index += 1
+            continue
+        if template and len(template) > 1 and _ID_SEGMENT_RE.match(segment):
+            template[-1] = "{id}"
+        index += 1
+    return f"{method.upper()} /{'/'.join(template)}", major
+
+
+@dataclass
+class _BucketState:
+    bucket: str
+    major: str
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: float = 0.0
+
+    def available(self, now: float) -> bool:
+        if self.remaining is None or self.remaining > 0:
+            return True
+        if self.reset_at <= now:
+            self.remaining = self.limit
+            return True
+        return False
+
+    def reserve(self) -> None:
+        if self.remaining is not None and self.remaining > 0:
+            self.remaining -= 1
+
+
+@dataclass(frozen=True)
+class DiscordRateLimitStats:
+    buckets_tracked: int
+    routes_mapped: int
+    exhausted_buckets: int
+    preemptive_waits_total: int
+    preemptive_wait_ms_total: float
+    rate_limited_total: int
+    global_rate_limited_total: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "buckets_tracked": self.buckets_tracked,
+            "routes_mapped": self.routes_mapped,
+            "exhausted_buckets": self.exhausted_buckets,
+            "preemptive_waits_total": self.preemptive_waits_total,
+            "preemptive_wait_ms_total": round(self.preemptive_wait_ms_total, 3),
+            "rate_limited_total": self.rate_limited_total,
+            "global_rate_limited_total": self.global_rate_limited_total,
+        }
+
+
+class DiscordRateLimiter:
+    def __init__(self, *, snapshot_path: Optional[Path] = None) -> None:
+        self._snapshot_path = snapshot_path
+        self._route_buckets: dict[str, str] = {}
+        self._buckets: dict[tuple[str, str], _BucketState] = {}
+        self._global_until = 0.0
+        self._preemptive_waits_total = 0
+        self._preemptive_wait_seconds_total = 0.0
+        self._rate_limited_total = 0
+        self._global_rate_limited_total = 0
+        self._snapshot_written_at = 0.0
+        self._snapshot_dirty = False
+
+    async def acquire(self, method: str, path: str) -> None:
+        """Wait until the request's bucket and the global limit allow a send."""
+        route, major = discord_route(method, path)
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            delay = self._global_until - now
+            state = self._buckets.get(self._bucket_key(route, major))
+            if delay <= 0:
+                if state is None or state.available(now):
+                    if state is not None:
+                        state.reserve()
+                    break
+                delay = state.reset_at - now
+            if not waited:
+                self._preemptive_waits_total += 1
+            logger.debug(
+                "Discord rate-limit bucket exhausted for %s (%s); waiting %.2fs",
+                route,
+                major or "-",
+                delay,
+            )
+            await asyncio.sleep(delay)
+            waited += delay
+        if waited:
+            self._preemptive_wait_seconds_total += waited
+
+    def observe(self, method: str, path: str, response: httpx.Response) -> None:
+        """Learn bucket state from a response's rate-limit headers."""
+        route, major = discord_route(method, path)
+        headers = response.headers
+        now = time.monotonic()
+        bucket = headers.get("X-RateLimit-Bucket")
+        if bucket:
+            previous = self._route_buckets.get(route)
+            self._route_buckets[route] = bucket
+            if previous is None:
+                self._buckets.pop((f"route:{route}", major), None)
+        key = self._bucket_key(route, major)
+        state = self._buckets.get(key)
+        limit = _int_header(headers.get("X-RateLimit-Limit"))
+        remaining = _int_header(headers.get("X-RateLimit-Remaining"))
+        reset_after = _float_header(headers.get("X-RateLimit-Reset-After"))
+        if state is None and (remaining is not None or response.status_code == 429):
+            if len(self._buckets) >= _MAX_TRACKED_BUCKETS:
+                self._prune(now)
+            state = _BucketState(bucket=key[0], major=major)
+            self._buckets[key] = state
+        if state is not None:
+            if limit is not None:
+                state.limit = limit
+            if remaining is not None:
+                state.remaining = remaining
+            if reset_after is not None:
+                state.reset_at = now + reset_after
+            self._snapshot_dirty = True
+
+        if response.status_code == 429:
+            self._observe_rate_limited(response, state, now)
+        self._maybe_write_snapshot()
+
+    def mark_retry_after_elapsed(self, method: str, path: str) -> None:
+        """Clear a 429 pause the caller already slept through before retrying."""
+        route, major = discord_route(method, path)
+        now = time.monotonic()
+        self._global_until = min(self._global_until, now)
+        state = self._buckets.get(self._bucket_key(route, major))
+        if state is not None and state.reset_at > now:
+            state.reset_at = now
+
+    def stats(self) -> DiscordRateLimitStats:
+        now = time.monotonic()
+        return DiscordRateLimitStats(
+            buckets_tracked=len(self._buckets),
+            routes_mapped=len(self._route_buckets),
+            exhausted_buckets=sum(
+                1 for state in self._buckets.values() if not state.available(now)
+            ),
+            preemptive_waits_total=self._preemptive_waits_total,
+            preemptive_wait_ms_total=self._preemptive_wait_seconds_total * 1000.0,
+            rate_limited_total=self._rate_limited_total,
+            global_rate_limited_total=self._global_rate_limited_total,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        now = time.monotonic()
+        routes_by_bucket: dict[str, list[str]] = {}
+        for route, bucket in self._route_buckets.items():
+            routes_by_bucket.setdefault(bucket, []).append(route)
+        states = sorted(
+            self._buckets.values(),
+            key=lambda state: (
+                state.available(now),
+                state.remaining if state.remaining is not None else 1 << 30,
+                -state.reset_at,
+            ),
+        )
+        buckets = [
+            {
+                "bucket": state.bucket,
+                "major": state.major,
+                "limit": state.limit,
+                "remaining": state.remaining,
+                "reset_after_seconds": round(max(0.0, state.reset_at - now), 3),
+                "routes": sorted(routes_by_bucket.get(state.bucket, [])),
+            }
+            for state in states[:_SNAPSHOT_MAX_BUCKETS]
+        ]
+        return {
+            "written_at": time.time(),
+            "global_reset_after_seconds": round(max(0.0, self._global_until - now), 3),
+            "stats": self.stats().to_dict(),
+            "buckets": buckets,
+        }
+
+    def _bucket_key(self, route: str, major: str) -> tuple[str, str]:
+        bucket = self._route_buckets.get(route)
+        return (bucket if bucket else f"route:{route}", major)
+
+    def _observe_rate_limited(
+        self, response: httpx.Response, state: Optional[_BucketState], now: float
+    ) -> None:
+        headers = response.headers
+        retry_after = _float_header(headers.get("Retry-After"))
+        if retry_after is None:
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            if isinstance(body, dict):
+                retry_after = _float_header(body.get("retry_after"))
+        retry_after = max(retry_after or 0.0, 0.0)
+        scope = (headers.get("X-RateLimit-Scope") or "").lower()
+        is_global = (headers.get("X-RateLimit-Global") or "").lower() == "true"
+        self._rate_limited_total += 1
+        if is_global or scope == "global":
+            self._global_rate_limited_total += 1
+            self._global_until = max(self._global_until, now + retry_after)
+        elif state is not None:
+            state.remaining = 0
+            state.reset_at = max(state.reset_at, now + retry_after)
+        self._snapshot_dirty = True
+        # Write 429s through immediately so doctor sees them.
+        self._snapshot_written_at = 0.0
+
+    def _prune(self, now: float) -> None:
+        for key, state in list(self._buckets.items()):
+            if state.reset_at <= now:
+                del self._buckets[key]
+
+    def _maybe_write_snapshot(self) -> None:
+        path = self._snapshot_path
+        if path is None or not self._snapshot_dirty:
+            return
+        now = time.monotonic()
+        if (
+            self._snapshot_written_at
+            and now - self._snapshot_written_at < _SNAPSHOT_INTERVAL_SECONDS
+        ):
+            return
+        self._snapshot_written_at = now
+        self._snapshot_dirty = False
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, json.dumps(self.snapshot(), indent=2) + "\n")
+        except OSError:
+            logger.debug("Failed to write Discord rate-limit snapshot", exc_info=True)
+
+
+def read_rate_limit_snapshot(path: Path) -> Optional[dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _int_header(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _float_header(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+__all__ = [
+    "RATE_LIMIT_SNAPSHOT_FILENAME",
+    "DiscordRateLimitStats",
+    "DiscordRateLimiter",
+    "discord_route",
+    "read_rate_limit_snapshot",
+]
@@ -5,6 +5,7 @@ import logging
 import random
 from contextlib import asynccontextmanager
 from io import BytesIO
+from pathlib import Path
 from typing import Any, AsyncIterator, Callable, Optional, cast
 from urllib.parse import urlparse
 
@@ -14,6 +15,7 @@ from codex_autorunner.core.circuit_breaker import CircuitBreaker
 
 from .constants import DISCORD_API_BASE_URL
 from .errors import DiscordAPIError, DiscordPermanentError, DiscordTransientError
+from .rate_limits import DiscordRateLimiter, DiscordRateLimitStats
 
 logger = logging.getLogger(__name__)
 _DISCORD_ATTACHMENT_HOSTS = frozenset({"cdn.discordapp.com", "media.discordapp.net"})
@@ -36,6 +38,7 @@ class DiscordRestClient:
         max_retries: int = 3,
         retry_base_delay: float = 1.0,
         retry_max_delay: float = 30.0,
+        rate_limit_snapshot_path: Optional[Path] = None,
     ) -> None:
         self._client = httpx.AsyncClient(base_url=base_url, timeout=timeout_seconds)
         self._authorization_header = f"Bot {bot_token}"
@@ -43,6 +46,10 @@ class DiscordRestClient:
         self._retry_base_delay = retry_base_delay
         self._retry_max_delay = retry_max_delay
         self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._rate_limits = DiscordRateLimiter(snapshot_path=rate_limit_snapshot_path)
+
+    def rate_limit_stats(self) -> DiscordRateLimitStats:
+        return self._rate_limits.stats()
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -171,11 +178,14 @@ class DiscordRestClient:
                     }
                     if timeout_seconds_override is not None:
                         request_kwargs["timeout"] = timeout_seconds_override
+                    if not fail_fast_interaction_callback:
+                        await self._rate_limits.acquire(method, path)
                     response = await self._client.request(
                         method,
                         path,
                         **request_kwargs,
                     )
+                    self._rate_limits.observe(method, path, response)
                     response.raise_for_status()
                 except httpx.HTTPStatusError as exc:
                     if exc.response.status_code == 429:
@@ -198,6 +208,7 @@ class DiscordRestClient:
                                 rate_limit_retries,
                             )
                             await asyncio.sleep(retry_after)
+                            self._rate_limits.mark_retry_after_elapsed(method, path)
                             continue
                         raise DiscordTransientError(
                             f"Discord API rate limit exceeded for {method} {path}"
@@ -449,6 +460,7 @@ class DiscordRestClient:
                         else:
                             data_fields[key] = value
 
+                    await self._rate_limits.acquire("POST", path)
                     response = await self._client.request(
                         "POST",
                         path,
@@ -456,6 +468,7 @@ class DiscordRestClient:
                         data=data_fields if data_fields else None,
                         headers={"Authorization": self._authorization_header},
                     )
+                    self._rate_limits.observe("POST", path, response)
                     response.raise_for_status()
                 except httpx.HTTPStatusError as exc:
                     if exc.response.status_code == 429:
@@ -476,6 +489,7 @@ class DiscordRestClient:
                                 rate_limit_retries,
                             )
                             await asyncio.sleep(retry_after)
+                            self._rate_limits.mark_retry_after_elapsed("POST", path)
                             continue
                         raise DiscordTransientError(
                             f"Discord API rate limit exceeded for multipart {path}"
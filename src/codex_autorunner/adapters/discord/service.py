@@ -380,6 +380,7 @@ from .pma_commands import (
     handle_pma_status,
 )
 from .queue_status_lifecycle import QueueStatusCleanupPolicy
+from .rate_limits import RATE_LIMIT_SNAPSHOT_FILENAME
 from .rendering import (
     format_discord_message,
 )
@@ -729,7 +730,12 @@ class DiscordBotService(DiscordInteractionResponseMixin):
         self._rest = (
             rest_client
             if rest_client is not None
-            else DiscordRestClient(bot_token=config.bot_token or "")
+            else DiscordRestClient(
+                bot_token=config.bot_token or "",
+                rate_limit_snapshot_path=config.state_file.with_name(
+                    RATE_LIMIT_SNAPSHOT_FILENAME
+                ),
+            )
         )
         self._owns_rest = rest_client is None
 
@@ -1004,6 +1010,7 @@ class DiscordBotService(DiscordInteractionResponseMixin):
             engine_factory=_build_engine,
             adapter=_DiscordDeliveryAdapter(),
             logger=self._logger,
+            hub_root=self._config.root,
         )
 
     async def run_forever(self) -> None:
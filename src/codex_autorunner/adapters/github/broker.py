@@ -54,6 +54,9 @@ class _CommandCachePolicy:
     namespace: str
     ttl_seconds: int
     scope: str = "cwd"
+    # REST reads revalidate an expired entry with ``If-None-Match``; GitHub
+    # does not charge 304 responses against the REST rate limit.
+    conditional: bool = False
 
 
 def _utc_now() -> datetime:
@@ -174,20 +177,51 @@ def _command_cache_policy(args: list[str]) -> Optional[_CommandCachePolicy]:
         return _CommandCachePolicy(
             namespace="reviews",
             ttl_seconds=_SCM_READ_CACHE_TTL_SECONDS,
+            conditional=True,
         )
     if endpoint.endswith("/comments"):
         return _CommandCachePolicy(
             namespace="comments",
             ttl_seconds=_SCM_READ_CACHE_TTL_SECONDS,
+            conditional=True,
         )
     if "/issues/" in endpoint:
         return _CommandCachePolicy(
             namespace="issues_api",
             ttl_seconds=_SCM_READ_CACHE_TTL_SECONDS,
+            conditional=True,
         )
     return None
 
 
+def _conditional_args(args: list[str], *, etag: Optional[str]) -> list[str]:
+    conditional = list(args) + ["--include"]
+    if etag:
+        conditional += ["-H", f"If-None-Match: {etag}"]
+    return conditional
+
+
+def _split_included_response(stdout: str) -> tuple[Optional[int], dict[str, str], str]:
+    """Split ``gh api --include`` output into status, headers and body."""
+    if not stdout.startswith("HTTP/"):
+        return None, {}, stdout
+    normalized = stdout.replace("\r\n", "\n")
+    head, _, body = normalized.partition("\n\n")
+    status_line, *header_lines = head.split("\n")
+    status_parts = status_line.split()
+    status = (
+        int(status_parts[1])
+        if len(status_parts) > 1 and status_parts[1].isdigit()
+        else None
+    )
+    headers: dict[str, str] = {}
+    for line in header_lines:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
 def _is_mutating_command(args: list[str]) -> bool:
     if not args:
         return False
@@ -228,6 +262,7 @@ class GitHubCliBroker:
             config=config_ns,
             repo_root=self._repo_root,
         )
+        self.request_counts = {"requests": 0, "cache_hits": 0, "not_modified": 0}
 
     def run(
         self,
@@ -254,6 +289,7 @@ class GitHubCliBroker:
                 cwd=normalized_cwd,
             )
             if cached is not None:
+                self.request_counts["cache_hits"] += 1
                 return cached
             lease_key = self._lease_key(
                 args,
@@ -277,6 +313,8 @@ class GitHubCliBroker:
                     lease_ttl_seconds=lease_ttl_seconds,
                 )
                 if waited is not None:
+                    if waited.returncode == 0:
+                        self.request_counts["cache_hits"] += 1
                     return waited
 
         if not _bypass_cooldown(args):
@@ -318,17 +356,64 @@ class GitHubCliBroker:
                         status_code=504,
                         check=check,
                     )
+                conditional = cache_policy is not None and cache_policy.conditional
+                validator = (
+                    self._cached_validator(
+                        args, cache_policy=cache_policy, cwd=normalized_cwd
+                    )
+                    if cache_policy is not None and conditional
+                    else None
+                )
+                self.request_counts["requests"] += 1
                 proc = self._runner(
-                    [self._gh_path] + args,
+                    [self._gh_path]
+                    + (
+                        _conditional_args(
+                            args, etag=validator[0] if validator else None
+                        )
+                        if conditional
+                        else args
+                    ),
                     cwd=normalized_cwd,
                     timeout_seconds=remaining_timeout_seconds,
-                    check=check,
+                    check=check and not conditional,
                 )
             except Exception as exc:
                 if looks_like_rate_limit(str(exc)):
                     self._record_rate_limit_hit(traffic_class=traffic_class)
                 raise
 
+            etag: Optional[str] = None
+            if conditional and cache_policy is not None:
+                status, headers, body = _split_included_response(proc.stdout or "")
+                if status == 304 and validator is not None:
+                    self.request_counts["not_modified"] += 1
+                    etag, body = validator
+                    proc = subprocess.CompletedProcess(
+                        [self._gh_path] + args, 0, stdout=body, stderr=""
+                    )
+                else:
+                    etag = headers.get("etag")
+                    proc = subprocess.CompletedProcess(
+                        [self._gh_path] + args,
+                        proc.returncode,
+                        stdout=body,
+                        stderr=proc.stderr,
+                    )
+                if check and proc.returncode != 0:
+                    detail = (
+                        (proc.stderr or "").strip()
+                        or (proc.stdout or "").strip()
+                        or f"exit {proc.returncode}"
+                    )
+                    rate_limited = looks_like_rate_limit(detail)
+                    if rate_limited:
+                        self._record_rate_limit_hit(traffic_class=traffic_class)
+                    raise self._error_factory(
+                        f"Command failed: {' '.join(args)}: {detail}",
+                        429 if rate_limited else 400,
+                    )
+
             if proc.returncode != 0 and looks_like_rate_limit(
                 (proc.stderr or "").strip() or (proc.stdout or "").strip()
             ):
@@ -343,6 +428,7 @@ class GitHubCliBroker:
                     cache_policy=cache_policy,
                     cwd=normalized_cwd,
                     stdout=proc.stdout or "",
+                    etag=etag,
                 )
             if _is_mutating_command(args):
                 self._invalidate_cached_responses()
@@ -541,6 +627,25 @@ class GitHubCliBroker:
             stderr="",
         )
 
+    def _cached_validator(
+        self,
+        args: list[str],
+        *,
+        cache_policy: _CommandCachePolicy,
+        cwd: Path,
+    ) -> Optional[tuple[str, str]]:
+        """Return the ETag and body of a cached response, even when expired."""
+        state = self._load_state(
+            self._cache_key(args, cache_policy=cache_policy, cwd=cwd)
+        )
+        if state is None:
+            return None
+        etag = state.value_json.get("etag")
+        stdout = state.value_json.get("stdout")
+        if not isinstance(etag, str) or not etag or not isinstance(stdout, str):
+            return None
+        return etag, stdout
+
     def _store_cached_response(
         self,
         args: list[str],
@@ -548,15 +653,18 @@ class GitHubCliBroker:
         cache_policy: _CommandCachePolicy,
         cwd: Path,
         stdout: str,
+        etag: Optional[str] = None,
     ) -> None:
         if len(stdout.encode("utf-8")) > _MAX_CACHED_STDOUT_BYTES:
             return
+        value: dict[str, Any] = {
+            "stdout": stdout,
+            "expires_at": _iso_after_seconds(cache_policy.ttl_seconds),
+        }
+        if etag:
+            value["etag"] = etag
         self._write_state(
-            self._cache_key(args, cache_policy=cache_policy, cwd=cwd),
-            {
-                "stdout": stdout,
-                "expires_at": _iso_after_seconds(cache_policy.ttl_seconds),
-            },
+            self._cache_key(args, cache_policy=cache_policy, cwd=cwd), value
         )
         if cache_policy.namespace != "rate_limit":
             return
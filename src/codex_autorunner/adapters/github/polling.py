@@ -50,6 +50,7 @@ from .polling_quota import (
 from .polling_snapshot import (
     build_snapshot,
     initial_post_open_boost_until,
+    snapshot_from_parts,
     snapshot_with_polling_metadata,
     snapshot_without_backfilled_comments,
 )
@@ -67,6 +68,17 @@ _DEFAULT_POST_OPEN_BOOST_MINUTES = 30
 _DEFAULT_POST_OPEN_BOOST_INTERVAL_SECONDS = 30
 _POST_OPEN_BOOST_UNTIL_SNAPSHOT_KEY = "post_open_boost_until"
 _RATE_LIMIT_BACKOFF_SECONDS = 15 * 60
+# Per-cycle GitHub API spend reported by process_due_watches and persisted
+# as ``last_cycle_quota_cost`` in the polling state file.
+_QUOTA_COST_COUNTS = (
+    "gh_requests",
+    "gh_cache_hits",
+    "graphql_requests",
+    "graphql_cost",
+    "graphql_remaining",
+    "rest_fallbacks",
+    "rest_not_modified",
+)
 _LOGGER = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -115,6 +127,15 @@ def _is_rate_limit_error(exc: Exception) -> bool:
     return looks_like_rate_limit(str(exc))
 
 
+def _add_request_counts(counts: dict[str, int], github: Any) -> None:
+    request_counts = getattr(github, "request_counts", None)
+    if not isinstance(request_counts, Mapping):
+        return
+    counts["gh_requests"] += int(request_counts.get("requests", 0))
+    counts["gh_cache_hits"] += int(request_counts.get("cache_hits", 0))
+    counts["rest_not_modified"] += int(request_counts.get("not_modified", 0))
+
+
 def _reaction_config_mapping(value: Any) -> dict[str, Any]:
     return ScmReactionConfig.from_mapping(value).to_dict()
 
@@ -600,6 +621,7 @@ class GitHubScmPollingService:
             "closed": 0,
             "errors": 0,
             "rate_limited_skipped": 0,
+            **dict.fromkeys(_QUOTA_COST_COUNTS, 0),
         }
         polling_config = GitHubPollingConfig.from_mapping(self._raw_config)
         due_watches = self._watch_store.claim_due_watches(
@@ -653,6 +675,9 @@ class GitHubScmPollingService:
             )
         )
         quota_state_cache: dict[str, Optional[GitHubQuotaState]] = {}
+        to_poll: list[
+            tuple[str, ScmPollingWatch, PrBinding, Path, Optional[GitHubQuotaState]]
+        ] = []
         for activity_tier, watch, binding, workspace_root in pending_watches:
             quota_state = self._quota_state_for_workspace(
                 workspace_root=workspace_root,
@@ -676,12 +701,35 @@ class GitHubScmPollingService:
                 )
                 counts["rate_limited_skipped"] += 1
                 continue
+            to_poll.append((activity_tier, watch, binding, workspace_root, quota_state))
+
+        batched_snapshots, batch_failures = self._fetch_batched_snapshots(
+            [
+                (watch, binding, workspace_root)
+                for _, watch, binding, workspace_root, _ in to_poll
+            ],
+            counts=counts,
+        )
+        for activity_tier, watch, binding, workspace_root, quota_state in to_poll:
             try:
-                github = self._github_service_factory(
-                    workspace_root,
-                    self._raw_config if isinstance(self._raw_config, dict) else None,
-                )
-                snapshot = build_snapshot(binding=binding, service=github)
+                batch_failure = batch_failures.get(watch.watch_id)
+                if batch_failure is not None:
+                    raise batch_failure
+                snapshot = batched_snapshots.get(watch.watch_id)
+                if snapshot is None:
+                    github = self._github_service_factory(
+                        workspace_root,
+                        (
+                            self._raw_config
+                            if isinstance(self._raw_config, dict)
+                            else None
+                        ),
+                    )
+                    try:
+                        snapshot = build_snapshot(binding=binding, service=github)
+                    finally:
+                        counts["rest_fallbacks"] += 1
+                        _add_request_counts(counts, github)
             except Exception as exc:
                 if _is_rate_limit_error(exc):
                     self._invalidate_quota_state_cache()
@@ -791,8 +839,79 @@ class GitHubScmPollingService:
             )
             counts["polled"] += 1
             counts["events_emitted"] += emitted
+        self._record_cycle_quota_cost(counts)
         return counts
 
+    def _fetch_batched_snapshots(
+        self,
+        watches: list[tuple[ScmPollingWatch, PrBinding, Path]],
+        *,
+        counts: dict[str, int],
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, Exception]]:
+        """Fetch snapshots for due watches with one GraphQL batch per repo.
+
+        Returns snapshots and rate-limit failures keyed by watch id. Watches
+        missing from both fall back to the per-PR ``build_snapshot`` path.
+        """
+        by_repo: dict[str, list[tuple[ScmPollingWatch, PrBinding, Path]]] = {}
+        for watch, binding, workspace_root in watches:
+            by_repo.setdefault(binding.repo_slug, []).append(
+                (watch, binding, workspace_root)
+            )
+        snapshots: dict[str, dict[str, Any]] = {}
+        failures: dict[str, Exception] = {}
+        for repo_slug, members in by_repo.items():
+            github: Any = None
+            try:
+                github = self._github_service_factory(
+                    members[0][2],
+                    self._raw_config if isinstance(self._raw_config, dict) else None,
+                )
+                # Injected service factories may not support batched polling.
+                pr_polling_batch = getattr(github, "pr_polling_batch", None)
+                if not callable(pr_polling_batch):
+                    continue
+                batch = pr_polling_batch(
+                    repo_slug=repo_slug,
+                    numbers=[binding.pr_number for _, binding, _ in members],
+                )
+            except Exception as exc:
+                if _is_rate_limit_error(exc):
+                    for watch, _, _ in members:
+                        failures[watch.watch_id] = exc
+                else:
+                    _LOGGER.warning(
+                        "GitHub batched poll failed for %s; polling PRs "
+                        "individually: %s",
+                        repo_slug,
+                        exc,
+                    )
+                continue
+            finally:
+                if github is not None:
+                    _add_request_counts(counts, github)
+            counts["graphql_requests"] += batch.requests
+            counts["graphql_cost"] += batch.cost
+            if batch.remaining is not None:
+                counts["graphql_remaining"] = batch.remaining
+            for watch, binding, _ in members:
+                parts = batch.pull_requests.get(binding.pr_number)
+                if parts is not None:
+                    snapshots[watch.watch_id] = snapshot_from_parts(
+                        binding=binding, **parts
+                    )
+        return snapshots, failures
+
+    def _record_cycle_quota_cost(self, counts: Mapping[str, int]) -> None:
+        if not any(counts.get(key) for key in _QUOTA_COST_COUNTS):
+            return
+        state = self._read_polling_state()
+        state["last_cycle_quota_cost"] = {
+            "recorded_at": now_iso(),
+            **{key: int(counts.get(key, 0)) for key in _QUOTA_COST_COUNTS},
+        }
+        self._write_polling_state(state)
+
     def process(self, *, limit: int = 20) -> dict[str, int]:
         counts = {
             "due": 0,
@@ -821,7 +940,8 @@ class GitHubScmPollingService:
         _LOGGER.info(
             "GitHub SCM poll cycles: scanned=%s/%s discovered=%s armed=%s "
             "backfilled=%s due=%s polled=%s emitted=%s rate_limited=%s invalid_bindings=%s "
-            "closed=%s expired=%s errors=%s",
+            "closed=%s expired=%s errors=%s graphql_requests=%s graphql_cost=%s "
+            "rest_fallbacks=%s rest_not_modified=%s",
             counts["candidate_workspaces_scanned"],
             counts["candidate_workspaces"],
             counts["bindings_discovered"],
@@ -835,6 +955,10 @@ class GitHubScmPollingService:
             counts["closed"],
             counts["expired"],
             counts["errors"] + counts["discovery_errors"],
+            counts.get("graphql_requests", 0),
+            counts.get("graphql_cost", 0),
+            counts.get("rest_fallbacks", 0),
+            counts.get("rest_not_modified", 0),
         )
         return counts
 
@@ -191,6 +191,35 @@ def build_snapshot(
     service: Any,
 ) -> dict[str, Any]:
     pr = service.pr_view(number=binding.pr_number, repo_slug=binding.repo_slug)
+    owner, repo = binding.repo_slug.split("/", 1)
+    return snapshot_from_parts(
+        binding=binding,
+        pr=pr,
+        reviews=service.pr_reviews(owner=owner, repo=repo, number=binding.pr_number),
+        checks=service.pr_checks(number=binding.pr_number),
+        issue_comments=service.issue_comments(
+            owner=owner,
+            repo=repo,
+            number=binding.pr_number,
+        ),
+        review_threads=service.pr_review_threads(
+            owner=owner,
+            repo=repo,
+            number=binding.pr_number,
+        ),
+    )
+
+
+def snapshot_from_parts(
+    *,
+    binding: Any,
+    pr: Mapping[str, Any],
+    reviews: list[Mapping[str, Any]],
+    checks: list[Mapping[str, Any]],
+    issue_comments: list[Mapping[str, Any]],
+    review_threads: list[Mapping[str, Any]],
+) -> dict[str, Any]:
+    """Build a polling snapshot from per-PR fetches or a batched poll entry."""
     head_sha = _normalize_text(pr.get("headRefOid"))
     pr_created_at = _normalize_text(pr.get("createdAt")) or _normalize_text(
         pr.get("created_at")
@@ -202,19 +231,6 @@ def build_snapshot(
         if isinstance(pr_author, Mapping)
         else None
     )
-    owner, repo = binding.repo_slug.split("/", 1)
-    reviews = service.pr_reviews(owner=owner, repo=repo, number=binding.pr_number)
-    checks = service.pr_checks(number=binding.pr_number)
-    issue_comments = service.issue_comments(
-        owner=owner,
-        repo=repo,
-        number=binding.pr_number,
-    )
-    review_threads = service.pr_review_threads(
-        owner=owner,
-        repo=repo,
-        number=binding.pr_number,
-    )
 
     changes_requested_reviews: dict[str, Any] = {}
     for review in reviews:
@@ -333,6 +349,7 @@ __all__ = [
     "build_snapshot",
     "initial_post_open_boost_until",
     "reaction_state_from_pr",
+    "snapshot_from_parts",
     "snapshot_map",
     "snapshot_with_polling_metadata",
     "snapshot_without_backfilled_comments",
@@ -257,6 +257,24 @@ class RepoInfo:
     default_branch: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class PullRequestPollBatch:
+    """PR polling data for one repo, fetched with batched GraphQL requests.
+
+    ``pull_requests`` maps PR number to the same shapes the per-PR methods
+    return (``pr``, ``reviews``, ``checks``, ``issue_comments``,
+    ``review_threads``). PRs that were missing from the response or whose
+    issue comments did not fit in one page are left out so callers can fall
+    back to the per-PR path.
+    """
+
+    pull_requests: dict[int, dict[str, Any]]
+    requests: int
+    cost: int
+    remaining: Optional[int] = None
+    reset_at: Optional[str] = None
+
+
 def _parse_repo_info(payload: dict) -> RepoInfo:
     name = payload.get("nameWithOwner") or ""
     url = payload.get("url") or ""
@@ -343,6 +361,267 @@ def _normalize_optional_identifier_text(value: Any) -> Optional[str]:
 _normalize_positive_int = normalize_positive_int
 
 
+def _review_threads_from_nodes(nodes: Any) -> list[dict[str, Any]]:
+    if not isinstance(nodes, list):
+        return []
+    threads: list[dict[str, Any]] = []
+    for node in nodes:
+        if not isinstance(node, dict):
+            continue
+        comments_nodes = _get_nested(node, "comments", "nodes")
+        comments: list[dict[str, Any]] = []
+        if isinstance(comments_nodes, list):
+            for comment in comments_nodes:
+                if not isinstance(comment, dict):
+                    continue
+                author = comment.get("author")
+                author_login = (
+                    _normalize_optional_text(author.get("login"))
+                    if isinstance(author, dict)
+                    else None
+                )
+                author_type = (
+                    _normalize_optional_text(author.get("__typename"))
+                    if isinstance(author, dict)
+                    else None
+                )
+                comments.append(
+                    {
+                        key: value
+                        for key, value in {
+                            "comment_id": _normalize_optional_identifier_text(
+                                comment.get("databaseId") or comment.get("id")
+                            ),
+                            "html_url": _normalize_optional_text(comment.get("url")),
+                            "author": (
+                                {"login": author_login}
+                                if author_login is not None
+                                else None
+                            ),
+                            "author_login": author_login,
+                            "author_type": author_type,
+                            "author_association": _normalize_optional_text(
+                                comment.get("authorAssociation")
+                            ),
+                            "body": _normalize_optional_text(comment.get("body")),
+                            "path": _normalize_optional_text(comment.get("path")),
+                            "line": _normalize_positive_int(comment.get("line")),
+                            "createdAt": _normalize_optional_text(
+                                comment.get("createdAt")
+                            ),
+                            "updated_at": _normalize_optional_text(
+                                comment.get("updatedAt")
+                            ),
+                        }.items()
+                        if value is not None
+                    }
+                )
+        threads.append(
+            {
+                key: value
+                for key, value in {
+                    "thread_id": _normalize_optional_text(node.get("id")),
+                    "isResolved": bool(node.get("isResolved")),
+                    "comments": comments,
+                }.items()
+                if value is not None
+            }
+        )
+    return threads
+
+
+def _checks_from_commit(commit: dict[str, Any]) -> list[dict[str, Any]]:
+    commit_oid = _normalize_optional_text(commit.get("oid"))
+    rollup = commit.get("statusCheckRollup")
+    contexts_container = rollup.get("contexts") if isinstance(rollup, dict) else None
+    contexts = (
+        contexts_container.get("nodes")
+        if isinstance(contexts_container, dict)
+        else None
+    )
+    if not isinstance(contexts, list):
+        return []
+    checks: list[dict[str, Any]] = []
+    for entry in contexts:
+        if not isinstance(entry, dict):
+            continue
+        typename = _normalize_optional_text(entry.get("__typename"))
+        if typename == "CheckRun":
+            check_suite = entry.get("checkSuite")
+            check_commit = (
+                check_suite.get("commit") if isinstance(check_suite, dict) else None
+            )
+            check_head_sha = (
+                _normalize_optional_text(check_commit.get("oid"))
+                if isinstance(check_commit, dict)
+                else None
+            )
+            checks.append(
+                {
+                    "name": entry.get("name"),
+                    "status": entry.get("status"),
+                    "conclusion": entry.get("conclusion"),
+                    "details_url": entry.get("detailsUrl"),
+                    "head_sha": check_head_sha or commit_oid,
+                }
+            )
+            continue
+        if typename == "StatusContext":
+            checks.append(
+                {
+                    "name": entry.get("context"),
+                    "status": entry.get("state"),
+                    "conclusion": entry.get("state"),
+                    "details_url": entry.get("targetUrl"),
+                    "head_sha": commit_oid,
+                }
+            )
+    return [
+        check
+        for check in checks
+        if check.get("name") or check.get("status") or check.get("conclusion")
+    ]
+
+
+_POLL_BATCH_MAX_PULL_REQUESTS = 20
+_POLL_BATCH_PULL_REQUEST_FIELDS = (
+    "number state isDraft createdAt headRefOid author{login} "
+    "reviews(first:100){nodes{databaseId state body url submittedAt "
+    "commit{oid} author{__typename login}}} "
+    "comments(last:100){pageInfo{hasPreviousPage} nodes{databaseId body url "
+    "authorAssociation createdAt updatedAt author{__typename login}}} "
+    "reviewThreads(first:50){nodes{id isResolved comments(first:20){nodes{id "
+    "databaseId url authorAssociation body path line createdAt updatedAt "
+    "author{__typename login}}}}} "
+    "commits(last:1){nodes{commit{oid statusCheckRollup{contexts(first:100){"
+    "nodes{__typename ... on CheckRun{name status conclusion detailsUrl "
+    "checkSuite{commit{oid}}} ... on StatusContext{context state targetUrl}}}}}}}"
+)
+
+
+def _poll_batch_query(numbers: list[int]) -> str:
+    aliases = " ".join(
+        f"pr{int(number)}:pullRequest(number:{int(number)}){{...PollFields}}"
+        for number in numbers
+    )
+    return (
+        "query($owner:String!,$name:String!){"
+        "rateLimit{cost remaining resetAt} "
+        f"repository(owner:$owner,name:$name){{{aliases}}}"
+        "}"
+        f"fragment PollFields on PullRequest{{{_POLL_BATCH_PULL_REQUEST_FIELDS}}}"
+    )
+
+
+def _review_from_rest(item: dict[str, Any]) -> dict[str, Any]:
+    user = item.get("user")
+    author_login = (
+        _normalize_optional_text(user.get("login")) if isinstance(user, dict) else None
+    )
+    review = {
+        "review_id": _normalize_optional_identifier_text(item.get("id")),
+        "review_state": _normalize_optional_text(item.get("state")),
+        "body": _normalize_optional_text(item.get("body")),
+        "html_url": _normalize_optional_text(item.get("html_url")),
+        "author_login": author_login,
+        "commit_id": _normalize_optional_text(item.get("commit_id")),
+        "submitted_at": _normalize_optional_text(item.get("submitted_at")),
+    }
+    return {key: value for key, value in review.items() if value is not None}
+
+
+def _graphql_author_login(author: Any) -> Optional[str]:
+    # GraphQL drops the ``[bot]`` suffix that REST keeps on app logins; restore
+    # it so batched and REST reads match the same login allow/deny lists.
+    if not isinstance(author, dict):
+        return None
+    login = _normalize_optional_text(author.get("login"))
+    if (
+        login is not None
+        and _normalize_optional_text(author.get("__typename")) == "Bot"
+        and not login.endswith("[bot]")
+    ):
+        return f"{login}[bot]"
+    return login
+
+
+def _review_from_graphql(node: dict[str, Any]) -> dict[str, Any]:
+    login = _graphql_author_login(node.get("author"))
+    return _review_from_rest(
+        {
+            "id": node.get("databaseId"),
+            "state": node.get("state"),
+            "body": node.get("body"),
+            "html_url": node.get("url"),
+            "user": {"login": login} if login is not None else None,
+            "commit_id": _get_nested(node, "commit", "oid"),
+            "submitted_at": node.get("submittedAt"),
+        }
+    )
+
+
+def _issue_comment_from_graphql(
+    node: dict[str, Any], *, issue_number: int
+) -> dict[str, Any]:
+    author = node.get("author")
+    comment = {
+        "comment_id": _normalize_optional_identifier_text(node.get("databaseId")),
+        "body": _normalize_optional_text(node.get("body")),
+        "html_url": _normalize_optional_text(node.get("url")),
+        "author_login": _graphql_author_login(author),
+        "author_type": (
+            _normalize_optional_text(author.get("__typename"))
+            if isinstance(author, dict)
+            else None
+        ),
+        "author_association": _normalize_optional_text(node.get("authorAssociation")),
+        "issue_number": issue_number,
+        "created_at": _normalize_optional_text(node.get("createdAt")),
+        "updated_at": _normalize_optional_text(node.get("updatedAt")),
+    }
+    return {key: value for key, value in comment.items() if value is not None}
+
+
+def _poll_parts_from_graphql(node: dict[str, Any]) -> Optional[dict[str, Any]]:
+    number = normalize_positive_int(node.get("number"))
+    if number is None:
+        return None
+    if _get_nested(node, "comments", "pageInfo", "hasPreviousPage"):
+        return None
+    commits = _get_nested(node, "commits", "nodes")
+    commit = (
+        commits[-1].get("commit")
+        if isinstance(commits, list) and commits and isinstance(commits[-1], dict)
+        else None
+    )
+    reviews = _get_nested(node, "reviews", "nodes")
+    comments = _get_nested(node, "comments", "nodes")
+    return {
+        "pr": {
+            "number": number,
+            "state": node.get("state"),
+            "isDraft": bool(node.get("isDraft")),
+            "createdAt": node.get("createdAt"),
+            "headRefOid": node.get("headRefOid"),
+            "author": node.get("author"),
+        },
+        "reviews": [
+            _review_from_graphql(review)
+            for review in (reviews if isinstance(reviews, list) else [])
+            if isinstance(review, dict)
+        ],
+        "checks": _checks_from_commit(commit) if isinstance(commit, dict) else [],
+        "issue_comments": [
+            _issue_comment_from_graphql(comment, issue_number=number)
+            for comment in (comments if isinstance(comments, list) else [])
+            if isinstance(comment, dict)
+        ],
+        "review_threads": _review_threads_from_nodes(
+            _get_nested(node, "reviewThreads", "nodes")
+        ),
+    }
+
+
 def _resolve_default_config_root(repo_root: Path) -> Path:
     current = Path(repo_root).resolve()
     while True:
@@ -388,6 +667,11 @@ class GitHubService:
             ),
         )
 
+    @property
+    def request_counts(self) -> dict[str, int]:
+        """``gh`` invocations, broker cache hits and 304 revalidations so far."""
+        return dict(self._gh_broker.request_counts)
+
     def _binding_context(self) -> tuple[Optional[Path], Optional[str]]:
         try:
             context = pr_binding_runtime_context(
@@ -683,27 +967,7 @@ class GitHubService:
             timeout_seconds=30,
         )
         payload = _parse_gh_json(proc, expect=list)
-        reviews: list[dict[str, Any]] = []
-        for item in payload:
-            user = item.get("user")
-            author_login = (
-                _normalize_optional_text(user.get("login"))
-                if isinstance(user, dict)
-                else None
-            )
-            review = {
-                "review_id": _normalize_optional_identifier_text(item.get("id")),
-                "review_state": _normalize_optional_text(item.get("state")),
-                "body": _normalize_optional_text(item.get("body")),
-                "html_url": _normalize_optional_text(item.get("html_url")),
-                "author_login": author_login,
-                "commit_id": _normalize_optional_text(item.get("commit_id")),
-                "submitted_at": _normalize_optional_text(item.get("submitted_at")),
-            }
-            reviews.append(
-                {key: value for key, value in review.items() if value is not None}
-            )
-        return reviews
+        return [_review_from_rest(item) for item in payload]
 
     def ensure_pr_head(
         self,
@@ -773,74 +1037,7 @@ class GitHubService:
         nodes = _get_nested(
             payload, "data", "repository", "pullRequest", "reviewThreads", "nodes"
         )
-        if not isinstance(nodes, list):
-            return []
-        threads: list[dict[str, Any]] = []
-        for node in nodes:
-            if not isinstance(node, dict):
-                continue
-            comments_nodes = _get_nested(node, "comments", "nodes")
-            comments: list[dict[str, Any]] = []
-            if isinstance(comments_nodes, list):
-                for comment in comments_nodes:
-                    if not isinstance(comment, dict):
-                        continue
-                    author = comment.get("author")
-                    author_login = (
-                        _normalize_optional_text(author.get("login"))
-                        if isinstance(author, dict)
-                        else None
-                    )
-                    author_type = (
-                        _normalize_optional_text(author.get("__typename"))
-                        if isinstance(author, dict)
-                        else None
-                    )
-                    comments.append(
-                        {
-                            key: value
-                            for key, value in {
-                                "comment_id": _normalize_optional_identifier_text(
-                                    comment.get("databaseId") or comment.get("id")
-                                ),
-                                "html_url": _normalize_optional_text(
-                                    comment.get("url")
-                                ),
-                                "author": (
-                                    {"login": author_login}
-                                    if author_login is not None
-                                    else None
-                                ),
-                                "author_login": author_login,
-                                "author_type": author_type,
-                                "author_association": _normalize_optional_text(
-                                    comment.get("authorAssociation")
-                                ),
-                                "body": _normalize_optional_text(comment.get("body")),
-                                "path": _normalize_optional_text(comment.get("path")),
-                                "line": _normalize_positive_int(comment.get("line")),
-                                "createdAt": _normalize_optional_text(
-                                    comment.get("createdAt")
-                                ),
-                                "updated_at": _normalize_optional_text(
-                                    comment.get("updatedAt")
-                                ),
-                            }.items()
-                            if value is not None
-                        }
-                    )
-            threads.append(
-                {
-                    key: value
-                    for key, value in {
-                        "thread_id": _normalize_optional_text(node.get("id")),
-                        "isResolved": bool(node.get("isResolved")),
-                        "comments": comments,
-                    }.items()
-                    if value is not None
-                }
-            )
-        return threads
+        return _review_threads_from_nodes(nodes)
 
     def create_pull_request_review_comment_reaction(
         self,
@@ -1004,58 +1201,78 @@ class GitHubService:
         commit = nodes[-1].get("commit") if isinstance(nodes[-1], dict) else None
         if not isinstance(commit, dict):
             return None
-        commit_oid = _normalize_optional_text(commit.get("oid"))
-        rollup = commit.get("statusCheckRollup")
-        contexts_container = (
-            rollup.get("contexts") if isinstance(rollup, dict) else None
-        )
-        contexts = (
-            contexts_container.get("nodes")
-            if isinstance(contexts_container, dict)
-            else None
-        )
-        if not isinstance(contexts, list):
-            return []
-        checks: list[dict[str, Any]] = []
-        for entry in contexts:
-            if not isinstance(entry, dict):
-                continue
-            typename = _normalize_optional_text(entry.get("__typename"))
-            if typename == "CheckRun":
-                check_suite = entry.get("checkSuite")
-                check_commit = (
-                    check_suite.get("commit") if isinstance(check_suite, dict) else None
-                )
-                check_head_sha = (
-                    _normalize_optional_text(check_commit.get("oid"))
-                    if isinstance(check_commit, dict)
-                    else None
-                )
-                checks.append(
-                    {
-                        "name": entry.get("name"),
-                        "status": entry.get("status"),
-                        "conclusion": entry.get("conclusion"),
-                        "details_url": entry.get("detailsUrl"),
-                        "head_sha": check_head_sha or commit_oid,
-                    }
+        return _checks_from_commit(commit)
+
+    def pr_polling_batch(
+        self,
+        *,
+        repo_slug: str,
+        numbers: list[int],
+        cwd: Optional[Path] = None,
+    ) -> PullRequestPollBatch:
+        """Fetch state, reviews, checks, comments and threads for many PRs.
+
+        Issues one GraphQL request per page of up to
+        ``_POLL_BATCH_MAX_PULL_REQUESTS`` PRs instead of five ``gh`` calls per
+        PR, and reports the GraphQL rate-limit cost of the requests.
+        """
+        owner, name = repo_slug.split("/", 1)
+        unique_numbers = sorted({int(number) for number in numbers})
+        pull_requests: dict[int, dict[str, Any]] = {}
+        requests = 0
+        cost = 0
+        remaining: Optional[int] = None
+        reset_at: Optional[str] = None
+        for start in range(0, len(unique_numbers), _POLL_BATCH_MAX_PULL_REQUESTS):
+            page = unique_numbers[start : start + _POLL_BATCH_MAX_PULL_REQUESTS]
+            proc = self._gh(
+                [
+                    "api",
+                    "graphql",
+                    "-f",
+                    f"query={_poll_batch_query(page)}",
+                    "-F",
+                    f"owner={owner}",
+                    "-F",
+                    f"name={name}",
+                ],
+                cwd=cwd or self.repo_root,
+                check=False,
+                timeout_seconds=60,
+            )
+            requests += 1
+            payload = _parse_gh_json(proc, soft_fail=True, expect=dict)
+            repository = _get_nested(payload, "data", "repository")
+            if not isinstance(repository, dict):
+                detail = (proc.stderr or "").strip() or (proc.stdout or "").strip()
+                raise GitHubError(
+                    f"GitHub polling batch failed for {repo_slug}: "
+                    f"{detail or f'exit {proc.returncode}'}",
+                    status_code=429 if looks_like_rate_limit(detail) else 502,
                 )
-                continue
-            if typename == "StatusContext":
-                checks.append(
-                    {
-                        "name": entry.get("context"),
-                        "status": entry.get("state"),
-                        "conclusion": entry.get("state"),
-                        "details_url": entry.get("targetUrl"),
-                        "head_sha": commit_oid,
-                    }
+            rate_limit = _get_nested(payload, "data", "rateLimit")
+            if isinstance(rate_limit, dict):
+                cost += normalize_positive_int(rate_limit.get("cost")) or 0
+                page_remaining = rate_limit.get("remaining")
+                if isinstance(page_remaining, int) and not isinstance(
+                    page_remaining, bool
+                ):
+                    remaining = page_remaining
+                reset_at = _normalize_optional_text(rate_limit.get("resetAt"))
+            for number in page:
+                node = repository.get(f"pr{number}")
+                parts = (
+                    _poll_parts_from_graphql(node) if isinstance(node, dict) else None
                 )
-        return [
-            check
-            for check in checks
-            if check.get("name") or check.get("status") or check.get("conclusion")
-        ]
+                if parts is not None:
+                    pull_requests[number] = parts
+        return PullRequestPollBatch(
+            pull_requests=pull_requests,
+            requests=requests,
+            cost=cost,
+            remaining=remaining,
+            reset_at=reset_at,
+        )
 
     def issue_meta(
         self, *, owner: str, repo: str, number: int, cwd: Optional[Path] = None
@@ -44,6 +44,11 @@ from .constants import (
     TELEGRAM_CALLBACK_DATA_LIMIT,
     TELEGRAM_MAX_MESSAGE_LENGTH,
 )
+from .rate_limiter import (
+    TelegramRateLimiter,
+    TelegramRateLimitStats,
+    priority_for_method,
+)
 from .rendering import sanitize_telegram_outbound_text
 from .retry import _extract_retry_after_seconds
 
@@ -1145,6 +1150,12 @@ def next_update_offset(
     return max_update_id + 1
 
 
+@dataclass
+class _PendingEdit:
+    payload: dict[str, Any]
+    result: asyncio.Future[Any]
+
+
 class TelegramBotClient:
     def __init__(
         self,
@@ -1153,6 +1164,7 @@ class TelegramBotClient:
         timeout_seconds: float = 30.0,
         logger: Optional[logging.Logger] = None,
         client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[TelegramRateLimiter] = None,
     ) -> None:
         self._bot_token = bot_token
         self._base_url = TELEGRAM_API_BASE_URL
@@ -1168,6 +1180,11 @@ class TelegramBotClient:
         self._rate_limit_lock: Optional[asyncio.Lock] = None
         self._rate_limit_lock_loop: Optional[asyncio.AbstractEventLoop] = None
         self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._send_limiter = rate_limiter or TelegramRateLimiter()
+        self._pending_edits: dict[tuple[str, int], _PendingEdit] = {}
+
+    def rate_limit_stats(self) -> TelegramRateLimitStats:
+        return self._send_limiter.stats()
 
     async def close(self) -> None:
         if self._owns_client:
@@ -1538,7 +1555,24 @@ class TelegramBotClient:
             payload["reply_markup"] = reply_markup
         if parse_mode is not None:
             payload["parse_mode"] = parse_mode
-        result = await self._request("editMessageText", payload)
+        key = (str(chat_id), message_id)
+        pending = self._pending_edits.get(key)
+        if pending is not None:
+            # An edit of this message is still waiting for a send slot; replace
+            # its payload so only the newest text goes out.
+            pending.payload.clear()
+            pending.payload.update(payload)
+            self._send_limiter.record_coalesced()
+            log_event(
+                self._logger,
+                logging.DEBUG,
+                "telegram.edit_message.coalesced",
+                chat_id=chat_id,
+                message_id=message_id,
+            )
+            result = await asyncio.shield(pending.result)
+        else:
+            result = await self._request_coalescible_edit(key, payload)
         return result if isinstance(result, dict) else {}
 
     async def delete_message(
@@ -1593,7 +1627,45 @@ class TelegramBotClient:
         return await self._request_with_retry(
             method,
             self._build_json_sender(method, payload),
+            chat_id=payload.get("chat_id"),
+        )
+
+    async def _request_coalescible_edit(
+        self, key: tuple[str, int], payload: dict[str, Any]
+    ) -> Any:
+        pending = _PendingEdit(
+            payload=payload, result=asyncio.get_running_loop().create_future()
+        )
+        # Nobody may be waiting on the shared result; don't warn about it.
+        pending.result.add_done_callback(
+            lambda future: future.cancelled() or future.exception()
         )
+        self._pending_edits[key] = pending
+        send_json = self._build_json_sender("editMessageText", payload)
+
+        async def send() -> httpx.Response:
+            # Once admitted, the payload is frozen and later edits queue anew.
+            if self._pending_edits.get(key) is pending:
+                del self._pending_edits[key]
+            return await send_json()
+
+        try:
+            result = await self._request_with_retry(
+                "editMessageText", send, chat_id=payload.get("chat_id")
+            )
+        except BaseException as exc:
+            if self._pending_edits.get(key) is pending:
+                del self._pending_edits[key]
+            if not pending.result.done():
+                if isinstance(exc, Exception):
+                    pending.result.set_exception(exc)
+                else:
+                    pending.result.set_exception(
+                        TelegramTransientError("Telegram edit was cancelled")
+                    )
+            raise
+        pending.result.set_result(result)
+        return result
 
     async def _request_once_payload(self, method: str, payload: dict[str, Any]) -> Any:
         return await self._request_once(
@@ -1618,19 +1690,31 @@ class TelegramBotClient:
         async def send() -> httpx.Response:
             return await self._client.post(url, data=data, files=files)
 
-        return await self._request_with_retry(method, send)
+        return await self._request_with_retry(method, send, chat_id=data.get("chat_id"))
 
     @retry_transient(max_attempts=5, base_wait=1.0, max_wait=60.0)
     async def _request_with_retry(
-        self, method: str, send: Callable[[], Awaitable[httpx.Response]]
+        self,
+        method: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        *,
+        chat_id: Optional[Union[int, str]] = None,
     ) -> Any:
-        return await self._request_once(method, send)
+        return await self._request_once(method, send, chat_id=chat_id)
 
     async def _request_once(
-        self, method: str, send: Callable[[], Awaitable[httpx.Response]]
+        self,
+        method: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        *,
+        chat_id: Optional[Union[int, str]] = None,
     ) -> Any:
         async with self._resilience_guard(method):
             await self._wait_for_rate_limit(method)
+            if chat_id is not None:
+                await self._send_limiter.acquire(
+                    chat_id, priority=priority_for_method(method)
+                )
             try:
                 payload = await self._send_request_payload(send)
             except httpx.HTTPStatusError as exc:
@@ -1815,6 +1899,7 @@ class TelegramBotClient:
         loop = asyncio.get_running_loop()
         until = loop.time() + delay + _RATE_LIMIT_BUFFER_SECONDS
         scope = self._resilience_scope(method)
+        self._send_limiter.record_rate_limited()
         lock = self._ensure_rate_limit_lock()
         async with lock:
             existing = self._rate_limit_until.get(scope)
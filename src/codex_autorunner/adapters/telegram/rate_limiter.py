@@ -0,0 +1,287 @@
+"""Proactive Telegram send scheduling.
+
+Telegram documents three outbound budgets for bots: roughly one message per
+second to a single chat (short bursts are tolerated), at most 20 messages per
+minute to the same group, and about 30 messages per second overall. Waiting
+for a 429 to learn about them stalls a topic for the whole ``retry_after``
+window, so :class:`TelegramRateLimiter` models each budget as a token bucket
+and admits chat-scoped requests only when every bucket they draw from has a
+token.
+
+Waiting requests are granted in priority order. Replies (new messages,
+documents, deletes, callback answers) outrank progress traffic (edits and
+chat actions), and a waiter never lets a lower-priority request for the same
+chat, or a lower-priority request anywhere while the global bucket is the
+bottleneck, take the token it is waiting for.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Optional, Union
+
+CHAT_MESSAGES_PER_SECOND = 1.0
+CHAT_BURST = 5
+GROUP_MESSAGES_PER_MINUTE = 20
+GLOBAL_MESSAGES_PER_SECOND = 30.0
+_MAX_IDLE_CHAT_BUCKETS = 1024
+
+_PROGRESS_METHODS = frozenset({"editMessageText", "sendChatAction"})
+
+
+class TelegramSendPriority(IntEnum):
+    REPLY = 0
+    PROGRESS = 1
+
+
+def priority_for_method(method: str) -> TelegramSendPriority:
+    if method in _PROGRESS_METHODS:
+        return TelegramSendPriority.PROGRESS
+    return TelegramSendPriority.REPLY
+
+
+def _is_group_chat(chat_id: Union[int, str]) -> bool:
+    # Private chats have positive ids; groups, supergroups, and channels are
+    # negative or addressed by ``@username``.
+    if isinstance(chat_id, int):
+        return chat_id < 0
+    text = str(chat_id).strip()
+    return text.startswith("-") or text.startswith("@")
+
+
+class _TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated_at")
+
+    def __init__(self, *, rate: float, capacity: float, now: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = now
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def delay(self, now: float) -> float:
+        self.refill(now)
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1.0
+
+    def is_full(self, now: float) -> bool:
+        self.refill(now)
+        return self.tokens >= self.capacity
+
+
+@dataclass(eq=False)
+class _Waiter:
+    priority: TelegramSendPriority
+    sequence: int
+    chat_key: str
+    buckets: tuple[_TokenBucket, ...]
+    future: asyncio.Future[None] = field(repr=False)
+
+
+@dataclass(frozen=True)
+class TelegramRateLimitStats:
+    queued: int
+    admitted_total: int
+    throttled_total: int
+    throttle_wait_ms_total: float
+    coalesced_total: int
+    rate_limited_total: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "admitted_total": self.admitted_total,
+            "throttled_total": self.throttled_total,
+            "throttle_wait_ms_total": round(self.throttle_wait_ms_total, 3),
+            "coalesced_total": self.coalesced_total,
+            "rate_limited_total": self.rate_limited_total,
+        }
+
+
+class TelegramRateLimiter:
+    def __init__(
+        self,
+        *,
+        chat_messages_per_second: float = CHAT_MESSAGES_PER_SECOND,
+        chat_burst: int = CHAT_BURST,
+        group_messages_per_minute: int = GROUP_MESSAGES_PER_MINUTE,
+        global_messages_per_second: float = GLOBAL_MESSAGES_PER_SECOND,
+    ) -> None:
+        self._chat_rate = max(float(chat_messages_per_second), 1e-6)
+        self._chat_burst = max(int(chat_burst), 1)
+        self._group_per_minute = max(int(group_messages_per_minute), 1)
+        self._global_rate = max(float(global_messages_per_second), 1e-6)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global: Optional[_TokenBucket] = None
+        self._chat_buckets: dict[str, tuple[_TokenBucket, ...]] = {}
+        self._waiters: list[_Waiter] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._admitted_total = 0
+        self._throttled_total = 0
+        self._throttle_wait_seconds_total = 0.0
+        self._coalesced_total = 0
+        self._rate_limited_total = 0
+
+    async def acquire(
+        self,
+        chat_id: Union[int, str],
+        *,
+        priority: TelegramSendPriority = TelegramSendPriority.REPLY,
+    ) -> None:
+        """Wait until a request to ``chat_id`` fits every budget it draws from."""
+        loop = self._ensure_loop()
+        now = loop.time()
+        chat_key = str(chat_id)
+        waiter = _Waiter(
+            priority=priority,
+            sequence=next(self._sequence),
+            chat_key=chat_key,
+            buckets=self._buckets_for(chat_key, chat_id, now),
+            future=loop.create_future(),
+        )
+        self._waiters.append(waiter)
+        self._schedule()
+        if waiter.future.done():
+            return
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._schedule()
+            raise
+        self._throttled_total += 1
+        self._throttle_wait_seconds_total += max(0.0, loop.time() - now)
+
+    def record_coalesced(self) -> None:
+        self._coalesced_total += 1
+
+    def record_rate_limited(self) -> None:
+        self._rate_limited_total += 1
+
+    def stats(self) -> TelegramRateLimitStats:
+        return TelegramRateLimitStats(
+            queued=len(self._waiters),
+            admitted_total=self._admitted_total,
+            throttled_total=self._throttled_total,
+            throttle_wait_ms_total=self._throttle_wait_seconds_total * 1000.0,
+            coalesced_total=self._coalesced_total,
+            rate_limited_total=self._rate_limited_total,
+        )
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._global is None:
+            # Buckets and timers are tied to the loop that created them.
+            if self._timer is not None:
+                self._timer.cancel()
+            self._loop = loop
+            self._timer = None
+            self._waiters = []
+            self._chat_buckets = {}
+            self._global = _TokenBucket(
+                rate=self._global_rate,
+                capacity=max(self._global_rate, 1.0),
+                now=loop.time(),
+            )
+        return loop
+
+    def _buckets_for(
+        self, chat_key: str, chat_id: Union[int, str], now: float
+    ) -> tuple[_TokenBucket, ...]:
+        assert self._global is not None
+        chat_buckets = self._chat_buckets.get(chat_key)
+        if chat_buckets is None:
+            if len(self._chat_buckets) >= _MAX_IDLE_CHAT_BUCKETS:
+                self._prune_idle_buckets(now)
+            chat_buckets = (
+                _TokenBucket(
+                    rate=self._chat_rate, capacity=float(self._chat_burst), now=now
+                ),
+            )
+            if _is_group_chat(chat_id):
+                chat_buckets += (
+                    _TokenBucket(
+                        rate=self._group_per_minute / 60.0,
+                        capacity=float(self._group_per_minute),
+                        now=now,
+                    ),
+                )
+            self._chat_buckets[chat_key] = chat_buckets
+        return chat_buckets + (self._global,)
+
+    def _prune_idle_buckets(self, now: float) -> None:
+        waiting = {waiter.chat_key for waiter in self._waiters}
+        for chat_key, buckets in list(self._chat_buckets.items()):
+            if chat_key in waiting:
+                continue
+            if all(bucket.is_full(now) for bucket in buckets):
+                del self._chat_buckets[chat_key]
+
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        loop = self._loop
+        if loop is None or not self._waiters:
+            return
+        next_delay = self._grant(loop.time())
+        if next_delay is not None:
+            self._timer = loop.call_later(next_delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._schedule()
+
+    def _grant(self, now: float) -> Optional[float]:
+        """Admit every waiter that fits; return the delay until the next check."""
+        assert self._global is not None
+        blocked_chats: set[str] = set()
+        global_blocked = False
+        next_delay: Optional[float] = None
+        for waiter in sorted(
+            self._waiters, key=lambda item: (item.priority, item.sequence)
+        ):
+            if waiter.future.done():
+                self._waiters.remove(waiter)
+                continue
+            if waiter.chat_key in blocked_chats:
+                continue
+            chat_delay = max(bucket.delay(now) for bucket in waiter.buckets[:-1])
+            global_delay = self._global.delay(now)
+            if chat_delay <= 0 and global_delay <= 0 and not global_blocked:
+                for bucket in waiter.buckets:
+                    bucket.take()
+                self._waiters.remove(waiter)
+                self._admitted_total += 1
+                waiter.future.set_result(None)
+                continue
+            blocked_chats.add(waiter.chat_key)
+            if chat_delay <= 0:
+                # Only the shared budget is short; hold it for this waiter.
+                global_blocked = True
+            delay = max(chat_delay, global_delay)
+            if delay > 0 and (next_delay is None or delay < next_delay):
+                next_delay = delay
+        return next_delay
+
+
+__all__ = [
+    "TelegramRateLimitStats",
+    "TelegramRateLimiter",
+    "TelegramSendPriority",
+    "priority_for_method",
+]
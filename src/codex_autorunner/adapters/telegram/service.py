@@ -743,6 +743,7 @@ class TelegramBotService(  # type: ignore[misc]  # _chat_delete_message return t
             engine_factory=_build_engine,
             adapter=_TelegramDeliveryAdapter(),
             logger=self._logger,
+            hub_root=Path(self._hub_root or self._config.root),
         )
 
     async def _handle_telegram_outbox_delivery(
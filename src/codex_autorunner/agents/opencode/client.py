@@ -12,14 +12,28 @@ import dataclasses
 import json
 import logging
 import re
-from typing import Any, AsyncIterator, Iterable, Optional
+import time
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Optional,
+)
 
 import httpx
 
 from ...core.logging_utils import log_event
 from ...core.sse import SSEEvent, parse_sse_lines
+from .event_stream import OpenCodeEventPump, OpenCodeEventStreamStats
 
 _MAX_INVALID_JSON_PREVIEW_BYTES = 512
+# A reconnecting event stream only sends Last-Event-ID when the previous
+# stream for the same endpoint ended this recently.
+_EVENT_STREAM_RESUME_WINDOW_SECONDS = 300.0
+
+_EventStreamKey = tuple[tuple[str, ...], tuple[tuple[str, str], ...]]
 
 
 @dataclasses.dataclass
@@ -54,13 +68,20 @@ def _normalize_sse_event(event: SSEEvent) -> SSEEvent:
     merge outer ``type``, session fields, ``session``, and ``properties`` into
     ``payload`` and re-serialize so downstream code matches unwrapped events.
     """
+    return _normalize_sse_frame(event)[0]
+
+
+def _normalize_sse_frame(event: SSEEvent) -> tuple[SSEEvent, Optional[dict[str, Any]]]:
+    """Normalize ``event`` and also return its decoded JSON object, if any."""
     event_type = event.event
     raw_data = event.data or ""
     payload_obj: Optional[dict[str, Any]] = None
     try:
-        payload_obj = json.loads(raw_data) if raw_data else None
+        decoded = json.loads(raw_data) if raw_data else None
     except (json.JSONDecodeError, TypeError):
-        payload_obj = None
+        decoded = None
+    if isinstance(decoded, dict):
+        payload_obj = decoded
 
     if isinstance(payload_obj, dict) and isinstance(payload_obj.get("payload"), dict):
         outer = payload_obj
@@ -82,11 +103,14 @@ def _normalize_sse_event(event: SSEEvent) -> SSEEvent:
             event_type = payload_type
         raw_data = json.dumps(payload_obj)
 
-    return SSEEvent(
-        event=event_type,
-        data=raw_data,
-        id=event.id,
-        retry=event.retry,
+    return (
+        SSEEvent(
+            event=event_type,
+            data=raw_data,
+            id=event.id,
+            retry=event.retry,
+        ),
+        payload_obj,
     )
 
 
@@ -112,8 +136,12 @@ class OpenCodeClient:
             int(max_text_chars) if isinstance(max_text_chars, int) else None
         )
         self._max_text_chars_cache: Optional[int] = None
+        self._event_pumps: dict[_EventStreamKey, OpenCodeEventPump] = {}
+        self._event_resume_ids: dict[_EventStreamKey, tuple[str, float]] = {}
 
     async def close(self) -> None:
+        for pump in list(self._event_pumps.values()):
+            await pump.stop()
         await self._client.aclose()
 
     async def detect_api_shape(self) -> OpenCodeApiProfile:
@@ -668,13 +696,17 @@ class OpenCodeClient:
             directory: Workspace directory for session filtering
             ready_event: Event to signal when stream is ready
             paths: Custom list of endpoint paths to try (overrides defaults)
-            session_id: Session ID for caller-side correlation/filtering. The
-                actual OpenCode stream stays on the documented /event or
-                /global/event endpoints.
+            session_id: Session ID used to route events from the shared
+                stream. The actual OpenCode stream stays on the documented
+                /event or /global/event endpoints.
 
         Yields:
             Normalized SSEEvent objects from the server.
 
+        Concurrent callers for the same endpoint share one upstream
+        connection (see :mod:`.event_stream`). Events for sessions that
+        another caller is streaming are not delivered to this caller.
+
         The endpoint negotiation strategy is:
         1. If paths provided, use those
         2. Use the documented stream endpoints (/event, /global/event)
@@ -691,17 +723,82 @@ class OpenCodeClient:
                 profile=profile,
             )
 
+        key: _EventStreamKey = (tuple(event_paths), tuple(sorted(params.items())))
+        pump = self._event_pumps.get(key)
+        if pump is None or pump.finished:
+            pump = self._start_event_pump(key, event_paths, params)
+        subscription = pump.subscribe(session_id, ready_event=ready_event)
+        try:
+            while True:
+                event = await subscription.get()
+                if event is None:
+                    return
+                yield event
+        finally:
+            await pump.unsubscribe(subscription)
+
+    def event_stream_stats(self) -> list[OpenCodeEventStreamStats]:
+        """Per-session lag and drop counters for the shared event streams."""
+        stats: list[OpenCodeEventStreamStats] = []
+        for pump in self._event_pumps.values():
+            stats.extend(pump.stats())
+        return stats
+
+    def _start_event_pump(
+        self,
+        key: _EventStreamKey,
+        event_paths: list[str],
+        params: dict[str, str],
+    ) -> OpenCodeEventPump:
+        resume_from: Optional[str] = None
+        resume = self._event_resume_ids.pop(key, None)
+        if resume is not None:
+            last_event_id, ended_at = resume
+            if time.monotonic() - ended_at <= _EVENT_STREAM_RESUME_WINDOW_SECONDS:
+                resume_from = last_event_id
+
+        def _source(
+            on_connected: Callable[[], None],
+        ) -> AsyncGenerator[tuple[SSEEvent, Optional[dict[str, Any]]], None]:
+            return self._iter_event_stream(
+                event_paths,
+                params,
+                on_connected=on_connected,
+                last_event_id=resume_from,
+            )
+
+        def _on_finished(finished: OpenCodeEventPump) -> None:
+            if self._event_pumps.get(key) is finished:
+                del self._event_pumps[key]
+            last_event_id = finished.last_event_id or resume_from
+            if last_event_id:
+                self._event_resume_ids[key] = (last_event_id, time.monotonic())
+
+        pump = OpenCodeEventPump(_source, on_finished=_on_finished)
+        self._event_pumps[key] = pump
+        return pump
+
+    async def _iter_event_stream(
+        self,
+        event_paths: list[str],
+        params: dict[str, str],
+        *,
+        on_connected: Callable[[], None],
+        last_event_id: Optional[str],
+    ) -> AsyncGenerator[tuple[SSEEvent, Optional[dict[str, Any]]], None]:
+        request_kwargs: dict[str, Any] = {"params": params, "timeout": None}
+        if last_event_id:
+            request_kwargs["headers"] = {"Last-Event-ID": last_event_id}
         last_error: Optional[BaseException] = None
         for path in event_paths:
             try:
                 async with self._client.stream(
-                    "GET", path, params=params, timeout=None
+                    "GET", path, **request_kwargs
                 ) as response:
                     response.raise_for_status()
-                    if ready_event is not None:
-                        ready_event.set()
+                    on_connected()
                     async for sse in parse_sse_lines(response.aiter_lines()):
-                        yield _normalize_sse_event(sse)
+                        yield _normalize_sse_frame(sse)
                 return
             except httpx.HTTPStatusError as exc:
                 last_error = exc
@@ -714,8 +811,6 @@ class OpenCodeClient:
             ) as exc:  # intentional: SSE streaming can fail in many transport-layer ways; re-raised after tracking
                 last_error = exc
                 raise
-        if ready_event is not None and not ready_event.is_set():
-            ready_event.set()
         if last_error is not None:
             raise last_error
 
@@ -0,0 +1,286 @@
+"""Shared OpenCode SSE event pump.
+
+An OpenCode server publishes progress for every session on one
+``/global/event`` (or ``/event``) stream. Opening that stream once per turn
+means N concurrent turns hold N identical connections, and every one of them
+parses every frame for every session. ``OpenCodeClient`` instead runs one
+:class:`OpenCodeEventPump` per negotiated stream endpoint: each frame is
+parsed and normalized once, its session id is read once, and the event is
+routed into bounded per-subscriber queues.
+
+Routing keeps the caller-visible contract of the old per-turn streams:
+
+- subscribers without a session id see every event;
+- events without a session id reach every subscriber;
+- events for a session (or a known descendant of a session) that has a
+  subscriber go only to that session's subscribers;
+- events for sessions nobody claims still reach every session-scoped
+  subscriber, because harnesses discover descendant (child) sessions from
+  those events.
+
+When a subscriber falls more than ``max_queue`` events behind, its oldest
+queued events are dropped and counted. The pump stops when its upstream
+stream ends or fails (subscribers then finish or see the same error) and when
+the last subscriber leaves. The last event id is remembered so the next pump
+for the same endpoint can resume with ``Last-Event-ID``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Callable, Optional
+
+from ...core.sse import SSEEvent
+from .progress_synthesis import extract_parent_session_id
+from .protocol_payload import extract_session_id
+
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 2048
+_MAX_TRACKED_SESSION_PARENTS = 4096
+_MAX_LINEAGE_DEPTH = 16
+
+# A source is called with an ``on_connected`` callback and yields normalized
+# events together with their already-decoded JSON payload (or None).
+EventSource = Callable[[Callable[[], None]], AsyncGenerator[tuple[SSEEvent, Any], None]]
+
+
+@dataclass(frozen=True)
+class OpenCodeEventStreamStats:
+    """Delivery counters for the subscribers of one session on one pump."""
+
+    session_id: Optional[str]
+    subscribers: int
+    lag_events: int
+    lag_ms: float
+    delivered_total: int
+    dropped_total: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "subscribers": self.subscribers,
+            "lag_events": self.lag_events,
+            "lag_ms": round(self.lag_ms, 3),
+            "delivered_total": self.delivered_total,
+            "dropped_total": self.dropped_total,
+        }
+
+
+class OpenCodeEventSubscription:
+    """Bounded queue of events for one ``stream_events`` caller."""
+
+    def __init__(self, session_id: Optional[str], *, max_queue: int) -> None:
+        self.session_id = session_id
+        self._queue: deque[tuple[float, SSEEvent]] = deque()
+        self._max_queue = max(1, int(max_queue))
+        self._wakeup = asyncio.Event()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self.delivered_total = 0
+        self.dropped_total = 0
+
+    def push(self, event: SSEEvent, *, now: float) -> None:
+        if self._closed:
+            return
+        if len(self._queue) >= self._max_queue:
+            self._queue.popleft()
+            self.dropped_total += 1
+        self._queue.append((now, event))
+        self._wakeup.set()
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._error = error
+        self._wakeup.set()
+
+    async def get(self) -> Optional[SSEEvent]:
+        """Return the next event, None once the stream ended, or raise its error."""
+        while not self._queue:
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                return None
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        _enqueued_at, event = self._queue.popleft()
+        self.delivered_total += 1
+        return event
+
+    def lag(self, now: float) -> tuple[int, float]:
+        if not self._queue:
+            return 0, 0.0
+        return len(self._queue), max(0.0, now - self._queue[0][0]) * 1000.0
+
+
+class OpenCodeEventPump:
+    """One upstream SSE connection fanned out to many subscriptions."""
+
+    def __init__(
+        self,
+        source: EventSource,
+        *,
+        max_queue: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        on_finished: Optional[Callable[["OpenCodeEventPump"], None]] = None,
+    ) -> None:
+        self._source = source
+        self._max_queue = max_queue
+        self._on_finished = on_finished
+        self._subscriptions: list[OpenCodeEventSubscription] = []
+        self._parents: OrderedDict[str, Optional[str]] = OrderedDict()
+        self._ready_events: list[asyncio.Event] = []
+        self._connected = False
+        self._finished = False
+        self._task: Optional[asyncio.Task[None]] = None
+        self.last_event_id: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def subscribe(
+        self,
+        session_id: Optional[str],
+        *,
+        ready_event: Optional[asyncio.Event] = None,
+    ) -> OpenCodeEventSubscription:
+        subscription = OpenCodeEventSubscription(
+            session_id or None, max_queue=self._max_queue
+        )
+        self._subscriptions.append(subscription)
+        if ready_event is not None:
+            if self._connected or self._finished:
+                ready_event.set()
+            else:
+                self._ready_events.append(ready_event)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+    async def unsubscribe(self, subscription: OpenCodeEventSubscription) -> None:
+        subscription.close()
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+        if not self._subscriptions:
+            await self.stop()
+
+    async def stop(self) -> None:
+        """Cancel the upstream stream; subscribers see a clean end of stream."""
+        task = self._task
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        # A task cancelled before its first step never runs its finally block.
+        self._finish(None)
+
+    def stats(self) -> list[OpenCodeEventStreamStats]:
+        now = time.monotonic()
+        grouped: dict[Optional[str], list[OpenCodeEventSubscription]] = {}
+        for subscription in self._subscriptions:
+            grouped.setdefault(subscription.session_id, []).append(subscription)
+        stats: list[OpenCodeEventStreamStats] = []
+        for session_id, subscriptions in grouped.items():
+            lags = [subscription.lag(now) for subscription in subscriptions]
+            stats.append(
+                OpenCodeEventStreamStats(
+                    session_id=session_id,
+                    subscribers=len(subscriptions),
+                    lag_events=max(lag_events for lag_events, _lag_ms in lags),
+                    lag_ms=max(lag_ms for _lag_events, lag_ms in lags),
+                    delivered_total=sum(item.delivered_total for item in subscriptions),
+                    dropped_total=sum(item.dropped_total for item in subscriptions),
+                )
+            )
+        return stats
+
+    def _mark_connected(self) -> None:
+        self._connected = True
+        self._release_ready_events()
+
+    def _release_ready_events(self) -> None:
+        ready_events, self._ready_events = self._ready_events, []
+        for ready_event in ready_events:
+            ready_event.set()
+
+    async def _run(self) -> None:
+        error: Optional[BaseException] = None
+        try:
+            async with contextlib.aclosing(
+                self._source(self._mark_connected)
+            ) as events:
+                async for event, payload in events:
+                    if event.id:
+                        self.last_event_id = event.id
+                    self._dispatch(event, payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # intentional: every subscriber re-raises it
+            error = exc
+        finally:
+            self._finish(error)
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        self._release_ready_events()
+        for subscription in self._subscriptions:
+            subscription.close(error)
+        if self._on_finished is not None:
+            self._on_finished(self)
+
+    def _dispatch(self, event: SSEEvent, payload: Any) -> None:
+        if not self._subscriptions:
+            return
+        session_id: Optional[str] = None
+        if isinstance(payload, dict):
+            session_id = extract_session_id(payload)
+            if session_id:
+                self._remember_parent(session_id, extract_parent_session_id(payload))
+        now = time.monotonic()
+        owner = self._claimed_ancestor(session_id) if session_id else None
+        for subscription in self._subscriptions:
+            if (
+                subscription.session_id is None
+                or session_id is None
+                or owner is None
+                or subscription.session_id == owner
+            ):
+                subscription.push(event, now=now)
+
+    def _remember_parent(self, session_id: str, parent_id: Optional[str]) -> None:
+        if parent_id is None and session_id in self._parents:
+            self._parents.move_to_end(session_id)
+            return
+        self._parents[session_id] = parent_id
+        self._parents.move_to_end(session_id)
+        while len(self._parents) > _MAX_TRACKED_SESSION_PARENTS:
+            self._parents.popitem(last=False)
+
+    def _claimed_ancestor(self, session_id: str) -> Optional[str]:
+        claimed = {
+            subscription.session_id
+            for subscription in self._subscriptions
+            if subscription.session_id is not None
+        }
+        current: Optional[str] = session_id
+        for _ in range(_MAX_LINEAGE_DEPTH):
+            if current is None:
+                return None
+            if current in claimed:
+                return current
+            current = self._parents.get(current)
+        return None
+
+
+__all__ = [
+    "DEFAULT_SUBSCRIBER_QUEUE_SIZE",
+    "OpenCodeEventPump",
+    "OpenCodeEventStreamStats",
+    "OpenCodeEventSubscription",
+]
@@ -76,6 +76,11 @@ from .turn_runtime import (
 
 _logger = logging.getLogger(__name__)
 _GLOB_META_RE = re.compile(r"[*?\[\]{}]")
+# The progress buffer only feeds live tails and progress snapshots; final turn
+# output is collected from ``streamed_raw_events``, so older progress events
+# can be evicted once a turn gets long. Snapshots whose cursor predates the
+# evicted events start with a gap marker.
+_PROGRESS_EVENT_BUFFER_MAX_EVENTS = 4096
 
 
 def _resolve_runtime_model_payload(model: Optional[str]) -> Optional[dict[str, str]]:
@@ -140,7 +145,11 @@ class _PendingTurnConfig:
     prompt: Optional[str] = None
     reserved_workspace_root: Optional[Path] = None
     command_task: Optional[asyncio.Task[Any]] = None
-    event_buffer: TurnEventBuffer = field(default_factory=TurnEventBuffer)
+    event_buffer: TurnEventBuffer = field(
+        default_factory=lambda: TurnEventBuffer(
+            max_events=_PROGRESS_EVENT_BUFFER_MAX_EVENTS
+        )
+    )
     pre_connected_event_queue: Optional[asyncio.Queue[Any]] = None
     pre_connected_stream_task: Optional[asyncio.Task[None]] = None
     pre_connected_event_seen: asyncio.Event = field(default_factory=asyncio.Event)
@@ -955,6 +964,7 @@ class OpenCodeHarness(AgentHarness):
                 progress_buffer_published=pending.progress_events_published,
                 progress_buffer_skipped_session=pending.progress_events_skipped_session,
                 progress_buffer_idle=pending.progress_events_idle,
+                progress_buffer_evicted=pending.event_buffer.evicted_count,
             )
 
     async def wait_for_turn(
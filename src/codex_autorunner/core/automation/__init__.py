@@ -64,7 +64,12 @@ from .scheduler import (
     SchedulerProcessResult,
     calculate_next_fire_at,
 )
-from .store import AutomationStore
+from .store import (
+    AutomationQueueMetrics,
+    AutomationStore,
+    add_job_enqueued_listener,
+    remove_job_enqueued_listener,
+)
 from .worker import (
     AutomationExecutor,
     AutomationExecutorRegistry,
@@ -94,6 +99,7 @@ __all__ = [
     "AutomationJob",
     "AutomationJobAttempt",
     "AutomationJobWorker",
+    "AutomationQueueMetrics",
     "AgentTaskTurnAutomationExecutor",
     "AutomationRule",
     "AutomationRuntimeContract",
@@ -131,8 +137,10 @@ __all__ = [
     "TARGET_POLICIES",
     "TRIGGER_KINDS",
     "WorkerProcessResult",
+    "add_job_enqueued_listener",
     "calculate_next_fire_at",
     "ensure_builtin_pma_reactive_rule",
+    "remove_job_enqueued_listener",
     "render_template",
     "validate_job_transition",
     "validate_policy",
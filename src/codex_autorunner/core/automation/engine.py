@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Mapping, Optional
 
 from ..text_utils import _json_dumps
 from ..time_utils import now_iso
@@ -24,6 +25,14 @@ _ALLOWED_TEMPLATE_ROOTS = frozenset(
     {"event", "repo", "target", "pr", "schedule", "job", "metadata"}
 )
 _NON_EXECUTABLE_ERROR_CODE = "AUTOMATION_EXECUTOR_KIND_UNSUPPORTED"
+_EVENT_FILTER_FIELDS = frozenset({"repo_id", "event_type", "source", "observed_at"})
+# Scalar filter values that can key a dict bucket with the same semantics as
+# ``actual == expected``.
+_INDEXABLE_TYPES = (str, int, type(None))
+
+_Context = Mapping[str, Any]
+_Template = Callable[[_Context], Any]
+_Predicate = Callable[[Any, _Context], bool]
 
 
 @dataclass(frozen=True)
@@ -62,14 +71,26 @@ def _non_executable_reason(rule: AutomationRule) -> dict[str, Any]:
 
 
 def _dig(context: Mapping[str, Any], path: str) -> Any:
+    return _dig_parts(context, path.split("."))
+
+
+def _dig_parts(context: Mapping[str, Any], parts: tuple[str, ...] | list[str]) -> Any:
     current: Any = context
-    for part in path.split("."):
+    for part in parts:
         if not isinstance(current, Mapping) or part not in current:
             return None
         current = current[part]
     return current
 
 
+def _format_template_value(resolved: Any) -> str:
+    if resolved is None:
+        return ""
+    if isinstance(resolved, (dict, list)):
+        return _json_dumps(resolved)
+    return str(resolved)
+
+
 def render_template(value: Any, context: Mapping[str, Any]) -> Any:
     if isinstance(value, dict):
         return {str(key): render_template(item, context) for key, item in value.items()}
@@ -83,16 +104,276 @@ def render_template(value: Any, context: Mapping[str, Any]) -> Any:
         root = path.split(".", 1)[0]
         if root not in _ALLOWED_TEMPLATE_ROOTS:
             raise ValueError(f"template root is not allowed: {root}")
-        resolved = _dig(context, path)
-        if resolved is None:
-            return ""
-        if isinstance(resolved, (dict, list)):
-            return _json_dumps(resolved)
-        return str(resolved)
+        return _format_template_value(_dig(context, path))
 
     return _TEMPLATE_RE.sub(_replace, value)
 
 
+def compile_template(value: Any) -> _Template:
+    """Compile ``value`` into a callable equivalent to ``render_template(value, ctx)``.
+
+    Placeholder paths are parsed once; strings without placeholders render as
+    constants. Containers are rebuilt on every call so results may be mutated.
+    """
+    if isinstance(value, dict):
+        items = [(str(key), compile_template(item)) for key, item in value.items()]
+        return lambda context: {key: render(context) for key, render in items}
+    if isinstance(value, list):
+        renders = [compile_template(item) for item in value]
+        return lambda context: [render(context) for render in renders]
+    if not isinstance(value, str) or _TEMPLATE_RE.search(value) is None:
+        return lambda _context: value
+    literals: list[str] = []
+    paths: list[tuple[str, ...]] = []
+    position = 0
+    for match in _TEMPLATE_RE.finditer(value):
+        literals.append(value[position : match.start()])
+        paths.append(tuple(match.group(1).split(".")))
+        position = match.end()
+    tail = value[position:]
+
+    def _render(context: _Context) -> str:
+        chunks: list[str] = []
+        for literal, parts in zip(literals, paths, strict=True):
+            if parts[0] not in _ALLOWED_TEMPLATE_ROOTS:
+                raise ValueError(f"template root is not allowed: {parts[0]}")
+            chunks.append(literal)
+            chunks.append(_format_template_value(_dig_parts(context, parts)))
+        chunks.append(tail)
+        return "".join(chunks)
+
+    return _render
+
+
+def _filter_path(key: str) -> str:
+    if "." in key:
+        return key
+    if key in _EVENT_FILTER_FIELDS:
+        return f"event.{key}"
+    return f"event.payload.{key}"
+
+
+def _compile_filter(expected: Any) -> _Predicate:
+    """Compile one filter value into ``predicate(actual, context)``."""
+    if isinstance(expected, Mapping):
+        path = tuple(str(expected["path"]).split(".")) if "path" in expected else None
+
+        def _resolve(actual: Any, context: _Context) -> Any:
+            return actual if path is None else _dig_parts(context, path)
+
+        if "exists" in expected:
+            wanted = bool(expected["exists"])
+            return (
+                lambda actual, context: (_resolve(actual, context) is not None)
+                is wanted
+            )
+        if "eq" in expected:
+            eq = expected["eq"]
+            return lambda actual, context: bool(_resolve(actual, context) == eq)
+        if "ne" in expected:
+            ne = expected["ne"]
+            return lambda actual, context: bool(_resolve(actual, context) != ne)
+        if "in" in expected:
+            values = expected["in"]
+            if not isinstance(values, list):
+                return lambda _actual, _context: False
+            return lambda actual, context: _resolve(actual, context) in values
+        if "not_in" in expected:
+            excluded = expected["not_in"]
+            if not isinstance(excluded, list):
+                return lambda _actual, _context: False
+            return lambda actual, context: _resolve(actual, context) not in excluded
+        if "contains" in expected:
+            needle = expected["contains"]
+
+            def _contains(actual: Any, context: _Context) -> bool:
+                resolved = _resolve(actual, context)
+                return isinstance(resolved, (list, str)) and needle in resolved
+
+            return _contains
+        nested = [(str(key), _compile_filter(value)) for key, value in expected.items()]
+
+        def _all_nested(actual: Any, context: _Context) -> bool:
+            resolved = _resolve(actual, context)
+            return all(
+                check(
+                    resolved.get(key) if isinstance(resolved, Mapping) else None,
+                    context,
+                )
+                for key, check in nested
+            )
+
+        return _all_nested
+    if isinstance(expected, list):
+        options = expected
+        return lambda actual, _context: actual in options
+    return lambda actual, _context: bool(actual == expected)
+
+
+def _index_value(expected: Any) -> tuple[bool, Any]:
+    """Return ``(True, value)`` when a filter is a plain equality on ``value``."""
+    if isinstance(expected, Mapping):
+        if set(expected) == {"eq"} and isinstance(expected["eq"], _INDEXABLE_TYPES):
+            return True, expected["eq"]
+        return False, None
+    if isinstance(expected, _INDEXABLE_TYPES):
+        return True, expected
+    return False, None
+
+
+def _event_types(rule: AutomationRule) -> Optional[frozenset[str]]:
+    """Event types a rule listens to; ``None`` means any, empty means none."""
+    if rule.trigger_kind == TRIGGER_KIND_SCHEDULE:
+        return frozenset({"schedule.fire"})
+    if rule.trigger_kind != TRIGGER_KIND_EVENT:
+        return frozenset()
+    raw = rule.trigger.get("event_types")
+    if isinstance(raw, str):
+        raw = [raw]
+    if not raw:
+        return None
+    if not isinstance(raw, (list, tuple, set, frozenset, dict)):
+        return frozenset()
+    return frozenset(str(item) for item in raw)
+
+
+@dataclass(frozen=True)
+class _CompiledRule:
+    ordinal: int
+    rule: AutomationRule
+    event_types: Optional[frozenset[str]]
+    filters: tuple[tuple[tuple[str, ...], _Predicate], ...]
+    index_key: Optional[tuple[tuple[str, ...], Any]]
+    target: _Template
+    executor: _Template
+    policy: _Template
+    metadata: _Template
+    rule_ref: _Template
+
+    def matches(self, event_type: str, context: _Context) -> bool:
+        if self.event_types is not None and event_type not in self.event_types:
+            return False
+        if self.rule.trigger_kind == TRIGGER_KIND_SCHEDULE:
+            schedule_rule_id = _dig_parts(context, ("schedule", "rule_id"))
+            if schedule_rule_id is not None and schedule_rule_id != self.rule.rule_id:
+                return False
+        return all(
+            check(_dig_parts(context, path), context) for path, check in self.filters
+        )
+
+
+def _compile_rule(rule: AutomationRule, ordinal: int = 0) -> _CompiledRule:
+    filters: list[tuple[tuple[str, ...], _Predicate]] = []
+    index_key: Optional[tuple[tuple[str, ...], Any]] = None
+    for key, expected in rule.filters.items():
+        path = tuple(_filter_path(str(key)).split("."))
+        filters.append((path, _compile_filter(expected)))
+        indexable, value = _index_value(expected)
+        # ``metadata`` paths see the rule's own metadata, so they cannot be
+        # looked up in the shared per-event context.
+        if (
+            index_key is None
+            and indexable
+            and not (path[0] == "metadata" and rule.metadata)
+        ):
+            index_key = (path, value)
+    return _CompiledRule(
+        ordinal=ordinal,
+        rule=rule,
+        event_types=_event_types(rule),
+        filters=tuple(filters),
+        index_key=index_key,
+        target=compile_template({"policy": rule.target_policy, **rule.target}),
+        executor=compile_template({"kind": rule.executor_kind, **rule.executor}),
+        policy=compile_template(rule.policy),
+        metadata=compile_template(rule.metadata),
+        rule_ref=compile_template({"rule_id": rule.rule_id, "name": rule.name}),
+    )
+
+
+@dataclass
+class _RuleBucket:
+    unkeyed: list[_CompiledRule] = field(default_factory=list)
+    keyed: dict[tuple[str, ...], dict[Any, list[_CompiledRule]]] = field(
+        default_factory=dict
+    )
+
+    def add(self, compiled: _CompiledRule) -> None:
+        if compiled.index_key is None:
+            self.unkeyed.append(compiled)
+            return
+        path, value = compiled.index_key
+        self.keyed.setdefault(path, {}).setdefault(value, []).append(compiled)
+
+    def candidates(self, context: _Context, into: list[_CompiledRule]) -> None:
+        into.extend(self.unkeyed)
+        for path, by_value in self.keyed.items():
+            actual = _dig_parts(context, path)
+            # Floats hash like equal ints, so ``1.0`` still finds ``1``.
+            if not isinstance(actual, (*_INDEXABLE_TYPES, float)):
+                continue
+            into.extend(by_value.get(actual, ()))
+
+
+@dataclass
+class _RuleIndex:
+    """Enabled rules compiled and bucketed by event type and equality filter."""
+
+    fingerprint: tuple[Any, ...]
+    rules: dict[str, _CompiledRule] = field(default_factory=dict)
+    by_event_type: dict[str, _RuleBucket] = field(default_factory=dict)
+    any_event_type: _RuleBucket = field(default_factory=_RuleBucket)
+
+    @classmethod
+    def build(
+        cls, fingerprint: tuple[Any, ...], rules: list[AutomationRule]
+    ) -> "_RuleIndex":
+        index = cls(fingerprint=fingerprint)
+        for ordinal, rule in enumerate(rules):
+            compiled = _compile_rule(rule, ordinal)
+            index.rules[rule.rule_id] = compiled
+            if compiled.event_types is None:
+                index.any_event_type.add(compiled)
+                continue
+            for event_type in compiled.event_types:
+                index.by_event_type.setdefault(event_type, _RuleBucket()).add(compiled)
+        return index
+
+    def candidates(self, event_type: str, context: _Context) -> list[_CompiledRule]:
+        found: list[_CompiledRule] = []
+        bucket = self.by_event_type.get(event_type)
+        if bucket is not None:
+            bucket.candidates(context, found)
+        self.any_event_type.candidates(context, found)
+        found.sort(key=lambda compiled: compiled.ordinal)
+        return found
+
+
+_RULE_INDEXES: dict[str, _RuleIndex] = {}
+_RULE_INDEX_LOCK = threading.Lock()
+
+
+def clear_rule_index_cache() -> None:
+    """Drop every cached rule index; the next event reloads rules from SQLite."""
+    with _RULE_INDEX_LOCK:
+        _RULE_INDEXES.clear()
+
+
+def _rule_index(store: AutomationStore) -> _RuleIndex:
+    # Read the fingerprint before the rules: a concurrent edit then leaves a
+    # stale fingerprint in the cache, which only forces one extra rebuild.
+    fingerprint = store.rule_set_fingerprint()
+    key = str(store.hub_root)
+    with _RULE_INDEX_LOCK:
+        cached = _RULE_INDEXES.get(key)
+    if cached is not None and cached.fingerprint == fingerprint:
+        return cached
+    index = _RuleIndex.build(fingerprint, store.list_rules(enabled=True))
+    with _RULE_INDEX_LOCK:
+        _RULE_INDEXES[key] = index
+    return index
+
+
 class AutomationRuleEngine:
     def __init__(self, store: AutomationStore) -> None:
         self._store = store
@@ -109,15 +390,21 @@ class AutomationRuleEngine:
         deduped = 0
         skipped = 0
         skipped_reasons: list[dict[str, Any]] = []
-        for rule in self._store.list_rules(enabled=True):
-            if not self.matches_event(rule, event):
+        index = _rule_index(self._store)
+        shared_context = self._match_context(event)
+        for compiled in index.candidates(event.event_type, shared_context):
+            rule = compiled.rule
+            context = (
+                self._match_context(event, rule) if rule.metadata else shared_context
+            )
+            if not compiled.matches(event.event_type, context):
                 continue
             matched += 1
             if not automation_rule_executable(rule):
                 skipped += 1
                 skipped_reasons.append(_non_executable_reason(rule))
                 continue
-            rule_result = self.enqueue_job_for_rule(rule, event)
+            rule_result = self._enqueue_compiled(compiled, event)
             created += rule_result.jobs_created
             deduped += rule_result.jobs_deduped
             skipped += rule_result.jobs_skipped
@@ -136,7 +423,13 @@ class AutomationRuleEngine:
     ) -> RuleEvaluationResult:
         if not automation_rule_executable(rule):
             raise AutomationRuleNonExecutableError(rule)
-        job = self._job_for_rule(rule, event)
+        return self._enqueue_compiled(_compile_rule(rule), event)
+
+    def _enqueue_compiled(
+        self, compiled: _CompiledRule, event: AutomationEvent
+    ) -> RuleEvaluationResult:
+        rule = compiled.rule
+        job = self._job_for_rule(compiled, event)
         if self._blocked_by_policy(rule, event, job):
             return RuleEvaluationResult(
                 event=event,
@@ -159,52 +452,36 @@ class AutomationRuleEngine:
     ) -> AutomationJob:
         if not automation_rule_executable(rule):
             raise AutomationRuleNonExecutableError(rule)
-        return self._job_for_rule(rule, event)
+        return self._job_for_rule(_compile_rule(rule), event)
 
     def matches_event(self, rule: AutomationRule, event: AutomationEvent) -> bool:
-        if rule.trigger_kind == TRIGGER_KIND_SCHEDULE:
-            if event.event_type != "schedule.fire":
-                return False
-            schedule_rule_id = _dig(
-                self._match_context(event, rule), "schedule.rule_id"
-            )
-            if schedule_rule_id is not None and schedule_rule_id != rule.rule_id:
-                return False
-            return self._filters_match(rule.filters, self._match_context(event, rule))
-        if rule.trigger_kind != TRIGGER_KIND_EVENT:
-            return False
-        event_types = rule.trigger.get("event_types")
-        if isinstance(event_types, str):
-            event_types = [event_types]
-        if event_types and event.event_type not in {str(item) for item in event_types}:
-            return False
-        return self._filters_match(rule.filters, self._match_context(event, rule))
+        return _compile_rule(rule).matches(
+            event.event_type, self._match_context(event, rule)
+        )
 
     def _job_for_rule(
-        self, rule: AutomationRule, event: AutomationEvent
+        self, compiled: _CompiledRule, event: AutomationEvent
     ) -> AutomationJob:
+        rule = compiled.rule
         context = self._template_context(rule=rule, event=event, job={})
-        target = render_template({"policy": rule.target_policy, **rule.target}, context)
-        executor = render_template(
-            {"kind": rule.executor_kind, **rule.executor}, context
-        )
-        policy = render_template(rule.policy, context)
-        payload = render_template(
-            {
-                "event": event.to_dict(),
-                "metadata": rule.metadata,
-                "rule": {"rule_id": rule.rule_id, "name": rule.name},
-                **(
-                    {
-                        "manual_run": True,
-                        "request": event.payload,
-                    }
-                    if event.event_type == "manual.run"
-                    else {}
-                ),
-            },
-            context,
-        )
+        target = compiled.target(context)
+        executor = compiled.executor(context)
+        policy = compiled.policy(context)
+        # The event half of the payload is data, not rule config, so it is
+        # rendered per event rather than compiled with the rule.
+        payload = {
+            "event": render_template(event.to_dict(), context),
+            "metadata": compiled.metadata(context),
+            "rule": compiled.rule_ref(context),
+            **(
+                {
+                    "manual_run": True,
+                    "request": render_template(event.payload, context),
+                }
+                if event.event_type == "manual.run"
+                else {}
+            ),
+        }
         dedupe_key = (
             self._render_policy_key(policy.get("dedupe_key"), context)
             or self._render_policy_key(event.metadata.get("manual_dedupe_key"), context)
@@ -251,56 +528,6 @@ class AutomationRuleEngine:
             return True
         return False
 
-    def _filters_match(
-        self, filters: Mapping[str, Any], context: Mapping[str, Any]
-    ) -> bool:
-        for key, expected in filters.items():
-            path = self._filter_path(str(key))
-            actual = _dig(context, path)
-            if not self._match_filter(actual, expected, context):
-                return False
-        return True
-
-    def _match_filter(
-        self, actual: Any, expected: Any, context: Mapping[str, Any]
-    ) -> bool:
-        if isinstance(expected, Mapping):
-            if "path" in expected:
-                actual = _dig(context, str(expected["path"]))
-            if "exists" in expected:
-                return (actual is not None) is bool(expected["exists"])
-            if "eq" in expected:
-                return bool(actual == expected["eq"])
-            if "ne" in expected:
-                return bool(actual != expected["ne"])
-            if "in" in expected:
-                values = expected["in"]
-                return isinstance(values, list) and actual in values
-            if "not_in" in expected:
-                values = expected["not_in"]
-                return isinstance(values, list) and actual not in values
-            if "contains" in expected:
-                needle = expected["contains"]
-                return isinstance(actual, (list, str)) and needle in actual
-            return all(
-                self._match_filter(
-                    actual.get(str(key)) if isinstance(actual, Mapping) else None,
-                    value,
-                    context,
-                )
-                for key, value in expected.items()
-            )
-        if isinstance(expected, list):
-            return actual in expected
-        return bool(actual == expected)
-
-    def _filter_path(self, key: str) -> str:
-        if "." in key:
-            return key
-        if key in {"repo_id", "event_type", "source", "observed_at"}:
-            return f"event.{key}"
-        return f"event.payload.{key}"
-
     def _match_context(
         self, event: AutomationEvent, rule: Optional[AutomationRule] = None
     ) -> dict[str, Any]:
@@ -364,4 +591,10 @@ def _add_seconds(value: str, seconds: int) -> str:
     return (parsed + timedelta(seconds=seconds)).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-__all__ = ["AutomationRuleEngine", "RuleEvaluationResult", "render_template"]
+__all__ = [
+    "AutomationRuleEngine",
+    "RuleEvaluationResult",
+    "clear_rule_index_cache",
+    "compile_template",
+    "render_template",
+]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import logging
 import sqlite3
+import threading
 import uuid
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import Any, Callable, Collection, Literal, Optional
 
+from ..orchestration.notification_bus import TOPIC_AUTOMATION, ring
 from ..orchestration.sqlite import open_orchestration_sqlite
 from ..pma_domain.automation_lifecycle import cancel_schedule_state
 from ..runtime_identity import RUNTIME_STAGE_EFFECTIVE, RuntimeIdentityEnvelope
@@ -71,12 +75,82 @@ _LEGACY_JOB_CHILD_COLUMNS = (
 )
 
 
+logger = logging.getLogger(__name__)
+
+JobEnqueuedListener = Callable[[AutomationJob], None]
+
+_job_listeners: list[JobEnqueuedListener] = []
+_job_listeners_lock = threading.Lock()
+
+
+def add_job_enqueued_listener(listener: JobEnqueuedListener) -> None:
+    """Call ``listener`` after ``enqueue_job`` commits a new job in this process."""
+    with _job_listeners_lock:
+        _job_listeners.append(listener)
+
+
+def remove_job_enqueued_listener(listener: JobEnqueuedListener) -> None:
+    with _job_listeners_lock:
+        _job_listeners[:] = [lst for lst in _job_listeners if lst != listener]
+
+
+def _notify_job_listeners(job: AutomationJob) -> None:
+    with _job_listeners_lock:
+        listeners = list(_job_listeners)
+    for listener in listeners:
+        try:
+            listener(job)
+        except Exception as exc:  # intentional: listeners must not break enqueue
+            logger.exception("Error in automation job listener: %s", exc)
+
+
+# Bumped on every rule write made through this module so rule caches see
+# same-process edits even when they land within one ``updated_at`` second.
+_rule_generation = 0
+_rule_generation_lock = threading.Lock()
+
+
+def _bump_rule_generation() -> None:
+    global _rule_generation
+    with _rule_generation_lock:
+        _rule_generation += 1
+
+
 @dataclass(frozen=True)
 class ActiveAutomationBlocker:
     job_id: str
     reason: str
 
 
+@dataclass(frozen=True)
+class AutomationQueueMetrics:
+    """Backlog and throughput of the automation job queue at one instant."""
+
+    due_pending: int
+    scheduled_pending: int
+    active: int
+    oldest_due_age_seconds: Optional[float]
+    finished_in_window: int
+    window_seconds: int
+
+    @property
+    def jobs_per_minute(self) -> float:
+        if self.window_seconds <= 0:
+            return 0.0
+        return round(self.finished_in_window * 60.0 / self.window_seconds, 2)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "due_pending": self.due_pending,
+            "scheduled_pending": self.scheduled_pending,
+            "active": self.active,
+            "oldest_due_age_seconds": self.oldest_due_age_seconds,
+            "finished_in_window": self.finished_in_window,
+            "window_seconds": self.window_seconds,
+            "jobs_per_minute": self.jobs_per_minute,
+        }
+
+
 class AutomationStore:
     def __init__(self, hub_root: Path, *, durable: bool = True) -> None:
         self._hub_root = Path(hub_root)
@@ -117,6 +191,7 @@ class AutomationStore:
                 )
                 if existing is not None:
                     self._record_rule_version(conn, existing)
+        _bump_rule_generation()
         saved = self.get_rule(rule.rule_id)
         if saved is None:
             raise RuntimeError("failed to persist automation rule")
@@ -171,7 +246,8 @@ class AutomationStore:
                     "DELETE FROM orch_automation_rules WHERE rule_id = ?",
                     (rule_id,),
                 )
-                return cursor.rowcount > 0
+        _bump_rule_generation()
+        return cursor.rowcount > 0
 
     def set_rule_enabled(self, rule_id: str, enabled: bool) -> Optional[AutomationRule]:
         with open_orchestration_sqlite(self._hub_root, durable=self._durable) as conn:
@@ -184,8 +260,37 @@ class AutomationStore:
                     """,
                     (1 if enabled else 0, now_iso(), rule_id),
                 )
+        _bump_rule_generation()
         return self.get_rule(rule_id)
 
+    def rule_set_fingerprint(self) -> tuple[Any, ...]:
+        """Return a cheap key that changes whenever the stored rule set changes.
+
+        Combines this process's rule write counter with the rule count, newest
+        ``updated_at``, enabled count, and ``orch_automation_rule_versions``
+        count, so writes from other processes are detected too.
+        """
+        with open_orchestration_sqlite(self._hub_root, durable=self._durable) as conn:
+            row = conn.execute("""
+                SELECT COUNT(*) AS rules,
+                       MAX(updated_at) AS updated_at,
+                       SUM(enabled) AS enabled,
+                       (SELECT COUNT(*) FROM orch_automation_rule_versions)
+                           AS versions
+                  FROM orch_automation_rules
+                """).fetchone()
+        with _rule_generation_lock:
+            generation = _rule_generation
+        if row is None:
+            return (generation,)
+        return (
+            generation,
+            int(row["rules"] or 0),
+            row["updated_at"],
+            int(row["enabled"] or 0),
+            int(row["versions"] or 0),
+        )
+
     def cancel_schedule(self, schedule_id: str) -> Optional[AutomationSchedule]:
         stamp = now_iso()
         with open_orchestration_sqlite(self._hub_root, durable=self._durable) as conn:
@@ -301,6 +406,9 @@ class AutomationStore:
         saved = self.get_job(job.job_id)
         if saved is None:
             raise RuntimeError("failed to persist automation job")
+        _notify_job_listeners(saved)
+        if saved.state == JOB_PENDING:
+            ring(self._hub_root, TOPIC_AUTOMATION)
         return saved, False
 
     def create_job(self, **kwargs: Any) -> tuple[AutomationJob, bool]:
@@ -440,8 +548,22 @@ class AutomationStore:
     def claim_next_job(
         self, *, lock_key: Optional[str] = None, now: Optional[str] = None
     ) -> Optional[AutomationJob]:
+        claimed = self.claim_jobs(limit=1, lock_key=lock_key, now=now)
+        return claimed[0] if claimed else None
+
+    def claim_jobs(
+        self,
+        *,
+        limit: int,
+        lock_key: Optional[str] = None,
+        now: Optional[str] = None,
+    ) -> list[AutomationJob]:
+        """Claim up to ``limit`` due pending jobs in one write transaction."""
         stamp = normalize_timestamp(now)
-        claimed: sqlite3.Row | None = None
+        take = max(0, int(limit))
+        if take <= 0:
+            return []
+        claimed: list[sqlite3.Row] = []
         with open_orchestration_sqlite(self._hub_root, durable=self._durable) as conn:
             try:
                 conn.execute("BEGIN IMMEDIATE")
@@ -451,11 +573,13 @@ class AutomationStore:
                       FROM orch_automation_jobs
                      WHERE state = ? AND available_at <= ?
                      ORDER BY available_at ASC, updated_at ASC, job_id ASC
-                     LIMIT 100
+                     LIMIT ?
                     """,
-                    (JOB_PENDING, stamp),
+                    (JOB_PENDING, stamp, max(100, take)),
                 ).fetchall()
                 for row in rows:
+                    if len(claimed) >= take:
+                        break
                     validate_job_transition(str(row["state"]), JOB_CLAIMED)
                     cursor = conn.execute(
                         """
@@ -480,16 +604,17 @@ class AutomationStore:
                     )
                     if int(cursor.rowcount or 0) != 1:
                         continue
-                    claimed = conn.execute(
+                    refreshed = conn.execute(
                         "SELECT * FROM orch_automation_jobs WHERE job_id = ?",
                         (row["job_id"],),
                     ).fetchone()
-                    break
+                    if refreshed is not None:
+                        claimed.append(refreshed)
                 conn.commit()
             except Exception:
                 conn.rollback()
                 raise
-        return self._row_to_job(claimed) if claimed is not None else None
+        return [self._row_to_job(row) for row in claimed]
 
     def start_job(self, job_id: str, *, now: Optional[str] = None) -> AutomationJob:
         job = self._transition_job(
@@ -1319,6 +1444,7 @@ class AutomationStore:
         rule_id: Optional[str] = None,
         target: Optional[dict[str, Any]] = None,
         exclude_job_id: Optional[str] = None,
+        exclude_job_ids: Collection[str] = (),
     ) -> int:
         with open_orchestration_sqlite(self._hub_root, durable=self._durable) as conn:
             return self._count_active_jobs(
@@ -1326,11 +1452,21 @@ class AutomationStore:
                 rule_id=rule_id,
                 target=target,
                 exclude_job_id=exclude_job_id,
+                exclude_job_ids=exclude_job_ids,
             )
 
     def concurrency_blocker_for_job(
-        self, job: AutomationJob, *, now: Optional[str] = None
+        self,
+        job: AutomationJob,
+        *,
+        now: Optional[str] = None,
+        ignore_job_ids: Collection[str] = (),
     ) -> Optional[ActiveAutomationBlocker]:
+        """Return the active job that blocks ``job`` under its concurrency policy.
+
+        ``ignore_job_ids`` lists jobs claimed in the same batch that have not
+        started yet; they are checked after ``job`` and must not block it.
+        """
         self.reconcile_concurrency_blockers(job, now=now)
         per_rule = int(job.policy.get("max_concurrent_per_rule") or 1)
         per_target = int(job.policy.get("max_concurrent_per_target") or 1)
@@ -1338,12 +1474,14 @@ class AutomationStore:
             blocker = self._first_active_blocker(
                 rule_id=job.rule_id,
                 exclude_job_id=job.job_id,
+                exclude_job_ids=ignore_job_ids,
             )
             if (
                 blocker is not None
                 and self.count_active_jobs(
                     rule_id=job.rule_id,
                     exclude_job_id=job.job_id,
+                    exclude_job_ids=ignore_job_ids,
                 )
                 >= per_rule
             ):
@@ -1355,12 +1493,14 @@ class AutomationStore:
             blocker = self._first_active_blocker(
                 target=job.target,
                 exclude_job_id=job.job_id,
+                exclude_job_ids=ignore_job_ids,
             )
             if (
                 blocker is not None
                 and self.count_active_jobs(
                     target=job.target,
                     exclude_job_id=job.job_id,
+                    exclude_job_ids=ignore_job_ids,
                 )
                 >= per_target
             ):
@@ -1415,6 +1555,59 @@ class AutomationStore:
             ).fetchone()
         return int(row["c"] if row is not None else 0)
 
+    def queue_metrics(
+        self, *, now: Optional[str] = None, window_seconds: int = 900
+    ) -> AutomationQueueMetrics:
+        stamp = normalize_timestamp(now)
+        current = _parse_stamp(stamp)
+        window = max(1, int(window_seconds))
+        since = (current - timedelta(seconds=window)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with open_orchestration_sqlite(self._hub_root, durable=self._durable) as conn:
+            row = conn.execute(
+                """
+                SELECT
+                    SUM(CASE WHEN state = ? AND available_at <= ? THEN 1 ELSE 0 END)
+                        AS due_pending,
+                    SUM(CASE WHEN state = ? AND available_at > ? THEN 1 ELSE 0 END)
+                        AS scheduled_pending,
+                    SUM(CASE WHEN state IN (?, ?) THEN 1 ELSE 0 END) AS active,
+                    MIN(CASE WHEN state = ? AND available_at <= ? THEN available_at END)
+                        AS oldest_due_at,
+                    SUM(CASE WHEN finished_at IS NOT NULL AND finished_at >= ?
+                             THEN 1 ELSE 0 END) AS finished_in_window
+                  FROM orch_automation_jobs
+                """,
+                (
+                    JOB_PENDING,
+                    stamp,
+                    JOB_PENDING,
+                    stamp,
+                    JOB_CLAIMED,
+                    JOB_RUNNING,
+                    JOB_PENDING,
+                    stamp,
+                    since,
+                ),
+            ).fetchone()
+        oldest_due_at = row["oldest_due_at"] if row is not None else None
+        oldest_age: Optional[float] = None
+        if oldest_due_at:
+            oldest_age = max(
+                0.0, (current - _parse_stamp(str(oldest_due_at))).total_seconds()
+            )
+        return AutomationQueueMetrics(
+            due_pending=int((row["due_pending"] if row is not None else 0) or 0),
+            scheduled_pending=int(
+                (row["scheduled_pending"] if row is not None else 0) or 0
+            ),
+            active=int((row["active"] if row is not None else 0) or 0),
+            oldest_due_age_seconds=oldest_age,
+            finished_in_window=int(
+                (row["finished_in_window"] if row is not None else 0) or 0
+            ),
+            window_seconds=window,
+        )
+
     def _transition_job(
         self,
         job_id: str,
@@ -1500,6 +1693,7 @@ class AutomationStore:
         rule_id: Optional[str] = None,
         target: Optional[dict[str, Any]] = None,
         exclude_job_id: Optional[str] = None,
+        exclude_job_ids: Collection[str] = (),
     ) -> int:
         clauses = ["state IN (?, ?)"]
         params: list[Any] = [JOB_CLAIMED, JOB_RUNNING]
@@ -1512,6 +1706,10 @@ class AutomationStore:
         if exclude_job_id is not None:
             clauses.append("job_id != ?")
             params.append(exclude_job_id)
+        if exclude_job_ids:
+            excluded = sorted(set(exclude_job_ids))
+            clauses.append(f"job_id NOT IN ({', '.join('?' for _ in excluded)})")
+            params.extend(excluded)
         row = conn.execute(
             f"SELECT COUNT(*) AS c FROM orch_automation_jobs WHERE {' AND '.join(clauses)}",
             tuple(params),
@@ -1524,6 +1722,7 @@ class AutomationStore:
         rule_id: Optional[str] = None,
         target: Optional[dict[str, Any]] = None,
         exclude_job_id: Optional[str] = None,
+        exclude_job_ids: Collection[str] = (),
     ) -> Optional[AutomationJob]:
         clauses = ["state IN (?, ?)"]
         params: list[Any] = [JOB_CLAIMED, JOB_RUNNING]
@@ -1536,6 +1735,10 @@ class AutomationStore:
         if exclude_job_id is not None:
             clauses.append("job_id != ?")
             params.append(exclude_job_id)
+        if exclude_job_ids:
+            excluded = sorted(set(exclude_job_ids))
+            clauses.append(f"job_id NOT IN ({', '.join('?' for _ in excluded)})")
+            params.extend(excluded)
         with open_orchestration_sqlite(self._hub_root, durable=self._durable) as conn:
             row = conn.execute(
                 f"""
@@ -1725,4 +1928,18 @@ class AutomationStore:
         )
 
 
-__all__ = ["ActiveAutomationBlocker", "AutomationStore"]
+def _parse_stamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(normalize_timestamp(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+__all__ = [
+    "ActiveAutomationBlocker",
+    "AutomationQueueMetrics",
+    "AutomationStore",
+    "JobEnqueuedListener",
+    "add_job_enqueued_listener",
+    "remove_job_enqueued_listener",
+]
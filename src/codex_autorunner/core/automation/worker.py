@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import traceback
 import uuid
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Protocol
@@ -74,6 +76,14 @@ class WorkerProcessResult:
 
 
 class AutomationJobWorker:
+    """Claims due automation jobs in batches and runs them on a bounded pool.
+
+    Claiming, cancellation checks, concurrency checks, and ``start_job`` run
+    serially in claim order so per-rule and per-target policies see every job
+    started before them; only executor calls and result recording fan out to
+    ``max_workers`` threads. ``max_workers=1`` keeps execution inline.
+    """
+
     def __init__(
         self,
         store: AutomationStore,
@@ -81,11 +91,17 @@ class AutomationJobWorker:
         *,
         worker_id: str | None = None,
         claim_lease_seconds: int = 300,
+        max_workers: int = 1,
+        claim_batch_size: int | None = None,
     ) -> None:
         self._store = store
         self._registry = registry
         self._worker_id = worker_id or f"automation-worker:{uuid.uuid4()}"
         self._claim_lease_seconds = max(1, int(claim_lease_seconds))
+        self._max_workers = max(1, int(max_workers))
+        self._claim_batch_size = max(
+            1, int(claim_batch_size or max(self._max_workers, 1))
+        )
 
     def process_once(
         self, *, now: str | None = None, limit: int = 10
@@ -94,154 +110,201 @@ class AutomationJobWorker:
         self._store.release_stale_claims(
             stale_before=_add_seconds(stamp, -self._claim_lease_seconds), now=stamp
         )
-        claimed = running_count = succeeded = failed = retried = dead = cancelled = 0
-        skipped = 0
-        paused = escalated = 0
-        for _ in range(max(0, int(limit))):
-            job = self._store.claim_next_job(lock_key=self._worker_id, now=stamp)
-            if job is None:
-                break
-            claimed += 1
-            latest = self._store.get_job(job.job_id)
-            if latest is None or latest.state == JOB_CANCELLED:
-                cancelled += 1
-                continue
-            blocker = self._store.concurrency_blocker_for_job(latest, now=stamp)
-            if blocker is not None:
-                self._store.defer_job_for_concurrency(
-                    latest.job_id,
-                    blocked_by_job_id=blocker.job_id,
-                    blocked_reason=blocker.reason,
-                    available_at=_add_seconds(stamp, 5),
+        counts: Counter[str] = Counter()
+        remaining = max(0, int(limit))
+        pool: ThreadPoolExecutor | None = None
+        pending: list[Future[Counter[str]]] = []
+        try:
+            while remaining > 0:
+                batch = self._store.claim_jobs(
+                    limit=min(self._claim_batch_size, remaining),
+                    lock_key=self._worker_id,
                     now=stamp,
                 )
-                skipped += 1
-                continue
-            kind = str(latest.executor.get("kind") or "").strip()
-            attempt_started_at = stamp
-            running = self._store.start_job(latest.job_id, now=attempt_started_at)
-            try:
-                executor = self._registry.get(kind)
-                result = executor.execute(running)
-                status = result.status or JOB_SUCCEEDED
-                if status == JOB_CANCELLED:
-                    self._store.cancel_job(running.job_id, now=stamp)
-                    cancelled += 1
-                elif status == JOB_DEAD_LETTERED:
-                    self._store.fail_job(
-                        running.job_id,
-                        error_text=result.summary or "dead_lettered",
-                        dead_letter=True,
-                        now=stamp,
-                    )
-                    dead += 1
-                elif status == JOB_SKIPPED:
-                    self._store.skip_job(
-                        running.job_id,
-                        result_summary=result.summary or "skipped",
-                    )
-                    skipped += 1
-                elif status == JOB_PAUSED:
-                    self._store.pause_job(
-                        running.job_id,
-                        result_summary=result.summary or "paused",
-                        execution_refs=result.execution_refs,
-                        now=stamp,
-                    )
-                    paused += 1
-                elif status == JOB_RUNNING:
-                    self._store.update_running_job(
-                        running.job_id,
-                        result_summary=result.summary,
-                        execution_refs=result.execution_refs,
-                        now=stamp,
-                    )
-                    running_count += 1
-                elif status == JOB_FAILED:
-                    did_escalate = self._handle_failure(
-                        running, result.summary or "executor_failed", stamp
-                    )
-                    failed += 1
-                    if running.attempt_count >= running.max_attempts:
-                        dead += 1
-                        escalated += int(did_escalate)
-                    else:
-                        retried += 1
-                else:
-                    self._store.complete_job(
-                        running.job_id,
-                        result_summary=result.summary,
-                        execution_refs=result.execution_refs,
-                        now=stamp,
-                    )
-                    succeeded += 1
-                self._store.record_attempt(
-                    AutomationJobAttempt.create(
-                        job_id=running.job_id,
-                        attempt_number=running.attempt_count,
-                        status=status,
-                        started_at=attempt_started_at,
-                        finished_at=stamp,
-                        error_text=result.summary if status == JOB_FAILED else None,
-                        executor_result=result.data,
-                        execution_refs=result.execution_refs,
+                if not batch:
+                    break
+                remaining -= len(batch)
+                counts["claimed"] += len(batch)
+                for index, job in enumerate(batch):
+                    running = self._start_claimed(
+                        job,
+                        stamp=stamp,
+                        batch_mates=[mate.job_id for mate in batch[index + 1 :]],
+                        counts=counts,
                     )
-                )
-            except AutomationExecutorUnavailableError as exc:
-                error = str(exc)
+                    if running is None:
+                        continue
+                    if self._max_workers == 1:
+                        counts.update(self._execute(running, stamp))
+                        continue
+                    if pool is None:
+                        pool = ThreadPoolExecutor(
+                            max_workers=self._max_workers,
+                            thread_name_prefix="automation-job",
+                        )
+                    pending.append(pool.submit(self._execute, running, stamp))
+                if len(batch) < self._claim_batch_size:
+                    break
+            for future in pending:
+                counts.update(future.result())
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+        return WorkerProcessResult(
+            claimed=counts["claimed"],
+            running=counts["running"],
+            succeeded=counts["succeeded"],
+            failed=counts["failed"],
+            retried=counts["retried"],
+            dead_lettered=counts["dead_lettered"],
+            cancelled=counts["cancelled"],
+            skipped=counts["skipped"],
+            paused=counts["paused"],
+            escalated=counts["escalated"],
+        )
+
+    def _start_claimed(
+        self,
+        job: AutomationJob,
+        *,
+        stamp: str,
+        batch_mates: list[str],
+        counts: Counter[str],
+    ) -> AutomationJob | None:
+        latest = self._store.get_job(job.job_id)
+        if latest is None or latest.state == JOB_CANCELLED:
+            counts["cancelled"] += 1
+            return None
+        blocker = self._store.concurrency_blocker_for_job(
+            latest, now=stamp, ignore_job_ids=batch_mates
+        )
+        if blocker is not None:
+            self._store.defer_job_for_concurrency(
+                latest.job_id,
+                blocked_by_job_id=blocker.job_id,
+                blocked_reason=blocker.reason,
+                available_at=_add_seconds(stamp, 5),
+                now=stamp,
+            )
+            counts["skipped"] += 1
+            return None
+        return self._store.start_job(latest.job_id, now=stamp)
+
+    def _execute(self, running: AutomationJob, stamp: str) -> Counter[str]:
+        counts: Counter[str] = Counter()
+        kind = str(running.executor.get("kind") or "").strip()
+        attempt_started_at = stamp
+        try:
+            executor = self._registry.get(kind)
+            result = executor.execute(running)
+            status = result.status or JOB_SUCCEEDED
+            if status == JOB_CANCELLED:
+                self._store.cancel_job(running.job_id, now=stamp)
+                counts["cancelled"] += 1
+            elif status == JOB_DEAD_LETTERED:
                 self._store.fail_job(
-                    running.job_id, error_text=error, dead_letter=True, now=stamp
+                    running.job_id,
+                    error_text=result.summary or "dead_lettered",
+                    dead_letter=True,
+                    now=stamp,
                 )
-                failed += 1
-                dead += 1
-                self._store.record_attempt(
-                    AutomationJobAttempt.create(
-                        job_id=running.job_id,
-                        attempt_number=running.attempt_count,
-                        status=JOB_DEAD_LETTERED,
-                        started_at=attempt_started_at,
-                        finished_at=stamp,
-                        error_text=error,
-                        executor_result={
-                            "code": exc.code,
-                            "executor_kind": exc.executor_kind,
-                            "executable": False,
-                        },
-                    )
+                counts["dead_lettered"] += 1
+            elif status == JOB_SKIPPED:
+                self._store.skip_job(
+                    running.job_id,
+                    result_summary=result.summary or "skipped",
+                )
+                counts["skipped"] += 1
+            elif status == JOB_PAUSED:
+                self._store.pause_job(
+                    running.job_id,
+                    result_summary=result.summary or "paused",
+                    execution_refs=result.execution_refs,
+                    now=stamp,
+                )
+                counts["paused"] += 1
+            elif status == JOB_RUNNING:
+                self._store.update_running_job(
+                    running.job_id,
+                    result_summary=result.summary,
+                    execution_refs=result.execution_refs,
+                    now=stamp,
+                )
+                counts["running"] += 1
+            elif status == JOB_FAILED:
+                did_escalate = self._handle_failure(
+                    running, result.summary or "executor_failed", stamp
                 )
-            except Exception as exc:
-                error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
-                did_escalate = self._handle_failure(running, error, stamp)
-                failed += 1
+                counts["failed"] += 1
                 if running.attempt_count >= running.max_attempts:
-                    dead += 1
-                    escalated += int(did_escalate)
-                    attempt_status = JOB_DEAD_LETTERED
+                    counts["dead_lettered"] += 1
+                    counts["escalated"] += int(did_escalate)
                 else:
-                    retried += 1
-                    attempt_status = JOB_FAILED
-                self._store.record_attempt(
-                    AutomationJobAttempt.create(
-                        job_id=running.job_id,
-                        attempt_number=running.attempt_count,
-                        status=attempt_status,
-                        started_at=attempt_started_at,
-                        finished_at=stamp,
-                        error_text=error,
-                    )
+                    counts["retried"] += 1
+            else:
+                self._store.complete_job(
+                    running.job_id,
+                    result_summary=result.summary,
+                    execution_refs=result.execution_refs,
+                    now=stamp,
                 )
-        return WorkerProcessResult(
-            claimed=claimed,
-            running=running_count,
-            succeeded=succeeded,
-            failed=failed,
-            retried=retried,
-            dead_lettered=dead,
-            cancelled=cancelled,
-            skipped=skipped,
-            paused=paused,
-            escalated=escalated,
-        )
+                counts["succeeded"] += 1
+            self._store.record_attempt(
+                AutomationJobAttempt.create(
+                    job_id=running.job_id,
+                    attempt_number=running.attempt_count,
+                    status=status,
+                    started_at=attempt_started_at,
+                    finished_at=stamp,
+                    error_text=result.summary if status == JOB_FAILED else None,
+                    executor_result=result.data,
+                    execution_refs=result.execution_refs,
+                )
+            )
+        except AutomationExecutorUnavailableError as exc:
+            error = str(exc)
+            self._store.fail_job(
+                running.job_id, error_text=error, dead_letter=True, now=stamp
+            )
+            counts["failed"] += 1
+            counts["dead_lettered"] += 1
+            self._store.record_attempt(
+                AutomationJobAttempt.create(
+                    job_id=running.job_id,
+                    attempt_number=running.attempt_count,
+                    status=JOB_DEAD_LETTERED,
+                    started_at=attempt_started_at,
+                    finished_at=stamp,
+                    error_text=error,
+                    executor_result={
+                        "code": exc.code,
+                        "executor_kind": exc.executor_kind,
+                        "executable": False,
+                    },
+                )
+            )
+        except Exception as exc:
+            error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+            did_escalate = self._handle_failure(running, error, stamp)
+            counts["failed"] += 1
+            if running.attempt_count >= running.max_attempts:
+                counts["dead_lettered"] += 1
+                counts["escalated"] += int(did_escalate)
+                attempt_status = JOB_DEAD_LETTERED
+            else:
+                counts["retried"] += 1
+                attempt_status = JOB_FAILED
+            self._store.record_attempt(
+                AutomationJobAttempt.create(
+                    job_id=running.job_id,
+                    attempt_number=running.attempt_count,
+                    status=attempt_status,
+                    started_at=attempt_started_at,
+                    finished_at=stamp,
+                    error_text=error,
+                )
+            )
+        return counts
 
     def _handle_failure(self, job: AutomationJob, error: str, now: str) -> bool:
         if job.attempt_count >= job.max_attempts:
@@ -15,6 +15,7 @@ from .config_builders import (
     load_hub_config_data,
     load_repo_config,
 )
+from .config_cache import ConfigCacheStats, clear_config_cache, config_cache_stats
 from .config_contract import (
     CONFIG_VERSION,
     ConfigError,
@@ -84,6 +85,7 @@ __all__ = [
     "AppsConfig",
     "BrowserAuthConfig",
     "BrowserAuthCookieSecure",
+    "ConfigCacheStats",
     "DestinationConfigSection",
     "FlowRetentionConfig",
     "HubConfig",
@@ -100,7 +102,9 @@ __all__ = [
     "TicketFlowConfig",
     "UsageConfig",
     "VoiceConfigSection",
+    "clear_config_cache",
     "collect_env_overrides",
+    "config_cache_stats",
     "derive_repo_config",
     "ensure_hub_config_at",
     "find_nearest_hub_config_path",
@@ -17,9 +17,15 @@ from typing import Any, Dict, Optional, cast
 from ..housekeeping import parse_housekeeping_config
 from ..manifest import ManifestError, load_manifest
 from .agent_config import parse_agents_config
+from .config_cache import (
+    clone_config,
+    load_cached_config,
+    load_shared_config,
+    load_yaml_dict_shared,
+)
 from .config_contract import CONFIG_VERSION, ConfigError
 from .config_defaults import DEFAULT_HUB_CONFIG, DEFAULT_REPO_CONFIG
-from .config_env import load_dotenv_for_root
+from .config_env import dotenv_paths_for_root, load_dotenv_for_root
 from .config_parsers import (
     _parse_app_server_config,
     _parse_apps_config,
@@ -44,6 +50,9 @@ from .config_parsers import (
 )
 from .config_sources import (
     CONFIG_FILENAME,
+    REPO_OVERRIDE_FILENAME,
+    ROOT_CONFIG_FILENAME,
+    ROOT_OVERRIDE_FILENAME,
     derive_repo_config_data,
     find_nearest_hub_config_path,
     resolve_hub_config_data,
@@ -57,7 +66,6 @@ from .config_types import (
     RepoConfig,
 )
 from .config_validation import _validate_hub_config, _validate_repo_config
-from .config_yaml import _load_yaml_dict
 from .destinations import resolve_effective_repo_destination
 from .generated_hub_config import normalize_generated_hub_config
 from .path_utils import ConfigPathError, resolve_config_path
@@ -150,11 +158,36 @@ def ensure_hub_config_at(start: Path) -> tuple[Path, bool]:
 def load_hub_config(start: Path) -> HubConfig:
     """Load the nearest hub config walking upward from the provided path."""
     config_path = _resolve_hub_config_path(start)
+    return clone_config(_load_hub_config_at(config_path))
+
+
+def _hub_config_sources(config_path: Path) -> tuple[Path, ...]:
+    root = config_path.parent.parent.resolve()
+    return (
+        config_path,
+        root / ROOT_CONFIG_FILENAME,
+        root / ROOT_OVERRIDE_FILENAME,
+        *dotenv_paths_for_root(root),
+    )
+
+
+def _build_hub_config_at(config_path: Path) -> HubConfig:
     merged = load_hub_config_data(config_path)
     _validate_hub_config(merged, root=config_path.parent.parent.resolve())
     return build_hub_config(config_path, merged)
 
 
+def _load_hub_config_at(config_path: Path) -> HubConfig:
+    """Return the shared cached hub config for ``config_path``; do not mutate it."""
+    load_dotenv_for_root(config_path.parent.parent.resolve())
+    return load_shared_config(
+        "hub",
+        str(config_path.resolve()),
+        _hub_config_sources(config_path),
+        lambda: _build_hub_config_at(config_path),
+    )
+
+
 def _resolve_hub_path_for_repo(repo_root: Path, hub_path: Optional[Path]) -> Path:
     if hub_path:
         candidate = hub_path
@@ -162,7 +195,7 @@ def _resolve_hub_path_for_repo(repo_root: Path, hub_path: Optional[Path]) -> Pat
             candidate = candidate / CONFIG_FILENAME
         if not candidate.exists():
             raise ConfigError(f"Hub config not found at {candidate}")
-        data = _load_yaml_dict(candidate)
+        data = load_yaml_dict_shared(candidate)
         mode = data.get("mode")
         if mode not in (None, "hub"):
             raise ConfigError(f"Invalid hub config mode '{mode}'; expected 'hub'")
@@ -176,7 +209,7 @@ def _resolve_hub_path_for_repo(repo_root: Path, hub_path: Optional[Path]) -> Pat
         if candidate.is_dir():
             candidate = candidate / CONFIG_FILENAME
         if candidate.exists():
-            data = _load_yaml_dict(candidate)
+            data = load_yaml_dict_shared(candidate)
             mode = data.get("mode")
             if mode not in (None, "hub"):
                 raise ConfigError(
@@ -190,7 +223,12 @@ def _resolve_repo_effective_destination(
     hub: HubConfig, repo_root: Path
 ) -> DestinationConfigSection:
     try:
-        manifest = load_manifest(hub.manifest_path, hub.root)
+        manifest = load_shared_config(
+            "manifest",
+            str(hub.manifest_path),
+            (hub.manifest_path,),
+            lambda: load_manifest(hub.manifest_path, hub.root),
+        )
     except ManifestError as exc:
         raise ConfigError(
             "Failed to resolve effective destination from hub manifest: "
@@ -229,10 +267,20 @@ def load_repo_config(start: Path, hub_path: Optional[Path] = None) -> RepoConfig
     """Load a repo config by deriving it from the nearest hub config."""
     repo_root = _resolve_repo_root(start)
     hub_config_path = _resolve_hub_path_for_repo(repo_root, hub_path)
-    hub_config = load_hub_config_data(hub_config_path)
-    _validate_hub_config(hub_config, root=hub_config_path.parent.parent.resolve())
-    hub = build_hub_config(hub_config_path, hub_config)
-    return derive_repo_config(hub, repo_root)
+    hub = _load_hub_config_at(hub_config_path)
+    load_dotenv_for_root(repo_root)
+    sources = (
+        *_hub_config_sources(hub_config_path),
+        repo_root / REPO_OVERRIDE_FILENAME,
+        *dotenv_paths_for_root(repo_root),
+        hub.manifest_path,
+    )
+    return load_cached_config(
+        "repo",
+        f"{hub_config_path.resolve()}:{repo_root}",
+        sources,
+        lambda: derive_repo_config(hub, repo_root, load_env=False),
+    )
 
 
 def build_repo_config(config_path: Path, cfg: Dict[str, Any]) -> RepoConfig:
@@ -256,6 +304,7 @@ def build_repo_config(config_path: Path, cfg: Dict[str, Any]) -> RepoConfig:
         idle_timeout_seconds = int(idle_timeout_value)
         if idle_timeout_seconds <= 0:
             idle_timeout_seconds = None
+    terminal_screen_model = bool(terminal_cfg.get("screen_model", False))
     notifications_cfg = _parse_notifications_config_section(cfg.get("notifications"))
     security_cfg = _parse_security_config_section(cfg.get("security"))
     log_cfg = cfg.get("log", {})
@@ -342,6 +391,7 @@ def build_repo_config(config_path: Path, cfg: Dict[str, Any]) -> RepoConfig:
         server_allowed_origins=list(cfg["server"].get("allowed_origins") or []),
         notifications=notifications_cfg,
         terminal_idle_timeout_seconds=idle_timeout_seconds,
+        terminal_screen_model=terminal_screen_model,
         log=LogConfig(
             path=root / log_cfg.get("path", DEFAULT_REPO_CONFIG["log"]["path"]),
             max_bytes=int(
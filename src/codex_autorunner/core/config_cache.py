@@ -0,0 +1,266 @@
+"""Process-wide cache of built hub and repo configs.
+
+``load_hub_config`` and ``load_repo_config`` are called from dozens of places,
+and each call re-reads the YAML layers, merges defaults, validates, builds the
+typed config, and (for repos) reloads the hub manifest. This module memoizes
+the built objects keyed by the stat of every file that contributes to them
+(hub YAML, root and repo overrides, ``.env`` files, manifest) plus the
+environment variables the parsers read, so an unchanged hub is parsed once
+per process and any edit invalidates exactly the entries it feeds.
+
+Cached objects never leave this module. Callers receive a copy whose dicts,
+lists, tuples and dataclasses are rebuilt (other objects are deep-copied), so
+they may mutate it freely; immutable leaves such as strings, numbers, enums
+and paths are shared with the cached entry instead of copied. Files modified
+within ``_RACY_WINDOW_NS`` of a load are not trusted, because a same-size
+rewrite inside one timestamp tick would keep its stat key; such loads are
+rebuilt until the file settles.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import enum
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path, PurePath
+from typing import Any, Callable, Dict, Iterable, Optional, TypeVar, cast
+
+from .app_server_command import CODEX_APP_SERVER_COMMAND_ENV
+from .config_yaml import _load_yaml_dict
+
+_RACY_WINDOW_NS = 2_000_000_000
+_MAX_CACHED_CONFIGS = 512
+_MAX_CACHED_YAML = 512
+# Environment variables read while building configs (path expansion, the
+# app-server command override, and the Codex home fallback).
+_ENV_KEYS = (
+    "HOME",
+    "CODEX_HOME",
+    "CAR_GLOBAL_STATE_ROOT",
+    CODEX_APP_SERVER_COMMAND_ENV,
+)
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None), PurePath, enum.Enum)
+
+_SourceStamp = tuple[str, Optional[int], Optional[int], Optional[int]]
+_Fingerprint = tuple[tuple[_SourceStamp, ...], tuple[Optional[str], ...]]
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ConfigCacheStats:
+    hits: int
+    misses: int
+    uncacheable: int
+    entries: int
+    yaml_hits: int
+    yaml_misses: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncacheable": self.uncacheable,
+            "entries": self.entries,
+            "yaml_hits": self.yaml_hits,
+            "yaml_misses": self.yaml_misses,
+        }
+
+
+@dataclass(frozen=True)
+class _CachedConfig:
+    fingerprint: _Fingerprint
+    value: Any
+
+
+@dataclass(frozen=True)
+class _CachedYaml:
+    stamp: _SourceStamp
+    data: Dict[str, Any]
+
+
+_LOCK = threading.Lock()
+_CONFIGS: "OrderedDict[tuple[str, str], _CachedConfig]" = OrderedDict()
+_YAML: "OrderedDict[str, _CachedYaml]" = OrderedDict()
+_counters = {
+    "hits": 0,
+    "misses": 0,
+    "uncacheable": 0,
+    "yaml_hits": 0,
+    "yaml_misses": 0,
+}
+
+
+def _stamp(path: Path) -> _SourceStamp:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path), None, None, None)
+    return (str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _settled(stamps: Iterable[_SourceStamp], loaded_at_ns: int) -> bool:
+    return all(
+        mtime_ns is None or mtime_ns + _RACY_WINDOW_NS < loaded_at_ns
+        for _, mtime_ns, _, _ in stamps
+    )
+
+
+def _fingerprint(sources: Iterable[Path]) -> _Fingerprint:
+    return (
+        tuple(_stamp(path) for path in sources),
+        tuple(os.environ.get(key) for key in _ENV_KEYS),
+    )
+
+
+def _clone(value: Any, memo: dict[int, Any]) -> Any:
+    """Copy a built config's containers, sharing immutable leaves such as paths.
+
+    ``copy.deepcopy`` spends most of its time reconstructing ``Path`` objects;
+    configs are plain dicts, lists and dataclasses, so walk those directly and
+    fall back to ``deepcopy`` for anything else. ``memo`` keeps aliasing (the
+    same dict reachable from two fields) intact.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    existing = memo.get(id(value))
+    if existing is not None:
+        return existing
+    clone: Any
+    if type(value) is dict:
+        clone = {}
+        memo[id(value)] = clone
+        for key, item in value.items():
+            clone[key] = _clone(item, memo)
+    elif type(value) is list:
+        clone = []
+        memo[id(value)] = clone
+        clone.extend(_clone(item, memo) for item in value)
+    elif type(value) is tuple:
+        clone = tuple(_clone(item, memo) for item in value)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        clone = copy.copy(value)
+        memo[id(value)] = clone
+        for field in dataclasses.fields(value):
+            object.__setattr__(
+                clone, field.name, _clone(getattr(value, field.name), memo)
+            )
+    else:
+        clone = copy.deepcopy(value)
+    memo[id(value)] = clone
+    return clone
+
+
+def clone_config(value: T) -> T:
+    """Return a private copy of a cached config object; see :func:`_clone`."""
+    return cast(T, _clone(value, {}))
+
+
+def load_cached_config(
+    kind: str, ident: str, sources: Iterable[Path], build: Callable[[], T]
+) -> T:
+    """Return a copy of the cached ``kind`` config for ``ident``, building on a miss.
+
+    ``sources`` must list every file whose content feeds ``build``; missing
+    files are part of the key too, so creating one invalidates the entry.
+    """
+    return clone_config(load_shared_config(kind, ident, sources, build))
+
+
+def load_shared_config(
+    kind: str, ident: str, sources: Iterable[Path], build: Callable[[], T]
+) -> T:
+    """Like :func:`load_cached_config` but return the cached instance itself.
+
+    For internal callers that only read the result; it must not be mutated.
+    """
+    paths = tuple(sources)
+    key = (kind, ident)
+    before = _fingerprint(paths)
+    with _LOCK:
+        cached = _CONFIGS.get(key)
+        if cached is not None and cached.fingerprint == before:
+            _CONFIGS.move_to_end(key)
+            _counters["hits"] += 1
+            return cached.value  # type: ignore[no-any-return]
+    loaded_at_ns = time.time_ns()
+    value = build()
+    after = _fingerprint(paths)
+    with _LOCK:
+        _counters["misses"] += 1
+        if after != before or not _settled(after[0], loaded_at_ns):
+            # A source changed underneath the build or is too fresh to trust.
+            _counters["uncacheable"] += 1
+            _CONFIGS.pop(key, None)
+            return value
+        _CONFIGS[key] = _CachedConfig(fingerprint=after, value=value)
+        _CONFIGS.move_to_end(key)
+        while len(_CONFIGS) > _MAX_CACHED_CONFIGS:
+            _CONFIGS.popitem(last=False)
+    return value
+
+
+def load_yaml_dict_shared(path: Path) -> Dict[str, Any]:
+    """Return the parsed YAML mapping at ``path`` from a stat-keyed cache.
+
+    The mapping is shared between readers and must be treated as read-only;
+    use ``_load_yaml_dict`` when the result will be modified.
+    """
+    stamp = _stamp(path)
+    key = stamp[0]
+    with _LOCK:
+        cached = _YAML.get(key)
+        if cached is not None and cached.stamp == stamp:
+            _YAML.move_to_end(key)
+            _counters["yaml_hits"] += 1
+            return cached.data
+    loaded_at_ns = time.time_ns()
+    data = _load_yaml_dict(path)
+    with _LOCK:
+        _counters["yaml_misses"] += 1
+        if stamp == _stamp(path) and _settled((stamp,), loaded_at_ns):
+            _YAML[key] = _CachedYaml(stamp=stamp, data=data)
+            _YAML.move_to_end(key)
+            while len(_YAML) > _MAX_CACHED_YAML:
+                _YAML.popitem(last=False)
+        else:
+            _YAML.pop(key, None)
+    return data
+
+
+def config_cache_stats() -> ConfigCacheStats:
+    with _LOCK:
+        return ConfigCacheStats(
+            hits=_counters["hits"],
+            misses=_counters["misses"],
+            uncacheable=_counters["uncacheable"],
+            entries=len(_CONFIGS),
+            yaml_hits=_counters["yaml_hits"],
+            yaml_misses=_counters["yaml_misses"],
+        )
+
+
+def clear_config_cache() -> None:
+    """Drop every cached config and YAML mapping and reset the counters."""
+    with _LOCK:
+        _CONFIGS.clear()
+        _YAML.clear()
+        for counter in _counters:
+            _counters[counter] = 0
+
+
+__all__ = [
+    "ConfigCacheStats",
+    "clear_config_cache",
+    "clone_config",
+    "config_cache_stats",
+    "load_cached_config",
+    "load_shared_config",
+    "load_yaml_dict_shared",
+]
@@ -261,6 +261,7 @@ def _default_terminal_section() -> Dict[str, Any]:
     """Build the default terminal section."""
     return {
         "idle_timeout_seconds": TWELVE_HOUR_SECONDS,
+        "screen_model": False,
     }
 
 
@@ -29,6 +29,11 @@ except ModuleNotFoundError:  # pragma: no cover
         return {}
 
 
+def dotenv_paths_for_root(root: Path) -> tuple[Path, Path]:
+    """Return the ``.env`` candidates for ``root`` in load order."""
+    return (root / ".env", root / ".codex-autorunner" / ".env")
+
+
 def load_dotenv_for_root(root: Path) -> None:
     """
     Best-effort load of environment variables for the provided repo root.
@@ -40,13 +45,7 @@ def load_dotenv_for_root(root: Path) -> None:
 
     logger = logging.getLogger("codex_autorunner.core.config_env")
     try:
-        root = root.resolve()
-        candidates = [
-            root / ".env",
-            root / ".codex-autorunner" / ".env",
-        ]
-
-        for candidate in candidates:
+        for candidate in dotenv_paths_for_root(root.resolve()):
             if candidate.exists():
                 load_dotenv(dotenv_path=candidate, override=True)
     except OSError as exc:
@@ -86,11 +85,7 @@ def resolve_env_for_root(
     Precedence mirrors load_dotenv_for_root: root/.env then root/.codex-autorunner/.env.
     """
     env = dict(base_env) if base_env is not None else dict(os.environ)
-    candidates = [
-        root / ".env",
-        root / ".codex-autorunner" / ".env",
-    ]
-    for candidate in candidates:
+    for candidate in dotenv_paths_for_root(root):
         if not candidate.exists():
             continue
         if DOTENV_AVAILABLE:
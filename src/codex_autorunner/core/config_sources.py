@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, cast
 
 import yaml
 
+from .config_cache import load_yaml_dict_shared
 from .config_contract import ConfigError
 from .config_defaults import DEFAULT_HUB_CONFIG, DEFAULT_REPO_CONFIG, REPO_SHARED_KEYS
 from .config_yaml import _load_yaml_dict, _mapping_has_nested_key, _merge_defaults
@@ -99,7 +100,7 @@ def find_nearest_hub_config_path(start: Path) -> Optional[Path]:
         candidate = current / CONFIG_FILENAME
         if not candidate.exists():
             continue
-        data = _load_yaml_dict(candidate)
+        data = load_yaml_dict_shared(candidate)
         if data.get("mode") in (None, "hub"):
             return candidate
     return None
@@ -384,6 +384,7 @@ class RepoConfig(AgentConfigMixin):
     server_allowed_origins: List[str]
     notifications: NotificationsConfigSection
     terminal_idle_timeout_seconds: Optional[int]
+    terminal_screen_model: bool
     log: LogConfig
     server_log: LogConfig
     voice: VoiceConfigSection
@@ -1072,6 +1072,9 @@ def _validate_repo_config(cfg: Dict[str, Any], *, root: Path) -> None:
             )
         if isinstance(idle_timeout_seconds, int) and idle_timeout_seconds < 0:
             raise ConfigError("terminal.idle_timeout_seconds must be >= 0")
+        screen_model = terminal_cfg.get("screen_model")
+        if screen_model is not None and not isinstance(screen_model, bool):
+            raise ConfigError("terminal.screen_model must be boolean")
     log_cfg = cfg.get("log")
     if not isinstance(log_cfg, dict):
         raise ConfigError("log section must be a mapping")
@@ -26,6 +26,7 @@ AUTOMATION_RUNTIME_MISMATCH = "AUTOMATION_RUNTIME_MISMATCH"
 AUTOMATION_LEGACY_EXECUTOR_SHAPE = "AUTOMATION_LEGACY_EXECUTOR_SHAPE"
 AUTOMATION_CHILD_EDGE_MISSING = "AUTOMATION_CHILD_EDGE_MISSING"
 AUTOMATION_LEGACY_CHILD_COLUMN_POPULATED = "AUTOMATION_LEGACY_CHILD_COLUMN_POPULATED"
+AUTOMATION_QUEUE_AGE_WARN_SECONDS = 300
 
 _LEGACY_JOB_CHILD_COLUMNS = (
     "managed_thread_target_id",
@@ -75,18 +76,22 @@ def automation_migration_doctor_checks(
     report = collect_automation_migration_read_model(hub_config.root)
     architecture_checks = automation_architecture_doctor_checks(hub_config)
     if report.status == "complete":
-        return [
-            DoctorCheck(
-                name="Automation migration",
-                passed=True,
-                message=(
-                    "Automation migration gate OK "
-                    f"(schema={report.schema_version}/{report.target_schema_version})"
-                ),
-                check_id="automation.migration",
-                severity="info",
-            )
-        ] + architecture_checks
+        return (
+            [
+                DoctorCheck(
+                    name="Automation migration",
+                    passed=True,
+                    message=(
+                        "Automation migration gate OK "
+                        f"(schema={report.schema_version}/{report.target_schema_version})"
+                    ),
+                    check_id="automation.migration",
+                    severity="info",
+                )
+            ]
+            + architecture_checks
+            + automation_queue_doctor_checks(hub_config)
+        )
     codes = ", ".join(item.code for item in report.diagnostics[:5])
     if len(report.diagnostics) > 5:
         codes += f", +{len(report.diagnostics) - 5} more"
@@ -131,6 +136,37 @@ def automation_architecture_doctor_checks(hub_config: HubConfig) -> list[DoctorC
     ]
 
 
+def automation_queue_doctor_checks(hub_config: HubConfig) -> list[DoctorCheck]:
+    metrics = AutomationStore(hub_config.root).queue_metrics()
+    oldest = metrics.oldest_due_age_seconds
+    summary = (
+        f"due={metrics.due_pending} scheduled={metrics.scheduled_pending} "
+        f"active={metrics.active} "
+        f"oldest_due_age={'-' if oldest is None else f'{int(oldest)}s'} "
+        f"throughput={metrics.jobs_per_minute}/min"
+    )
+    if oldest is not None and oldest > AUTOMATION_QUEUE_AGE_WARN_SECONDS:
+        return [
+            DoctorCheck(
+                name="Automation job queue",
+                passed=False,
+                message=f"Automation jobs are waiting to be claimed: {summary}",
+                severity="warning",
+                check_id="automation.queue",
+                fix="Confirm the hub server is running; its lifecycle worker claims automation jobs.",
+            )
+        ]
+    return [
+        DoctorCheck(
+            name="Automation job queue",
+            passed=True,
+            message=f"Automation job queue OK: {summary}",
+            check_id="automation.queue",
+            severity="info",
+        )
+    ]
+
+
 def collect_automation_architecture_diagnostics(
     hub_root: Path, *, durable: bool = True
 ) -> tuple[AutomationArchitectureDiagnostic, ...]:
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import math
-import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from ..process_table import ProcessCpuSampler
 from .process_snapshot import (
     ProcessCategory,
     collect_processes,
@@ -37,39 +37,18 @@ def _percentile(values: list[float], pct: float) -> float:
     return ordered[min(rank, len(ordered) - 1)]
 
 
+_PROCESS_CPU_SAMPLER = ProcessCpuSampler()
+
+
 def sample_cpu_for_pids(
     pids: list[int],
 ) -> dict[int, tuple[float, float]]:
-    if not pids:
-        return {}
-    pid_strs = ",".join(str(p) for p in pids)
-    try:
-        proc = subprocess.run(
-            ["ps", "-p", pid_strs, "-o", "pid=", "-o", "%cpu=", "-o", "rss="],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-    except OSError:
-        return {}
-    if proc.returncode != 0:
-        return {}
-    result: dict[int, tuple[float, float]] = {}
-    for line in proc.stdout.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        parts = line.split()
-        if len(parts) < 3:
-            continue
-        try:
-            pid = int(parts[0])
-            cpu_pct = float(parts[1])
-            rss_kb = float(parts[2])
-        except (ValueError, IndexError):
-            continue
-        result[pid] = (cpu_pct, rss_kb / 1024.0)
-    return result
+    """Return ``{pid: (cpu_percent, rss_mb)}``.
+
+    CPU% is measured since the previous call for the same pid, so periodic
+    samplers see current usage rather than a lifetime average.
+    """
+    return _PROCESS_CPU_SAMPLER.sample(pids)
 
 
 def collect_cpu_sample(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
 from ...manifest import load_manifest, load_manifest_with_issues
@@ -9,9 +10,18 @@ from ..destinations import (
     probe_docker_readiness,
     resolve_effective_repo_destination,
 )
+from ..hub_topology import (
+    GitStateCache,
+    HubTopologyRepository,
+    RepoSnapshotTiming,
+    build_repo_snapshots,
+)
 from ..orchestration.sqlite import collect_orchestration_control_plane_status
 from .types import DoctorCheck
 
+_SLOW_REPO_SNAPSHOT_MS = 2000.0
+_REPO_SNAPSHOT_REPORT_LIMIT = 5
+
 
 def hub_worktree_doctor_checks(hub_config: HubConfig) -> list[DoctorCheck]:
     """Check for unregistered worktrees under the hub worktrees root."""
@@ -293,8 +303,75 @@ def hub_control_plane_doctor_checks(hub_config: HubConfig) -> list[DoctorCheck]:
     return checks
 
 
+def hub_repo_snapshot_doctor_checks(hub_config: HubConfig) -> list[DoctorCheck]:
+    """Time repo snapshot collection and report the slowest repos."""
+    try:
+        _manifest, records = HubTopologyRepository(
+            hub_root=hub_config.root,
+            manifest_path=hub_config.manifest_path,
+        ).manifest_records()
+    except (ValueError, TypeError, OSError, RuntimeError) as exc:
+        return [
+            DoctorCheck(
+                name="Hub repo snapshot timing",
+                passed=False,
+                message=f"Failed to load hub manifest for snapshot timing: {exc}",
+                severity="warning",
+                check_id="hub.repo_snapshots",
+                fix=f"Validate manifest at {hub_config.manifest_path}",
+            )
+        ]
+
+    timings: list[RepoSnapshotTiming] = []
+    started = time.perf_counter()
+    build_repo_snapshots(records, git_state_cache=GitStateCache(), timings=timings)
+    total_ms = (time.perf_counter() - started) * 1000.0
+    slowest = sorted(timings, key=lambda timing: timing.elapsed_ms, reverse=True)
+    slowest_summary = ", ".join(
+        f"{timing.repo_id} ({timing.elapsed_ms:.0f}ms)"
+        for timing in slowest[:_REPO_SNAPSHOT_REPORT_LIMIT]
+    )
+    checks = [
+        DoctorCheck(
+            name="Hub repo snapshot timing",
+            passed=True,
+            message=(
+                f"Built {len(timings)} repo snapshot(s) in {total_ms:.0f}ms"
+                + (f"; slowest: {slowest_summary}" if slowest_summary else "")
+            ),
+            severity="info",
+            check_id="hub.repo_snapshots",
+        )
+    ]
+    slow = [timing for timing in slowest if timing.elapsed_ms >= _SLOW_REPO_SNAPSHOT_MS]
+    if slow:
+        checks.append(
+            DoctorCheck(
+                name="Hub repo snapshot timing",
+                passed=False,
+                message=(
+                    f"{len(slow)} repo snapshot(s) took at least "
+                    f"{_SLOW_REPO_SNAPSHOT_MS:.0f}ms: "
+                    + ", ".join(
+                        f"{timing.repo_id} ({timing.elapsed_ms:.0f}ms)"
+                        for timing in slow[:_REPO_SNAPSHOT_REPORT_LIMIT]
+                    )
+                ),
+                severity="warning",
+                check_id="hub.repo_snapshots",
+                fix=(
+                    "Check `git status` latency in the listed worktrees "
+                    "(large untracked trees, missing .gitignore entries, or "
+                    "slow filesystems)."
+                ),
+            )
+        )
+    return checks
+
+
 __all__ = [
     "hub_control_plane_doctor_checks",
     "hub_destination_doctor_checks",
+    "hub_repo_snapshot_doctor_checks",
     "hub_worktree_doctor_checks",
 ]
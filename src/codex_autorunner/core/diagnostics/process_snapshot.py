@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 import re
-import subprocess
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -10,6 +9,8 @@ from pathlib import Path
 from typing import Any, Callable, Optional
 
 from ...core.managed_processes import ProcessRecord, list_process_records
+from .. import process_table
+from ..process_table import ProcessEntry, format_elapsed
 
 
 class ProcessCategory(Enum):
@@ -196,66 +197,65 @@ def parse_ps_output(
         rss_kb: Optional[int] = None
         if rss_raw.isdigit():
             rss_kb = int(rss_raw)
-        category = classifier(command)
-        info = ProcessInfo(
-            pid=pid,
-            ppid=ppid,
-            pgid=pgid,
-            command=command,
-            category=category,
-            rss_kb=rss_kb,
-            elapsed=elapsed or None,
+        _add_process(
+            snapshot,
+            ProcessInfo(
+                pid=pid,
+                ppid=ppid,
+                pgid=pgid,
+                command=command,
+                category=classifier(command),
+                rss_kb=rss_kb,
+                elapsed=elapsed or None,
+            ),
         )
-        if category == ProcessCategory.CAR_SERVICE:
-            snapshot.car_service_processes.append(info)
-        elif category == ProcessCategory.OPENCODE:
-            snapshot.opencode_processes.append(info)
-        elif category == ProcessCategory.APP_SERVER:
-            snapshot.app_server_processes.append(info)
-        else:
-            snapshot.other_processes.append(info)
     return snapshot
 
 
-def get_ps_output() -> str:
-    try:
-        proc = subprocess.run(
-            [
-                "ps",
-                "-ax",
-                "-o",
-                "pid=",
-                "-o",
-                "ppid=",
-                "-o",
-                "pgid=",
-                "-o",
-                "rss=",
-                "-o",
-                "etime=",
-                "-o",
-                "command=",
-            ],
-            check=False,
-            capture_output=True,
-            text=True,
+def _add_process(snapshot: ProcessSnapshot, info: ProcessInfo) -> None:
+    if info.category == ProcessCategory.CAR_SERVICE:
+        snapshot.car_service_processes.append(info)
+    elif info.category == ProcessCategory.OPENCODE:
+        snapshot.opencode_processes.append(info)
+    elif info.category == ProcessCategory.APP_SERVER:
+        snapshot.app_server_processes.append(info)
+    else:
+        snapshot.other_processes.append(info)
+
+
+def snapshot_from_process_table(
+    entries: list[ProcessEntry],
+    classifier: Callable[[str], ProcessCategory] = _classify_process,
+) -> ProcessSnapshot:
+    snapshot = ProcessSnapshot()
+    for entry in entries:
+        if not entry.command:
+            continue
+        _add_process(
+            snapshot,
+            ProcessInfo(
+                pid=entry.pid,
+                ppid=entry.ppid,
+                pgid=entry.pgid,
+                command=entry.command,
+                category=classifier(entry.command),
+                rss_kb=entry.rss_kb,
+                elapsed=(
+                    format_elapsed(entry.elapsed_seconds)
+                    if entry.elapsed_seconds is not None
+                    else None
+                ),
+            ),
         )
-        if proc.returncode != 0:
-            return ""
-        return proc.stdout or ""
-    except OSError:
-        return ""
+    return snapshot
 
 
 def collect_processes(
     ps_output_getter: Optional[Callable[[], str]] = None,
 ) -> ProcessSnapshot:
-    output = ""
     if ps_output_getter is not None:
-        output = ps_output_getter()
-    else:
-        output = get_ps_output()
-    return parse_ps_output(output)
+        return parse_ps_output(ps_output_getter())
+    return snapshot_from_process_table(process_table.list_processes())
 
 
 def _find_record_for_pid(
@@ -10,6 +10,7 @@ from .hermes import hermes_doctor_checks
 from .hub import (
     hub_control_plane_doctor_checks,
     hub_destination_doctor_checks,
+    hub_repo_snapshot_doctor_checks,
     hub_worktree_doctor_checks,
 )
 from .pma import pma_doctor_checks
@@ -51,6 +52,10 @@ def runtime_doctor_providers(
             name="hub_destination",
             collect=lambda: hub_destination_doctor_checks(hub_config),
         ),
+        DoctorProvider(
+            name="hub_repo_snapshots",
+            collect=lambda: hub_repo_snapshot_doctor_checks(hub_config),
+        ),
         DoctorProvider(
             name="systemd",
             collect=lambda: linux_systemd_doctor_checks(hub_config),
@@ -0,0 +1,279 @@
+"""Group-commit buffering for high-volume flow event and telemetry writes.
+
+Streaming turns emit ``agent_stream_delta`` events and ``app_server_event``
+telemetry at wire rate. Writing each one through ``FlowStore.create_event`` costs
+a transaction (and an fsync in durable mode) plus a live-cap prune scan per row.
+``FlowEventBatch`` buffers those rows and commits them in one transaction per
+``max_events`` rows or ``max_latency_ms`` milliseconds, pruning each
+(run, event type) pair once per batch.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional
+
+from .models import FlowEvent
+
+if TYPE_CHECKING:
+    from .store import FlowStore
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_MAX_EVENTS = 64
+DEFAULT_BATCH_MAX_LATENCY_MS = 250
+
+FlowRowTable = Literal["flow_events", "flow_telemetry"]
+FlushCallback = Callable[[List[FlowEvent]], None]
+
+
+@dataclass(frozen=True)
+class PendingFlowRow:
+    """A flow event or telemetry row waiting to be inserted."""
+
+    table: FlowRowTable
+    row_id: str
+    run_id: str
+    event_type: str
+    timestamp: str
+    data_json: str
+    step_id: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.monotonic, compare=False)
+
+
+@dataclass(frozen=True)
+class FlowRowBatchResult:
+    events: List[FlowEvent]
+    pruned: int
+
+
+@dataclass
+class FlowEventBatchMetrics:
+    flushes: int = 0
+    rows_written: int = 0
+    rows_pruned: int = 0
+    flush_errors: int = 0
+    largest_batch: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+    total_flush_ms: float = 0.0
+    max_commit_delay_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        avg_flush_ms = self.total_flush_ms / self.flushes if self.flushes else 0.0
+        return {
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "rows_pruned": self.rows_pruned,
+            "flush_errors": self.flush_errors,
+            "largest_batch": self.largest_batch,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "max_flush_ms": round(self.max_flush_ms, 3),
+            "avg_flush_ms": round(avg_flush_ms, 3),
+            "max_commit_delay_ms": round(self.max_commit_delay_ms, 3),
+        }
+
+
+class FlowEventBatch:
+    """Buffered sink that group-commits flow rows from a background writer.
+
+    ``add_event``/``add_telemetry`` never touch SQLite; a writer thread commits
+    the buffer once it holds ``max_events`` rows or its oldest row is
+    ``max_latency_ms`` old. ``flush()`` commits synchronously on the caller's
+    thread and ``close()`` flushes, stops the writer and re-raises the last
+    write error, if any. ``on_flush`` receives the persisted events (from
+    ``RETURNING``) on whichever thread committed them.
+    """
+
+    def __init__(
+        self,
+        store: FlowStore,
+        *,
+        max_events: int = DEFAULT_BATCH_MAX_EVENTS,
+        max_latency_ms: int = DEFAULT_BATCH_MAX_LATENCY_MS,
+        on_flush: Optional[FlushCallback] = None,
+    ) -> None:
+        self._store = store
+        self._max_events = max(1, int(max_events))
+        self._max_latency = max(0, int(max_latency_ms)) / 1000.0
+        self._on_flush = on_flush
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending: List[PendingFlowRow] = []
+        self._closed = False
+        self._last_error: Optional[sqlite3.Error] = None
+        self._metrics = FlowEventBatchMetrics()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="flow-event-batch", daemon=True
+        )
+        self._writer.start()
+
+    def __enter__(self) -> FlowEventBatch:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    @property
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            payload = self._metrics.to_dict()
+            payload["pending"] = len(self._pending)
+        return payload
+
+    def add_event(
+        self,
+        event_id: str,
+        run_id: str,
+        event_type: Any,
+        data: Optional[Dict[str, Any]] = None,
+        step_id: Optional[str] = None,
+    ) -> None:
+        self._enqueue(
+            self._store.build_event_row(
+                event_id, run_id, event_type, data=data, step_id=step_id
+            )
+        )
+
+    def add_telemetry(
+        self,
+        telemetry_id: str,
+        run_id: str,
+        event_type: Any,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self._enqueue(
+            self._store.build_telemetry_row(telemetry_id, run_id, event_type, data=data)
+        )
+
+    def flush(self) -> List[FlowEvent]:
+        """Commit everything buffered so far on the calling thread."""
+        return self._drain(raise_errors=True)
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        self._drain(raise_errors=True)
+        with self._cond:
+            error = self._last_error
+            self._last_error = None
+        if error is not None:
+            raise error
+
+    def _enqueue(self, row: PendingFlowRow) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("FlowEventBatch is closed")
+            self._pending.append(row)
+            if len(self._pending) == 1 or len(self._pending) >= self._max_events:
+                self._cond.notify_all()
+
+    def _writer_loop(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    while not self._pending and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                    deadline = self._pending[0].enqueued_at + self._max_latency
+                    while (
+                        not self._closed
+                        and self._pending
+                        and len(self._pending) < self._max_events
+                    ):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    if self._closed:
+                        return
+                if not self._drain(raise_errors=False):
+                    with self._cond:
+                        failed = self._pending and self._last_error is not None
+                        if failed and not self._closed:
+                            # Back off before retrying rows requeued by a failed write.
+                            self._cond.wait(self._max_latency or 0.05)
+        finally:
+            # The writer thread owns its own FlowStore connection.
+            self._store.close()
+
+    def _drain(self, *, raise_errors: bool) -> List[FlowEvent]:
+        with self._write_lock:
+            with self._cond:
+                rows = self._pending
+                self._pending = []
+            if not rows:
+                return []
+            started = time.monotonic()
+            try:
+                result = self._store.write_event_batch(rows)
+            except sqlite3.Error as exc:
+                with self._cond:
+                    self._pending = rows + self._pending
+                    self._metrics.flush_errors += 1
+                    self._last_error = exc
+                if raise_errors:
+                    raise
+                _logger.warning(
+                    "Flow event batch write failed; %d rows requeued: %s",
+                    len(rows),
+                    exc,
+                )
+                return []
+            finished = time.monotonic()
+            with self._cond:
+                self._last_error = None
+                self._record_flush(rows, result, started=started, finished=finished)
+        if self._on_flush is not None and result.events:
+            try:
+                self._on_flush(result.events)
+            except (
+                Exception
+            ) as exc:  # intentional: listener failures must not poison the writer
+                _logger.exception("Error in flow event batch listener: %s", exc)
+        return result.events
+
+    def _record_flush(
+        self,
+        rows: List[PendingFlowRow],
+        result: FlowRowBatchResult,
+        *,
+        started: float,
+        finished: float,
+    ) -> None:
+        metrics = self._metrics
+        flush_ms = (finished - started) * 1000.0
+        metrics.flushes += 1
+        metrics.rows_written += len(rows)
+        metrics.rows_pruned += result.pruned
+        metrics.largest_batch = max(metrics.largest_batch, len(rows))
+        metrics.last_flush_ms = flush_ms
+        metrics.max_flush_ms = max(metrics.max_flush_ms, flush_ms)
+        metrics.total_flush_ms += flush_ms
+        oldest = min(row.enqueued_at for row in rows)
+        metrics.max_commit_delay_ms = max(
+            metrics.max_commit_delay_ms, (finished - oldest) * 1000.0
+        )
+
+
+__all__ = [
+    "DEFAULT_BATCH_MAX_EVENTS",
+    "DEFAULT_BATCH_MAX_LATENCY_MS",
+    "FlowEventBatch",
+    "FlowEventBatchMetrics",
+    "FlowRowBatchResult",
+    "PendingFlowRow",
+]
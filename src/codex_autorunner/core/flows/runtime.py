@@ -2,10 +2,12 @@ import inspect
 import logging
 import sqlite3
 import uuid
-from typing import Any, Callable, Dict, Optional, Set, cast
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, cast
 
 from ..lifecycle_events import LifecycleEventType
 from .definition import STEP_WANTS_EMIT_ATTR, FlowDefinition, StepFn, StepFn2, StepFn3
+from .event_batch import FlowEventBatch
 from .failure_diagnostics import (
     CANONICAL_FAILURE_REASON_CODE_FIELD,
     ensure_failure_payload,
@@ -32,6 +34,12 @@ LifecycleEventCallback = Optional[
     Callable[[LifecycleEventType, str, str, Dict[str, Any], str], None]
 ]
 
+# Wire-rate event types emitted while a step streams a turn; these are
+# group-committed through ``FlowStore.event_batch`` instead of one write each.
+_BATCHED_EVENT_TYPES = frozenset(
+    {FlowEventType.AGENT_STREAM_DELTA, FlowEventType.APP_SERVER_EVENT}
+)
+
 
 class FlowRuntime:
     def __init__(
@@ -46,6 +54,8 @@ class FlowRuntime:
         self.emit_event = emit_event
         self.emit_lifecycle_event = emit_lifecycle_event
         self._stop_check_interval = 0.5
+        self._event_batch: Optional[FlowEventBatch] = None
+        self.event_batch_metrics: Dict[str, Any] = {}
 
     def _build_transition_token(
         self, event_type: LifecycleEventType, record: FlowRunRecord
@@ -104,6 +114,27 @@ class FlowRuntime:
         data: Optional[Dict[str, Any]] = None,
         step_id: Optional[str] = None,
     ) -> None:
+        batch = self._event_batch
+        if batch is not None and event_type in _BATCHED_EVENT_TYPES:
+            if event_type == FlowEventType.APP_SERVER_EVENT:
+                batch.add_telemetry(
+                    telemetry_id=str(uuid.uuid4()),
+                    run_id=run_id,
+                    event_type=event_type,
+                    data=data or {},
+                )
+            else:
+                batch.add_event(
+                    event_id=str(uuid.uuid4()),
+                    run_id=run_id,
+                    event_type=event_type,
+                    data=data or {},
+                    step_id=step_id,
+                )
+            return
+        if batch is not None:
+            # Commit buffered stream rows first so seq order matches emit order.
+            batch.flush()
         if event_type == FlowEventType.APP_SERVER_EVENT:
             event = self.store.create_telemetry(
                 telemetry_id=str(uuid.uuid4()),
@@ -119,6 +150,9 @@ class FlowRuntime:
                 data=data or {},
                 step_id=step_id,
             )
+        self._notify_event(event)
+
+    def _notify_event(self, event: FlowEvent) -> None:
         if self.emit_event:
             try:
                 self.emit_event(event)
@@ -131,6 +165,32 @@ class FlowRuntime:
             ) as e:
                 _logger.exception("Error emitting event: %s", e)
 
+    def _notify_flushed_events(self, events: List[FlowEvent]) -> None:
+        for event in events:
+            self._notify_event(event)
+
+    @contextmanager
+    def _step_event_batch(self) -> Iterator[None]:
+        batch = self.store.event_batch(on_flush=self._notify_flushed_events)
+        self._event_batch = batch
+        step_failed = False
+        try:
+            yield
+        except BaseException:
+            step_failed = True
+            raise
+        finally:
+            self._event_batch = None
+            try:
+                batch.close()
+            except Exception:
+                if not step_failed:
+                    raise
+                # Keep the step's own exception; a flush error here is secondary.
+                _logger.exception("Error flushing flow events after step failure")
+            finally:
+                self.event_batch_metrics = batch.metrics()
+
     def _apply_transition(
         self,
         record: FlowRunRecord,
@@ -417,9 +477,10 @@ class FlowRuntime:
                 return len(positional) >= 3
 
             if _step_accepts_emit():
-                outcome = await cast(StepFn3, step_fn)(
-                    record, record.input_data, _bound_emit
-                )
+                with self._step_event_batch():
+                    outcome = await cast(StepFn3, step_fn)(
+                        record, record.input_data, _bound_emit
+                    )
             else:
                 outcome = await cast(StepFn2, step_fn)(record, record.input_data)
 
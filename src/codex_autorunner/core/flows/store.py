@@ -6,7 +6,7 @@ import sqlite3
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, cast
+from typing import Any, Dict, Generator, List, Optional, Sequence, cast
 
 from ..config import ConfigError, load_repo_config
 from ..sqlite_utils import (
@@ -20,6 +20,14 @@ from ..sqlite_utils import (
 from ..state_roots import resolve_repo_flows_db_path
 from ..time_utils import now_iso
 from .app_server_event_compaction import normalize_persisted_event_data
+from .event_batch import (
+    DEFAULT_BATCH_MAX_EVENTS,
+    DEFAULT_BATCH_MAX_LATENCY_MS,
+    FlowEventBatch,
+    FlowRowBatchResult,
+    FlushCallback,
+    PendingFlowRow,
+)
 from .models import (
     FlowArtifact,
     FlowEvent,
@@ -684,41 +692,144 @@ class FlowStore:
                 return None
             return self._row_to_flow_run(row)
 
-    def create_event(
+    def build_event_row(
         self,
         event_id: str,
         run_id: str,
         event_type: FlowEventType,
         data: Optional[Dict[str, Any]] = None,
         step_id: Optional[str] = None,
-    ) -> FlowEvent:
-        timestamp = now_iso()
+    ) -> PendingFlowRow:
         normalized_data = normalize_persisted_event_data(event_type, data)
+        return PendingFlowRow(
+            table="flow_events",
+            row_id=event_id,
+            run_id=run_id,
+            event_type=event_type.value,
+            timestamp=now_iso(),
+            data_json=json.dumps(normalized_data),
+            step_id=step_id,
+        )
 
-        with self.transaction() as conn:
-            conn.execute(
+    def build_telemetry_row(
+        self,
+        telemetry_id: str,
+        run_id: str,
+        event_type: FlowEventType,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> PendingFlowRow:
+        return PendingFlowRow(
+            table="flow_telemetry",
+            row_id=telemetry_id,
+            run_id=run_id,
+            event_type=event_type.value,
+            timestamp=now_iso(),
+            data_json=json.dumps(dict(data or {})),
+        )
+
+    def _insert_flow_row(
+        self, conn: sqlite3.Connection, row: PendingFlowRow
+    ) -> FlowEvent:
+        if row.table == "flow_events":
+            inserted = conn.execute(
                 """
                 INSERT INTO flow_events (id, run_id, event_type, timestamp, data, step_id)
                 VALUES (?, ?, ?, ?, ?, ?)
+                RETURNING *
                 """,
                 (
-                    event_id,
-                    run_id,
-                    event_type.value,
-                    timestamp,
-                    json.dumps(normalized_data),
-                    step_id,
+                    row.row_id,
+                    row.run_id,
+                    row.event_type,
+                    row.timestamp,
+                    row.data_json,
+                    row.step_id,
                 ),
-            )
-            self._enforce_live_event_cap(conn, run_id=run_id, event_type=event_type)
-            row = conn.execute(
-                "SELECT * FROM flow_events WHERE id = ?", (event_id,)
             ).fetchone()
+            if inserted is None:
+                raise RuntimeError("Failed to persist flow event")
+            return self._row_to_flow_event(inserted)
+        inserted = conn.execute(
+            """
+            INSERT INTO flow_telemetry (id, run_id, event_type, timestamp, data)
+            VALUES (?, ?, ?, ?, ?)
+            RETURNING *
+            """,
+            (row.row_id, row.run_id, row.event_type, row.timestamp, row.data_json),
+        ).fetchone()
+        if inserted is None:
+            raise RuntimeError("Failed to persist flow telemetry")
+        return self._row_to_flow_telemetry(inserted)
 
-        if row is None:
-            raise RuntimeError("Failed to persist flow event")
+    def _enforce_live_row_cap(
+        self, conn: sqlite3.Connection, *, table_name: str, run_id: str, event_type: str
+    ) -> int:
+        caps = (
+            _FLOW_EVENT_TYPE_LIVE_CAPS
+            if table_name == "flow_events"
+            else _FLOW_TELEMETRY_TYPE_LIVE_CAPS
+        )
+        max_rows = caps.get(event_type)
+        if max_rows is None:
+            return 0
+        return self._prune_rows_for_run_event_type(
+            conn,
+            table_name=table_name,
+            run_id=run_id,
+            event_type=event_type,
+            max_rows=max_rows,
+        )
 
-        return self._row_to_flow_event(row)
+    def write_event_batch(self, rows: Sequence[PendingFlowRow]) -> FlowRowBatchResult:
+        """Insert buffered rows in one transaction, pruning each capped stream once."""
+        if not rows:
+            return FlowRowBatchResult(events=[], pruned=0)
+        events: List[FlowEvent] = []
+        pruned = 0
+        with self.transaction() as conn:
+            for row in rows:
+                events.append(self._insert_flow_row(conn, row))
+            prune_keys = dict.fromkeys(
+                (row.table, row.run_id, row.event_type) for row in rows
+            )
+            for table_name, run_id, event_type in prune_keys:
+                pruned += self._enforce_live_row_cap(
+                    conn, table_name=table_name, run_id=run_id, event_type=event_type
+                )
+        return FlowRowBatchResult(events=events, pruned=pruned)
+
+    def event_batch(
+        self,
+        *,
+        max_events: int = DEFAULT_BATCH_MAX_EVENTS,
+        max_latency_ms: int = DEFAULT_BATCH_MAX_LATENCY_MS,
+        on_flush: Optional[FlushCallback] = None,
+    ) -> FlowEventBatch:
+        """Open a group-commit sink for hot-path events and telemetry."""
+        if self._readonly:
+            raise RuntimeError("FlowStore is read-only")
+        return FlowEventBatch(
+            self,
+            max_events=max_events,
+            max_latency_ms=max_latency_ms,
+            on_flush=on_flush,
+        )
+
+    def create_event(
+        self,
+        event_id: str,
+        run_id: str,
+        event_type: FlowEventType,
+        data: Optional[Dict[str, Any]] = None,
+        step_id: Optional[str] = None,
+    ) -> FlowEvent:
+        row = self.build_event_row(
+            event_id, run_id, event_type, data=data, step_id=step_id
+        )
+        with self.transaction() as conn:
+            event = self._insert_flow_row(conn, row)
+            self._enforce_live_event_cap(conn, run_id=run_id, event_type=event_type)
+        return event
 
     def get_events(
         self,
@@ -933,32 +1044,11 @@ class FlowStore:
         event_type: FlowEventType,
         data: Optional[Dict[str, Any]] = None,
     ) -> FlowEvent:
-        timestamp = now_iso()
-        normalized_data = dict(data or {})
-
+        row = self.build_telemetry_row(telemetry_id, run_id, event_type, data=data)
         with self.transaction() as conn:
-            conn.execute(
-                """
-                INSERT INTO flow_telemetry (id, run_id, event_type, timestamp, data)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    telemetry_id,
-                    run_id,
-                    event_type.value,
-                    timestamp,
-                    json.dumps(normalized_data),
-                ),
-            )
+            event = self._insert_flow_row(conn, row)
             self._enforce_live_telemetry_cap(conn, run_id=run_id, event_type=event_type)
-            row = conn.execute(
-                "SELECT * FROM flow_telemetry WHERE id = ?", (telemetry_id,)
-            ).fetchone()
-
-        if row is None:
-            raise RuntimeError("Failed to persist flow telemetry")
-
-        return self._row_to_flow_telemetry(row)
+        return event
 
     def get_telemetry(
         self,
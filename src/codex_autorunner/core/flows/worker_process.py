@@ -13,6 +13,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import IO, Any, Literal, Optional, Tuple
 
+from .. import process_table
 from ..text_utils import _iso_now, _pid_is_running
 from ..utils import resolve_executable
 
@@ -307,37 +308,7 @@ def _build_worker_cmd(entrypoint: str, run_id: str, repo_root: Path) -> list[str
 
 
 def _read_process_cmdline(pid: int) -> list[str] | None:
-    proc_path = Path(f"/proc/{pid}/cmdline")
-    if proc_path.exists():
-        try:
-            raw = proc_path.read_bytes()
-            return [part for part in raw.decode().split("\0") if part]
-        except OSError:
-            pass
-
-    try:
-        # Use wide output first to avoid truncating long command lines (notably on macOS/BSD).
-        out = subprocess.check_output(
-            ["ps", "-ww", "-p", str(pid), "-o", "command="],
-            stderr=subprocess.DEVNULL,
-        )
-        cmd = out.decode().strip()
-        if cmd:
-            return cmd.split()
-    except (subprocess.SubprocessError, OSError):
-        pass
-
-    try:
-        out = subprocess.check_output(
-            ["ps", "-p", str(pid), "-o", "command="],
-            stderr=subprocess.DEVNULL,
-        )
-        cmd = out.decode().strip()
-        if cmd:
-            return cmd.split()
-    except (subprocess.SubprocessError, OSError, ValueError):
-        return None
-    return None
+    return process_table.read_cmdline(pid)
 
 
 def _iso_from_epoch(value: float) -> str:
@@ -368,51 +339,22 @@ def _latest_log_activity_at(artifacts_dir: Path) -> Optional[str]:
 
 
 def _read_process_group_rows(pgid: int) -> list[dict[str, Any]]:
-    if pgid <= 0:
-        return []
-    try:
-        out = subprocess.check_output(
-            ["ps", "-ww", "-g", str(pgid), "-o", "pid=,ppid=,pgid=,etimes=,command="],
-            stderr=subprocess.DEVNULL,
-        )
-    except (subprocess.SubprocessError, OSError, ValueError):
-        try:
-            out = subprocess.check_output(
-                ["ps", "-ww", "-g", str(pgid), "-o", "pid=,ppid=,pgid=,command="],
-                stderr=subprocess.DEVNULL,
-            )
-        except (subprocess.SubprocessError, OSError, ValueError):
-            return []
-        has_elapsed = False
-    else:
-        has_elapsed = True
-
     rows: list[dict[str, Any]] = []
-    for raw_line in out.decode(errors="replace").splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-        parts = line.split(maxsplit=4 if has_elapsed else 3)
-        expected_parts = 5 if has_elapsed else 4
-        if len(parts) < expected_parts:
-            continue
-        try:
-            pid = int(parts[0])
-            ppid = int(parts[1])
-            row_pgid = int(parts[2])
-            elapsed = int(parts[3]) if has_elapsed else None
-        except ValueError:
-            continue
-        command = parts[4] if has_elapsed else parts[3]
-        if row_pgid != pgid or not command.strip():
+    for entry in process_table.processes_in_group(pgid) or []:
+        command = entry.command.strip()
+        if not command:
             continue
         rows.append(
             {
-                "pid": pid,
-                "ppid": ppid,
-                "pgid": row_pgid,
-                "elapsed_seconds": elapsed,
-                "command": command.strip(),
+                "pid": entry.pid,
+                "ppid": entry.ppid,
+                "pgid": entry.pgid,
+                "elapsed_seconds": (
+                    int(entry.elapsed_seconds)
+                    if entry.elapsed_seconds is not None
+                    else None
+                ),
+                "command": command,
             }
         )
     return rows
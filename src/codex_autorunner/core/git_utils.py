@@ -5,8 +5,13 @@ Centralized Git utilities for consistent git operations across the codebase.
 import hashlib
 import os
 import subprocess
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from stat import S_ISDIR, S_ISLNK, S_ISREG
 from typing import Any, Iterator, List, Optional
 
 from .locks import file_lock
@@ -101,20 +106,108 @@ def _run_git_stdout(args: List[str], *, workspace_root: Path) -> str:
     return proc.stdout or ""
 
 
-def _untracked_file_fingerprint(path: Path) -> str:
-    try:
-        stat = path.lstat()
-        if path.is_symlink():
-            payload = f"symlink:{path.readlink()}".encode(
-                "utf-8", errors="surrogateescape"
+# Dirty paths whose mtime falls this close to the moment they were hashed are
+# re-hashed on the next call: a write landing in the same timestamp tick would
+# otherwise leave the (mtime, size, inode) key unchanged ("racy git").
+_FINGERPRINT_RACY_WINDOW_NS = 2_000_000_000
+_FINGERPRINT_CACHE_MAX_WORKSPACES = 64
+_FINGERPRINT_HASH_CHUNK_BYTES = 1024 * 1024
+
+_FingerprintStatKey = tuple[int, int, int, int]
+
+
+@dataclass
+class _CachedPathFingerprint:
+    stat_key: _FingerprintStatKey
+    hashed_at_ns: int
+    fingerprint: str
+
+
+class _WorkspaceFingerprintCache:
+    """Per-workspace content hashes for dirty paths, keyed by stat tuple."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, _CachedPathFingerprint] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self, workspace_root: Path, rel_path: str) -> str:
+        path = workspace_root / rel_path
+        try:
+            stat = path.lstat()
+        except OSError as exc:
+            with self._lock:
+                self._entries.pop(rel_path, None)
+            return f"unreadable:{type(exc).__name__}"
+        stat_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_mode)
+        with self._lock:
+            cached = self._entries.get(rel_path)
+            if (
+                cached is not None
+                and cached.stat_key == stat_key
+                and stat.st_mtime_ns + _FINGERPRINT_RACY_WINDOW_NS < cached.hashed_at_ns
+            ):
+                self.hits += 1
+                return cached.fingerprint
+            self.misses += 1
+        hashed_at_ns = time.time_ns()
+        fingerprint = _path_content_fingerprint(path, stat)
+        with self._lock:
+            self._entries[rel_path] = _CachedPathFingerprint(
+                stat_key=stat_key,
+                hashed_at_ns=hashed_at_ns,
+                fingerprint=fingerprint,
             )
-        elif path.is_file():
-            payload = path.read_bytes()
+        return fingerprint
+
+    def retain(self, rel_paths: set[str]) -> None:
+        """Drop entries for paths that are no longer dirty."""
+        with self._lock:
+            for rel_path in [key for key in self._entries if key not in rel_paths]:
+                del self._entries[rel_path]
+
+
+_FINGERPRINT_CACHES: "OrderedDict[str, _WorkspaceFingerprintCache]" = OrderedDict()
+_FINGERPRINT_CACHES_LOCK = threading.Lock()
+
+
+def _workspace_fingerprint_cache(workspace_root: Path) -> _WorkspaceFingerprintCache:
+    key = str(workspace_root.resolve())
+    with _FINGERPRINT_CACHES_LOCK:
+        cache = _FINGERPRINT_CACHES.get(key)
+        if cache is None:
+            cache = _WorkspaceFingerprintCache()
+            _FINGERPRINT_CACHES[key] = cache
+            while len(_FINGERPRINT_CACHES) > _FINGERPRINT_CACHE_MAX_WORKSPACES:
+                _FINGERPRINT_CACHES.popitem(last=False)
         else:
-            payload = b""
-        content_hash = hashlib.sha256(payload).hexdigest()
-        return f"{stat.st_mode}:{stat.st_size}:{content_hash}"
-    except OSError as exc:
+            _FINGERPRINT_CACHES.move_to_end(key)
+        return cache
+
+
+def _path_content_fingerprint(path: Path, stat: os.stat_result) -> str:
+    try:
+        content_hash = hashlib.sha256()
+        if S_ISLNK(stat.st_mode):
+            content_hash.update(
+                f"symlink:{path.readlink()}".encode("utf-8", errors="surrogateescape")
+            )
+        elif S_ISREG(stat.st_mode):
+            with path.open("rb") as handle:
+                for chunk in iter(
+                    lambda: handle.read(_FINGERPRINT_HASH_CHUNK_BYTES), b""
+                ):
+                    content_hash.update(chunk)
+        elif S_ISDIR(stat.st_mode) and (path / ".git").exists():
+            # Submodule checkout: its HEAD stands in for the gitlink content.
+            content_hash.update(
+                _run_git_stdout(["rev-parse", "HEAD"], workspace_root=path).encode(
+                    "utf-8"
+                )
+            )
+        return f"{stat.st_mode}:{stat.st_size}:{content_hash.hexdigest()}"
+    except (OSError, GitError) as exc:
         return f"unreadable:{type(exc).__name__}"
 
 
@@ -122,64 +215,122 @@ def _is_control_plane_path(rel_path: str) -> bool:
     return rel_path == ".codex-autorunner" or rel_path.startswith(".codex-autorunner/")
 
 
+@dataclass(frozen=True)
+class _PorcelainV2Status:
+    head: Optional[str]
+    entries: tuple[bytes, ...]
+    status_lines: tuple[str, ...]
+    worktree_paths: tuple[str, ...]
+
+
+def _parse_porcelain_v2_status(raw: bytes) -> _PorcelainV2Status:
+    """Parse ``git status --porcelain=v2 --branch -z`` output.
+
+    ``worktree_paths`` lists paths whose worktree content differs from the
+    index (plus untracked files); staged content is already pinned by the
+    index object ids carried in each entry.
+    """
+    head: Optional[str] = None
+    entries: list[bytes] = []
+    status_lines: list[str] = []
+    worktree_paths: list[str] = []
+    fields = iter(raw.split(b"\0"))
+    for field in fields:
+        if not field:
+            continue
+        if field.startswith(b"# "):
+            if field.startswith(b"# branch.oid "):
+                oid = field[len(b"# branch.oid ") :].decode("ascii").strip()
+                head = None if oid == "(initial)" else oid
+            continue
+        kind = field[:1]
+        if kind == b"?":
+            rel_path = os.fsdecode(field[2:])
+            if _is_control_plane_path(rel_path):
+                continue
+            entries.append(field)
+            status_lines.append(f"?? {rel_path}")
+            worktree_paths.append(rel_path)
+            continue
+        if kind == b"!":
+            continue
+        if kind == b"1":
+            parts = field.split(b" ", 8)
+        elif kind == b"2":
+            parts = field.split(b" ", 9)
+            orig_path = next(fields, b"")
+            field = field + b"\0" + orig_path
+        elif kind == b"u":
+            parts = field.split(b" ", 10)
+        else:
+            continue
+        entries.append(field)
+        xy = parts[1].decode("ascii").replace(".", " ")
+        rel_path = os.fsdecode(parts[-1])
+        if kind == b"2":
+            status_lines.append(f"{xy} {os.fsdecode(orig_path)} -> {rel_path}")
+        else:
+            status_lines.append(f"{xy} {rel_path}")
+        if kind == b"u" or xy[1] != " ":
+            worktree_paths.append(rel_path)
+    return _PorcelainV2Status(
+        head=head,
+        entries=tuple(entries),
+        status_lines=tuple(status_lines),
+        worktree_paths=tuple(worktree_paths),
+    )
+
+
 def git_content_sensitive_repo_fingerprint(workspace_root: Path) -> Optional[str]:
-    """Return HEAD, status, and content hashes for dirty repository state."""
+    """Return HEAD, status, and content hashes for dirty repository state.
+
+    A single ``git status --porcelain=v2`` call supplies HEAD, the index
+    object id of every staged change, and the set of paths whose worktree
+    content differs from the index. Only those paths are hashed, and a hash
+    is reused while the file's (mtime, size, inode, mode) stat tuple is
+    unchanged, so repeated calls on a large dirty worktree stay cheap.
+    """
     try:
-        head = _run_git_stdout(
-            ["rev-parse", "HEAD"], workspace_root=workspace_root
-        ).strip()
-        if not head:
-            return None
-
-        status = _run_git_stdout(
-            ["status", "--porcelain"], workspace_root=workspace_root
-        ).strip()
-        staged_diff = _run_git_stdout(
-            ["diff", "--cached", "--full-index", "--binary"],
-            workspace_root=workspace_root,
-        )
-        worktree_diff = _run_git_stdout(
-            ["diff", "--full-index", "--binary"],
-            workspace_root=workspace_root,
-        )
-        untracked_proc = _run_git_bytes(
-            ["ls-files", "--others", "--exclude-standard", "-z"],
+        status_proc = _run_git_bytes(
+            [
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                "--untracked-files=all",
+                "-z",
+            ],
             cwd=workspace_root,
             check=True,
         )
-    except (GitError, UnicodeDecodeError):
+        status = _parse_porcelain_v2_status(status_proc.stdout or b"")
+    except (GitError, UnicodeDecodeError, IndexError):
+        return None
+    if not status.head:
         return None
 
+    cache = _workspace_fingerprint_cache(workspace_root)
     digest = hashlib.sha256()
-    for label, value in (
-        ("head", head),
-        ("status", status),
-        ("staged", staged_diff),
-        ("worktree", worktree_diff),
-    ):
-        digest.update(label.encode("utf-8"))
+    digest.update(b"head\0")
+    digest.update(status.head.encode("utf-8"))
+    digest.update(b"\0")
+    for entry in status.entries:
+        digest.update(b"entry\0")
+        digest.update(entry)
         digest.update(b"\0")
-        digest.update(value.encode("utf-8", errors="surrogateescape"))
-        digest.update(b"\0")
-
-    untracked_paths = sorted(
-        path for path in (untracked_proc.stdout or b"").split(b"\0") if path
-    )
-    for rel_path_bytes in untracked_paths:
-        rel_path = os.fsdecode(rel_path_bytes)
-        if _is_control_plane_path(rel_path):
-            continue
-        digest.update(b"untracked\0")
-        digest.update(rel_path_bytes)
+    for rel_path in status.worktree_paths:
+        digest.update(b"worktree\0")
+        digest.update(os.fsencode(rel_path))
         digest.update(b"\0")
         digest.update(
-            _untracked_file_fingerprint(workspace_root / rel_path).encode(
+            cache.fingerprint(workspace_root, rel_path).encode(
                 "utf-8", errors="surrogateescape"
             )
         )
         digest.update(b"\0")
+    cache.retain(set(status.worktree_paths))
 
-    return f"{head}\n{status}\ncontent:{digest.hexdigest()}"
+    status_text = "\n".join(status.status_lines)
+    return f"{status.head}\n{status_text}\ncontent:{digest.hexdigest()}"
 
 
 def git_linked_worktree_git_dir(repo_root: Path) -> Optional[Path]:
@@ -25,9 +25,11 @@ from .lifecycle_events import (
     LifecycleEventEmitter,
     LifecycleEventStore,
 )
+from .orchestration.notification_bus import TOPIC_AUTOMATION, TOPIC_LIFECYCLE, subscribe
 from .text_utils import _parse_iso_timestamp
 
 LIFECYCLE_RETRY_METADATA_KEY = "lifecycle_retry"
+AUTOMATION_WORKER_MAX_CONCURRENCY = 4
 
 
 class LifecycleEventStoreProtocol(Protocol):
@@ -370,7 +372,9 @@ class HubLifecycleOrchestrator:
             automation_executor_registry or AutomationExecutorRegistry()
         )
         self._automation_job_worker = AutomationJobWorker(
-            self._automation_store, self._automation_executor_registry
+            self._automation_store,
+            self._automation_executor_registry,
+            max_workers=AUTOMATION_WORKER_MAX_CONCURRENCY,
         )
         self._lifecycle_router = LifecycleEventRouter(
             hub_config=hub_config,
@@ -399,6 +403,7 @@ class HubLifecycleOrchestrator:
             logger=logger,
         )
         self._logger = logger or logging.getLogger("codex_autorunner.hub")
+        self._bus_unsubscribers: list[Callable[[], None]] = []
 
     @property
     def lifecycle_emitter(self) -> LifecycleEventEmitter:
@@ -409,9 +414,20 @@ class HubLifecycleOrchestrator:
         return self._lifecycle_emitter._store
 
     def startup(self) -> None:
+        # Lifecycle events and automation jobs are also written by flow
+        # workers, chat services and CLI processes; their commits ring the
+        # notification bus so the worker does not wait out its poll interval.
+        hub_root = self._hub_config.root
+        self._bus_unsubscribers = [
+            subscribe(hub_root, TOPIC_LIFECYCLE, self._on_bus_ring),
+            subscribe(hub_root, TOPIC_AUTOMATION, self._on_bus_ring),
+        ]
         self._lifecycle_worker.start()
 
     def shutdown(self) -> None:
+        unsubscribers, self._bus_unsubscribers = self._bus_unsubscribers, []
+        for unsubscribe in unsubscribers:
+            unsubscribe()
         self._lifecycle_worker.stop()
         from ..tickets.outbox import set_lifecycle_emitter
 
@@ -477,6 +493,9 @@ class HubLifecycleOrchestrator:
     def wake_worker(self) -> None:
         self._lifecycle_worker.wake()
 
+    def _on_bus_ring(self, _topic: str) -> None:
+        self._lifecycle_worker.wake()
+
     def _process_lifecycle_event(self, event: LifecycleEvent) -> None:
         self._lifecycle_router.route_event(event)
 
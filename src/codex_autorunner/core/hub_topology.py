@@ -4,6 +4,10 @@ import dataclasses
 import enum
 import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
 
@@ -31,6 +35,14 @@ from .utils import atomic_write
 
 logger = logging.getLogger("codex_autorunner.hub_topology")
 
+# Snapshot collection is dominated by ``git`` subprocesses and runner state DB
+# reads, both of which release the GIL, so a small pool hides most of the
+# per-repo latency without spawning a git process per repo at once.
+_REPO_SNAPSHOT_MAX_WORKERS = 8
+# ``.git/index`` and ``HEAD`` change on staging, commits, and checkouts but not
+# on edits to tracked files, so cached cleanliness is also bounded by age.
+_GIT_STATE_CACHE_TTL_SECONDS = 30.0
+
 
 class RepoTopologyRecord(Protocol):
     repo: ManifestRepo
@@ -269,6 +281,7 @@ class HubTopologyRepository:
     def __init__(self, *, hub_root: Path, manifest_path: Path) -> None:
         self._hub_root = hub_root
         self._manifest_path = manifest_path
+        self._last_snapshot_timings: List[RepoSnapshotTiming] = []
 
     def load_manifest(self) -> Manifest:
         return load_manifest(self._manifest_path, self._hub_root)
@@ -334,9 +347,19 @@ class HubTopologyRepository:
             if records is not None
             else [self._record_for_repo(entry) for entry in resolved_manifest.repos]
         )
+        timings: List[RepoSnapshotTiming] = []
+        started = time.perf_counter()
         repos, pinned_parent_repo_ids = build_full_topology(
             resolved_records,
             existing_pinned_parent_repo_ids,
+            timings=timings,
+        )
+        self._last_snapshot_timings = timings
+        logger.debug(
+            "Built %d repo snapshots in %.1fms (git cache hits: %d)",
+            len(timings),
+            (time.perf_counter() - started) * 1000.0,
+            sum(1 for timing in timings if timing.git_cache_hit),
         )
         return HubState(
             last_scan_at=last_scan_at,
@@ -353,6 +376,10 @@ class HubTopologyRepository:
         repos_by_id = {entry.id: entry for entry in manifest.repos}
         return build_repo_snapshot(record, repos_by_id)
 
+    def last_snapshot_timings(self) -> List[RepoSnapshotTiming]:
+        """Per-repo timings from the most recent ``build_hub_state`` call."""
+        return list(self._last_snapshot_timings)
+
     @property
     def hub_root(self) -> Path:
         return self._hub_root
@@ -540,6 +567,103 @@ class HubTopologyRepository:
         )
 
 
+@dataclasses.dataclass(frozen=True)
+class RepoSnapshotTiming:
+    repo_id: str
+    elapsed_ms: float
+    git_cache_hit: bool
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "repo_id": self.repo_id,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+            "git_cache_hit": self.git_cache_hit,
+        }
+
+
+def _resolve_git_dir(repo_path: Path) -> Optional[Path]:
+    dot_git = repo_path / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content[len("gitdir:") :].strip())
+    return git_dir if git_dir.is_absolute() else (repo_path / git_dir)
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class GitStateCache:
+    """Cache ``git_available``/``git_is_clean`` results per worktree.
+
+    Entries are keyed by the stat of the worktree's git index and ``HEAD``
+    plus the worktree root directory (which catches new top-level untracked
+    files). While the key is unchanged and the entry is younger than
+    ``ttl_seconds`` the cached result is returned without running git.
+    """
+
+    def __init__(self, *, ttl_seconds: float = _GIT_STATE_CACHE_TTL_SECONDS) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[Path, Tuple[Tuple[Any, ...], float, Optional[bool]]] = {}
+
+    def is_clean(self, repo_path: Path) -> Tuple[Optional[bool], bool]:
+        """Return ``(is_clean, cache_hit)``; ``is_clean`` is None outside git."""
+        key = self._key(repo_path)
+        if key is None:
+            return None, False
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(repo_path)
+        if (
+            cached is not None
+            and cached[0] == key
+            and now - cached[1] < self._ttl_seconds
+        ):
+            return cached[2], True
+        is_clean: Optional[bool] = None
+        if git_available(repo_path):
+            is_clean = git_is_clean(repo_path)
+        # ``git status`` may refresh the index, so key the entry on the state
+        # it left behind rather than the state observed before running it.
+        refreshed_key = self._key(repo_path)
+        if refreshed_key is not None:
+            with self._lock:
+                self._entries[repo_path] = (refreshed_key, now, is_clean)
+        return is_clean, False
+
+    def invalidate(self, repo_path: Optional[Path] = None) -> None:
+        with self._lock:
+            if repo_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(repo_path, None)
+
+    @staticmethod
+    def _key(repo_path: Path) -> Optional[Tuple[Any, ...]]:
+        git_dir = _resolve_git_dir(repo_path)
+        if git_dir is None:
+            return None
+        return (
+            _stat_key(git_dir / "index"),
+            _stat_key(git_dir / "HEAD"),
+            _stat_key(repo_path),
+        )
+
+
+_GIT_STATE_CACHE = GitStateCache()
+
+
 def _safe_git_branch(workspace_root: Path) -> Optional[str]:
     if not workspace_root.exists():
         return None
@@ -654,7 +778,22 @@ def derive_repo_status(
 def build_repo_snapshot(
     record: RepoTopologyRecord,
     repos_by_id: Optional[Dict[str, ManifestRepo]] = None,
+    *,
+    git_state_cache: Optional[GitStateCache] = None,
 ) -> RepoSnapshot:
+    snapshot, _timing = _build_repo_snapshot_timed(
+        record, repos_by_id, git_state_cache=git_state_cache
+    )
+    return snapshot
+
+
+def _build_repo_snapshot_timed(
+    record: RepoTopologyRecord,
+    repos_by_id: Optional[Dict[str, ManifestRepo]],
+    *,
+    git_state_cache: Optional[GitStateCache],
+) -> Tuple[RepoSnapshot, RepoSnapshotTiming]:
+    started = time.perf_counter()
     repo_path = record.absolute_path
     lock_path = repo_path / ".codex-autorunner" / "lock"
     lock_status = read_lock_status(lock_path)
@@ -664,8 +803,11 @@ def build_repo_snapshot(
         runner_state = load_state(resolve_repo_runner_state_db_path(repo_path))
 
     is_clean: Optional[bool] = None
-    if record.exists_on_disk and git_available(repo_path):
-        is_clean = git_is_clean(repo_path)
+    git_cache_hit = False
+    if record.exists_on_disk:
+        is_clean, git_cache_hit = (git_state_cache or _GIT_STATE_CACHE).is_clean(
+            repo_path
+        )
 
     status = derive_repo_status(record, lock_status, runner_state)
     last_run_id = runner_state.last_run_id if runner_state else None
@@ -673,7 +815,7 @@ def build_repo_snapshot(
     effective_destination = resolve_effective_repo_destination(
         record.repo, repo_index
     ).to_dict()
-    return RepoSnapshot(
+    snapshot = RepoSnapshot(
         id=record.repo.id,
         path=repo_path,
         display_name=record.repo.display_name or repo_path.name or record.repo.id,
@@ -702,18 +844,53 @@ def build_repo_snapshot(
         effective_destination=effective_destination,
         archived=bool(record.repo.archived),
     )
+    timing = RepoSnapshotTiming(
+        repo_id=record.repo.id,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+        git_cache_hit=git_cache_hit,
+    )
+    return snapshot, timing
 
 
-def build_repo_snapshots(records: Sequence[RepoTopologyRecord]) -> List[RepoSnapshot]:
+def build_repo_snapshots(
+    records: Sequence[RepoTopologyRecord],
+    *,
+    max_workers: int = _REPO_SNAPSHOT_MAX_WORKERS,
+    git_state_cache: Optional[GitStateCache] = None,
+    timings: Optional[List[RepoSnapshotTiming]] = None,
+) -> List[RepoSnapshot]:
+    """Build snapshots for ``records`` in manifest order.
+
+    Repos are snapshotted concurrently on up to ``max_workers`` threads. When
+    ``timings`` is given it receives one entry per repo, in the same order.
+    """
     repos_by_id = {record.repo.id: record.repo for record in records}
-    return [build_repo_snapshot(record, repos_by_id) for record in records]
+
+    def _build(record: RepoTopologyRecord) -> Tuple[RepoSnapshot, RepoSnapshotTiming]:
+        return _build_repo_snapshot_timed(
+            record, repos_by_id, git_state_cache=git_state_cache
+        )
+
+    workers = max(1, min(max_workers, len(records)))
+    if workers == 1:
+        results = [_build(record) for record in records]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="car-repo-snapshot"
+        ) as executor:
+            results = list(executor.map(_build, records))
+    if timings is not None:
+        timings.extend(timing for _snapshot, timing in results)
+    return [snapshot for snapshot, _timing in results]
 
 
 def build_full_topology(
     records: Sequence[RepoTopologyRecord],
     existing_pinned_ids: List[str],
+    *,
+    timings: Optional[List[RepoSnapshotTiming]] = None,
 ) -> Tuple[List[RepoSnapshot], List[str]]:
-    snapshots = build_repo_snapshots(records)
+    snapshots = build_repo_snapshots(records, timings=timings)
     pinned = prune_pinned_parent_repo_ids(existing_pinned_ids, snapshots)
     return snapshots, pinned
 
@@ -9,6 +9,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from .orchestration.notification_bus import TOPIC_LIFECYCLE, ring
 from .orchestration.sqlite import (
     open_orchestration_sqlite,
     resolve_orchestration_sqlite_path,
@@ -327,7 +328,8 @@ class _OrchestrationLifecycleEventStore:
                     1 if event.processed else 0,
                 ),
             )
-            return LifecycleEventAppendResult(event=event, deduped=False)
+        ring(self._hub_root, TOPIC_LIFECYCLE)
+        return LifecycleEventAppendResult(event=event, deduped=False)
 
     def append(self, event: LifecycleEvent) -> None:
         self.append_with_result(event)
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import logging
 import os
-import subprocess
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Final, Mapping
 
+from .. import process_table
 from ..force_attestation import enforce_force_attestation
 from ..locks import process_command_matches
 from ..process_termination import terminate_record
@@ -35,19 +35,7 @@ _OWNER_PROCESS_CMD_HINTS: Final = ("codex_autorunner", "codex-autorunner", "car
 
 
 def _pid_is_zombie(pid: int) -> bool:
-    try:
-        result = subprocess.run(
-            ["ps", "-p", str(pid), "-o", "stat="],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-    except OSError:
-        return False
-    if result.returncode != 0:
-        return False
-    state = result.stdout.strip()
-    return state != "" and state.split()[0].startswith("Z")
+    return process_table.pid_is_zombie(pid)
 
 
 def _pid_is_running(pid: int) -> bool:
@@ -94,7 +82,7 @@ def _pgid_is_running(pgid: int) -> bool:
         return False
 
     # `killpg(..., 0)` can return non-zero for permission/other failures.
-    # Fall back to `ps` when available to avoid false positives for zombie
+    # Confirm against the process table to avoid false positives for zombie
     # process groups and provide a more deterministic liveness decision.
     try:
         os.killpg(pgid, 0)
@@ -105,27 +93,11 @@ def _pgid_is_running(pgid: int) -> bool:
     except OSError:
         return False
 
-    try:
-        result = subprocess.run(
-            ["ps", "-g", str(pgid), "-o", "pid=,stat="],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-    except OSError:
-        return True
-    if result.returncode != 0:
-        return False
-    for line in result.stdout.splitlines():
-        if not line.strip():
-            continue
-        fields = line.split()
-        if len(fields) < 2:
-            continue
-        if fields[1].startswith("Z"):
-            continue
+    members = process_table.processes_in_group(pgid)
+    if members is None:
+        # killpg succeeded and the table is unreadable: assume it is still alive.
         return True
-    return False
+    return any(not entry.is_zombie for entry in members)
 
 
 def _record_is_running(record: ProcessRecord) -> bool:
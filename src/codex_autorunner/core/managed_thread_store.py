@@ -67,6 +67,7 @@ from .orchestration.models import (
     normalize_resource_owner_fields,
     owner_fields_from_scope_ref,
 )
+from .orchestration.notification_bus import ring, thread_topic
 from .orchestration.runtime_bindings import (
     BACKEND_BINDING_BOUND,
     RuntimeThreadBinding,
@@ -514,6 +515,8 @@ class ManagedThreadStore:
                 payload={"thread": thread, "surface": surface, **dict(payload or {})},
                 occurred_at=occurred_at,
             )
+        # Live tails of this thread refresh on the ring instead of their poll.
+        ring(self._hub_root, thread_topic(managed_thread_id))
 
     def get_thread_runtime_binding(
         self, managed_thread_id: str
@@ -5,7 +5,7 @@ import logging
 import time
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Literal, Mapping, Optional, Union
+from typing import Any, Iterable, Literal, Mapping, Optional, Union
 
 from ..text_utils import _normalize_optional_text
 from ..time_utils import now_iso
@@ -270,6 +270,41 @@ class SQLiteChatSurfaceEventJournal:
             ).fetchall()
         return [_event_from_row(row) for row in rows]
 
+    def read_surface_history(
+        self,
+        surfaces: Iterable[tuple[str, str]],
+        *,
+        min_cursor: int = 0,
+    ) -> list[ChatSurfaceEvent]:
+        """Return events for ``surfaces`` at or after ``min_cursor``, oldest first.
+
+        With ``min_cursor`` set to the oldest cursor ``read_history`` would
+        return, this is exactly the subset of that window touching the given
+        surfaces.
+        """
+
+        surface_keys = sorted({(str(kind), str(key)) for kind, key in surfaces})
+        if not surface_keys:
+            return []
+        with open_orchestration_sqlite(
+            self._hub_root, durable=self._durable, migrate=True
+        ) as conn:
+            rows = conn.execute(
+                """
+                SELECT *
+                  FROM orch_chat_surface_events
+                 WHERE event_id >= ?
+                   AND (surface_kind, surface_key) IN (
+                       SELECT json_extract(value, '$[0]'),
+                              json_extract(value, '$[1]')
+                         FROM json_each(?)
+                   )
+                 ORDER BY event_id ASC
+                """,
+                (max(0, int(min_cursor)), json.dumps(surface_keys)),
+            ).fetchall()
+        return [_event_from_row(row) for row in rows]
+
 
 def normalize_chat_surface_event_type(value: Any) -> ChatSurfaceEventType:
     normalized = _normalize_required_text(value, "event_type")
@@ -36,7 +36,7 @@ DEFAULT_CHAT_SURFACE_EVENT_LIMIT = 100
 MAX_CHAT_SURFACE_EVENT_LIMIT = 1000
 DEFAULT_CHAT_INDEX_LIMIT = 50
 MAX_CHAT_INDEX_LIMIT = 200
-CHAT_INDEX_PROJECTION_SCHEMA_VERSION = "chat.index.projection.facets.v1"
+CHAT_INDEX_PROJECTION_SCHEMA_VERSION = "chat.index.projection.fts.v1"
 DEFAULT_CHAT_TIMELINE_LIMIT = 50
 MAX_CHAT_TIMELINE_LIMIT = 200
 MAX_CHAT_TIMELINE_PAGE_SOURCE_LIMIT = 1000
@@ -210,6 +210,117 @@ class ChatSurfaceProjection:
         }
 
 
+@dataclass(frozen=True)
+class _ChatIndexSourceCursors:
+    """High-water marks of the sources folded into the chat index projection."""
+
+    event_cursor: int = 0
+    event_window_floor: int = 0
+    change_cursor: int = 0
+    channel_directory_signature: str = ""
+
+    @classmethod
+    def from_meta(cls, meta: Mapping[str, str]) -> "_ChatIndexSourceCursors":
+        return cls(
+            event_cursor=max(0, _safe_int(meta.get("event_cursor"), 0)),
+            event_window_floor=max(0, _safe_int(meta.get("event_window_floor"), 0)),
+            change_cursor=max(0, _safe_int(meta.get("change_cursor"), 0)),
+            channel_directory_signature=str(
+                meta.get("channel_directory_signature") or ""
+            ),
+        )
+
+    def to_meta(self) -> dict[str, str]:
+        return {
+            "event_cursor": str(self.event_cursor),
+            "event_window_floor": str(self.event_window_floor),
+            "change_cursor": str(self.change_cursor),
+            "channel_directory_signature": self.channel_directory_signature,
+        }
+
+    @property
+    def signature(self) -> str:
+        return (
+            f"events:{self.event_cursor}:{self.event_window_floor}"
+            f"|changes:{self.change_cursor}"
+            f"|channel_directory:{self.channel_directory_signature}"
+        )
+
+
+@dataclass
+class _ChatIndexProjectionDelta:
+    """Sources that changed since the stored cursors, before scope expansion."""
+
+    stored: _ChatIndexSourceCursors
+    cursors: _ChatIndexSourceCursors
+    thread_ids: set[str] = field(default_factory=set)
+    surfaces: set[tuple[str, str]] = field(default_factory=set)
+    surface_variants: set[tuple[str, str]] = field(default_factory=set)
+    row_ids: set[str] = field(default_factory=set)
+    channel_directory_surfaces: Optional[list[tuple[str, str]]] = None
+
+    def add_surface(self, surface_kind: Any, surface_key: Any) -> None:
+        surface = _normalized_surface(surface_kind, surface_key)
+        if surface is None:
+            return
+        self.surfaces.add(surface)
+        raw = (str(surface_kind), str(surface_key))
+        if raw != surface:
+            self.surface_variants.add(raw)
+
+    def add_thread(self, managed_thread_id: Any) -> None:
+        thread_id = _normalize_text(managed_thread_id)
+        if thread_id is not None:
+            self.thread_ids.add(thread_id)
+
+
+@dataclass(frozen=True)
+class _ChatIndexProjectionScope:
+    """Closed set of threads and surfaces re-projected by an incremental pass.
+
+    Every surface that can fold into a scoped thread row, and every thread a
+    scoped surface can belong to, is in scope, so projecting only these
+    sources yields the same rows a full pass would produce for them.
+    ``surface_variants`` carries un-normalized spellings seen in source tables
+    so SQL filters still match them.
+    """
+
+    thread_ids: frozenset[str]
+    surfaces: frozenset[tuple[str, str]]
+    surface_variants: frozenset[tuple[str, str]] = frozenset()
+    event_floor: int = 0
+
+    def surface_query_keys(self) -> list[tuple[str, str]]:
+        return sorted(self.surfaces | self.surface_variants)
+
+    def thread_ids_json(self) -> str:
+        return json.dumps(sorted(self.thread_ids))
+
+    def surface_keys_json(self) -> str:
+        return json.dumps([list(key) for key in self.surface_query_keys()])
+
+    def notification_ids_json(self) -> str:
+        return _notification_ids_json(self.surfaces)
+
+    def includes_row(self, row: Mapping[str, Any]) -> bool:
+        managed_thread_id = _normalize_text(row.get("managed_thread_id"))
+        if managed_thread_id is not None:
+            return managed_thread_id in self.thread_ids
+        surface = row.get("surface")
+        if not isinstance(surface, Mapping):
+            return False
+        return (
+            _normalized_surface(surface.get("surface_kind"), surface.get("surface_key"))
+            in self.surfaces
+        )
+
+    def row_ids(self) -> set[str]:
+        return {f"thread:{thread_id}" for thread_id in self.thread_ids} | {
+            f"surface:{surface_kind}:{surface_key}"
+            for surface_kind, surface_key in self.surfaces
+        }
+
+
 class ChatSurfaceReadService:
     """Build protocol-neutral chat surface snapshots from orchestration facts."""
 
@@ -722,32 +833,34 @@ class ChatSurfaceReadService:
     def chat_index_projection_status(self) -> dict[str, Any]:
         """Return current SQL projection state without rebuilding it."""
 
-        source_signature = self._chat_index_source_signature()
         with open_orchestration_sqlite(
             self._hub_root, durable=self._durable, migrate=True
         ) as conn:
-            if not _table_exists(
-                conn, "orch_chat_index_projection"
-            ) or not _table_exists(conn, "orch_chat_index_projection_meta"):
-                return {
-                    "source_signature": source_signature,
-                    "stored_source_signature": None,
-                    "projection_schema_version": CHAT_INDEX_PROJECTION_SCHEMA_VERSION,
-                    "stored_projection_schema_version": None,
-                    "projection_revision": 0,
-                    "row_count": 0,
-                    "needs_rebuild": True,
-                }
-            meta = {str(row["key"]): str(row["value"]) for row in conn.execute("""
-                    SELECT key, value
-                      FROM orch_chat_index_projection_meta
-                     WHERE key IN ('source_signature', 'projection_revision', 'projection_schema_version')
-                    """).fetchall()}
-            row = conn.execute(
-                "SELECT COUNT(*) AS row_count FROM orch_chat_index_projection"
-            ).fetchone()
+            cursors = _chat_index_source_cursors(conn, self._hub_root)
+            meta: dict[str, str] = {}
+            row_count = 0
+            if _table_exists(conn, "orch_chat_index_projection") and _table_exists(
+                conn, "orch_chat_index_projection_meta"
+            ):
+                meta = _read_chat_index_projection_meta(conn)
+                row = conn.execute(
+                    "SELECT COUNT(*) AS row_count FROM orch_chat_index_projection"
+                ).fetchone()
+                row_count = int(row["row_count"] or 0) if row is not None else 0
+            stored = _ChatIndexSourceCursors.from_meta(meta)
+            pending_events = _count_rows_after(
+                conn, "orch_chat_surface_events", "event_id", stored.event_cursor
+            )
+            pending_changes = _count_rows_after(
+                conn,
+                "orch_chat_index_projection_changes",
+                "change_id",
+                stored.change_cursor,
+            )
+        source_signature = cursors.signature
         stored_signature = meta.get("source_signature")
         stored_projection_schema_version = meta.get("projection_schema_version")
+        needs_rebuild = _chat_index_projection_needs_rebuild(meta)
         return {
             "source_signature": source_signature,
             "stored_source_signature": stored_signature,
@@ -756,9 +869,15 @@ class ChatSurfaceReadService:
             "projection_revision": max(
                 0, _safe_int(meta.get("projection_revision"), 0)
             ),
-            "row_count": int(row["row_count"] or 0) if row is not None else 0,
-            "needs_rebuild": stored_signature != source_signature
-            or stored_projection_schema_version != CHAT_INDEX_PROJECTION_SCHEMA_VERSION,
+            "row_count": row_count,
+            "event_cursor": stored.event_cursor,
+            "latest_event_cursor": cursors.event_cursor,
+            "change_cursor": stored.change_cursor,
+            "latest_change_cursor": cursors.change_cursor,
+            "pending_events": pending_events,
+            "pending_changes": pending_changes,
+            "needs_rebuild": needs_rebuild,
+            "needs_refresh": needs_rebuild or stored_signature != source_signature,
         }
 
     def repair_stale_bound_surface_archive_state(
@@ -908,7 +1027,14 @@ class ChatSurfaceReadService:
 
     def rebuild_chat_index_projection(self) -> dict[str, Any]:
         before = self.chat_index_projection_status()
-        source_signature = self._chat_index_source_signature()
+        # Cursors are taken before sources are read so writes racing the
+        # rebuild stay pending and are re-applied by the next incremental pass.
+        with open_orchestration_sqlite(
+            self._hub_root, durable=self._durable, migrate=True
+        ) as conn:
+            cursors = _chat_index_source_cursors(conn, self._hub_root)
+        source_signature = cursors.signature
+        directory_surfaces = _channel_directory_surfaces(self._hub_root)
         surfaces = self._projected_surfaces(limit=None)
         rows = sorted(
             _chat_index_rows_from_surfaces(surfaces), key=_chat_index_sort_key
@@ -919,13 +1045,7 @@ class ChatSurfaceReadService:
         ) as conn:
             with conn:
                 _ensure_chat_index_projection_facet_schema(conn)
-                existing_meta = {
-                    str(row["key"]): str(row["value"]) for row in conn.execute("""
-                        SELECT key, value
-                          FROM orch_chat_index_projection_meta
-                         WHERE key IN ('source_signature', 'projection_revision', 'projection_schema_version')
-                        """).fetchall()
-                }
+                existing_meta = _read_chat_index_projection_meta(conn)
                 if (
                     existing_meta.get("source_signature") == source_signature
                     and existing_meta.get("projection_schema_version")
@@ -939,87 +1059,37 @@ class ChatSurfaceReadService:
                         _safe_int(existing_meta.get("projection_revision"), 0) + 1
                     )
                 conn.execute("DELETE FROM orch_chat_index_projection")
-                conn.executemany(
-                    """
-                    INSERT INTO orch_chat_index_projection (
-                        row_id,
-                        chat_id,
-                        managed_thread_id,
-                        surface_kinds_json,
-                        surface_kind_list,
-                        lifecycle_status,
-                        runtime_status,
-                        effective_status,
-                        queue_depth,
-                        unread_count,
-                        unread,
-                        last_visible_message_at,
-                        last_lifecycle_update_at,
-                        last_internal_update_at,
-                        last_sort_activity_at,
-                        last_activity_at,
-                        updated_at,
-                        created_at,
-                        repo_id,
-                        worktree_id,
-                        resource_kind,
-                        resource_id,
-                        ticket_id,
-                        run_id,
-                        group_id,
-                        facet_category,
-                        facet_turn_kind_list,
-                        facet_origin_kind_list,
-                        facet_transport_list,
-                        facet_scope_kind,
-                        facet_scope_id,
-                        facet_agent_kind,
-                        search_text,
-                        sort_unread_priority,
-                        sort_last_activity_desc,
-                        row_json,
-                        source_signature,
-                        rebuilt_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    [
-                        _chat_index_projection_params(
-                            row,
-                            source_signature=source_signature,
-                            rebuilt_at=rebuilt_at,
-                        )
-                        for row in rows
-                    ],
-                )
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO orch_chat_index_projection_meta (
-                        key,
-                        value,
-                        updated_at
-                    ) VALUES ('source_signature', ?, ?)
-                    """,
-                    (source_signature, rebuilt_at),
+                conn.execute("DELETE FROM orch_chat_index_projection_surfaces")
+                conn.execute("DELETE FROM orch_chat_index_projection_files")
+                if _chat_index_fts_available(conn):
+                    conn.execute("DELETE FROM orch_chat_index_projection_fts")
+                _write_chat_index_projection_rows(
+                    conn,
+                    rows,
+                    source_signature=source_signature,
+                    projected_at=rebuilt_at,
                 )
                 conn.execute(
                     """
-                    INSERT OR REPLACE INTO orch_chat_index_projection_meta (
-                        key,
-                        value,
-                        updated_at
-                    ) VALUES ('projection_revision', ?, ?)
+                    DELETE FROM orch_chat_index_projection_changes
+                     WHERE change_id <= ?
                     """,
-                    (str(projection_revision), rebuilt_at),
+                    (cursors.change_cursor,),
                 )
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO orch_chat_index_projection_meta (
-                        key,
-                        value,
-                        updated_at
-                    ) VALUES ('projection_schema_version', ?, ?)
-                    """,
-                    (CHAT_INDEX_PROJECTION_SCHEMA_VERSION, rebuilt_at),
+                _write_chat_index_projection_meta(
+                    conn,
+                    {
+                        **cursors.to_meta(),
+                        "source_signature": source_signature,
+                        "projection_revision": str(projection_revision),
+                        "projection_schema_version": (
+                            CHAT_INDEX_PROJECTION_SCHEMA_VERSION
+                        ),
+                        "channel_directory_surfaces": _surface_pairs_json(
+                            directory_surfaces
+                        ),
+                    },
+                    updated_at=rebuilt_at,
                 )
         return {
             "rebuilt": True,
@@ -1039,7 +1109,16 @@ class ChatSurfaceReadService:
         }
 
     def _ensure_chat_index_projection_current(self) -> None:
-        source_signature = self._chat_index_source_signature()
+        """Bring the projection up to date with the canonical sources.
+
+        A full rebuild only happens when the projection storage or schema
+        version is missing or stale. Otherwise only threads and surfaces named
+        by journal events, the trigger-fed change log, ticket files, or the
+        channel directory since the stored cursors are re-projected, so an
+        idle poll costs a handful of indexed lookups regardless of history.
+        """
+
+        delta: Optional[_ChatIndexProjectionDelta] = None
         with open_orchestration_sqlite(
             self._hub_root, durable=self._durable, migrate=True
         ) as conn:
@@ -1049,87 +1128,90 @@ class ChatSurfaceReadService:
                 needs_rebuild = True
             else:
                 storage_repaired = _ensure_chat_index_projection_facet_schema(conn)
-                rows = conn.execute("""
-                    SELECT key, value
-                      FROM orch_chat_index_projection_meta
-                     WHERE key IN ('source_signature', 'projection_schema_version')
-                    """).fetchall()
-                meta = {str(row["key"]): str(row["value"]) for row in rows}
+                meta = _read_chat_index_projection_meta(conn)
                 needs_rebuild = (
-                    storage_repaired
-                    or meta.get("source_signature") != source_signature
-                    or meta.get("projection_schema_version")
-                    != CHAT_INDEX_PROJECTION_SCHEMA_VERSION
+                    storage_repaired or _chat_index_projection_needs_rebuild(meta)
                 )
+                if not needs_rebuild:
+                    delta = _chat_index_projection_delta(conn, self._hub_root, meta)
         if needs_rebuild:
             self.rebuild_chat_index_projection()
+        elif delta is not None:
+            self._apply_chat_index_projection_delta(delta)
 
-    def _chat_index_source_signature(self) -> str:
+    def _apply_chat_index_projection_delta(
+        self, delta: _ChatIndexProjectionDelta
+    ) -> None:
+        started_at = time.perf_counter()
         with open_orchestration_sqlite(
             self._hub_root, durable=self._durable, migrate=True
         ) as conn:
-            table_updated_exprs = {
-                "orch_thread_targets": "MAX(COALESCE(updated_at, created_at))",
-                "orch_thread_executions": "MAX(COALESCE(finished_at, started_at, created_at))",
-                "orch_bindings": "MAX(COALESCE(updated_at, created_at))",
-                "orch_managed_thread_deliveries": "MAX(COALESCE(updated_at, delivered_at, created_at))",
-                "orch_notification_conversations": "MAX(COALESCE(updated_at, created_at))",
-                "orch_chat_surface_events": "MAX(COALESCE(created_at, occurred_at, event_id))",
-                "orch_flow_run_projections": "MAX(updated_at)",
-            }
-            facts: dict[str, Any] = {}
-            for table, updated_expr in table_updated_exprs.items():
-                if not _table_exists(conn, table):
-                    facts[table] = None
-                    continue
-                row = conn.execute(
-                    f"SELECT COUNT(*) AS count, {updated_expr} AS max_updated FROM {table}"
-                ).fetchone()
-                facts[table] = {
-                    "count": int(row["count"] or 0),
-                    "max_updated": row["max_updated"],
-                }
-            if _table_exists(conn, "orch_thread_targets"):
-                row = conn.execute("""
-                    SELECT COUNT(*) AS count,
-                           MAX(COALESCE(updated_at, created_at)) AS max_updated
-                      FROM orch_thread_targets
-                     WHERE json_extract(metadata_json, '$.flow_type') = 'ticket_flow'
-                       AND json_extract(metadata_json, '$.ticket_flow_link_key') IS NOT NULL
-                    """).fetchone()
-                facts["ticket_flow_thread_links"] = {
-                    "count": int(row["count"] or 0),
-                    "max_updated": row["max_updated"],
-                }
-            else:
-                facts["ticket_flow_thread_links"] = None
-            facts["ticket_flow_ticket_files"] = _ticket_flow_ticket_file_signature(conn)
-            if _table_exists(conn, "orch_flow_run_projections"):
-                row = conn.execute("""
-                    SELECT COUNT(*) AS count,
-                           MAX(updated_at) AS max_updated
-                      FROM orch_flow_run_projections
-                     WHERE flow_type = 'ticket_flow'
-                    """).fetchone()
-                facts["ticket_flow_flow_projections"] = {
-                    "count": int(row["count"] or 0),
-                    "max_updated": row["max_updated"],
+            scope = _expand_chat_index_projection_scope(conn, delta)
+        rows: list[dict[str, Any]] = []
+        if scope.thread_ids or scope.surfaces:
+            rows = [
+                row
+                for row in _chat_index_rows_from_surfaces(
+                    self._projected_surfaces(limit=None, scope=scope)
+                )
+                if scope.includes_row(row)
+            ]
+        source_signature = delta.cursors.signature
+        applied_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        revision_changed = False
+        with open_orchestration_sqlite(
+            self._hub_root, durable=self._durable, migrate=True
+        ) as conn:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                meta = _read_chat_index_projection_meta(conn)
+                if _ChatIndexSourceCursors.from_meta(
+                    meta
+                ) != delta.stored or _chat_index_projection_needs_rebuild(meta):
+                    # Another reader already folded these sources in.
+                    return
+                stale_row_ids = scope.row_ids() | _projection_rows_for_surfaces(
+                    conn, scope.surfaces
+                )
+                previous = _projection_row_json_by_id(conn, stale_row_ids)
+                _delete_chat_index_projection_rows(conn, stale_row_ids)
+                current = _write_chat_index_projection_rows(
+                    conn,
+                    rows,
+                    source_signature=source_signature,
+                    projected_at=applied_at,
+                )
+                revision = max(0, _safe_int(meta.get("projection_revision"), 0))
+                revision_changed = previous != current
+                conn.execute(
+                    """
+                    DELETE FROM orch_chat_index_projection_changes
+                     WHERE change_id <= ?
+                    """,
+                    (delta.cursors.change_cursor,),
+                )
+                meta_values = {
+                    **delta.cursors.to_meta(),
+                    "source_signature": source_signature,
+                    "projection_revision": str(
+                        revision + 1 if revision_changed else revision
+                    ),
                 }
-            else:
-                facts["ticket_flow_flow_projections"] = None
-        directory_path = (
-            self._hub_root / ".codex-autorunner" / "chat" / "channel_directory.json"
+                if delta.channel_directory_surfaces is not None:
+                    meta_values["channel_directory_surfaces"] = _surface_pairs_json(
+                        delta.channel_directory_surfaces
+                    )
+                _write_chat_index_projection_meta(
+                    conn, meta_values, updated_at=applied_at
+                )
+        _log_read_model_metric(
+            "chat_index_projection_apply_latency",
+            started_at,
+            threads=len(scope.thread_ids),
+            surfaces=len(scope.surfaces),
+            rows=len(rows),
+            revision_changed=revision_changed,
         )
-        try:
-            stat = directory_path.stat()
-            facts["channel_directory"] = {
-                "mtime_ns": stat.st_mtime_ns,
-                "size": stat.st_size,
-            }
-        except OSError:
-            facts["channel_directory"] = None
-        basis = json.dumps(facts, sort_keys=True, separators=(",", ":"), default=str)
-        return hashlib.sha256(basis.encode("utf-8")).hexdigest()
 
     def _query_chat_index_projection(
         self,
@@ -1146,46 +1228,53 @@ class ChatSurfaceReadService:
         self._ensure_chat_index_projection_current()
         bounded_offset = max(0, int(offset or 0))
         bounded_limit = _bounded_limit(limit, MAX_CHAT_INDEX_LIMIT)
-        where_sql, params = _chat_index_projection_where(
-            view=view,
-            query=query,
-            facets=facets,
-            surface_kind=surface_kind,
-            parent_group_id=parent_group_id,
-        )
-        normalized_view = (view or "all").strip().lower()
-        if normalized_view == "all":
-            where_counters_sql, counters_params = _chat_index_projection_where(
+        with open_orchestration_sqlite(
+            self._hub_root, durable=self._durable, migrate=True
+        ) as conn:
+            fts_query = (
+                _chat_index_fts_query(query)
+                if _chat_index_fts_available(conn)
+                else None
+            )
+            where_sql, params = _chat_index_projection_where(
                 view=view,
                 query=query,
                 facets=facets,
                 surface_kind=surface_kind,
                 parent_group_id=parent_group_id,
-                include_archived_rows=True,
+                full_text=fts_query is not None,
             )
-            counters_sql = f"""
-                SELECT COALESCE(SUM(CASE WHEN {_CHAT_INDEX_NON_ARCHIVED_SQL} THEN 1 ELSE 0 END), 0) AS total,
-                       COALESCE(SUM(CASE WHEN {_CHAT_INDEX_NON_ARCHIVED_SQL} AND queue_depth > 0 THEN 1 ELSE 0 END), 0) AS waiting,
-                       COALESCE(SUM(CASE WHEN {_CHAT_INDEX_NON_ARCHIVED_SQL} AND effective_status = 'running' THEN 1 ELSE 0 END), 0) AS running,
-                       COALESCE(SUM(CASE WHEN {_CHAT_INDEX_NON_ARCHIVED_SQL} THEN unread_count ELSE 0 END), 0) AS unread,
-                       COALESCE(SUM(CASE WHEN NOT ({_CHAT_INDEX_NON_ARCHIVED_SQL}) THEN 1 ELSE 0 END), 0) AS archived
-                  FROM orch_chat_index_projection
-                 WHERE {where_counters_sql}
-                """
-        else:
-            where_counters_sql, counters_params = where_sql, params
-            counters_sql = f"""
-                SELECT COUNT(*) AS total,
-                       COALESCE(SUM(CASE WHEN queue_depth > 0 THEN 1 ELSE 0 END), 0) AS waiting,
-                       COALESCE(SUM(CASE WHEN effective_status = 'running' THEN 1 ELSE 0 END), 0) AS running,
-                       COALESCE(SUM(unread_count), 0) AS unread,
-                       COALESCE(SUM(CASE WHEN NOT ({_CHAT_INDEX_NON_ARCHIVED_SQL}) THEN 1 ELSE 0 END), 0) AS archived
-                  FROM orch_chat_index_projection
-                 WHERE {where_counters_sql}
-                """
-        with open_orchestration_sqlite(
-            self._hub_root, durable=self._durable, migrate=True
-        ) as conn:
+            normalized_view = (view or "all").strip().lower()
+            if normalized_view == "all":
+                where_counters_sql, counters_params = _chat_index_projection_where(
+                    view=view,
+                    query=query,
+                    facets=facets,
+                    surface_kind=surface_kind,
+                    parent_group_id=parent_group_id,
+                    include_archived_rows=True,
+                    full_text=fts_query is not None,
+                )
+                counters_sql = f"""
+                    SELECT COALESCE(SUM(CASE WHEN {_CHAT_INDEX_NON_ARCHIVED_SQL} THEN 1 ELSE 0 END), 0) AS total,
+                           COALESCE(SUM(CASE WHEN {_CHAT_INDEX_NON_ARCHIVED_SQL} AND queue_depth > 0 THEN 1 ELSE 0 END), 0) AS waiting,
+                           COALESCE(SUM(CASE WHEN {_CHAT_INDEX_NON_ARCHIVED_SQL} AND effective_status = 'running' THEN 1 ELSE 0 END), 0) AS running,
+                           COALESCE(SUM(CASE WHEN {_CHAT_INDEX_NON_ARCHIVED_SQL} THEN unread_count ELSE 0 END), 0) AS unread,
+                           COALESCE(SUM(CASE WHEN NOT ({_CHAT_INDEX_NON_ARCHIVED_SQL}) THEN 1 ELSE 0 END), 0) AS archived
+                      FROM orch_chat_index_projection
+                     WHERE {where_counters_sql}
+                    """
+            else:
+                where_counters_sql, counters_params = where_sql, params
+                counters_sql = f"""
+                    SELECT COUNT(*) AS total,
+                           COALESCE(SUM(CASE WHEN queue_depth > 0 THEN 1 ELSE 0 END), 0) AS waiting,
+                           COALESCE(SUM(CASE WHEN effective_status = 'running' THEN 1 ELSE 0 END), 0) AS running,
+                           COALESCE(SUM(unread_count), 0) AS unread,
+                           COALESCE(SUM(CASE WHEN NOT ({_CHAT_INDEX_NON_ARCHIVED_SQL}) THEN 1 ELSE 0 END), 0) AS archived
+                      FROM orch_chat_index_projection
+                     WHERE {where_counters_sql}
+                    """
             counters_row = conn.execute(
                 counters_sql,
                 counters_params,
@@ -1220,6 +1309,36 @@ class ChatSurfaceReadService:
                 )
                 window_rows = groups[bounded_offset : bounded_offset + bounded_limit]
                 total_count = len(groups)
+            elif fts_query is not None:
+                total_count = counters["total"]
+                window_rows = _chat_index_ranked_search_window(
+                    conn,
+                    where_sql,
+                    params,
+                    fts_query=fts_query,
+                    limit=bounded_limit,
+                    offset=bounded_offset,
+                )
+                groups = (
+                    _ticket_run_groups(
+                        [
+                            _chat_index_row_from_projection(row)
+                            for row in conn.execute(
+                                f"""
+                                SELECT row_json, effective_status
+                                  FROM orch_chat_index_projection
+                                 WHERE {where_sql}
+                                 ORDER BY sort_unread_priority DESC,
+                                          sort_last_activity_desc ASC,
+                                          row_id ASC
+                                """,
+                                params,
+                            ).fetchall()
+                        ]
+                    )
+                    if group_by == "ticket_run"
+                    else []
+                )
             else:
                 total_count = counters["total"]
                 page_params = [*params, bounded_limit, bounded_offset]
@@ -1267,13 +1386,22 @@ class ChatSurfaceReadService:
             "window": window_rows,
         }
 
-    def _projected_surfaces(self, *, limit: Optional[int]) -> list[dict[str, Any]]:
+    def _projected_surfaces(
+        self,
+        *,
+        limit: Optional[int],
+        scope: Optional[_ChatIndexProjectionScope] = None,
+    ) -> list[dict[str, Any]]:
         projections: dict[tuple[str, str], ChatSurfaceProjection] = {}
-        self._project_channel_directory(projections)
-        self._project_orchestration_tables(projections)
-        self._project_events(projections)
+        self._project_channel_directory(projections, scope=scope)
+        self._project_orchestration_tables(projections, scope=scope)
+        self._project_events(projections, scope=scope)
         surfaces = sorted(
-            (projection.to_dict() for projection in projections.values()),
+            (
+                projection.to_dict()
+                for key, projection in projections.items()
+                if scope is None or key in scope.surfaces
+            ),
             key=lambda item: (item["surface_kind"], item["surface_key"]),
         )
         if limit is None:
@@ -1281,13 +1409,19 @@ class ChatSurfaceReadService:
         return surfaces[:limit]
 
     def _project_channel_directory(
-        self, projections: dict[tuple[str, str], ChatSurfaceProjection]
+        self,
+        projections: dict[tuple[str, str], ChatSurfaceProjection],
+        *,
+        scope: Optional[_ChatIndexProjectionScope] = None,
     ) -> None:
         for entry in _read_channel_directory_entries(self._hub_root):
-            surface_kind = _normalize_kind(entry.get("platform"))
-            chat_id = _normalize_text(entry.get("chat_id"))
-            if surface_kind is None or chat_id is None:
+            directory_surface = _channel_directory_surface_key(entry)
+            if directory_surface is None:
                 continue
+            if scope is not None and directory_surface not in scope.surfaces:
+                continue
+            surface_kind, surface_key = directory_surface
+            chat_id = str(_normalize_text(entry.get("chat_id")))
             owner_fields = canonical_owner_fields(
                 self._scope_index,
                 repo_id=entry.get("repo_id"),
@@ -1297,7 +1431,6 @@ class ChatSurfaceReadService:
                 scope_urn=entry.get("scope_urn"),
             )
             thread_id = _normalize_text(entry.get("thread_id"))
-            surface_key = f"{chat_id}:{thread_id}" if thread_id else chat_id
             projection = _projection(projections, surface_kind, surface_key)
             projection.merge(
                 lifecycle="discovered",
@@ -1319,19 +1452,57 @@ class ChatSurfaceReadService:
             )
 
     def _project_orchestration_tables(
-        self, projections: dict[tuple[str, str], ChatSurfaceProjection]
+        self,
+        projections: dict[tuple[str, str], ChatSurfaceProjection],
+        *,
+        scope: Optional[_ChatIndexProjectionScope] = None,
     ) -> None:
+        # A scope narrows every source query to the threads and surfaces being
+        # re-projected; the per-thread and per-surface folds below are
+        # unchanged, so scoped output matches the same rows of a full pass.
+        thread_where = execution_where = delivery_where = ""
+        binding_where = notification_where = flow_where = ""
+        thread_params: tuple[Any, ...] = ()
+        delivery_params: tuple[Any, ...] = ()
+        notification_params: tuple[Any, ...] = ()
+        if scope is not None:
+            in_json = "IN (SELECT value FROM json_each(?))"
+            surface_in_json = (
+                "(surface_kind, surface_key) IN ("
+                "SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]') "
+                "FROM json_each(?))"
+            )
+            thread_where = f"WHERE thread_target_id {in_json}"
+            execution_where = thread_where
+            delivery_where = f"WHERE managed_thread_id {in_json} OR {surface_in_json}"
+            binding_where = f"AND (target_id {in_json} OR {surface_in_json})"
+            notification_where = (
+                f"WHERE notification_id {in_json} "
+                f"OR managed_thread_id {in_json} "
+                f"OR continuation_thread_target_id {in_json}"
+            )
+            flow_where = f"AND flow_run_id {in_json}"
+            thread_params = (scope.thread_ids_json(),)
+            delivery_params = thread_params + (scope.surface_keys_json(),)
+            notification_params = (
+                scope.notification_ids_json(),
+                *thread_params,
+                *thread_params,
+            )
         with open_orchestration_sqlite(
             self._hub_root, durable=self._durable, migrate=True
         ) as conn:
             thread_rows = conn.execute(
-                """
+                f"""
                 SELECT *
                   FROM orch_thread_targets
+                 {thread_where}
                  ORDER BY updated_at DESC, created_at DESC, thread_target_id ASC
                 """,
+                thread_params,
             ).fetchall()
-            execution_rows = conn.execute("""
+            execution_rows = conn.execute(
+                f"""
                 SELECT thread_target_id,
                        execution_id,
                        request_kind,
@@ -1348,10 +1519,14 @@ class ChatSurfaceReadService:
                        finished_at,
                        error_text
                   FROM orch_thread_executions
+                 {execution_where}
                  ORDER BY created_at ASC, execution_id ASC
-                """).fetchall()
+                """,
+                thread_params,
+            ).fetchall()
             delivery_rows = (
-                conn.execute("""
+                conn.execute(
+                    f"""
                     SELECT managed_thread_id,
                            surface_kind,
                            surface_key,
@@ -1361,32 +1536,52 @@ class ChatSurfaceReadService:
                            updated_at,
                            created_at
                       FROM orch_managed_thread_deliveries
+                     {delivery_where}
                      ORDER BY updated_at ASC, created_at ASC, delivery_id ASC
-                    """).fetchall()
+                    """,
+                    delivery_params,
+                ).fetchall()
                 if _table_exists(conn, "orch_managed_thread_deliveries")
                 else []
             )
             binding_rows = conn.execute(
-                """
+                f"""
                 SELECT *
                   FROM orch_bindings
                  WHERE disabled_at IS NULL
+                 {binding_where}
                  ORDER BY surface_kind ASC, surface_key ASC, updated_at ASC, binding_id ASC
                 """,
+                delivery_params,
             ).fetchall()
             notification_rows = (
                 conn.execute(
-                    """
+                    f"""
                     SELECT *
                       FROM orch_notification_conversations
+                     {notification_where}
                      ORDER BY updated_at ASC, created_at ASC, notification_id ASC
                     """,
+                    notification_params,
                 ).fetchall()
                 if _table_exists(conn, "orch_notification_conversations")
                 else []
             )
+            run_ids = sorted(
+                {
+                    run_id
+                    for row in thread_rows
+                    for run_id in [
+                        _normalize_text(
+                            _json_object(_row_get(row, "metadata_json")).get("run_id")
+                        )
+                    ]
+                    if run_id is not None
+                }
+            )
             flow_projection_rows = (
-                conn.execute("""
+                conn.execute(
+                    f"""
                     SELECT flow_run_id,
                            repo_id,
                            status,
@@ -1394,7 +1589,10 @@ class ChatSurfaceReadService:
                            updated_at
                       FROM orch_flow_run_projections
                      WHERE flow_type = 'ticket_flow'
-                    """).fetchall()
+                     {flow_where}
+                    """,
+                    (json.dumps(run_ids),) if scope is not None else (),
+                ).fetchall()
                 if _table_exists(conn, "orch_flow_run_projections")
                 else []
             )
@@ -1682,9 +1880,19 @@ class ChatSurfaceReadService:
             )
 
     def _project_events(
-        self, projections: dict[tuple[str, str], ChatSurfaceProjection]
+        self,
+        projections: dict[tuple[str, str], ChatSurfaceProjection],
+        *,
+        scope: Optional[_ChatIndexProjectionScope] = None,
     ) -> None:
-        for event in self._journal.read_history(limit=MAX_CHAT_SURFACE_EVENT_LIMIT):
+        events = (
+            self._journal.read_history(limit=MAX_CHAT_SURFACE_EVENT_LIMIT)
+            if scope is None
+            else self._journal.read_surface_history(
+                scope.surface_query_keys(), min_cursor=scope.event_floor
+            )
+        )
+        for event in events:
             projection = _projection(projections, event.surface_kind, event.surface_key)
             payload_display = event.payload.get("display")
             display = payload_display if isinstance(payload_display, Mapping) else {}
@@ -1771,52 +1979,6 @@ def _stable_revision(payload: Mapping[str, Any]) -> str:
     return hashlib.sha256(basis.encode("utf-8")).hexdigest()
 
 
-def _ticket_flow_ticket_file_signature(conn: Any) -> list[dict[str, Any]]:
-    if not _table_exists(conn, "orch_thread_targets"):
-        return []
-    rows = conn.execute("""
-        SELECT json_extract(metadata_json, '$.workspace_root') AS workspace_root,
-               json_extract(metadata_json, '$.ticket_path') AS ticket_path
-          FROM orch_thread_targets
-         WHERE json_extract(metadata_json, '$.flow_type') = 'ticket_flow'
-           AND json_extract(metadata_json, '$.ticket_path') IS NOT NULL
-        """).fetchall()
-    facts: list[dict[str, Any]] = []
-    seen: set[tuple[str, str]] = set()
-    for row in rows:
-        workspace_root = _normalize_text(row["workspace_root"])
-        ticket_path = _normalize_text(row["ticket_path"])
-        if workspace_root is None or ticket_path is None:
-            continue
-        key = (workspace_root, ticket_path)
-        if key in seen:
-            continue
-        seen.add(key)
-        path = Path(ticket_path)
-        if not path.is_absolute():
-            path = Path(workspace_root) / path
-        fact: dict[str, Any] = {
-            "workspace_root": workspace_root,
-            "ticket_path": ticket_path,
-        }
-        try:
-            resolved_path = path.resolve()
-            resolved_root = Path(workspace_root).resolve()
-            resolved_path.relative_to(resolved_root)
-            stat = resolved_path.stat()
-            fact.update({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
-        except (OSError, ValueError):
-            fact["missing"] = True
-        facts.append(fact)
-    return sorted(
-        facts,
-        key=lambda item: (
-            str(item.get("workspace_root") or ""),
-            str(item.get("ticket_path") or ""),
-        ),
-    )
-
-
 def _ticket_flow_projection_by_run_id(
     rows: Iterable[Mapping[str, Any]],
 ) -> dict[str, list[dict[str, Any]]]:
@@ -2663,6 +2825,108 @@ def _chat_row_search_text(row: Mapping[str, Any]) -> str:
     return " ".join(str(value).lower() for value in values if value)
 
 
+def _chat_row_search_columns(row: Mapping[str, Any]) -> tuple[str, str, str]:
+    """Split the searchable text of a row into FTS ``title``/``preview``/``tokens``."""
+
+    def _join(values: Iterable[Any]) -> str:
+        seen: list[str] = []
+        for value in values:
+            text = str(value) if value else ""
+            if text and text not in seen:
+                seen.append(text)
+        return " ".join(seen)
+
+    title = _join(
+        [
+            _visible_chrome_text(row.get("title")),
+            _visible_chrome_text(row.get("display_title")),
+        ]
+    )
+    preview = _join([_visible_chrome_text(row.get("last_message_preview"))])
+    tokens = _join(
+        [
+            row.get("managed_thread_id"),
+            row.get("repo_id"),
+            row.get("resource_kind"),
+            row.get("resource_id"),
+            row.get("agent"),
+            row.get("agent_profile"),
+            row.get("model"),
+            *(row.get("surface_kinds") or []),
+        ]
+    )
+    return (title, preview, tokens)
+
+
+# Private-use markers around FTS matches; split into segments before returning
+# so callers never have to parse or escape markup.
+_CHAT_SEARCH_MATCH_START = "\ue000"
+_CHAT_SEARCH_MATCH_END = "\ue001"
+_CHAT_SEARCH_SNIPPET_TOKENS = 16
+_CHAT_SEARCH_COLUMNS = ("title", "preview", "tokens")
+# bm25 weights for (row_id, title, preview, tokens); titles dominate ranking.
+_CHAT_SEARCH_BM25_WEIGHTS = "0.0, 10.0, 4.0, 1.0"
+
+
+def _chat_index_fts_query(query: Optional[str]) -> Optional[str]:
+    """Translate free text into an FTS5 prefix query, or ``None`` if unusable.
+
+    Each whitespace-separated term becomes a quoted prefix phrase, so
+    ``"fix check"`` matches rows containing words starting with ``fix`` and
+    ``check`` in any column, and punctuation inside a term (``repo-a``) is
+    tokenized the same way the indexed text was.
+    """
+
+    normalized = _normalize_text(query)
+    if normalized is None:
+        return None
+    phrases = [
+        '"' + term.replace('"', '""') + '"*'
+        for term in normalized.lower().split()
+        if any(char.isalnum() for char in term)
+    ]
+    return " ".join(phrases) if phrases else None
+
+
+def _chat_index_fts_available(conn: Any) -> bool:
+    return _table_exists(conn, "orch_chat_index_projection_fts")
+
+
+def _chat_search_snippet_segments(raw: Any) -> list[dict[str, Any]]:
+    segments: list[dict[str, Any]] = []
+    text = str(raw or "")
+    while text:
+        start = text.find(_CHAT_SEARCH_MATCH_START)
+        if start < 0:
+            segments.append({"text": text, "match": False})
+            break
+        if start > 0:
+            segments.append({"text": text[:start], "match": False})
+        end = text.find(_CHAT_SEARCH_MATCH_END, start)
+        if end < 0:
+            end = len(text)
+        matched = text[start + len(_CHAT_SEARCH_MATCH_START) : end]
+        if matched:
+            segments.append({"text": matched, "match": True})
+        text = text[end + len(_CHAT_SEARCH_MATCH_END) :]
+    return segments
+
+
+def _chat_search_match(row: Mapping[str, Any]) -> dict[str, Any]:
+    column = "title"
+    segments: list[dict[str, Any]] = []
+    for name in _CHAT_SEARCH_COLUMNS:
+        candidate = _chat_search_snippet_segments(row[f"snippet_{name}"])
+        if any(segment["match"] for segment in candidate):
+            column, segments = name, candidate
+            break
+    return {
+        "column": column,
+        "rank": float(row["search_rank"] or 0.0),
+        "snippet": segments,
+    }
+
+
 def _chat_index_sort_key(row: Mapping[str, Any]) -> tuple[int, float, str]:
     priority = 1 if row.get("unread") else 0
     raw = str(row.get("last_sort_activity_at") or row.get("last_activity_at") or "")
@@ -2759,6 +3023,66 @@ def _chat_index_projection_params(
     )
 
 
+def _chat_index_ranked_search_window(
+    conn: Any,
+    where_sql: str,
+    params: Sequence[Any],
+    *,
+    fts_query: str,
+    limit: int,
+    offset: int,
+) -> list[dict[str, Any]]:
+    """Return one page of full-text matches, best bm25 rank first.
+
+    Each row carries ``search_match`` with the best-matching column and a
+    snippet split into plain and matched segments.
+    """
+
+    snippet_columns = ",\n".join(
+        f"snippet(orch_chat_index_projection_fts, {index}, ?, ?, '…', "
+        f"{_CHAT_SEARCH_SNIPPET_TOKENS}) AS snippet_{name}"
+        for index, name in enumerate(_CHAT_SEARCH_COLUMNS, start=1)
+    )
+    snippet_params: list[Any] = []
+    for _name in _CHAT_SEARCH_COLUMNS:
+        snippet_params.extend((_CHAT_SEARCH_MATCH_START, _CHAT_SEARCH_MATCH_END))
+    rows = conn.execute(
+        f"""
+        SELECT row_json,
+               effective_status,
+               search_matches.search_rank,
+               search_matches.snippet_title,
+               search_matches.snippet_preview,
+               search_matches.snippet_tokens
+          FROM orch_chat_index_projection
+          JOIN (
+              SELECT row_id AS match_row_id,
+                     bm25(orch_chat_index_projection_fts, {_CHAT_SEARCH_BM25_WEIGHTS})
+                         AS search_rank,
+                     {snippet_columns}
+                FROM orch_chat_index_projection_fts
+               WHERE orch_chat_index_projection_fts MATCH ?
+          ) AS search_matches
+            ON search_matches.match_row_id = orch_chat_index_projection.row_id
+         WHERE {where_sql}
+         ORDER BY search_matches.search_rank ASC,
+                  sort_unread_priority DESC,
+                  sort_last_activity_desc ASC,
+                  orch_chat_index_projection.row_id ASC
+         LIMIT ? OFFSET ?
+        """,
+        [*snippet_params, fts_query, *params, limit, offset],
+    ).fetchall()
+    window: list[dict[str, Any]] = []
+    for row in rows:
+        parsed = _chat_index_row_from_projection(row)
+        if not parsed:
+            continue
+        parsed["search_match"] = _chat_search_match(row)
+        window.append(parsed)
+    return window
+
+
 def _chat_index_row_from_projection(row: Mapping[str, Any]) -> dict[str, Any]:
     try:
         parsed = json.loads(str(row["row_json"]))
@@ -2910,10 +3234,12 @@ def _chat_index_projection_where(
     surface_kind: Optional[str],
     parent_group_id: Optional[str],
     include_archived_rows: bool = False,
+    full_text: bool = False,
 ) -> tuple[str, list[Any]]:
     normalized_view = (view or "all").strip().lower()
     normalized_query = _normalize_text(query)
     normalized_query = normalized_query.lower() if normalized_query else None
+    fts_query = _chat_index_fts_query(query) if full_text else None
     normalized_surface = _normalize_kind(surface_kind)
     clauses = ["1 = 1"]
     params: list[Any] = []
@@ -2944,7 +3270,14 @@ def _chat_index_projection_where(
         include_archived_rows and normalized_view == "all"
     ):
         clauses.append(_CHAT_INDEX_NON_ARCHIVED_SQL)
-    if normalized_query is not None:
+    if fts_query is not None:
+        clauses.append("""row_id IN (
+            SELECT row_id
+              FROM orch_chat_index_projection_fts
+             WHERE orch_chat_index_projection_fts MATCH ?
+        )""")
+        params.append(fts_query)
+    elif normalized_query is not None:
         clauses.append("search_text LIKE ?")
         params.append(f"%{normalized_query}%")
     facet_request = _normalize_chat_facet_request(facets)
@@ -3026,6 +3359,8 @@ def _chat_index_facet_counts(
         "scope_kind": {},
         "agent_kind": {},
     }
+    # Rows sharing a facet tuple are tallied once; the projection usually holds
+    # far fewer distinct tuples than rows.
     rows = conn.execute(
         f"""
         SELECT facet_category,
@@ -3033,31 +3368,47 @@ def _chat_index_facet_counts(
                facet_origin_kind_list,
                facet_transport_list,
                facet_scope_kind,
-               facet_agent_kind
+               facet_agent_kind,
+               COUNT(*) AS row_count
           FROM orch_chat_index_projection
          WHERE {where_sql}
+         GROUP BY facet_category,
+                  facet_turn_kind_list,
+                  facet_origin_kind_list,
+                  facet_transport_list,
+                  facet_scope_kind,
+                  facet_agent_kind
         """,
         list(params),
     ).fetchall()
     for row in rows:
-        _increment_count(counts["category"], _normalize_text(row["facet_category"]))
+        amount = int(row["row_count"] or 0)
+        _increment_count(
+            counts["category"], _normalize_text(row["facet_category"]), amount
+        )
         for value in _values_from_pipe_list(row["facet_turn_kind_list"]):
-            _increment_count(counts["turn_kind"], value)
+            _increment_count(counts["turn_kind"], value, amount)
         for value in _values_from_pipe_list(row["facet_origin_kind_list"]):
-            _increment_count(counts["origin_kind"], value)
+            _increment_count(counts["origin_kind"], value, amount)
         for value in _values_from_pipe_list(row["facet_transport_list"]):
             if value == "pma":
                 continue
-            _increment_count(counts["transport"], value)
-        _increment_count(counts["scope_kind"], _normalize_text(row["facet_scope_kind"]))
-        _increment_count(counts["agent_kind"], _normalize_text(row["facet_agent_kind"]))
+            _increment_count(counts["transport"], value, amount)
+        _increment_count(
+            counts["scope_kind"], _normalize_text(row["facet_scope_kind"]), amount
+        )
+        _increment_count(
+            counts["agent_kind"], _normalize_text(row["facet_agent_kind"]), amount
+        )
     return counts
 
 
-def _increment_count(target: dict[str, int], value: Optional[str]) -> None:
+def _increment_count(
+    target: dict[str, int], value: Optional[str], amount: int = 1
+) -> None:
     if value is None:
         return
-    target[value] = target.get(value, 0) + 1
+    target[value] = target.get(value, 0) + amount
 
 
 def _values_from_pipe_list(raw: Any) -> list[str]:
@@ -3218,7 +3569,7 @@ def _flow_store_status_to_ticket_status(status: Optional[str]) -> Optional[str]:
     return None
 
 
-def _ticket_done_from_row_path(row: Mapping[str, Any]) -> Optional[bool]:
+def _resolved_ticket_path(row: Mapping[str, Any]) -> Optional[Path]:
     ticket_path = _normalize_text(row.get("ticket_path"))
     workspace_root = _normalize_text(row.get("workspace_root"))
     if ticket_path is None or workspace_root is None:
@@ -3232,33 +3583,22 @@ def _ticket_done_from_row_path(row: Mapping[str, Any]) -> Optional[bool]:
         resolved_path.relative_to(resolved_root)
     except (OSError, ValueError):
         return None
-    frontmatter = _read_markdown_frontmatter_mapping(resolved_path)
+    return resolved_path
+
+
+def _ticket_done_from_row_path(row: Mapping[str, Any]) -> Optional[bool]:
+    resolved_path = _resolved_ticket_path(row)
+    if resolved_path is None:
+        return None
+    from ...tickets.ticket_index import ticket_index_entry
+
+    frontmatter = ticket_index_entry(resolved_path).data or {}
     ticket_done = _bool_or_none(frontmatter.get("done"))
     if ticket_done is None:
         return None
     return ticket_done
 
 
-def _read_markdown_frontmatter_mapping(path: Path) -> dict[str, str]:
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return {}
-    if not lines or lines[0].strip() != "---":
-        return {}
-    data: dict[str, str] = {}
-    for line in lines[1:]:
-        if line.strip() == "---":
-            return data
-        key, separator, value = line.partition(":")
-        if not separator:
-            continue
-        key = key.strip()
-        if key:
-            data[key] = value.strip().strip("\"'")
-    return {}
-
-
 def _bool_or_none(value: Any) -> Optional[bool]:
     if isinstance(value, bool):
         return value
@@ -4293,8 +4633,41 @@ def _pma_thread_from_surface(surface: Mapping[str, Any]) -> dict[str, Any]:
     return payload
 
 
+def _channel_directory_path(hub_root: Path) -> Path:
+    return hub_root / ".codex-autorunner" / "chat" / "channel_directory.json"
+
+
+def _channel_directory_signature(hub_root: Path) -> str:
+    mtime_ns, size = _file_stat_signature(_channel_directory_path(hub_root))
+    if mtime_ns is None:
+        return "missing"
+    return f"{mtime_ns}:{size}"
+
+
+def _channel_directory_surface_key(
+    entry: Mapping[str, Any],
+) -> Optional[tuple[str, str]]:
+    surface_kind = _normalize_kind(entry.get("platform"))
+    chat_id = _normalize_text(entry.get("chat_id"))
+    if surface_kind is None or chat_id is None:
+        return None
+    thread_id = _normalize_text(entry.get("thread_id"))
+    return (surface_kind, f"{chat_id}:{thread_id}" if thread_id else chat_id)
+
+
+def _channel_directory_surfaces(hub_root: Path) -> list[tuple[str, str]]:
+    return sorted(
+        {
+            surface
+            for entry in _read_channel_directory_entries(hub_root)
+            for surface in [_channel_directory_surface_key(entry)]
+            if surface is not None
+        }
+    )
+
+
 def _read_channel_directory_entries(hub_root: Path) -> list[dict[str, Any]]:
-    path = hub_root / ".codex-autorunner" / "chat" / "channel_directory.json"
+    path = _channel_directory_path(hub_root)
     try:
         raw = path.read_text(encoding="utf-8")
         parsed = json.loads(raw)
@@ -4405,6 +4778,569 @@ def _ensure_chat_index_projection_facet_schema(conn: Any) -> bool:
     return repaired
 
 
+_CHAT_INDEX_PROJECTION_INSERT_SQL = """
+    INSERT OR REPLACE INTO orch_chat_index_projection (
+        row_id,
+        chat_id,
+        managed_thread_id,
+        surface_kinds_json,
+        surface_kind_list,
+        lifecycle_status,
+        runtime_status,
+        effective_status,
+        queue_depth,
+        unread_count,
+        unread,
+        last_visible_message_at,
+        last_lifecycle_update_at,
+        last_internal_update_at,
+        last_sort_activity_at,
+        last_activity_at,
+        updated_at,
+        created_at,
+        repo_id,
+        worktree_id,
+        resource_kind,
+        resource_id,
+        ticket_id,
+        run_id,
+        group_id,
+        facet_category,
+        facet_turn_kind_list,
+        facet_origin_kind_list,
+        facet_transport_list,
+        facet_scope_kind,
+        facet_scope_id,
+        facet_agent_kind,
+        search_text,
+        sort_unread_priority,
+        sort_last_activity_desc,
+        row_json,
+        source_signature,
+        rebuilt_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_CHAT_INDEX_PROJECTION_ROW_JSON_PARAM = 35
+_CHAT_INDEX_PROJECTION_CURSOR_KEYS = (
+    "event_cursor",
+    "event_window_floor",
+    "change_cursor",
+    "channel_directory_signature",
+)
+_JSON_SURFACE_PAIRS_SQL = (
+    "SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]') "
+    "FROM json_each(?)"
+)
+
+
+def _chat_index_projection_needs_rebuild(meta: Mapping[str, str]) -> bool:
+    return meta.get(
+        "projection_schema_version"
+    ) != CHAT_INDEX_PROJECTION_SCHEMA_VERSION or any(
+        key not in meta for key in _CHAT_INDEX_PROJECTION_CURSOR_KEYS
+    )
+
+
+def _read_chat_index_projection_meta(conn: Any) -> dict[str, str]:
+    return {
+        str(row["key"]): str(row["value"])
+        for row in conn.execute(
+            "SELECT key, value FROM orch_chat_index_projection_meta"
+        ).fetchall()
+    }
+
+
+def _write_chat_index_projection_meta(
+    conn: Any, values: Mapping[str, str], *, updated_at: str
+) -> None:
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO orch_chat_index_projection_meta (
+            key,
+            value,
+            updated_at
+        ) VALUES (?, ?, ?)
+        """,
+        [(key, value, updated_at) for key, value in values.items()],
+    )
+
+
+def _chat_index_source_cursors(conn: Any, hub_root: Path) -> _ChatIndexSourceCursors:
+    event_cursor = 0
+    event_window_floor = 0
+    if _table_exists(conn, "orch_chat_surface_events"):
+        row = conn.execute(
+            "SELECT COALESCE(MAX(event_id), 0) AS cursor FROM orch_chat_surface_events"
+        ).fetchone()
+        event_cursor = int(row["cursor"] or 0) if row is not None else 0
+        # The oldest event still inside the window ``_project_events`` reads.
+        row = conn.execute(
+            """
+            SELECT event_id
+              FROM orch_chat_surface_events
+             ORDER BY event_id DESC
+             LIMIT 1 OFFSET ?
+            """,
+            (MAX_CHAT_SURFACE_EVENT_LIMIT - 1,),
+        ).fetchone()
+        event_window_floor = int(row["event_id"]) if row is not None else 0
+    change_cursor = 0
+    if _table_exists(conn, "sqlite_sequence"):
+        row = conn.execute("""
+            SELECT seq
+              FROM sqlite_sequence
+             WHERE name = 'orch_chat_index_projection_changes'
+            """).fetchone()
+        change_cursor = int(row["seq"] or 0) if row is not None else 0
+    return _ChatIndexSourceCursors(
+        event_cursor=event_cursor,
+        event_window_floor=event_window_floor,
+        change_cursor=change_cursor,
+        channel_directory_signature=_channel_directory_signature(hub_root),
+    )
+
+
+def _count_rows_after(conn: Any, table: str, column: str, cursor: int) -> int:
+    if not _table_exists(conn, table):
+        return 0
+    row = conn.execute(
+        f"SELECT COUNT(*) AS count FROM {table} WHERE {column} > ?",
+        (cursor,),
+    ).fetchone()
+    return int(row["count"] or 0) if row is not None else 0
+
+
+def _chat_index_projection_delta(
+    conn: Any, hub_root: Path, meta: Mapping[str, str]
+) -> Optional[_ChatIndexProjectionDelta]:
+    """Collect what changed since the cursors stored in ``meta``.
+
+    Returns ``None`` when every source is at its stored cursor and no tracked
+    ticket file changed, which is the common case for an idle poll.
+    """
+
+    stored = _ChatIndexSourceCursors.from_meta(meta)
+    cursors = _chat_index_source_cursors(conn, hub_root)
+    delta = _ChatIndexProjectionDelta(stored=stored, cursors=cursors)
+    event_ranges: list[tuple[str, tuple[int, int]]] = []
+    if cursors.event_cursor > stored.event_cursor:
+        event_ranges.append(
+            (
+                "event_id > ? AND event_id <= ?",
+                (stored.event_cursor, cursors.event_cursor),
+            )
+        )
+    if cursors.event_window_floor > stored.event_window_floor:
+        # Events that slid out of the window no longer contribute to a surface.
+        event_ranges.append(
+            (
+                "event_id >= ? AND event_id < ?",
+                (stored.event_window_floor, cursors.event_window_floor),
+            )
+        )
+    for where, params in event_ranges:
+        for row in conn.execute(
+            f"""
+            SELECT DISTINCT surface_kind, surface_key, managed_thread_id
+              FROM orch_chat_surface_events
+             WHERE {where}
+            """,
+            params,
+        ).fetchall():
+            delta.add_surface(row["surface_kind"], row["surface_key"])
+            delta.add_thread(row["managed_thread_id"])
+    if cursors.change_cursor > stored.change_cursor:
+        run_ids: set[str] = set()
+        for row in conn.execute(
+            """
+            SELECT managed_thread_id, surface_kind, surface_key, run_id
+              FROM orch_chat_index_projection_changes
+             WHERE change_id > ? AND change_id <= ?
+            """,
+            (stored.change_cursor, cursors.change_cursor),
+        ).fetchall():
+            delta.add_thread(row["managed_thread_id"])
+            delta.add_surface(row["surface_kind"], row["surface_key"])
+            run_id = _normalize_text(row["run_id"])
+            if run_id is not None:
+                run_ids.add(run_id)
+        if run_ids:
+            for row in conn.execute(
+                """
+                SELECT managed_thread_id
+                  FROM orch_chat_index_projection
+                 WHERE run_id IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(sorted(run_ids)),),
+            ).fetchall():
+                delta.add_thread(row["managed_thread_id"])
+    for row in conn.execute(
+        "SELECT row_id, path, mtime_ns, size FROM orch_chat_index_projection_files"
+    ).fetchall():
+        if _file_stat_signature(Path(str(row["path"]))) != (
+            row["mtime_ns"],
+            row["size"],
+        ):
+            delta.row_ids.add(str(row["row_id"]))
+    if cursors.channel_directory_signature != stored.channel_directory_signature:
+        directory_surfaces = _channel_directory_surfaces(hub_root)
+        delta.channel_directory_surfaces = directory_surfaces
+        for surface_kind, surface_key in [
+            *directory_surfaces,
+            *_surface_pairs_from_json(meta.get("channel_directory_surfaces")),
+        ]:
+            delta.add_surface(surface_kind, surface_key)
+    if (
+        cursors == stored
+        and not delta.thread_ids
+        and not delta.surfaces
+        and not delta.row_ids
+    ):
+        return None
+    return delta
+
+
+def _expand_chat_index_projection_scope(
+    conn: Any, delta: _ChatIndexProjectionDelta
+) -> _ChatIndexProjectionScope:
+    """Close the dirty threads and surfaces over every thread/surface link.
+
+    A thread row folds in its PMA surface, active bindings, notification reply
+    contexts, and surfaces whose windowed events name it; a surface belongs to
+    whichever of its candidate threads wins the merge. Following those links
+    (plus the rows each surface was last projected into) to a fixpoint keeps
+    rebinds, unbinds, and merge-order ties exact.
+    """
+
+    event_floor = delta.cursors.event_window_floor
+    has_notifications = _table_exists(conn, "orch_notification_conversations")
+    threads: set[str] = set()
+    surfaces: set[tuple[str, str]] = set()
+    variants: set[tuple[str, str]] = set(delta.surface_variants)
+    pending_threads = set(delta.thread_ids)
+    pending_surfaces = set(delta.surfaces)
+    for row_id in delta.row_ids:
+        if row_id.startswith("thread:"):
+            pending_threads.add(row_id[len("thread:") :])
+    pending_surfaces |= _projection_surfaces_for_rows(conn, delta.row_ids)
+
+    def _add_surface(surface_kind: Any, surface_key: Any) -> None:
+        surface = _normalized_surface(surface_kind, surface_key)
+        if surface is None:
+            return
+        pending_surfaces.add(surface)
+        raw = (str(surface_kind), str(surface_key))
+        if raw != surface:
+            variants.add(raw)
+
+    def _add_thread(managed_thread_id: Any) -> None:
+        thread_id = _normalize_text(managed_thread_id)
+        if thread_id is not None:
+            pending_threads.add(thread_id)
+
+    while pending_threads or pending_surfaces:
+        new_threads = pending_threads - threads
+        new_surfaces = pending_surfaces - surfaces
+        threads |= new_threads
+        surfaces |= new_surfaces
+        pending_threads = set()
+        pending_surfaces = set()
+        if new_threads:
+            thread_json = json.dumps(sorted(new_threads))
+            for thread_id in new_threads:
+                _add_surface("pma", thread_id)
+            for row in conn.execute(
+                """
+                SELECT surface_kind, surface_key
+                  FROM orch_bindings
+                 WHERE disabled_at IS NULL
+                   AND target_id IN (SELECT value FROM json_each(?))
+                """,
+                (thread_json,),
+            ).fetchall():
+                _add_surface(row["surface_kind"], row["surface_key"])
+            if has_notifications:
+                for row in conn.execute(
+                    """
+                    SELECT notification_id
+                      FROM orch_notification_conversations
+                     WHERE managed_thread_id IN (SELECT value FROM json_each(?))
+                        OR continuation_thread_target_id IN (
+                            SELECT value FROM json_each(?)
+                        )
+                    """,
+                    (thread_json, thread_json),
+                ).fetchall():
+                    _add_surface("notification", f"notification:{row[0]}")
+            for row in conn.execute(
+                """
+                SELECT DISTINCT surface_kind, surface_key
+                  FROM orch_chat_surface_events
+                 WHERE managed_thread_id IN (SELECT value FROM json_each(?))
+                   AND event_id >= ?
+                """,
+                (thread_json, event_floor),
+            ).fetchall():
+                _add_surface(row["surface_kind"], row["surface_key"])
+            for surface in _projection_surfaces_for_rows(
+                conn, {f"thread:{thread_id}" for thread_id in new_threads}
+            ):
+                _add_surface(*surface)
+        if new_surfaces:
+            surface_json = _surface_pairs_json(
+                new_surfaces
+                | {raw for raw in variants if _normalized_surface(*raw) in new_surfaces}
+            )
+            for surface_kind, surface_key in new_surfaces:
+                if surface_kind == "pma":
+                    _add_thread(surface_key)
+            for row in conn.execute(
+                f"""
+                SELECT target_id
+                  FROM orch_bindings
+                 WHERE disabled_at IS NULL
+                   AND (surface_kind, surface_key) IN ({_JSON_SURFACE_PAIRS_SQL})
+                """,
+                (surface_json,),
+            ).fetchall():
+                _add_thread(row["target_id"])
+            if has_notifications:
+                for row in conn.execute(
+                    """
+                    SELECT managed_thread_id, continuation_thread_target_id
+                      FROM orch_notification_conversations
+                     WHERE notification_id IN (SELECT value FROM json_each(?))
+                    """,
+                    (_notification_ids_json(new_surfaces),),
+                ).fetchall():
+                    _add_thread(row["managed_thread_id"])
+                    _add_thread(row["continuation_thread_target_id"])
+            for row in conn.execute(
+                f"""
+                SELECT DISTINCT managed_thread_id
+                  FROM orch_chat_surface_events
+                 WHERE (surface_kind, surface_key) IN ({_JSON_SURFACE_PAIRS_SQL})
+                   AND event_id >= ?
+                """,
+                (surface_json, event_floor),
+            ).fetchall():
+                _add_thread(row["managed_thread_id"])
+            for row_id in _projection_rows_for_surfaces(conn, new_surfaces):
+                if row_id.startswith("thread:"):
+                    _add_thread(row_id[len("thread:") :])
+    return _ChatIndexProjectionScope(
+        thread_ids=frozenset(threads),
+        surfaces=frozenset(surfaces),
+        surface_variants=frozenset(variants),
+        event_floor=event_floor,
+    )
+
+
+def _projection_rows_for_surfaces(
+    conn: Any, surfaces: Iterable[tuple[str, str]]
+) -> set[str]:
+    surface_json = _surface_pairs_json(surfaces)
+    if surface_json == "[]":
+        return set()
+    return {
+        str(row["row_id"])
+        for row in conn.execute(
+            f"""
+            SELECT row_id
+              FROM orch_chat_index_projection_surfaces
+             WHERE (surface_kind, surface_key) IN ({_JSON_SURFACE_PAIRS_SQL})
+            """,
+            (surface_json,),
+        ).fetchall()
+    }
+
+
+def _projection_surfaces_for_rows(
+    conn: Any, row_ids: Iterable[str]
+) -> set[tuple[str, str]]:
+    row_id_json = json.dumps(sorted(row_ids))
+    if row_id_json == "[]":
+        return set()
+    return {
+        (str(row["surface_kind"]), str(row["surface_key"]))
+        for row in conn.execute(
+            """
+            SELECT surface_kind, surface_key
+              FROM orch_chat_index_projection_surfaces
+             WHERE row_id IN (SELECT value FROM json_each(?))
+            """,
+            (row_id_json,),
+        ).fetchall()
+    }
+
+
+def _projection_row_json_by_id(conn: Any, row_ids: Iterable[str]) -> dict[str, str]:
+    return {
+        str(row["row_id"]): str(row["row_json"])
+        for row in conn.execute(
+            """
+            SELECT row_id, row_json
+              FROM orch_chat_index_projection
+             WHERE row_id IN (SELECT value FROM json_each(?))
+            """,
+            (json.dumps(sorted(row_ids)),),
+        ).fetchall()
+    }
+
+
+def _delete_chat_index_projection_rows(conn: Any, row_ids: Iterable[str]) -> None:
+    row_id_json = json.dumps(sorted(row_ids))
+    tables = [
+        "orch_chat_index_projection",
+        "orch_chat_index_projection_surfaces",
+        "orch_chat_index_projection_files",
+    ]
+    if _chat_index_fts_available(conn):
+        tables.append("orch_chat_index_projection_fts")
+    for table in tables:
+        conn.execute(
+            f"DELETE FROM {table} WHERE row_id IN (SELECT value FROM json_each(?))",
+            (row_id_json,),
+        )
+
+
+def _write_chat_index_projection_rows(
+    conn: Any,
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    source_signature: str,
+    projected_at: str,
+) -> dict[str, str]:
+    """Insert projected rows with their surface and ticket-file dependencies.
+
+    Returns the written ``row_json`` keyed by row id.
+    """
+
+    row_list = list(rows)
+    params = [
+        _chat_index_projection_params(
+            row,
+            source_signature=source_signature,
+            rebuilt_at=projected_at,
+        )
+        for row in row_list
+    ]
+    conn.executemany(_CHAT_INDEX_PROJECTION_INSERT_SQL, params)
+    memberships: set[tuple[str, str, str]] = set()
+    files: list[tuple[str, str, Optional[int], Optional[int]]] = []
+    for row, row_params in zip(row_list, params, strict=True):
+        row_id = str(row_params[0])
+        for surface in row.get("surfaces") or []:
+            if not isinstance(surface, Mapping):
+                continue
+            normalized = _normalized_surface(
+                surface.get("surface_kind"), surface.get("surface_key")
+            )
+            if normalized is not None:
+                memberships.add((normalized[0], normalized[1], row_id))
+        for path in _chat_index_row_file_dependencies(row):
+            files.append((row_id, str(path), *_file_stat_signature(path)))
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO orch_chat_index_projection_surfaces (
+            surface_kind,
+            surface_key,
+            row_id
+        ) VALUES (?, ?, ?)
+        """,
+        sorted(memberships),
+    )
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO orch_chat_index_projection_files (
+            row_id,
+            path,
+            mtime_ns,
+            size
+        ) VALUES (?, ?, ?, ?)
+        """,
+        files,
+    )
+    if _chat_index_fts_available(conn):
+        conn.executemany(
+            """
+            INSERT INTO orch_chat_index_projection_fts (
+                row_id,
+                title,
+                preview,
+                tokens
+            ) VALUES (?, ?, ?, ?)
+            """,
+            list(
+                {
+                    str(row_params[0]): (
+                        str(row_params[0]),
+                        *_chat_row_search_columns(row),
+                    )
+                    for row, row_params in zip(row_list, params, strict=True)
+                }.values()
+            ),
+        )
+    return {
+        str(row_params[0]): str(row_params[_CHAT_INDEX_PROJECTION_ROW_JSON_PARAM])
+        for row_params in params
+    }
+
+
+def _chat_index_row_file_dependencies(row: Mapping[str, Any]) -> list[Path]:
+    if _normalize_kind(row.get("flow_type")) != "ticket_flow":
+        return []
+    path = _resolved_ticket_path(row)
+    return [path] if path is not None else []
+
+
+def _file_stat_signature(path: Path) -> tuple[Optional[int], Optional[int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return (None, None)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _normalized_surface(
+    surface_kind: Any, surface_key: Any
+) -> Optional[tuple[str, str]]:
+    kind = _normalize_kind(surface_kind)
+    key = _normalize_text(surface_key)
+    if kind is None or key is None:
+        return None
+    return (kind, key)
+
+
+def _surface_pairs_json(surfaces: Iterable[tuple[str, str]]) -> str:
+    return json.dumps([list(surface) for surface in sorted(set(surfaces))])
+
+
+def _surface_pairs_from_json(raw: Any) -> list[tuple[str, str]]:
+    try:
+        parsed = json.loads(raw or "[]")
+    except (TypeError, json.JSONDecodeError):
+        return []
+    if not isinstance(parsed, list):
+        return []
+    return [
+        (str(item[0]), str(item[1]))
+        for item in parsed
+        if isinstance(item, list) and len(item) == 2
+    ]
+
+
+def _notification_ids_json(surfaces: Iterable[tuple[str, str]]) -> str:
+    prefix = "notification:"
+    return json.dumps(
+        sorted(
+            surface_key[len(prefix) :]
+            for surface_kind, surface_key in surfaces
+            if surface_kind == "notification" and surface_key.startswith(prefix)
+        )
+    )
+
+
 def _table_exists(conn: Any, table_name: str) -> bool:
     row = conn.execute(
         "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import bisect
 import gzip
 import hashlib
+import itertools
 import json
 import uuid
 import zlib
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterator, Optional, cast
+from typing import IO, Any, Iterator, Optional, cast
 
 from ..redaction import redact_jsonable
 from ..state_roots import resolve_hub_traces_root
@@ -21,15 +24,77 @@ from .execution_history import (
 )
 from .sqlite import open_orchestration_sqlite
 
-_TRACE_FORMAT = "gzipped_jsonl"
-_TRACE_SCHEMA_VERSION = 1
+_TRACE_FORMAT = "gzipped_jsonl_blocks"
+_LEGACY_TRACE_FORMAT = "gzipped_jsonl"
+_TRACE_SCHEMA_VERSION = 2
 _TRACE_GLOB_SUFFIX = ".trace.jsonl.gz"
+_TRACE_INDEX_SUFFIX = ".idx"
+_TRACE_BLOCK_MAX_EVENTS = 256
+_TRACE_BLOCK_MAX_BYTES = 1024 * 1024
 
 
 def _trace_artifact_relpath(execution_id: str, trace_id: str) -> str:
     return f"{execution_id}/{trace_id}{_TRACE_GLOB_SUFFIX}"
 
 
+def cold_trace_index_path(artifact_path: Path) -> Path:
+    """Return the block index sidecar that belongs to a trace artifact."""
+    return artifact_path.with_name(artifact_path.name + _TRACE_INDEX_SUFFIX)
+
+
+@dataclass(frozen=True)
+class _TraceBlock:
+    """One independently compressed gzip member of a block-format trace.
+
+    ``first_event`` is the zero-based position of the block's first event in
+    the trace, which is what ``read_events(offset=...)`` addresses; ``first_seq``
+    and ``last_seq`` are the envelope sequence numbers it covers.
+    """
+
+    first_event: int
+    event_count: int
+    first_seq: int
+    last_seq: int
+    offset: int
+    length: int
+    families: tuple[str, ...] = ()
+
+    @property
+    def end_event(self) -> int:
+        return self.first_event + self.event_count
+
+    @property
+    def end_offset(self) -> int:
+        return self.offset + self.length
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "first_event": self.first_event,
+            "event_count": self.event_count,
+            "first_seq": self.first_seq,
+            "last_seq": self.last_seq,
+            "offset": self.offset,
+            "length": self.length,
+            "families": list(self.families),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "_TraceBlock":
+        families = data.get("families")
+        return cls(
+            first_event=int(data["first_event"]),
+            event_count=int(data["event_count"]),
+            first_seq=int(data["first_seq"]),
+            last_seq=int(data["last_seq"]),
+            offset=int(data["offset"]),
+            length=int(data["length"]),
+            families=tuple(
+                str(family)
+                for family in (families if isinstance(families, list) else [])
+            ),
+        )
+
+
 def _build_trace_envelope(
     *,
     seq: int,
@@ -56,7 +121,14 @@ def _serialize_envelope(envelope: dict[str, Any]) -> bytes:
 class ColdTraceWriter:
     """Append-only writer for a single execution's cold trace artifact.
 
-    The writer keeps a gzip file open and appends JSONL event envelopes.
+    Events are written as JSONL into a sequence of gzip members of at most
+    ``_TRACE_BLOCK_MAX_EVENTS`` events each, so the artifact is still a plain
+    ``.jsonl.gz`` file. Every closed block is recorded in a sidecar index
+    (``<artifact>.idx``) with its event range and byte range, which lets readers
+    seek straight to the block holding a given event. The open block is
+    sync-flushed after each append so live readers see it without waiting for
+    the block to close.
+
     Callers must call ``finalize()`` when the execution ends to persist the
     manifest; ``close()`` is also available for cleanup without finalization.
     """
@@ -78,6 +150,7 @@ class ColdTraceWriter:
         self._traces_root = resolve_hub_traces_root(hub_root)
         self._relpath = _trace_artifact_relpath(execution_id, self._trace_id)
         self._artifact_path = self._traces_root / self._relpath
+        self._index_path = cold_trace_index_path(self._artifact_path)
         self._seq: int = 0
         self._event_count: int = 0
         self._byte_count: int = 0
@@ -86,7 +159,14 @@ class ColdTraceWriter:
         self._started_at: Optional[str] = None
         self._finished_at: Optional[str] = None
         self._manifest: Optional[ExecutionTraceManifest] = None
-        self._file: Optional[gzip.GzipFile] = None
+        self._file: Optional[IO[bytes]] = None
+        self._block: Optional[gzip.GzipFile] = None
+        self._block_offset: int = 0
+        self._block_first_seq: int = 0
+        self._block_event_count: int = 0
+        self._block_byte_count: int = 0
+        self._block_families: set[str] = set()
+        self._indexed_event_count: int = 0
         self._disabled: bool = False
 
     @property
@@ -111,7 +191,8 @@ class ColdTraceWriter:
 
     def open(self) -> "ColdTraceWriter":
         self._artifact_path.parent.mkdir(parents=True, exist_ok=True)
-        self._file = gzip.open(self._artifact_path, "ab")
+        self._indexed_event_count = _index_unindexed_tail(self._artifact_path)
+        self._file = open(self._artifact_path, "ab")
         self._disabled = False
         self._started_at = now_iso()
         self._manifest = ExecutionTraceManifest(
@@ -154,15 +235,26 @@ class ColdTraceWriter:
             payload=cast(dict[str, Any], redacted_payload),
         )
         data = _serialize_envelope(envelope)
-        self._file.write(data)
-        self._file.flush()
+        block = self._open_block()
+        block.write(data)
+        block.flush()
+        self._block_event_count += 1
+        self._block_byte_count += len(data)
+        self._block_families.add(event_family)
         self._byte_count += len(data)
         self._event_count += 1
         self._includes_families.add(event_family)
+        if (
+            self._block_event_count >= _TRACE_BLOCK_MAX_EVENTS
+            or self._block_byte_count >= _TRACE_BLOCK_MAX_BYTES
+        ):
+            self._close_block()
         return self._seq
 
     def flush(self) -> None:
-        if self._file is not None:
+        if self._block is not None:
+            self._block.flush()
+        elif self._file is not None:
             self._file.flush()
 
     def finalize(self) -> ExecutionTraceManifest:
@@ -206,7 +298,42 @@ class ColdTraceWriter:
         self._disabled = True
         self._close_file()
 
+    def _open_block(self) -> gzip.GzipFile:
+        if self._block is not None:
+            return self._block
+        assert self._file is not None
+        self._block_offset = self._file.tell()
+        self._block_first_seq = self._seq
+        self._block_event_count = 0
+        self._block_byte_count = 0
+        self._block_families = set()
+        self._block = gzip.GzipFile(filename="", mode="wb", fileobj=self._file, mtime=0)
+        return self._block
+
+    def _close_block(self) -> None:
+        if self._block is None or self._file is None:
+            return
+        block = self._block
+        self._block = None
+        block.close()
+        self._file.flush()
+        entry = _TraceBlock(
+            first_event=self._indexed_event_count,
+            event_count=self._block_event_count,
+            first_seq=self._block_first_seq,
+            last_seq=self._block_first_seq + self._block_event_count - 1,
+            offset=self._block_offset,
+            length=self._file.tell() - self._block_offset,
+            families=tuple(sorted(self._block_families)),
+        )
+        _append_trace_index(self._index_path, entry)
+        self._indexed_event_count = entry.end_event
+
     def _close_file(self) -> None:
+        try:
+            self._close_block()
+        except Exception:
+            self._block = None
         if self._file is not None:
             try:
                 self._file.close()
@@ -221,6 +348,74 @@ class ColdTraceWriter:
         self.close()
 
 
+def _append_trace_index(index_path: Path, block: _TraceBlock) -> None:
+    with open(index_path, "a", encoding="utf-8") as f:
+        f.write(_json_dumps(block.to_dict()) + "\n")
+
+
+def _load_trace_index(artifact_path: Path) -> list[_TraceBlock]:
+    """Load the block index for ``artifact_path``.
+
+    Returns an empty list for legacy single-stream traces. Entries that are
+    truncated or do not continue the previous block end the index, so readers
+    fall back to scanning from the last trusted block instead of seeking to a
+    bad offset.
+    """
+    index_path = cold_trace_index_path(artifact_path)
+    try:
+        raw = index_path.read_text(encoding="utf-8")
+    except OSError:
+        return []
+    blocks: list[_TraceBlock] = []
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        try:
+            block = _TraceBlock.from_dict(json.loads(line))
+        except (ValueError, KeyError, TypeError):
+            break
+        expected_offset = blocks[-1].end_offset if blocks else 0
+        expected_event = blocks[-1].end_event if blocks else 0
+        if block.offset != expected_offset or block.first_event != expected_event:
+            break
+        blocks.append(block)
+    return blocks
+
+
+def _index_unindexed_tail(artifact_path: Path) -> int:
+    """Index bytes left behind after the last indexed block.
+
+    A writer that died mid-block leaves a gzip member without a trailer. That
+    member is recorded as its own block before new blocks are appended, so it
+    stays readable without decompressing it as part of the next member.
+    Returns the number of events covered by the index.
+    """
+    blocks = _load_trace_index(artifact_path)
+    indexed_end = blocks[-1].end_offset if blocks else 0
+    indexed_events = blocks[-1].end_event if blocks else 0
+    try:
+        size = artifact_path.stat().st_size
+    except OSError:
+        return indexed_events
+    if size <= indexed_end:
+        return indexed_events
+    envelopes = list(_iter_trace_segment(artifact_path, offset=indexed_end))
+    if not envelopes:
+        return indexed_events
+    seqs = [_envelope_seq(envelope) for envelope in envelopes]
+    block = _TraceBlock(
+        first_event=indexed_events,
+        event_count=len(envelopes),
+        first_seq=seqs[0],
+        last_seq=seqs[-1],
+        offset=indexed_end,
+        length=size - indexed_end,
+        families=tuple(sorted(_envelope_families(envelopes))),
+    )
+    _append_trace_index(cold_trace_index_path(artifact_path), block)
+    return block.end_event
+
+
 def _compute_file_checksum(path: Path) -> str:
     sha256 = hashlib.sha256()
     if not path.exists():
@@ -283,7 +478,13 @@ def _persist_manifest(hub_root: Path, manifest: ExecutionTraceManifest) -> None:
 
 
 class ColdTraceReader:
-    """Read events from a finalized cold trace artifact."""
+    """Read events from a cold trace artifact.
+
+    Block-format traces are read through their index: ``read_events`` seeks to
+    the block containing ``offset`` and decompresses only the blocks it
+    returns, so paging and tailing an open trace cost the page, not the trace.
+    Legacy single-stream traces are scanned from the start.
+    """
 
     @staticmethod
     def read_events(
@@ -297,19 +498,14 @@ class ColdTraceReader:
         artifact_path = traces_root / manifest.artifact_relpath
         if not artifact_path.exists():
             return []
-        events: list[dict[str, Any]] = []
-        count = 0
-        for envelope in _iter_trace_envelopes(
+        if limit is not None and limit <= 0:
+            return []
+        envelopes = _iter_trace_envelopes(
             artifact_path,
             allow_partial=(manifest.status == "open"),
-        ):
-            count += 1
-            if count <= offset:
-                continue
-            events.append(envelope)
-            if limit is not None and len(events) >= limit:
-                break
-        return events
+            start=max(0, offset),
+        )
+        return list(itertools.islice(envelopes, limit))
 
     @staticmethod
     def iter_events(
@@ -644,13 +840,18 @@ def _refresh_open_manifest(
     artifact_path = traces_root / manifest.artifact_relpath
     if not artifact_path.exists():
         return manifest
-    event_count = 0
+    blocks = _load_trace_index(artifact_path)
+    event_count = blocks[-1].end_event if blocks else 0
     includes_families: set[str] = set()
-    for envelope in _iter_trace_envelopes(artifact_path, allow_partial=True):
-        event_count += 1
-        family = str(envelope.get("event_family") or "").strip()
-        if family:
-            includes_families.add(family)
+    for block in blocks:
+        includes_families.update(block.families)
+    tail = list(
+        _iter_trace_segment(
+            artifact_path, offset=blocks[-1].end_offset if blocks else 0
+        )
+    )
+    event_count += len(tail)
+    includes_families.update(_envelope_families(tail))
     return ExecutionTraceManifest(
         trace_id=manifest.trace_id,
         execution_id=manifest.execution_id,
@@ -677,39 +878,103 @@ def _iter_trace_envelopes(
     artifact_path: Path,
     *,
     allow_partial: bool,
+    start: int = 0,
 ) -> Iterator[dict[str, Any]]:
-    if allow_partial:
-        raw_bytes = artifact_path.read_bytes()
-        if not raw_bytes:
-            return
+    """Yield envelopes from event position ``start`` onwards.
+
+    Indexed blocks before ``start`` are skipped without being read; bytes past
+    the last indexed block (the block an open writer is still filling, or a
+    whole legacy trace) are decompressed as one tolerant segment.
+    """
+    blocks = _load_trace_index(artifact_path)
+    if not blocks and not allow_partial:
+        yield from itertools.islice(_iter_legacy_trace(artifact_path), start, None)
+        return
+    first = bisect.bisect_right(blocks, start, key=lambda block: block.end_event)
+    if first < len(blocks):
+        skip = start - blocks[first].first_event
+    else:
+        skip = start - (blocks[-1].end_event if blocks else 0)
+    for block in blocks[first:]:
+        envelopes = _iter_trace_segment(
+            artifact_path, offset=block.offset, length=block.length
+        )
+        yield from itertools.islice(envelopes, skip, None)
+        skip = 0
+    tail_offset = blocks[-1].end_offset if blocks else 0
+    yield from itertools.islice(
+        _iter_trace_segment(artifact_path, offset=tail_offset), skip, None
+    )
+
+
+def _iter_trace_segment(
+    artifact_path: Path,
+    *,
+    offset: int,
+    length: Optional[int] = None,
+) -> Iterator[dict[str, Any]]:
+    """Decompress gzip members stored at ``offset`` and yield their envelopes.
+
+    Tolerates a member without its trailer (an open block) and a torn final
+    line, both of which are normal while a writer is appending.
+    """
+    try:
+        with open(artifact_path, "rb") as f:
+            f.seek(offset)
+            raw = f.read() if length is None else f.read(length)
+    except OSError:
+        return
+    yield from _parse_trace_lines(_decompress_gzip_members(raw))
+
+
+def _decompress_gzip_members(raw: bytes) -> str:
+    chunks: list[bytes] = []
+    while raw:
         decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
         try:
-            text = decompressor.decompress(raw_bytes).decode("utf-8", errors="ignore")
+            chunks.append(decompressor.decompress(raw))
         except zlib.error:
-            return
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                envelope = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(envelope, dict):
-                yield envelope
-        return
+            break
+        if not decompressor.eof:
+            break
+        raw = decompressor.unused_data
+    return b"".join(chunks).decode("utf-8", errors="ignore")
+
 
+def _iter_legacy_trace(artifact_path: Path) -> Iterator[dict[str, Any]]:
     with gzip.open(artifact_path, "rt", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                envelope = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(envelope, dict):
-                yield envelope
+        yield from _parse_trace_lines(f)
+
+
+def _parse_trace_lines(lines: Any) -> Iterator[dict[str, Any]]:
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            envelope = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(envelope, dict):
+            yield envelope
+
+
+def _envelope_seq(envelope: dict[str, Any]) -> int:
+    try:
+        return int(envelope.get("seq") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _envelope_families(envelopes: list[dict[str, Any]]) -> set[str]:
+    families: set[str] = set()
+    for envelope in envelopes:
+        family = str(envelope.get("event_family") or "").strip()
+        if family:
+            families.add(family)
+    return families
 
 
 def _row_optional(row: Any, key: str) -> Optional[str]:
@@ -750,4 +1015,5 @@ __all__ = [
     "ColdTraceReader",
     "ColdTraceStore",
     "ColdTraceWriter",
+    "cold_trace_index_path",
 ]
@@ -14,6 +14,8 @@ from .cold_trace_store import ColdTraceStore
 from .execution_history import timeline_hot_family_for_event_type
 from .execution_history_maintenance import (
     ExecutionHistoryMaintenancePolicy,
+    ExecutionHistoryRetentionSlice,
+    ExecutionHistoryVacuumSlice,
 )
 from .runtime_chain_diagnostics import (
     RuntimeChainReport,
@@ -888,6 +890,17 @@ def log_retention_prune(
     logger.info(_json_dumps(payload))
 
 
+def log_retention_slice(
+    *,
+    retention_slice: ExecutionHistoryRetentionSlice,
+    dry_run: bool,
+) -> None:
+    payload: dict[str, Any] = {"event": "execution_history_retention_slice"}
+    payload.update(retention_slice.to_dict())
+    payload["dry_run"] = dry_run
+    logger.info(_json_dumps(payload))
+
+
 def log_vacuum(
     *,
     database_path: str,
@@ -908,6 +921,19 @@ def log_vacuum(
     )
 
 
+def log_vacuum_slice(
+    *,
+    database_path: str,
+    vacuum_slice: ExecutionHistoryVacuumSlice,
+) -> None:
+    payload: dict[str, Any] = {
+        "event": "execution_history_vacuum_slice",
+        "database_path": database_path,
+    }
+    payload.update(vacuum_slice.to_dict())
+    logger.info(_json_dumps(payload))
+
+
 def log_quarantine(
     *,
     execution_id: str,
@@ -964,9 +990,11 @@ __all__ = [
     "log_dedupe",
     "log_quarantine",
     "log_retention_prune",
+    "log_retention_slice",
     "log_spill_to_cold",
     "log_startup_recovery",
     "log_truncation",
     "log_vacuum",
+    "log_vacuum_slice",
     "run_execution_history_diagnostics",
 ]
@@ -3,15 +3,17 @@ from __future__ import annotations
 import dataclasses
 import json
 import shutil
+import time
 from collections import Counter
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Mapping, Optional, Sequence, cast
+from typing import Any, Callable, Mapping, Optional, Sequence, cast
 
 from ..state_roots import resolve_hub_traces_root
 from ..text_utils import _json_dumps, _truncate_text
 from ..time_utils import now_iso
-from .cold_trace_store import ColdTraceStore
+from ..utils import atomic_write
+from .cold_trace_store import ColdTraceStore, cold_trace_index_path
 from .execution_history import (
     CheckpointSignalStatus,
     ExecutionCheckpoint,
@@ -27,14 +29,15 @@ from .execution_history_queries import (
     TIMELINE_EVENT_FAMILY as _TIMELINE_EVENT_FAMILY,
 )
 from .execution_history_queries import (
-    checkpoint_exists_for_execution,
-    count_all_timeline_rows_for_execution,
     count_baseline_timeline_rows,
-    delete_checkpoint_for_execution,
-    delete_timeline_rows_for_execution,
+    delete_checkpoints_for_executions,
+    delete_timeline_rows_for_executions,
+    execution_ids_with_checkpoints,
     load_timeline_rows,
     select_execution_rows,
+    select_terminal_executions_finished_before,
     timeline_row_counts_by_execution,
+    timeline_row_counts_for_executions,
 )
 from .migrations import collect_orchestration_migration_status
 from .sqlite import open_orchestration_sqlite, resolve_orchestration_sqlite_path
@@ -60,6 +63,12 @@ _TERMINAL_EXECUTION_STATUSES = frozenset(
 _TERMINAL_EVENT_TYPES = frozenset({"turn_completed", "turn_failed", "turn_interrupted"})
 _CHECKPOINT_PREVIEW_CHARS = 240
 _DEFAULT_AUDIT_LIMIT = 50
+_DEFAULT_PRUNE_BATCH_SIZE = 200
+_DEFAULT_PRUNE_TIME_BUDGET_SECONDS = 2.0
+_DEFAULT_INCREMENTAL_VACUUM_PAGES = 512
+_DEFAULT_INCREMENTAL_VACUUM_TIME_BUDGET_SECONDS = 2.0
+_SQLITE_AUTO_VACUUM_INCREMENTAL = 2
+_RETENTION_CURSOR_FILENAME = "execution_history_retention_cursor.json"
 
 
 @dataclasses.dataclass(frozen=True)
@@ -118,6 +127,22 @@ class ExecutionHistoryCompactionSummary:
         return dataclasses.asdict(self)
 
 
+@dataclasses.dataclass(frozen=True)
+class ExecutionHistoryRetentionSlice:
+    """One committed batch of hot-history retention deletes."""
+
+    executions_scanned: int
+    executions_pruned: int
+    hot_rows_deleted: int
+    checkpoints_deleted: int
+    elapsed_ms: float
+    cursor_finished_at: str
+    cursor_execution_id: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
 @dataclasses.dataclass(frozen=True)
 class ExecutionHistoryRetentionSummary:
     dry_run: bool
@@ -128,6 +153,9 @@ class ExecutionHistoryRetentionSummary:
     manifests_deleted: int
     trace_files_deleted: int
     bytes_reclaimed: int
+    complete: bool = True
+    resumed_from_cursor: bool = False
+    slices: tuple[ExecutionHistoryRetentionSlice, ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
         return dataclasses.asdict(self)
@@ -147,12 +175,31 @@ class ExecutionHistoryExportSummary:
         return dataclasses.asdict(self)
 
 
+@dataclasses.dataclass(frozen=True)
+class ExecutionHistoryVacuumSlice:
+    """One ``PRAGMA incremental_vacuum(N)`` step."""
+
+    pages_requested: int
+    pages_freed: int
+    reclaimed_bytes: int
+    free_pages_remaining: int
+    elapsed_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
 @dataclasses.dataclass(frozen=True)
 class ExecutionHistoryVacuumSummary:
     database_path: str
     size_before: int
     size_after: int
     reclaimed_bytes: int
+    mode: str = "full"
+    deferred: bool = False
+    complete: bool = True
+    free_pages_remaining: int = 0
+    slices: tuple[ExecutionHistoryVacuumSlice, ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
         return dataclasses.asdict(self)
@@ -663,8 +710,21 @@ def prune_execution_history_retention(
     *,
     policy: ExecutionHistoryMaintenancePolicy,
     dry_run: bool = False,
+    batch_size: int = _DEFAULT_PRUNE_BATCH_SIZE,
+    time_budget_seconds: Optional[float] = None,
 ) -> ExecutionHistoryRetentionSummary:
-    from .execution_history_diagnostics import log_retention_prune
+    """Delete hot rows and cold traces that aged out of the retention policy.
+
+    Hot rows are deleted in batches of ``batch_size`` executions, each in its
+    own short write transaction so other hub writers interleave between
+    batches. When ``time_budget_seconds`` runs out the pass stops early and
+    persists a retention cursor the next call resumes from; a pass that runs
+    to completion clears the cursor.
+    """
+    from .execution_history_diagnostics import (
+        log_retention_prune,
+        log_retention_slice,
+    )
 
     hot_cutoff = _iso_cutoff(policy.hot_history_retention_days)
     cold_cutoff = _iso_cutoff(policy.cold_trace_retention_days)
@@ -676,29 +736,74 @@ def prune_execution_history_retention(
     manifests_deleted = 0
     trace_files_deleted = 0
     bytes_reclaimed = 0
+    slices: list[ExecutionHistoryRetentionSlice] = []
+    complete = True
+    cursor = None if dry_run else _load_retention_cursor(hub_root)
+    resumed_from_cursor = cursor is not None
+    started = time.monotonic()
+    limit = max(1, int(batch_size))
+
+    while hot_cutoff is not None:
+        if (
+            time_budget_seconds is not None
+            and slices
+            and time.monotonic() - started >= time_budget_seconds
+        ):
+            complete = False
+            if not dry_run and cursor is not None:
+                _save_retention_cursor(hub_root, cursor)
+            break
+        slice_started = time.monotonic()
+        with open_orchestration_sqlite(hub_root) as conn:
+            batch = select_terminal_executions_finished_before(
+                conn,
+                cutoff=hot_cutoff,
+                terminal_statuses=sorted(_TERMINAL_EXECUTION_STATUSES),
+                after=cursor,
+                limit=limit,
+            )
+            if not batch:
+                break
+            batch_ids = [execution_id for _finished_at, execution_id in batch]
+            row_counts = timeline_row_counts_for_executions(conn, batch_ids)
+            with_checkpoints = execution_ids_with_checkpoints(conn, batch_ids)
+            batch_pruned = [
+                execution_id
+                for execution_id in batch_ids
+                if row_counts.get(execution_id) or execution_id in with_checkpoints
+            ]
+            batch_rows = sum(row_counts.values())
+            batch_checkpoints = len(with_checkpoints)
+            if batch_pruned and not dry_run:
+                with conn:
+                    batch_rows = delete_timeline_rows_for_executions(conn, batch_pruned)
+                    batch_checkpoints = delete_checkpoints_for_executions(
+                        conn, batch_pruned
+                    )
+        cursor = batch[-1]
+        pruned_execution_ids.extend(batch_pruned)
+        hot_rows_deleted += batch_rows
+        checkpoints_deleted += batch_checkpoints
+        retention_slice = ExecutionHistoryRetentionSlice(
+            executions_scanned=len(batch),
+            executions_pruned=len(batch_pruned),
+            hot_rows_deleted=batch_rows,
+            checkpoints_deleted=batch_checkpoints,
+            elapsed_ms=round((time.monotonic() - slice_started) * 1000.0, 3),
+            cursor_finished_at=cursor[0],
+            cursor_execution_id=cursor[1],
+        )
+        slices.append(retention_slice)
+        log_retention_slice(retention_slice=retention_slice, dry_run=dry_run)
+        if len(batch) < limit:
+            break
 
-    with open_orchestration_sqlite(hub_root) as conn:
-        execution_rows = select_execution_rows(conn)
-        for execution_row in execution_rows:
-            execution_id = str(execution_row["execution_id"] or "").strip()
-            if not execution_id or not _is_terminal_execution_row(execution_row):
-                continue
-            finished_at = _execution_finished_at(execution_row)
-            if hot_cutoff is None or not finished_at or finished_at > hot_cutoff:
-                continue
-            deleted_hot_rows = count_all_timeline_rows_for_execution(conn, execution_id)
-            chkpt_exists = checkpoint_exists_for_execution(conn, execution_id)
-            if deleted_hot_rows or chkpt_exists:
-                pruned_execution_ids.append(execution_id)
-            hot_rows_deleted += deleted_hot_rows
-            if chkpt_exists:
-                checkpoints_deleted += 1
-            if dry_run:
-                continue
-            with conn:
-                delete_timeline_rows_for_execution(conn, execution_id)
-                delete_checkpoint_for_execution(conn, execution_id)
+    if complete and not dry_run:
+        # A finished pass restarts from the oldest row next time, so rows whose
+        # age key sorts below the old cursor are not skipped forever.
+        _clear_retention_cursor(hub_root)
 
+    with open_orchestration_sqlite(hub_root) as conn:
         if cold_cutoff is not None:
             checkpoints_by_trace_manifest_id: dict[str, list[ExecutionCheckpoint]] = {}
             if not dry_run:
@@ -749,11 +854,12 @@ def prune_execution_history_retention(
                         """,
                         (manifest.trace_id,),
                     )
-                if artifact_path.exists():
-                    try:
-                        artifact_path.unlink()
-                    except OSError:
-                        pass
+                for path in (artifact_path, cold_trace_index_path(artifact_path)):
+                    if path.exists():
+                        try:
+                            path.unlink()
+                        except OSError:
+                            pass
                 _remove_empty_trace_dirs(
                     artifact_path.parent,
                     resolve_hub_traces_root(hub_root),
@@ -776,6 +882,9 @@ def prune_execution_history_retention(
         manifests_deleted=manifests_deleted,
         trace_files_deleted=trace_files_deleted,
         bytes_reclaimed=bytes_reclaimed,
+        complete=complete,
+        resumed_from_cursor=resumed_from_cursor,
+        slices=tuple(slices),
     )
 
 
@@ -817,6 +926,9 @@ def export_execution_history_bundle(
         dest = traces_dest / manifest.artifact_relpath
         dest.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(source, dest)
+        index_source = cold_trace_index_path(source)
+        if index_source.exists():
+            shutil.copy2(index_source, cold_trace_index_path(dest))
         try:
             total_bytes += dest.stat().st_size
         except OSError:
@@ -864,12 +976,23 @@ def export_execution_history_bundle(
 
 
 def vacuum_execution_history(hub_root: Path) -> ExecutionHistoryVacuumSummary:
+    """Run a blocking full ``VACUUM`` of the orchestration database.
+
+    The database is switched to ``auto_vacuum=INCREMENTAL`` first; SQLite
+    only applies that change during a full ``VACUUM``, after which
+    housekeeping reclaims space with short ``incremental_vacuum`` slices.
+    """
     from .execution_history_diagnostics import log_vacuum
 
     db_path = resolve_orchestration_sqlite_path(hub_root)
-    size_before = db_path.stat().st_size if db_path.exists() else 0
     with open_orchestration_sqlite(hub_root) as conn:
+        # Pooled connections stay open, so fold the WAL back into the main
+        # file before and after VACUUM to measure what was actually reclaimed.
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        size_before = db_path.stat().st_size if db_path.exists() else 0
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
         conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     size_after = db_path.stat().st_size if db_path.exists() else 0
     reclaimed = max(size_before - size_after, 0)
     log_vacuum(
@@ -886,6 +1009,111 @@ def vacuum_execution_history(hub_root: Path) -> ExecutionHistoryVacuumSummary:
     )
 
 
+def incremental_vacuum_execution_history(
+    hub_root: Path,
+    *,
+    pages_per_slice: int = _DEFAULT_INCREMENTAL_VACUUM_PAGES,
+    time_budget_seconds: float = _DEFAULT_INCREMENTAL_VACUUM_TIME_BUDGET_SECONDS,
+    is_idle: Optional[Callable[[], bool]] = None,
+) -> ExecutionHistoryVacuumSummary:
+    """Return free pages to the filesystem in short ``incremental_vacuum`` slices.
+
+    Slices only run while ``is_idle`` reports the hub idle (by default: no
+    execution is running) and stop once ``time_budget_seconds`` is spent;
+    leftover free pages are picked up by the next call. A database that is
+    not yet in ``auto_vacuum=INCREMENTAL`` mode is converted once with a full
+    ``VACUUM`` when idle.
+    """
+    from .execution_history_diagnostics import log_vacuum, log_vacuum_slice
+
+    db_path = resolve_orchestration_sqlite_path(hub_root)
+    idle = is_idle or (lambda: execution_history_is_idle(hub_root))
+    size_before = execution_history_database_size_bytes(hub_root)
+    if not idle():
+        return ExecutionHistoryVacuumSummary(
+            database_path=str(db_path),
+            size_before=size_before,
+            size_after=size_before,
+            reclaimed_bytes=0,
+            mode="incremental",
+            deferred=True,
+            complete=False,
+        )
+    with open_orchestration_sqlite(hub_root) as conn:
+        auto_vacuum = int(conn.execute("PRAGMA auto_vacuum").fetchone()[0])
+    if auto_vacuum != _SQLITE_AUTO_VACUUM_INCREMENTAL:
+        return vacuum_execution_history(hub_root)
+
+    pages = max(1, int(pages_per_slice))
+    slices: list[ExecutionHistoryVacuumSlice] = []
+    free_pages = 0
+    started = time.monotonic()
+    while True:
+        slice_started = time.monotonic()
+        with open_orchestration_sqlite(hub_root) as conn:
+            page_size = int(conn.execute("PRAGMA page_size").fetchone()[0])
+            free_before = int(conn.execute("PRAGMA freelist_count").fetchone()[0])
+            if free_before <= 0:
+                free_pages = 0
+                break
+            # executescript steps the pragma to completion; a plain execute()
+            # stops after the first page.
+            conn.executescript(f"PRAGMA incremental_vacuum({pages});")
+            free_pages = int(conn.execute("PRAGMA freelist_count").fetchone()[0])
+            # Passive checkpoints never wait on readers or writers; they let
+            # the truncated main file shrink on disk as soon as possible.
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+        pages_freed = max(free_before - free_pages, 0)
+        vacuum_slice = ExecutionHistoryVacuumSlice(
+            pages_requested=pages,
+            pages_freed=pages_freed,
+            reclaimed_bytes=pages_freed * page_size,
+            free_pages_remaining=free_pages,
+            elapsed_ms=round((time.monotonic() - slice_started) * 1000.0, 3),
+        )
+        slices.append(vacuum_slice)
+        log_vacuum_slice(database_path=str(db_path), vacuum_slice=vacuum_slice)
+        if (
+            free_pages <= 0
+            or pages_freed <= 0
+            or time.monotonic() - started >= time_budget_seconds
+            or not idle()
+        ):
+            break
+
+    size_after = execution_history_database_size_bytes(hub_root)
+    reclaimed = sum(vacuum_slice.reclaimed_bytes for vacuum_slice in slices)
+    if slices:
+        log_vacuum(
+            database_path=str(db_path),
+            size_before=size_before,
+            size_after=size_after,
+            reclaimed_bytes=reclaimed,
+        )
+    return ExecutionHistoryVacuumSummary(
+        database_path=str(db_path),
+        size_before=size_before,
+        size_after=size_after,
+        reclaimed_bytes=reclaimed,
+        mode="incremental",
+        complete=free_pages <= 0,
+        free_pages_remaining=free_pages,
+        slices=tuple(slices),
+    )
+
+
+def execution_history_is_idle(hub_root: Path) -> bool:
+    """Return True when no managed-thread execution is currently running."""
+    with open_orchestration_sqlite(hub_root) as conn:
+        row = conn.execute("""
+            SELECT 1 AS busy
+              FROM orch_thread_executions
+             WHERE status = 'running'
+             LIMIT 1
+            """).fetchone()
+    return row is None
+
+
 def execution_history_database_size_bytes(hub_root: Path) -> int:
     db_path = resolve_orchestration_sqlite_path(hub_root)
     try:
@@ -989,10 +1217,9 @@ def run_execution_history_housekeeping_once(
     retention = prune_execution_history_retention(
         hub_root,
         policy=resolved_policy,
+        time_budget_seconds=_DEFAULT_PRUNE_TIME_BUDGET_SECONDS,
     )
-    vacuum_summary: Optional[ExecutionHistoryVacuumSummary] = None
-    if compaction.rows_deleted > 0 or retention.hot_rows_deleted > 0:
-        vacuum_summary = vacuum_execution_history(hub_root)
+    vacuum_summary = incremental_vacuum_execution_history(hub_root)
     db_size_after = (
         vacuum_summary.size_after
         if vacuum_summary is not None
@@ -1010,6 +1237,47 @@ def run_execution_history_housekeeping_once(
     )
 
 
+def _retention_cursor_path(hub_root: Path) -> Path:
+    return resolve_orchestration_sqlite_path(hub_root).with_name(
+        _RETENTION_CURSOR_FILENAME
+    )
+
+
+def _load_retention_cursor(hub_root: Path) -> Optional[tuple[str, str]]:
+    try:
+        payload = json.loads(_retention_cursor_path(hub_root).read_text("utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    finished_at = payload.get("finished_at")
+    execution_id = payload.get("execution_id")
+    if not isinstance(finished_at, str) or not isinstance(execution_id, str):
+        return None
+    return finished_at, execution_id
+
+
+def _save_retention_cursor(hub_root: Path, cursor: tuple[str, str]) -> None:
+    atomic_write(
+        _retention_cursor_path(hub_root),
+        json.dumps(
+            {
+                "finished_at": cursor[0],
+                "execution_id": cursor[1],
+                "updated_at": now_iso(),
+            }
+        )
+        + "\n",
+    )
+
+
+def _clear_retention_cursor(hub_root: Path) -> None:
+    try:
+        _retention_cursor_path(hub_root).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
 def _normalized_execution_ids(
     execution_ids: Optional[Sequence[str]],
 ) -> Optional[tuple[str, ...]]:
@@ -1590,7 +1858,9 @@ __all__ = [
     "ExecutionHistoryHousekeepingSummary",
     "ExecutionHistoryMaintenancePolicy",
     "ExecutionHistoryMigrationSummary",
+    "ExecutionHistoryRetentionSlice",
     "ExecutionHistoryRetentionSummary",
+    "ExecutionHistoryVacuumSlice",
     "ExecutionHistoryVacuumSummary",
     "OrchestrationStorageMaintenanceReadModel",
     "audit_execution_history",
@@ -1599,7 +1869,9 @@ __all__ = [
     "collect_orchestration_storage_maintenance_read_model",
     "compact_completed_execution_history",
     "execution_history_database_size_bytes",
+    "execution_history_is_idle",
     "export_execution_history_bundle",
+    "incremental_vacuum_execution_history",
     "prune_execution_history_retention",
     "resolve_execution_history_maintenance_policy",
     "run_execution_history_housekeeping_once",
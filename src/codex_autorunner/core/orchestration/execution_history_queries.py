@@ -173,6 +173,126 @@ def delete_checkpoint_for_execution(conn: Any, execution_id: str) -> None:
     )
 
 
+_EXECUTION_AGE_KEY_SQL = """
+    COALESCE(
+        NULLIF(TRIM(e.finished_at), ''),
+        NULLIF(TRIM(e.started_at), ''),
+        NULLIF(TRIM(e.created_at), '')
+    )
+"""
+
+
+def select_terminal_executions_finished_before(
+    conn: Any,
+    *,
+    cutoff: str,
+    terminal_statuses: Sequence[str],
+    after: Optional[tuple[str, str]] = None,
+    limit: int,
+) -> list[tuple[str, str]]:
+    """Return ``(finished_at, execution_id)`` pairs in cursor order.
+
+    ``finished_at`` falls back to ``started_at`` and ``created_at`` the same
+    way the Python-side retention checks do. ``after`` is an exclusive cursor
+    from a previous batch.
+    """
+    status_placeholders = ",".join("?" for _ in terminal_statuses)
+    params: list[Any] = [*terminal_statuses, cutoff]
+    cursor_clause = ""
+    if after is not None:
+        cursor_clause = f"""
+           AND ({_EXECUTION_AGE_KEY_SQL} > ?
+                OR ({_EXECUTION_AGE_KEY_SQL} = ? AND e.execution_id > ?))
+        """
+        params.extend([after[0], after[0], after[1]])
+    params.append(max(1, int(limit)))
+    rows = conn.execute(
+        f"""
+        SELECT {_EXECUTION_AGE_KEY_SQL} AS age_key,
+               e.execution_id
+          FROM orch_thread_executions AS e
+          JOIN orch_thread_targets AS t
+            ON t.thread_target_id = e.thread_target_id
+         WHERE (LOWER(TRIM(COALESCE(e.status, ''))) IN ({status_placeholders})
+                OR TRIM(COALESCE(e.finished_at, '')) != '')
+           AND TRIM(COALESCE(e.execution_id, '')) != ''
+           AND {_EXECUTION_AGE_KEY_SQL} <= ?
+           {cursor_clause}
+         ORDER BY age_key ASC, e.execution_id ASC
+         LIMIT ?
+        """,
+        tuple(params),
+    ).fetchall()
+    return [(str(row["age_key"]), str(row["execution_id"])) for row in rows]
+
+
+def timeline_row_counts_for_executions(
+    conn: Any, execution_ids: Sequence[str]
+) -> dict[str, int]:
+    if not execution_ids:
+        return {}
+    placeholders = ",".join("?" for _ in execution_ids)
+    return {
+        str(row["execution_id"]): int(row["cnt"] or 0)
+        for row in conn.execute(
+            f"""
+            SELECT execution_id, COUNT(*) AS cnt
+              FROM orch_event_projections
+             WHERE event_family = ?
+               AND execution_id IN ({placeholders})
+             GROUP BY execution_id
+            """,
+            (TIMELINE_EVENT_FAMILY, *execution_ids),
+        ).fetchall()
+    }
+
+
+def execution_ids_with_checkpoints(conn: Any, execution_ids: Sequence[str]) -> set[str]:
+    if not execution_ids:
+        return set()
+    placeholders = ",".join("?" for _ in execution_ids)
+    return {
+        str(row["execution_id"])
+        for row in conn.execute(
+            f"""
+            SELECT execution_id
+              FROM orch_execution_checkpoints
+             WHERE execution_id IN ({placeholders})
+            """,
+            tuple(execution_ids),
+        ).fetchall()
+    }
+
+
+def delete_timeline_rows_for_executions(conn: Any, execution_ids: Sequence[str]) -> int:
+    if not execution_ids:
+        return 0
+    placeholders = ",".join("?" for _ in execution_ids)
+    cursor = conn.execute(
+        f"""
+        DELETE FROM orch_event_projections
+         WHERE event_family = ?
+           AND execution_id IN ({placeholders})
+        """,
+        (TIMELINE_EVENT_FAMILY, *execution_ids),
+    )
+    return max(0, int(cursor.rowcount or 0))
+
+
+def delete_checkpoints_for_executions(conn: Any, execution_ids: Sequence[str]) -> int:
+    if not execution_ids:
+        return 0
+    placeholders = ",".join("?" for _ in execution_ids)
+    cursor = conn.execute(
+        f"""
+        DELETE FROM orch_execution_checkpoints
+         WHERE execution_id IN ({placeholders})
+        """,
+        tuple(execution_ids),
+    )
+    return max(0, int(cursor.rowcount or 0))
+
+
 def _decode_payload(raw: Any) -> dict[str, Any]:
     if not isinstance(raw, str) or not raw.strip():
         return {}
@@ -190,8 +310,13 @@ __all__ = [
     "count_all_timeline_rows_for_execution",
     "count_baseline_timeline_rows",
     "delete_checkpoint_for_execution",
+    "delete_checkpoints_for_executions",
     "delete_timeline_rows_for_execution",
+    "delete_timeline_rows_for_executions",
+    "execution_ids_with_checkpoints",
     "load_timeline_rows",
     "select_execution_rows",
+    "select_terminal_executions_finished_before",
     "timeline_row_counts_by_execution",
+    "timeline_row_counts_for_executions",
 ]
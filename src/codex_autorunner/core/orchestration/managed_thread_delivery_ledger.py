@@ -15,11 +15,13 @@ Placement:
 from __future__ import annotations
 
 import json
+import logging
+import threading
 import uuid
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Mapping, Optional, cast
+from typing import Any, Callable, Mapping, Optional, cast
 
 from ..time_utils import now_iso
 from .chat_surface_emitters import emit_chat_surface_event
@@ -43,6 +45,7 @@ from .managed_thread_delivery import (
     plan_managed_thread_delivery_recovery,
     record_from_intent,
 )
+from .notification_bus import delivery_topic, ring, thread_topic
 from .sqlite import open_orchestration_sqlite
 from .turn_assistant_output import TurnAssistantOutput
 
@@ -53,6 +56,38 @@ _DEFAULT_MAX_ATTEMPTS = 5
 _DEFAULT_BACKOFF_MULTIPLIER = 2.0
 _DEFAULT_MAX_BACKOFF = timedelta(minutes=30)
 
+logger = logging.getLogger(__name__)
+
+DeliveryIntentListener = Callable[[ManagedThreadDeliveryRecord], None]
+
+_intent_listeners: list[DeliveryIntentListener] = []
+_intent_listeners_lock = threading.Lock()
+
+
+def add_delivery_intent_listener(listener: DeliveryIntentListener) -> None:
+    """Call ``listener`` after a new delivery record commits in this process.
+
+    Delivery workers use this to wake immediately instead of waiting for their
+    next poll. Listeners run on the registering thread and must not block.
+    """
+    with _intent_listeners_lock:
+        _intent_listeners.append(listener)
+
+
+def remove_delivery_intent_listener(listener: DeliveryIntentListener) -> None:
+    with _intent_listeners_lock:
+        _intent_listeners[:] = [lst for lst in _intent_listeners if lst != listener]
+
+
+def _notify_intent_listeners(record: ManagedThreadDeliveryRecord) -> None:
+    with _intent_listeners_lock:
+        listeners = list(_intent_listeners)
+    for listener in listeners:
+        try:
+            listener(record)
+        except Exception as exc:  # intentional: listeners must not break commits
+            logger.exception("Error in delivery intent listener: %s", exc)
+
 
 class SQLiteManagedThreadDeliveryLedger:
     """Durable SQLite-backed implementation of the delivery ledger protocol."""
@@ -76,6 +111,12 @@ class SQLiteManagedThreadDeliveryLedger:
                 f"delivery record missing after insert: {record.delivery_id}"
             )
         _emit_delivery_event(self._hub_root, self._durable, stored)
+        _notify_intent_listeners(stored)
+        ring(
+            self._hub_root,
+            delivery_topic(stored.target.adapter_key),
+            thread_topic(stored.managed_thread_id),
+        )
         return ManagedThreadDeliveryRegistration(record=stored, inserted=True)
 
     def get_delivery(self, delivery_id: str) -> Optional[ManagedThreadDeliveryRecord]:
@@ -1090,6 +1131,9 @@ def _optional_text(value: Any) -> Optional[str]:
 
 
 __all__ = [
+    "DeliveryIntentListener",
     "SQLiteManagedThreadDeliveryEngine",
     "SQLiteManagedThreadDeliveryLedger",
+    "add_delivery_intent_listener",
+    "remove_delivery_intent_listener",
 ]
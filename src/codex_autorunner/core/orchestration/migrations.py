@@ -3021,6 +3021,26 @@ _TABLE_DEFINITIONS = (
         role="projection",
         description="Metadata for chat index projection rebuild freshness and source signatures.",
     ),
+    OrchestrationTableDefinition(
+        name="orch_chat_index_projection_changes",
+        role="projection",
+        description="Trigger-fed log of managed threads, surfaces, and flow runs changed since the chat index projection high-water mark.",
+    ),
+    OrchestrationTableDefinition(
+        name="orch_chat_index_projection_surfaces",
+        role="projection",
+        description="Surface-to-row membership for incremental chat index projection updates.",
+    ),
+    OrchestrationTableDefinition(
+        name="orch_chat_index_projection_files",
+        role="projection",
+        description="Ticket file stats that projected chat index rows depend on.",
+    ),
+    OrchestrationTableDefinition(
+        name="orch_chat_index_projection_fts",
+        role="projection",
+        description="FTS5 index of chat index projection titles, previews, and owner/agent tokens for ranked search.",
+    ),
     OrchestrationTableDefinition(
         name="orch_automation_rules",
         role="authoritative",
@@ -0,0 +1,212 @@
+"""Add the change log and dependency tables behind the incremental chat index.
+
+``orch_chat_index_projection`` used to be rebuilt wholesale whenever a
+signature over every source table changed. The tables added here let the read
+model re-project only the threads and surfaces touched since its last
+high-water mark:
+
+- ``orch_chat_index_projection_changes`` is fed by triggers on the canonical
+  tables the projection reads (thread targets, executions, bindings,
+  deliveries, notification reply contexts, and ticket-flow run projections).
+  Each row names the managed thread, surface, or flow run that changed; older
+  duplicates of the same key are collapsed so the log stays bounded by the
+  number of distinct dirty keys rather than the write rate.
+- ``orch_chat_index_projection_surfaces`` records which projected row each
+  surface currently belongs to, so a rebound surface also refreshes the row it
+  left.
+- ``orch_chat_index_projection_files`` records ticket files whose frontmatter a
+  projected row depends on.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from ...sqlite_utils import SqliteMigrationStep, table_exists
+
+# (table, trigger slug, optional WHEN guard, change-row column expressions).
+# Expressions are written against ``{row}`` which is replaced by NEW/OLD.
+_CHANGE_SOURCES: tuple[tuple[str, str, str, tuple[dict[str, str], ...]], ...] = (
+    (
+        "orch_thread_targets",
+        "thread_targets",
+        "",
+        ({"managed_thread_id": "{row}.thread_target_id"},),
+    ),
+    (
+        "orch_thread_executions",
+        "thread_executions",
+        "",
+        ({"managed_thread_id": "{row}.thread_target_id"},),
+    ),
+    (
+        "orch_bindings",
+        "bindings",
+        "",
+        (
+            {
+                "managed_thread_id": "{row}.target_id",
+                "surface_kind": "{row}.surface_kind",
+                "surface_key": "{row}.surface_key",
+            },
+        ),
+    ),
+    (
+        "orch_managed_thread_deliveries",
+        "deliveries",
+        "",
+        (
+            {
+                "managed_thread_id": "{row}.managed_thread_id",
+                "surface_kind": "{row}.surface_kind",
+                "surface_key": "{row}.surface_key",
+            },
+        ),
+    ),
+    (
+        "orch_notification_conversations",
+        "notifications",
+        "",
+        (
+            {
+                "managed_thread_id": "{row}.managed_thread_id",
+                "surface_kind": "'notification'",
+                "surface_key": "'notification:' || {row}.notification_id",
+            },
+            {"managed_thread_id": "{row}.continuation_thread_target_id"},
+        ),
+    ),
+    (
+        "orch_flow_run_projections",
+        "flow_run_projections",
+        "{row}.flow_type = 'ticket_flow'",
+        ({"run_id": "{row}.flow_run_id"},),
+    ),
+)
+
+_CHANGE_COLUMNS = ("managed_thread_id", "surface_kind", "surface_key", "run_id")
+
+
+def _change_insert(row_ref: str, columns: dict[str, str]) -> str:
+    values = ", ".join(
+        (
+            f"COALESCE({columns[name].format(row=row_ref)}, '')"
+            if name in columns
+            else "''"
+        )
+        for name in _CHANGE_COLUMNS
+    )
+    return (
+        "INSERT INTO orch_chat_index_projection_changes "
+        f"({', '.join(_CHANGE_COLUMNS)}) VALUES ({values});"
+    )
+
+
+def _create_change_triggers(conn: sqlite3.Connection) -> None:
+    for table, slug, guard, change_rows in _CHANGE_SOURCES:
+        if not table_exists(conn, table):
+            continue
+        for operation, row_refs in (
+            ("INSERT", ("NEW",)),
+            ("UPDATE", ("OLD", "NEW")),
+            ("DELETE", ("OLD",)),
+        ):
+            guards = [guard.format(row=ref) for ref in row_refs if guard]
+            when_sql = f"WHEN {' OR '.join(guards)}" if guards else ""
+            body = "\n".join(
+                _change_insert(ref, columns)
+                for ref in row_refs
+                for columns in change_rows
+            )
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_orch_chat_index_{slug}_{operation.lower()}
+                AFTER {operation} ON {table}
+                {when_sql}
+                BEGIN
+                {body}
+                END
+                """)
+
+
+def _apply(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS orch_chat_index_projection_changes (
+            change_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            managed_thread_id TEXT NOT NULL DEFAULT '',
+            surface_kind TEXT NOT NULL DEFAULT '',
+            surface_key TEXT NOT NULL DEFAULT '',
+            run_id TEXT NOT NULL DEFAULT ''
+        )
+        """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_orch_chat_index_projection_changes_key
+            ON orch_chat_index_projection_changes(
+                managed_thread_id,
+                surface_kind,
+                surface_key,
+                run_id
+            )
+        """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_orch_chat_index_projection_changes_collapse
+        AFTER INSERT ON orch_chat_index_projection_changes
+        BEGIN
+            DELETE FROM orch_chat_index_projection_changes
+             WHERE managed_thread_id = NEW.managed_thread_id
+               AND surface_kind = NEW.surface_kind
+               AND surface_key = NEW.surface_key
+               AND run_id = NEW.run_id
+               AND change_id < NEW.change_id;
+        END
+        """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS orch_chat_index_projection_surfaces (
+            surface_kind TEXT NOT NULL,
+            surface_key TEXT NOT NULL,
+            row_id TEXT NOT NULL,
+            PRIMARY KEY (surface_kind, surface_key, row_id)
+        )
+        """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_orch_chat_index_projection_surfaces_row
+            ON orch_chat_index_projection_surfaces(row_id)
+        """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS orch_chat_index_projection_files (
+            row_id TEXT NOT NULL,
+            path TEXT NOT NULL,
+            mtime_ns INTEGER,
+            size INTEGER,
+            PRIMARY KEY (row_id, path)
+        )
+        """)
+    if table_exists(conn, "orch_chat_index_projection"):
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_orch_chat_index_projection_thread
+                ON orch_chat_index_projection(managed_thread_id)
+            """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_orch_chat_index_projection_run
+                ON orch_chat_index_projection(run_id)
+            """)
+    # Scoped re-projection looks sources up by thread and by surface.
+    if table_exists(conn, "orch_bindings"):
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_orch_bindings_target_active
+                ON orch_bindings(target_id)
+             WHERE disabled_at IS NULL
+            """)
+    if table_exists(conn, "orch_notification_conversations"):
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_orch_notification_managed_thread
+                ON orch_notification_conversations(managed_thread_id)
+            """)
+    if table_exists(conn, "orch_managed_thread_deliveries"):
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_orch_mtd_surface
+                ON orch_managed_thread_deliveries(surface_kind, surface_key)
+            """)
+    _create_change_triggers(conn)
+
+
+STEP = SqliteMigrationStep(47, "add_chat_index_projection_change_log", _apply)
@@ -0,0 +1,44 @@
+"""Add the FTS5 index that shadows ``orch_chat_index_projection``.
+
+Chat search used to filter the projection with ``search_text LIKE '%q%'``,
+which scans every projected row. ``orch_chat_index_projection_fts`` holds the
+searchable text of each projected row in separate columns so matches can be
+ranked (titles weigh more than previews) and highlighted:
+
+- ``title``: visible chat title and display title.
+- ``preview``: the last visible message preview.
+- ``tokens``: thread id, repo/resource, agent, profile, model, and surface
+  kinds.
+
+The table is written by the read model alongside every projection write, and
+the projection schema version bump that accompanies it forces one rebuild to
+populate it. SQLite builds without FTS5 skip the table; search then falls back
+to the ``search_text`` scan.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from ...sqlite_utils import SqliteMigrationStep
+
+
+def _apply(conn: sqlite3.Connection) -> None:
+    try:
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS orch_chat_index_projection_fts
+            USING fts5(
+                row_id UNINDEXED,
+                title,
+                preview,
+                tokens,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+            """)
+    except sqlite3.OperationalError as exc:
+        if "fts5" not in str(exc).lower():
+            raise
+
+
+STEP = SqliteMigrationStep(48, "add_chat_index_projection_fts", _apply)
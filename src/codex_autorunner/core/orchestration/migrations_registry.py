@@ -25,6 +25,10 @@ registering a step here automatically becomes the new target schema version.
 from __future__ import annotations
 
 from ..sqlite_utils import SqliteMigrationStep
+from .migrations_future.v047_add_chat_index_projection_change_log import (
+    STEP as _V047,
+)
+from .migrations_future.v048_add_chat_index_projection_fts import STEP as _V048
 
 # Import and append new migration steps here, in ascending version order,
 # e.g.:
@@ -33,6 +37,6 @@ from ..sqlite_utils import SqliteMigrationStep
 #
 #     REGISTERED_MIGRATIONS: tuple[SqliteMigrationStep, ...] = (_V047,)
 
-REGISTERED_MIGRATIONS: tuple[SqliteMigrationStep, ...] = ()
+REGISTERED_MIGRATIONS: tuple[SqliteMigrationStep, ...] = (_V047, _V048)
 
 __all__ = ["REGISTERED_MIGRATIONS"]
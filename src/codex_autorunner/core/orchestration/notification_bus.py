@@ -0,0 +1,357 @@
+"""Local cross-process doorbell for orchestration writers and pollers.
+
+Hub workers (lifecycle processing, automation, chat delivery, PMA lanes)
+re-query the orchestration database on timers because rows are also written
+by flow workers, chat services and CLI processes. This module lets a writer
+ring a topic after it commits, and lets pollers wake on that ring instead of
+waiting out their interval. Rings carry no data; receivers still read the
+database, and their poll interval stays as the fallback for lost rings.
+
+Each process that subscribes binds one Unix datagram socket in a per-hub
+doorbell directory under the user's runtime directory. ``ring`` dispatches to
+subscribers in the calling process directly and sends one small datagram to
+every other socket in the directory. Sends are non-blocking and never raise:
+a full receive buffer already guarantees a wakeup, and sockets whose owner
+exited are removed on the first refused send. If the doorbell base directory
+is not a private 0700 directory owned by the current user, the process keeps
+only in-process dispatch.
+
+Topics: ``lifecycle``, ``automation``, ``delivery:<adapter_key>``,
+``queue:<lane_id>``, and ``thread:<managed_thread_id>``. Writers only ring
+topics something subscribes to: chat delivery workers listen on
+``delivery:<adapter_key>`` and live managed-thread tails on ``thread:<id>``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import socket
+import stat
+import tempfile
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+TOPIC_LIFECYCLE = "lifecycle"
+TOPIC_AUTOMATION = "automation"
+TOPIC_DELIVERY = "delivery"
+
+NotificationCallback = Callable[[str], None]
+
+_SOCKET_SUFFIX = ".sock"
+_RECV_BUFFER_BYTES = 4096
+_RECV_TIMEOUT_SECONDS = 1.0
+_SUPPORTED = hasattr(socket, "AF_UNIX")
+
+
+def queue_topic(lane_id: str) -> str:
+    return f"queue:{lane_id}"
+
+
+def delivery_topic(adapter_key: str) -> str:
+    return f"{TOPIC_DELIVERY}:{adapter_key}"
+
+
+def thread_topic(managed_thread_id: str) -> str:
+    return f"thread:{managed_thread_id}"
+
+
+def notification_bus_dir(hub_root: Path) -> Path:
+    """Return the doorbell directory shared by every process using ``hub_root``.
+
+    It lives under the runtime directory rather than the hub so socket paths
+    stay within the ``AF_UNIX`` length limit for deeply nested hubs.
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    owner = os.getuid() if hasattr(os, "getuid") else 0
+    digest = hashlib.sha256(str(_hub_key(hub_root)).encode("utf-8")).hexdigest()
+    return Path(base) / f"car-notify-{owner}" / digest[:16]
+
+
+@dataclass(frozen=True)
+class NotificationBusStats:
+    rings: int
+    datagrams_sent: int
+    datagrams_received: int
+    callbacks_run: int
+    stale_sockets_removed: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rings": self.rings,
+            "datagrams_sent": self.datagrams_sent,
+            "datagrams_received": self.datagrams_received,
+            "callbacks_run": self.callbacks_run,
+            "stale_sockets_removed": self.stale_sockets_removed,
+        }
+
+
+_LOCK = threading.Lock()
+_counters = {
+    "rings": 0,
+    "datagrams_sent": 0,
+    "datagrams_received": 0,
+    "callbacks_run": 0,
+    "stale_sockets_removed": 0,
+}
+
+
+def _count(name: str, amount: int = 1) -> None:
+    with _LOCK:
+        _counters[name] += amount
+
+
+def _hub_key(hub_root: Path) -> str:
+    try:
+        return str(Path(hub_root).resolve())
+    except OSError:
+        return str(Path(hub_root).absolute())
+
+
+class _Receiver:
+    """One bound doorbell socket plus the in-process subscriptions for a hub."""
+
+    def __init__(self, hub_root: Path) -> None:
+        self.directory = notification_bus_dir(hub_root)
+        self.subscriptions: dict[int, tuple[str, NotificationCallback]] = {}
+        self.path: Optional[Path] = None
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        if not _SUPPORTED:
+            return
+        try:
+            problem = _claim_private_dir(self.directory.parent)
+            if problem is not None:
+                # Another user could read or spoof rings; stay in-process only.
+                logger.warning(
+                    "Notification bus disabled for %s: %s",
+                    self.directory.parent,
+                    problem,
+                )
+                return
+            self.directory.mkdir(exist_ok=True, mode=0o700)
+            path = self.directory / f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+            path = path.with_suffix(_SOCKET_SUFFIX)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sock.bind(str(path))
+            sock.settimeout(_RECV_TIMEOUT_SECONDS)
+        except OSError as exc:
+            # Pollers still run on their interval; only the fast path is lost.
+            logger.warning(
+                "Notification bus unavailable for %s: %s", self.directory, exc
+            )
+            return
+        self.path = path
+        self._sock = sock
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="orchestration-notify-bus"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            sock.close()
+        if self.path is not None:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+        # The receiver thread exits on its next recv timeout; callers may be on
+        # an event loop, so do not join it here.
+
+    def dispatch(self, topics: tuple[str, ...]) -> None:
+        with _LOCK:
+            matches = [
+                (matched, callback)
+                for subscribed, callback in self.subscriptions.values()
+                if (matched := _first_match(subscribed, topics)) is not None
+            ]
+        for matched, callback in matches:
+            try:
+                callback(matched)
+            except Exception:  # intentional: subscribers must not stop the bus
+                logger.exception("Error in notification bus subscriber")
+                continue
+            _count("callbacks_run")
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            sock = self._sock
+            if sock is None:
+                return
+            try:
+                data = sock.recv(_RECV_BUFFER_BYTES)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            _count("datagrams_received")
+            topics = tuple(
+                topic for topic in data.decode("utf-8", "replace").split("\n") if topic
+            )
+            if topics:
+                self.dispatch(topics)
+
+
+def _claim_private_dir(path: Path) -> Optional[str]:
+    """Create ``path`` as a 0700 directory, or explain why it is not private.
+
+    ``mkdir(parents=True, mode=...)`` only applies the mode to the last
+    component, and the shared temp directory lets anyone pre-create the base,
+    so check what is actually there before binding inside it.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if stat.S_ISLNK(info.st_mode):
+        return "directory is a symlink"
+    if not stat.S_ISDIR(info.st_mode):
+        return "not a directory"
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        return f"owned by uid {info.st_uid}"
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        # Older releases created the base with the default umask.
+        os.chmod(path, 0o700)
+    return None
+
+
+def _first_match(subscribed: str, topics: tuple[str, ...]) -> Optional[str]:
+    if subscribed.endswith("*"):
+        prefix = subscribed[:-1]
+        return next((topic for topic in topics if topic.startswith(prefix)), None)
+    return subscribed if subscribed in topics else None
+
+
+_receivers: dict[str, _Receiver] = {}
+_next_subscription_id = 0
+_sender: Optional[socket.socket] = None
+_sender_lock = threading.Lock()
+
+
+def subscribe(
+    hub_root: Path, topic: str, callback: NotificationCallback
+) -> Callable[[], None]:
+    """Call ``callback(topic)`` whenever ``topic`` is rung for ``hub_root``.
+
+    ``topic`` may end with ``*`` to match a prefix (``"queue:*"``). Callbacks
+    run on the bus receiver thread (or the ringing thread for rings from this
+    process) and must not block; hand off with ``call_soon_threadsafe`` or an
+    event. Returns a function that removes the subscription.
+    """
+    global _next_subscription_id
+    key = _hub_key(hub_root)
+    with _LOCK:
+        receiver = _receivers.get(key)
+        created = receiver is None
+        if receiver is None:
+            receiver = _Receiver(Path(key))
+            _receivers[key] = receiver
+        _next_subscription_id += 1
+        subscription_id = _next_subscription_id
+        receiver.subscriptions[subscription_id] = (topic, callback)
+    if created:
+        receiver.start()
+
+    def _unsubscribe() -> None:
+        with _LOCK:
+            receiver.subscriptions.pop(subscription_id, None)
+            idle = not receiver.subscriptions and _receivers.get(key) is receiver
+            if idle:
+                _receivers.pop(key, None)
+        if idle:
+            receiver.stop()
+
+    return _unsubscribe
+
+
+def ring(hub_root: Path, *topics: str) -> None:
+    """Wake subscribers of ``topics`` in every process using ``hub_root``.
+
+    Call after the write commits. Never raises and never blocks.
+    """
+    if not topics:
+        return
+    _count("rings")
+    key = _hub_key(hub_root)
+    with _LOCK:
+        local = _receivers.get(key)
+    if local is not None:
+        local.dispatch(topics)
+    if not _SUPPORTED:
+        return
+    directory = (
+        local.directory if local is not None else notification_bus_dir(Path(key))
+    )
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    own = local.path.name if local is not None and local.path is not None else None
+    payload = "\n".join(topics).encode("utf-8")
+    for name in names:
+        if name == own or not name.endswith(_SOCKET_SUFFIX):
+            continue
+        _send(directory / name, payload)
+
+
+def _send(path: Path, payload: bytes) -> None:
+    global _sender
+    with _sender_lock:
+        try:
+            if _sender is None:
+                _sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                _sender.setblocking(False)
+            _sender.sendto(payload, str(path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            # The owning process exited without unlinking its socket.
+            try:
+                path.unlink()
+                _count("stale_sockets_removed")
+            except OSError:
+                pass
+            return
+        except OSError:
+            # BlockingIOError means the receiver already has unread rings.
+            return
+    _count("datagrams_sent")
+
+
+def notification_bus_stats() -> NotificationBusStats:
+    with _LOCK:
+        return NotificationBusStats(
+            rings=_counters["rings"],
+            datagrams_sent=_counters["datagrams_sent"],
+            datagrams_received=_counters["datagrams_received"],
+            callbacks_run=_counters["callbacks_run"],
+            stale_sockets_removed=_counters["stale_sockets_removed"],
+        )
+
+
+__all__ = [
+    "NotificationBusStats",
+    "NotificationCallback",
+    "TOPIC_AUTOMATION",
+    "TOPIC_DELIVERY",
+    "TOPIC_LIFECYCLE",
+    "delivery_topic",
+    "notification_bus_dir",
+    "notification_bus_stats",
+    "queue_topic",
+    "ring",
+    "subscribe",
+    "thread_topic",
+]
@@ -34,6 +34,7 @@ from .migrations import (
     apply_orchestration_migrations,
     current_orchestration_schema_version,
 )
+from .sqlite_pool import orchestration_sqlite_pool, orchestration_sqlite_pool_stats
 
 # Hub/chat orchestration DB: higher busy_timeout than generic SQLite defaults (#1266).
 _DEFAULT_ORCH_BUSY_TIMEOUT_MS = 30_000
@@ -610,6 +611,7 @@ def collect_orchestration_control_plane_status(
         "compatibility": compatibility_payload,
         "active_declarations": active_declarations,
         "stale_declarations": stale_declarations,
+        "connection_pool": orchestration_sqlite_pool_stats().to_dict(),
         "error": error_text,
     }
 
@@ -642,19 +644,27 @@ def open_orchestration_sqlite(
     process_role: str | None = None,
     pid_start_time_matches: Callable[[int, float], bool] | None = None,
 ) -> Iterator[sqlite3.Connection]:
-    """Open the canonical orchestration SQLite database."""
+    """Open the canonical orchestration SQLite database.
+
+    Connections come from the process-wide pool in ``sqlite_pool`` and the
+    schema-version probe is skipped while the database file and its schema
+    cookie are unchanged since the last successful check.
+    """
     db_path = resolve_orchestration_sqlite_path(hub_root)
     mode = migration_mode or ("hub" if process_role == "hub" else "worker")
     role = process_role or mode
-    if migrate:
-        build_id, _unknown_reason = resolve_build_identity()
-        with open_sqlite(
-            db_path,
-            durable=durable,
-            busy_timeout_ms=orchestration_sqlite_busy_timeout_ms(),
-        ) as conn:
+    pool = orchestration_sqlite_pool()
+    with pool.lease(
+        db_path,
+        durable=durable,
+        busy_timeout_ms=orchestration_sqlite_busy_timeout_ms(),
+    ) as lease:
+        conn = lease.conn
+        schema_current = pool.schema_verified(lease)
+        if not schema_current:
             current_version = _read_orchestration_schema_version_if_present(conn)
             if current_version > ORCHESTRATION_SCHEMA_VERSION:
+                build_id = resolve_build_identity()[0] if migrate else "unknown"
                 raise SchemaCompatibilityError(
                     evaluate_schema_compatibility(
                         observed_schema=current_version,
@@ -663,51 +673,37 @@ def open_orchestration_sqlite(
                         build_id=build_id,
                     )
                 )
-            if current_version == ORCHESTRATION_SCHEMA_VERSION:
-                yield conn
-                return
+            schema_current = current_version == ORCHESTRATION_SCHEMA_VERSION
+            if schema_current:
+                pool.mark_schema_verified(lease)
+        if schema_current or not migrate:
+            yield conn
+            return
 
-        with file_lock(resolve_orchestration_migration_lock_path(hub_root)):
-            with open_sqlite(
-                db_path,
-                durable=durable,
-                busy_timeout_ms=orchestration_sqlite_busy_timeout_ms(),
-            ) as conn:
-                current_version = _read_orchestration_schema_version_if_present(conn)
-                _assert_migration_permitted(
+    build_id, _unknown_reason = resolve_build_identity()
+    with file_lock(resolve_orchestration_migration_lock_path(hub_root)):
+        with open_sqlite(
+            db_path,
+            durable=durable,
+            busy_timeout_ms=orchestration_sqlite_busy_timeout_ms(),
+        ) as conn:
+            current_version = _read_orchestration_schema_version_if_present(conn)
+            _assert_migration_permitted(
+                hub_root,
+                current_schema=current_version,
+                target_schema=ORCHESTRATION_SCHEMA_VERSION,
+                migration_mode=mode,
+                process_role=role,
+                build_id=build_id,
+                pid_start_time_matches=pid_start_time_matches,
+            )
+            if current_version < ORCHESTRATION_SCHEMA_VERSION:
+                apply_orchestration_migrations(conn)
+                _write_orchestration_compatibility_metadata(
                     hub_root,
-                    current_schema=current_version,
-                    target_schema=ORCHESTRATION_SCHEMA_VERSION,
-                    migration_mode=mode,
-                    process_role=role,
-                    build_id=build_id,
-                    pid_start_time_matches=pid_start_time_matches,
+                    schema_generation=current_orchestration_schema_version(conn),
                 )
-                if current_version < ORCHESTRATION_SCHEMA_VERSION:
-                    apply_orchestration_migrations(conn)
-                    _write_orchestration_compatibility_metadata(
-                        hub_root,
-                        schema_generation=current_orchestration_schema_version(conn),
-                    )
-                yield conn
-        return
-
-    with open_sqlite(
-        db_path,
-        durable=durable,
-        busy_timeout_ms=orchestration_sqlite_busy_timeout_ms(),
-    ) as conn:
-        current_version = _read_orchestration_schema_version_if_present(conn)
-        if current_version > ORCHESTRATION_SCHEMA_VERSION:
-            raise SchemaCompatibilityError(
-                evaluate_schema_compatibility(
-                    observed_schema=current_version,
-                    supported_schema=ORCHESTRATION_SCHEMA_VERSION,
-                    process_role=role,
-                    build_id="unknown",
-                )
-            )
-        yield conn
+            yield conn
 
 
 __all__ = [
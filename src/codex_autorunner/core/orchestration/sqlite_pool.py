@@ -0,0 +1,306 @@
+"""Process-wide reuse of orchestration SQLite connections.
+
+``open_orchestration_sqlite`` is entered from hundreds of call sites, many on
+hot read paths. Opening a connection costs a ``connect`` plus the WAL,
+synchronous, foreign-key, busy-timeout, and temp-store PRAGMAs, and the
+schema-version probe adds two more queries. The pool keeps idle connections
+per thread (``sqlite3`` connections are thread-affine) and remembers which
+database files already passed the schema check, keyed by file identity and
+SQLite's ``schema_version`` cookie.
+
+A leased connection behaves like ``open_sqlite``: it commits when the block
+exits cleanly and rolls back on error. Connections whose database file was
+replaced or removed are discarded instead of reused.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from ..sqlite_utils import connect_sqlite
+
+_MAX_IDLE_PER_DATABASE = 2
+_MAX_DATABASES_PER_THREAD = 8
+
+_PoolKey = tuple[str, bool, int]
+_FileIdentity = tuple[int, int]
+
+
+def _file_identity(path: Path) -> Optional[_FileIdentity]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except sqlite3.Error:
+        # Finalizers may run on a thread that does not own the connection;
+        # sqlite3 releases the handle when the object is collected instead.
+        pass
+
+
+@dataclass(frozen=True)
+class OrchestrationSqlitePoolStats:
+    connections_open: int
+    connections_in_use: int
+    connections_opened_total: int
+    connections_reused_total: int
+    stale_connections_discarded_total: int
+    checkouts_total: int
+    checkout_ms_avg: float
+    checkout_ms_max: float
+    schema_checks_total: int
+    schema_check_skips_total: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "connections_open": self.connections_open,
+            "connections_in_use": self.connections_in_use,
+            "connections_opened_total": self.connections_opened_total,
+            "connections_reused_total": self.connections_reused_total,
+            "stale_connections_discarded_total": (
+                self.stale_connections_discarded_total
+            ),
+            "checkouts_total": self.checkouts_total,
+            "checkout_ms_avg": round(self.checkout_ms_avg, 3),
+            "checkout_ms_max": round(self.checkout_ms_max, 3),
+            "schema_checks_total": self.schema_checks_total,
+            "schema_check_skips_total": self.schema_check_skips_total,
+        }
+
+
+class SqliteLease:
+    """One checkout of a pooled connection."""
+
+    __slots__ = ("conn", "db_path", "file_identity", "_finalizer", "__weakref__")
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        db_path: Path,
+        file_identity: Optional[_FileIdentity],
+        finalizer_callback: Any,
+    ) -> None:
+        self.conn = conn
+        self.db_path = db_path
+        self.file_identity = file_identity
+        self._finalizer = weakref.finalize(self, finalizer_callback, conn)
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+class OrchestrationSqlitePool:
+    def __init__(
+        self,
+        *,
+        max_idle_per_database: int = _MAX_IDLE_PER_DATABASE,
+        max_databases_per_thread: int = _MAX_DATABASES_PER_THREAD,
+    ) -> None:
+        self._max_idle_per_database = max(0, int(max_idle_per_database))
+        self._max_databases_per_thread = max(1, int(max_databases_per_thread))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._verified_schemas: dict[str, tuple[_FileIdentity, int]] = {}
+        self._open = 0
+        self._in_use = 0
+        self._opened_total = 0
+        self._reused_total = 0
+        self._stale_discarded_total = 0
+        self._checkouts_total = 0
+        self._checkout_seconds_total = 0.0
+        self._checkout_seconds_max = 0.0
+        self._schema_checks_total = 0
+        self._schema_check_skips_total = 0
+
+    @contextmanager
+    def lease(
+        self,
+        db_path: Path,
+        *,
+        durable: bool,
+        busy_timeout_ms: int,
+    ) -> Iterator[SqliteLease]:
+        started = time.perf_counter()
+        key: _PoolKey = (str(db_path), bool(durable), int(busy_timeout_ms))
+        lease = self._checkout(key, db_path)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._in_use += 1
+            self._checkouts_total += 1
+            self._checkout_seconds_total += elapsed
+            self._checkout_seconds_max = max(self._checkout_seconds_max, elapsed)
+        reusable = True
+        try:
+            yield lease
+            lease.conn.commit()
+        except Exception:  # intentional: rollback must cover any caller error
+            try:
+                lease.conn.rollback()
+            except sqlite3.Error:
+                reusable = False
+            raise
+        except BaseException:
+            reusable = False
+            raise
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._checkin(key, lease, reusable=reusable)
+
+    def schema_verified(self, lease: SqliteLease) -> bool:
+        """Return True when this database file already passed the schema check."""
+        if lease.file_identity is None:
+            return False
+        cookie = int(lease.conn.execute("PRAGMA schema_version").fetchone()[0])
+        with self._lock:
+            verified = self._verified_schemas.get(str(lease.db_path)) == (
+                lease.file_identity,
+                cookie,
+            )
+            if verified:
+                self._schema_check_skips_total += 1
+            else:
+                self._schema_checks_total += 1
+        return verified
+
+    def mark_schema_verified(self, lease: SqliteLease) -> None:
+        if lease.file_identity is None:
+            return
+        cookie = int(lease.conn.execute("PRAGMA schema_version").fetchone()[0])
+        with self._lock:
+            self._verified_schemas[str(lease.db_path)] = (lease.file_identity, cookie)
+
+    def stats(self) -> OrchestrationSqlitePoolStats:
+        with self._lock:
+            checkouts = self._checkouts_total
+            return OrchestrationSqlitePoolStats(
+                connections_open=self._open,
+                connections_in_use=self._in_use,
+                connections_opened_total=self._opened_total,
+                connections_reused_total=self._reused_total,
+                stale_connections_discarded_total=self._stale_discarded_total,
+                checkouts_total=checkouts,
+                checkout_ms_avg=(
+                    self._checkout_seconds_total * 1000.0 / checkouts
+                    if checkouts
+                    else 0.0
+                ),
+                checkout_ms_max=self._checkout_seconds_max * 1000.0,
+                schema_checks_total=self._schema_checks_total,
+                schema_check_skips_total=self._schema_check_skips_total,
+            )
+
+    def close_idle(self) -> None:
+        """Close this thread's idle connections and forget verified schemas."""
+        idle = self._thread_idle()
+        for leases in idle.values():
+            for lease in leases:
+                lease.close()
+        idle.clear()
+        with self._lock:
+            self._verified_schemas.clear()
+
+    def _thread_idle(self) -> "OrderedDict[_PoolKey, list[SqliteLease]]":
+        local = self._local
+        pid = os.getpid()
+        idle = getattr(local, "idle", None)
+        if idle is None or getattr(local, "pid", None) != pid:
+            # A forked child must not touch connections inherited from its parent.
+            idle = OrderedDict()
+            local.idle = idle
+            local.pid = pid
+        return idle
+
+    def _checkout(self, key: _PoolKey, db_path: Path) -> SqliteLease:
+        idle = self._thread_idle()
+        leases = idle.get(key)
+        file_identity = _file_identity(db_path)
+        while leases:
+            lease = leases.pop()
+            if file_identity is not None and lease.file_identity == file_identity:
+                with self._lock:
+                    self._reused_total += 1
+                return lease
+            with self._lock:
+                self._stale_discarded_total += 1
+            lease.close()
+        _db_path_text, durable, busy_timeout_ms = key
+        conn = connect_sqlite(
+            db_path,
+            durable=durable,
+            busy_timeout_ms=busy_timeout_ms,
+        )
+        with self._lock:
+            self._open += 1
+            self._opened_total += 1
+        return SqliteLease(
+            conn,
+            db_path=db_path,
+            file_identity=_file_identity(db_path),
+            finalizer_callback=self._release,
+        )
+
+    def _checkin(self, key: _PoolKey, lease: SqliteLease, *, reusable: bool) -> None:
+        conn = lease.conn
+        if reusable:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+                conn.row_factory = sqlite3.Row
+            except sqlite3.Error:
+                # Includes ProgrammingError when the caller closed the connection.
+                reusable = False
+        if not reusable or self._max_idle_per_database == 0:
+            lease.close()
+            return
+        idle = self._thread_idle()
+        leases = idle.setdefault(key, [])
+        idle.move_to_end(key)
+        if len(leases) >= self._max_idle_per_database:
+            lease.close()
+        else:
+            leases.append(lease)
+        while len(idle) > self._max_databases_per_thread:
+            _evicted_key, evicted = idle.popitem(last=False)
+            for stale in evicted:
+                stale.close()
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        _close_quietly(conn)
+        with self._lock:
+            self._open -= 1
+
+
+_POOL = OrchestrationSqlitePool()
+
+
+def orchestration_sqlite_pool() -> OrchestrationSqlitePool:
+    return _POOL
+
+
+def orchestration_sqlite_pool_stats() -> OrchestrationSqlitePoolStats:
+    return _POOL.stats()
+
+
+__all__ = [
+    "OrchestrationSqlitePool",
+    "OrchestrationSqlitePoolStats",
+    "SqliteLease",
+    "orchestration_sqlite_pool",
+    "orchestration_sqlite_pool_stats",
+]
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator
-from typing import Any
+import bisect
+import logging
+from collections.abc import AsyncIterator, Callable
+from typing import Any, Optional
+
+_logger = logging.getLogger(__name__)
+
+# Evicted slots are dropped from the backing lists in batches so eviction
+# stays amortized O(1) instead of shifting the list on every append.
+_COMPACT_MIN_EVICTED = 256
+
+TurnEventSpill = Callable[[dict[str, Any]], Any]
+
+TURN_EVENT_GAP_TYPE = "turn_event_gap"
 
 
 def _coerce_event_id(value: Any) -> int:
@@ -23,21 +35,65 @@ def _event_cursor(event: tuple[int, dict[str, Any]]) -> int:
     return 0
 
 
+def is_turn_event_gap(event: Any) -> bool:
+    """Return whether ``event`` is a gap marker emitted by ``snapshot``."""
+    return isinstance(event, dict) and event.get("type") == TURN_EVENT_GAP_TYPE
+
+
 class TurnEventBuffer:
-    """Condition-backed buffer for streaming dict-shaped turn events."""
+    """Condition-backed buffer for streaming dict-shaped turn events.
+
+    With ``max_events`` set the buffer keeps only the newest events and each
+    evicted event is handed to ``spill`` before it is dropped. When a
+    ``snapshot`` cursor points before events that were evicted, the result
+    starts with a ``TURN_EVENT_GAP_TYPE`` marker so callers can resync
+    instead of silently skipping them.
 
-    def __init__(self) -> None:
+    Events are copied once on ``append`` and the same dicts are shared by
+    every ``snapshot`` and ``tail`` reader, so readers must treat them as
+    read-only.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_events: Optional[int] = None,
+        spill: Optional[TurnEventSpill] = None,
+    ) -> None:
+        if max_events is not None and max_events <= 0:
+            raise ValueError("max_events must be positive")
+        self._max_events = max_events
+        self._spill = spill
         self._events: list[tuple[int, dict[str, Any]]] = []
+        self._cursors: list[int] = []
+        self._cursors_sorted = True
+        self._start = 0
+        self._evicted_count = 0
+        self._evicted_max_cursor = 0
         self._condition = asyncio.Condition()
         self._closed = False
         self._next_sequence_id = 1
 
+    @property
+    def evicted_count(self) -> int:
+        return self._evicted_count
+
+    def __len__(self) -> int:
+        return len(self._events) - self._start
+
     async def append(self, event: dict[str, Any]) -> None:
         async with self._condition:
             buffered = dict(event)
             sequence_id = self._next_sequence_id
             self._next_sequence_id += 1
+            cursor = _event_cursor((sequence_id, buffered))
+            if self._cursors and cursor < self._cursors[-1]:
+                self._cursors_sorted = False
             self._events.append((sequence_id, buffered))
+            self._cursors.append(cursor)
+            if self._max_events is not None:
+                while len(self) > self._max_events:
+                    self._evict_oldest()
             self._condition.notify_all()
 
     async def close(self) -> None:
@@ -49,30 +105,78 @@ class TurnEventBuffer:
         self, *, after_id: int = 0, limit: int | None = None
     ) -> list[dict[str, Any]]:
         min_id = max(0, int(after_id or 0))
+        start = self._start
+        end = len(self._events)
         events = self._events
         if min_id > 0:
-            events = [event for event in events if _event_cursor(event) > min_id]
+            if self._cursors_sorted:
+                start = bisect.bisect_right(self._cursors, min_id, lo=start)
+            else:
+                retained = zip(events[start:], self._cursors[start:], strict=True)
+                events = [event for event, cursor in retained if cursor > min_id]
+                start, end = 0, len(events)
         if limit is not None:
             normalized_limit = max(0, int(limit))
             if min_id > 0:
-                events = events[:normalized_limit]
+                end = min(end, start + normalized_limit)
             else:
-                events = events[-normalized_limit:] if normalized_limit > 0 else []
-        return [dict(event) for _sequence_id, event in events]
+                start = max(start, end - normalized_limit)
+        selected = [event for _sequence_id, event in events[start:end]]
+        if 0 < min_id < self._evicted_max_cursor:
+            selected.insert(
+                0,
+                {
+                    "type": TURN_EVENT_GAP_TYPE,
+                    "after_id": min_id,
+                    "evicted_count": self._evicted_count,
+                },
+            )
+        return selected
 
     async def tail(self) -> AsyncIterator[dict[str, Any]]:
-        next_index = 0
+        next_sequence_id = 0
         while True:
             async with self._condition:
-                while next_index >= len(self._events) and not self._closed:
+                while (
+                    next_sequence_id >= self._next_sequence_id - 1 and not self._closed
+                ):
                     await self._condition.wait()
-                batch = list(self._events[next_index:])
-                next_index += len(batch)
-                should_stop = self._closed and next_index >= len(self._events)
+                batch = self._events[self._index_after(next_sequence_id) :]
+                next_sequence_id = self._next_sequence_id - 1
+                should_stop = self._closed
             for _sequence_id, event in batch:
-                yield dict(event)
+                yield event
             if should_stop:
                 break
 
+    def _index_after(self, sequence_id: int) -> int:
+        """Return the list index of the first retained event after ``sequence_id``."""
+        if self._start >= len(self._events):
+            return len(self._events)
+        oldest_sequence_id = self._events[self._start][0]
+        return self._start + max(0, sequence_id + 1 - oldest_sequence_id)
+
+    def _evict_oldest(self) -> None:
+        _sequence_id, event = self._events[self._start]
+        self._evicted_max_cursor = max(
+            self._evicted_max_cursor, self._cursors[self._start]
+        )
+        self._start += 1
+        self._evicted_count += 1
+        if self._spill is not None:
+            try:
+                self._spill(event)
+            except Exception:  # intentional: spill sinks must not break streaming
+                _logger.warning("Turn event buffer spill failed", exc_info=True)
+        if self._start >= _COMPACT_MIN_EVICTED and self._start * 2 >= len(self._events):
+            del self._events[: self._start]
+            del self._cursors[: self._start]
+            self._start = 0
+
 
-__all__ = ["TurnEventBuffer"]
+__all__ = [
+    "TURN_EVENT_GAP_TYPE",
+    "TurnEventBuffer",
+    "TurnEventSpill",
+    "is_turn_event_gap",
+]
@@ -5,12 +5,14 @@ import json
 import logging
 import sqlite3
 import uuid
+import weakref
 from dataclasses import asdict, dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
 from .locks import file_lock
+from .orchestration.notification_bus import queue_topic, ring, subscribe
 from .orchestration.sqlite import (
     open_orchestration_sqlite,
     prepare_orchestration_sqlite,
@@ -431,6 +433,7 @@ class PmaQueue:
         self._mirror = PmaQueueJsonlMirror(hub_root)
         self._scheduler = PmaLaneScheduler()
         self._lane_locks: dict[str, asyncio.Lock] = {}
+        self._lane_bells: dict[str, asyncio.Event] = {}
         self._lock: Optional[asyncio.Lock] = None
         self._initialize_canonical_state()
 
@@ -468,6 +471,27 @@ class PmaQueue:
     def _ensure_lane_queue(self, lane_id: str) -> asyncio.Queue[PmaQueueItem]:
         return self._scheduler.ensure_lane_queue(lane_id)
 
+    def _ensure_lane_bell(self, lane_id: str) -> asyncio.Event:
+        bell = self._lane_bells.get(lane_id)
+        if bell is not None:
+            return bell
+        # Enqueues from other processes ring the lane topic after they commit.
+        # Subscribe once per lane; the callback must not reference ``self`` so
+        # the finalizer can release the subscription with the queue.
+        bell = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def _on_ring(_topic: str) -> None:
+            try:
+                loop.call_soon_threadsafe(bell.set)
+            except RuntimeError:
+                pass
+
+        unsubscribe = subscribe(self._hub_root, queue_topic(lane_id), _on_ring)
+        weakref.finalize(self, unsubscribe)
+        self._lane_bells[lane_id] = bell
+        return bell
+
     def _ensure_lane_known_ids(self, lane_id: str) -> set[str]:
         return self._scheduler.ensure_lane_known_ids(lane_id)
 
@@ -679,9 +703,14 @@ class PmaQueue:
             return True
 
         poll_interval = max(0.1, poll_interval_seconds)
-
+        # A ring makes the disk refresh below run immediately instead of on the
+        # next poll.
+        bell = self._ensure_lane_bell(lane_id)
         while True:
-            wait_tasks = [asyncio.create_task(event.wait())]
+            wait_tasks = [
+                asyncio.create_task(event.wait()),
+                asyncio.create_task(bell.wait()),
+            ]
             if cancel_event is not None:
                 wait_tasks.append(asyncio.create_task(cancel_event.wait()))
 
@@ -703,10 +732,12 @@ class PmaQueue:
                 event.clear()
                 return True
 
+            rung = bell.is_set()
+            bell.clear()
             current_mtime = self._mirror.lane_mtime(lane_id)
             prev_mtime = self._scheduler.mirror_mtime(lane_id)
 
-            if current_mtime == prev_mtime:
+            if current_mtime == prev_mtime and not rung:
                 continue
 
             added = await self._refresh_lane_from_disk(lane_id)
@@ -828,6 +859,8 @@ class PmaQueue:
                         item.dedupe_reason = f"duplicate_of_{existing.item_id}"
                         self._insert_or_update_item(conn, item)
         self._sync_lane_mirror_sync(item.lane_id)
+        if item.state == QueueItemState.PENDING:
+            ring(self._hub_root, queue_topic(item.lane_id))
 
     def _insert_or_update_item(
         self, conn: sqlite3.Connection, item: PmaQueueItem
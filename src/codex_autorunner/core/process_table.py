@@ -0,0 +1,422 @@
+"""Shared process-table reader.
+
+Health checks, the managed-process reaper, the worker monitor and the CPU
+sampler all need a handful of facts about other processes: command line,
+parent and process group, run state, RSS and CPU time. Shelling out to
+``ps`` for each probe costs a fork+exec, so on Linux this module reads
+``/proc/<pid>/stat`` and ``/proc/<pid>/cmdline`` directly and only falls
+back to ``ps`` where procfs is unavailable.
+
+:class:`ProcessCpuSampler` turns the cumulative CPU ticks from procfs into a
+CPU percentage by diffing consecutive samples of the same process.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+_PROC_ROOT = "/proc"
+_PS_FIELDS = "pid=,ppid=,pgid=,stat=,rss=,etime=,%cpu=,command="
+_MAX_CPU_HISTORY = 4096
+
+
+@dataclass(frozen=True)
+class ProcessEntry:
+    pid: int
+    ppid: int
+    pgid: int
+    state: str
+    command: str
+    argv: tuple[str, ...] = ()
+    rss_kb: Optional[int] = None
+    elapsed_seconds: Optional[float] = None
+    # procfs only: cumulative user+system clock ticks and start time in ticks.
+    cpu_ticks: Optional[int] = None
+    start_ticks: Optional[int] = None
+    # ps fallback only: lifetime CPU percentage as reported by ``ps``.
+    cpu_percent: Optional[float] = None
+
+    @property
+    def is_zombie(self) -> bool:
+        return self.state.startswith("Z")
+
+
+@functools.lru_cache(maxsize=1)
+def procfs_available() -> bool:
+    return sys.platform.startswith("linux") and os.path.isfile(
+        f"{_PROC_ROOT}/self/stat"
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _clock_ticks() -> int:
+    try:
+        return int(os.sysconf("SC_CLK_TCK")) or 100
+    except (AttributeError, OSError, ValueError):
+        return 100
+
+
+@functools.lru_cache(maxsize=1)
+def _page_size_kb() -> int:
+    try:
+        return max(int(os.sysconf("SC_PAGE_SIZE")) // 1024, 1)
+    except (AttributeError, OSError, ValueError):
+        return 4
+
+
+def _read_uptime() -> Optional[float]:
+    try:
+        with open(f"{_PROC_ROOT}/uptime", encoding="ascii") as handle:
+            return float(handle.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _read_procfs_cmdline(pid: int) -> Optional[tuple[str, ...]]:
+    try:
+        with open(f"{_PROC_ROOT}/{pid}/cmdline", "rb") as handle:
+            raw = handle.read()
+    except OSError:
+        return None
+    return tuple(part for part in raw.decode(errors="replace").split("\0") if part)
+
+
+def _read_procfs_entry(
+    pid: int,
+    *,
+    uptime: Optional[float],
+    pgid: Optional[int] = None,
+    include_command: bool = True,
+) -> Optional[ProcessEntry]:
+    try:
+        with open(f"{_PROC_ROOT}/{pid}/stat", "rb") as handle:
+            raw = handle.read().decode(errors="replace")
+    except OSError:
+        return None
+    # The command name is parenthesized and may itself contain spaces or
+    # parentheses, so split on the last closing paren.
+    open_paren = raw.find("(")
+    close_paren = raw.rfind(")")
+    if open_paren < 0 or close_paren < open_paren:
+        return None
+    comm = raw[open_paren + 1 : close_paren]
+    fields = raw[close_paren + 2 :].split()
+    if len(fields) < 22:
+        return None
+    try:
+        ppid = int(fields[1])
+        row_pgid = int(fields[2])
+        cpu_ticks = int(fields[11]) + int(fields[12])
+        start_ticks = int(fields[19])
+        rss_pages = int(fields[21])
+    except ValueError:
+        return None
+    if pgid is not None and row_pgid != pgid:
+        return None
+    argv: tuple[str, ...] = ()
+    if include_command:
+        argv = _read_procfs_cmdline(pid) or ()
+    elapsed: Optional[float] = None
+    if uptime is not None:
+        elapsed = max(0.0, uptime - start_ticks / _clock_ticks())
+    return ProcessEntry(
+        pid=pid,
+        ppid=ppid,
+        pgid=row_pgid,
+        state=fields[0],
+        # Kernel threads and zombies have no cmdline; ps shows them bracketed.
+        command=" ".join(argv) if argv else f"[{comm}]",
+        argv=argv,
+        rss_kb=rss_pages * _page_size_kb(),
+        elapsed_seconds=elapsed,
+        cpu_ticks=cpu_ticks,
+        start_ticks=start_ticks,
+    )
+
+
+def _procfs_pids() -> list[int]:
+    try:
+        names = os.listdir(_PROC_ROOT)
+    except OSError:
+        return []
+    return [int(name) for name in names if name.isdigit()]
+
+
+def parse_elapsed(value: str) -> Optional[float]:
+    """Parse ``ps`` ``etime`` output (``[[dd-]hh:]mm:ss``) into seconds."""
+    text = value.strip()
+    if not text:
+        return None
+    days = 0
+    if "-" in text:
+        day_text, text = text.split("-", 1)
+        if not day_text.isdigit():
+            return None
+        days = int(day_text)
+    seconds = 0
+    for part in text.split(":"):
+        if not part.isdigit():
+            return None
+        seconds = seconds * 60 + int(part)
+    return float(days * 86400 + seconds)
+
+
+def format_elapsed(seconds: float) -> str:
+    """Format seconds the way ``ps`` prints ``etime``."""
+    total = int(max(seconds, 0))
+    days, remainder = divmod(total, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, secs = divmod(remainder, 60)
+    text = f"{minutes:02d}:{secs:02d}"
+    if hours or days:
+        text = f"{hours:02d}:{text}"
+    if days:
+        text = f"{days}-{text}"
+    return text
+
+
+def _run_ps(selection: list[str]) -> Optional[list[ProcessEntry]]:
+    """Run ``ps`` for ``selection``; ``None`` means ``ps`` could not run."""
+    try:
+        proc = subprocess.run(
+            ["ps", "-ww", *selection, "-o", _PS_FIELDS],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        # ``ps`` exits non-zero when nothing matches the selection.
+        return []
+    entries: list[ProcessEntry] = []
+    for line in (proc.stdout or "").splitlines():
+        parts = line.strip().split(maxsplit=7)
+        if len(parts) < 8:
+            continue
+        try:
+            pid = int(parts[0])
+            ppid = int(parts[1])
+            pgid = int(parts[2])
+            cpu_percent = float(parts[6])
+        except ValueError:
+            continue
+        command = parts[7].strip()
+        entries.append(
+            ProcessEntry(
+                pid=pid,
+                ppid=ppid,
+                pgid=pgid,
+                state=parts[3],
+                command=command,
+                argv=tuple(command.split()),
+                rss_kb=int(parts[4]) if parts[4].isdigit() else None,
+                elapsed_seconds=parse_elapsed(parts[5]),
+                cpu_percent=cpu_percent,
+            )
+        )
+    return entries
+
+
+def list_processes(*, pgid: Optional[int] = None) -> list[ProcessEntry]:
+    """Return every visible process, optionally limited to one process group."""
+    if pgid is not None and pgid <= 0:
+        return []
+    if not procfs_available():
+        selection = ["-ax"] if pgid is None else ["-g", str(pgid)]
+        return [
+            entry
+            for entry in _run_ps(selection) or []
+            if pgid is None or entry.pgid == pgid
+        ]
+    uptime = _read_uptime()
+    entries: list[ProcessEntry] = []
+    for pid in _procfs_pids():
+        entry = _read_procfs_entry(pid, uptime=uptime, pgid=pgid)
+        if entry is not None:
+            entries.append(entry)
+    return entries
+
+
+def processes_in_group(pgid: int) -> Optional[list[ProcessEntry]]:
+    """Return the members of ``pgid``, or ``None`` if the table is unreadable.
+
+    Liveness checks must treat ``None`` as unknown rather than as an empty
+    group, so a missing ``ps`` never makes a live group look dead.
+    """
+    if pgid > 0 and not procfs_available():
+        entries = _run_ps(["-g", str(pgid)])
+        if entries is None:
+            return None
+        return [entry for entry in entries if entry.pgid == pgid]
+    return list_processes(pgid=pgid)
+
+
+def read_processes(
+    pids: Iterable[int], *, include_command: bool = True
+) -> dict[int, ProcessEntry]:
+    """Look up a batch of pids; pids that no longer exist are omitted."""
+    wanted = sorted({pid for pid in pids if pid > 0})
+    if not wanted:
+        return {}
+    if not procfs_available():
+        entries = _run_ps(["-p", ",".join(str(pid) for pid in wanted)]) or []
+        return {entry.pid: entry for entry in entries}
+    uptime = _read_uptime()
+    result: dict[int, ProcessEntry] = {}
+    for pid in wanted:
+        entry = _read_procfs_entry(pid, uptime=uptime, include_command=include_command)
+        if entry is not None:
+            result[pid] = entry
+    return result
+
+
+def read_process(pid: int) -> Optional[ProcessEntry]:
+    return read_processes([pid]).get(pid)
+
+
+def _ps_command(args: list[str]) -> Optional[str]:
+    try:
+        out = subprocess.check_output(args, stderr=subprocess.DEVNULL)
+    except (subprocess.SubprocessError, OSError, ValueError):
+        return None
+    return out.decode(errors="replace").strip() or None
+
+
+def read_cmdline(pid: int) -> Optional[list[str]]:
+    if procfs_available():
+        argv = _read_procfs_cmdline(pid)
+        return list(argv) if argv else None
+    # Use wide output first to avoid truncating long command lines (notably on
+    # macOS/BSD), then retry without it for ps builds that reject ``-ww``.
+    cmd = _ps_command(["ps", "-ww", "-p", str(pid), "-o", "command="])
+    if cmd is None:
+        cmd = _ps_command(["ps", "-p", str(pid), "-o", "command="])
+    return cmd.split() if cmd else None
+
+
+def pid_is_zombie(pid: int) -> bool:
+    if procfs_available():
+        entry = _read_procfs_entry(pid, uptime=None, include_command=False)
+        return entry is not None and entry.is_zombie
+    try:
+        result = subprocess.run(
+            ["ps", "-p", str(pid), "-o", "stat="],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return False
+    if result.returncode != 0:
+        return False
+    state = result.stdout.strip()
+    return state != "" and state.split()[0].startswith("Z")
+
+
+def _ps_cpu_for_pids(pids: list[int]) -> dict[int, tuple[float, float]]:
+    try:
+        proc = subprocess.run(
+            [
+                "ps",
+                "-p",
+                ",".join(str(pid) for pid in pids),
+                "-o",
+                "pid=",
+                "-o",
+                "%cpu=",
+                "-o",
+                "rss=",
+            ],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return {}
+    if proc.returncode != 0:
+        return {}
+    result: dict[int, tuple[float, float]] = {}
+    for line in proc.stdout.splitlines():
+        parts = line.strip().split()
+        if len(parts) < 3:
+            continue
+        try:
+            pid = int(parts[0])
+            cpu_pct = float(parts[1])
+            rss_kb = float(parts[2])
+        except ValueError:
+            continue
+        result[pid] = (cpu_pct, rss_kb / 1024.0)
+    return result
+
+
+class ProcessCpuSampler:
+    """CPU% and RSS per pid, computed from tick deltas between samples.
+
+    The first sample of a process reports its lifetime average, matching what
+    ``ps %cpu`` prints; later samples report usage since the previous one.
+    """
+
+    def __init__(self) -> None:
+        # pid -> (start_ticks, cpu_ticks, sampled_at)
+        self._previous: dict[int, tuple[int, int, float]] = {}
+
+    def sample(self, pids: list[int]) -> dict[int, tuple[float, float]]:
+        """Return ``{pid: (cpu_percent, rss_mb)}`` for the live pids."""
+        if not pids:
+            return {}
+        if not procfs_available():
+            return _ps_cpu_for_pids(pids)
+        entries = read_processes(pids, include_command=False)
+        now = time.monotonic()
+        ticks_per_second = float(_clock_ticks())
+        result: dict[int, tuple[float, float]] = {}
+        for pid in pids:
+            entry = entries.get(pid)
+            if entry is None:
+                self._previous.pop(pid, None)
+                continue
+            cpu_ticks = entry.cpu_ticks or 0
+            start_ticks = entry.start_ticks or 0
+            previous = self._previous.get(pid)
+            if (
+                previous is not None
+                and previous[0] == start_ticks
+                and now > previous[2]
+                and cpu_ticks >= previous[1]
+            ):
+                busy = (cpu_ticks - previous[1]) / ticks_per_second
+                cpu_percent = busy / (now - previous[2]) * 100.0
+            elif entry.elapsed_seconds:
+                busy = cpu_ticks / ticks_per_second
+                cpu_percent = busy / entry.elapsed_seconds * 100.0
+            else:
+                cpu_percent = 0.0
+            if len(self._previous) >= _MAX_CPU_HISTORY and pid not in self._previous:
+                self._previous.clear()
+            self._previous[pid] = (start_ticks, cpu_ticks, now)
+            rss_mb = (entry.rss_kb or 0) / 1024.0
+            result[pid] = (round(cpu_percent, 3), rss_mb)
+        return result
+
+
+__all__ = [
+    "ProcessCpuSampler",
+    "ProcessEntry",
+    "format_elapsed",
+    "list_processes",
+    "parse_elapsed",
+    "pid_is_zombie",
+    "procfs_available",
+    "processes_in_group",
+    "read_cmdline",
+    "read_process",
+    "read_processes",
+]
@@ -9,11 +9,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, Mapping, Optional, Sequence, TypedDict
 
-from ..tickets.files import list_ticket_paths, read_ticket, safe_relpath, ticket_is_done
+from ..tickets.files import list_ticket_paths, read_ticket, safe_relpath
 from ..tickets.frontmatter import parse_markdown_frontmatter
 from ..tickets.models import Dispatch
 from ..tickets.outbox import parse_dispatch, resolve_outbox_paths
 from ..tickets.replies import resolve_reply_paths
+from ..tickets.ticket_index import ticket_index_for
 from .config import load_repo_config
 from .config_contract import ConfigError
 from .flows.failure_diagnostics import format_failure_summary, get_failure_payload
@@ -747,9 +748,7 @@ def resolve_run_reuse_policy(
             stale_terminal_runs=stale,
         )
     if existing_run is not None and reason == "completed_pending":
-        pending = sum(
-            1 for path in list_ticket_paths(ticket_dir) if not ticket_is_done(path)
-        )
+        pending = ticket_index_for(ticket_dir).scan().pending_count
         return RunReuseResult(
             action="completed_pending",
             run=existing_run,
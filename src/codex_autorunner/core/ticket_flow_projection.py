@@ -5,9 +5,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
-from ..tickets.files import list_ticket_paths
-from ..tickets.frontmatter import parse_markdown_frontmatter
 from ..tickets.ingest_state import read_ingest_receipt
+from ..tickets.ticket_index import ticket_index_for
 from .config import load_repo_config
 from .flows.models import FlowRunRecord, FlowRunStatus
 from .flows.store import FlowStore
@@ -126,25 +125,20 @@ def _extract_pr_url(data: dict[str, Any], body: Optional[str]) -> Optional[str]:
 def collect_ticket_flow_census(repo_root: Path) -> TicketFlowCensus:
     ticket_dir = resolve_repo_state_root(repo_root) / "tickets"
     try:
-        ticket_paths = list_ticket_paths(ticket_dir)
+        entries = ticket_index_for(ticket_dir).scan().entries
     except (OSError, ValueError):
-        ticket_paths = []
+        entries = ()
 
-    total_count = len(ticket_paths)
+    total_count = len(entries)
     done_count = 0
     effective_next_ticket: Optional[str] = None
     open_pr_url: Optional[str] = None
     final_review_status: Optional[str] = None
 
-    for path in ticket_paths:
+    for entry in entries:
         done_flag = False
-        frontmatter: Any = None
-        body: Optional[str] = None
-        try:
-            raw = path.read_text(encoding="utf-8")
-            frontmatter, body = parse_markdown_frontmatter(raw)
-        except (OSError, ValueError):
-            done_flag = False
+        frontmatter: Any = entry.data
+        body: Optional[str] = entry.body if entry.data is not None else None
 
         if isinstance(frontmatter, dict) and isinstance(frontmatter.get("done"), bool):
             done_flag = frontmatter["done"]
@@ -152,7 +146,7 @@ def collect_ticket_flow_census(repo_root: Path) -> TicketFlowCensus:
         if done_flag:
             done_count += 1
         elif effective_next_ticket is None:
-            effective_next_ticket = path.name
+            effective_next_ticket = entry.path.name
 
         if not isinstance(frontmatter, dict):
             continue
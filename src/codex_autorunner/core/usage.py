@@ -3,12 +3,26 @@ import dataclasses
 import json
 import logging
 import os
+import sqlite3
 import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    cast,
+)
 
+from .sqlite_utils import open_sqlite, read_schema_version, write_schema_version
 from .text_utils import _coerce_int, _iso_now
 
 logger = logging.getLogger("codex_autorunner.core.usage")
@@ -1769,24 +1783,6 @@ def _parse_bucket_label(value: str, bucket: str) -> Optional[datetime]:
         return None
 
 
-def _empty_rollup_bucket() -> Dict[str, Any]:
-    return {
-        "total": 0,
-        "models": {},
-        "token_types": {},
-        "model_token": {},
-    }
-
-
-def _empty_summary_entry() -> Dict[str, Any]:
-    return {
-        "events": 0,
-        "totals": TokenTotals().to_dict(),
-        "latest_rate_limits": None,
-        "latest_rate_limits_pos": None,
-    }
-
-
 def _rate_limits_pos_key(pos: Optional[Dict[str, Any]]) -> Optional[Tuple[str, int]]:
     if not pos:
         return None
@@ -1834,97 +1830,355 @@ class _SummaryAccumulator:
             self.latest_rate_limits_pos = pos
 
 
+_USAGE_INDEX_SCHEMA_VERSION = 1
+_USAGE_INDEX_IN_CHUNK = 500
+_USAGE_ROLLUP_BUCKETS = ("hour", "day", "week")
+_USAGE_TOKEN_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("input", "input_tokens"),
+    ("cached", "cached_input_tokens"),
+    ("output", "output_tokens"),
+    ("reasoning", "reasoning_output_tokens"),
+)
+_USAGE_COUNTER_COLUMNS: Tuple[str, ...] = (
+    "input_tokens",
+    "cached_input_tokens",
+    "output_tokens",
+    "reasoning_output_tokens",
+    "total_tokens",
+)
+
+_USAGE_INDEX_TABLES = (
+    "usage_files",
+    "usage_file_rollups",
+    "usage_rollups",
+    "usage_file_summaries",
+    "usage_summaries",
+)
+
+_USAGE_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage_files (
+    path TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    cwd TEXT,
+    model TEXT,
+    last_totals_json TEXT,
+    event_index INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS usage_file_rollups (
+    path TEXT NOT NULL,
+    cwd TEXT NOT NULL,
+    agent TEXT NOT NULL,
+    model TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    bucket_label TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    cached_input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    reasoning_output_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (path, cwd, agent, model, bucket, bucket_label)
+);
+CREATE INDEX IF NOT EXISTS idx_usage_file_rollups_cwd
+    ON usage_file_rollups(cwd);
+CREATE TABLE IF NOT EXISTS usage_rollups (
+    bucket TEXT NOT NULL,
+    cwd TEXT NOT NULL,
+    bucket_label TEXT NOT NULL,
+    agent TEXT NOT NULL,
+    model TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    cached_input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    reasoning_output_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, cwd, bucket_label, agent, model)
+);
+CREATE INDEX IF NOT EXISTS idx_usage_rollups_bucket_label
+    ON usage_rollups(bucket, bucket_label);
+CREATE TABLE IF NOT EXISTS usage_file_summaries (
+    path TEXT NOT NULL,
+    cwd TEXT NOT NULL,
+    events INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    cached_input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    reasoning_output_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    latest_rate_limits_json TEXT,
+    latest_rate_limits_index INTEGER,
+    PRIMARY KEY (path, cwd)
+);
+CREATE INDEX IF NOT EXISTS idx_usage_file_summaries_cwd
+    ON usage_file_summaries(cwd);
+CREATE TABLE IF NOT EXISTS usage_summaries (
+    cwd TEXT PRIMARY KEY,
+    events INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    cached_input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    reasoning_output_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    latest_rate_limits_json TEXT,
+    latest_rate_limits_path TEXT,
+    latest_rate_limits_index INTEGER
+);
+"""
+
+_COUNTER_INSERT_COLUMNS = ", ".join(_USAGE_COUNTER_COLUMNS)
+_COUNTER_PLACEHOLDERS = ", ".join("?" for _ in _USAGE_COUNTER_COLUMNS)
+_COUNTER_UPSERT = ",\n    ".join(
+    f"{column} = {{table}}.{column} + excluded.{column}"
+    for column in _USAGE_COUNTER_COLUMNS
+)
+_COUNTER_SUMS = ", ".join(f"SUM({column})" for column in _USAGE_COUNTER_COLUMNS)
+
+_UPSERT_FILE_ROLLUP_SQL = f"""
+INSERT INTO usage_file_rollups (
+    path, cwd, agent, model, bucket, bucket_label, {_COUNTER_INSERT_COLUMNS}
+) VALUES (?, ?, ?, ?, ?, ?, {_COUNTER_PLACEHOLDERS})
+ON CONFLICT(path, cwd, agent, model, bucket, bucket_label) DO UPDATE SET
+    {_COUNTER_UPSERT.format(table="usage_file_rollups")}
+"""
+
+_UPSERT_ROLLUP_SQL = f"""
+INSERT INTO usage_rollups (
+    cwd, agent, model, bucket, bucket_label, {_COUNTER_INSERT_COLUMNS}
+) VALUES (?, ?, ?, ?, ?, {_COUNTER_PLACEHOLDERS})
+ON CONFLICT(bucket, cwd, bucket_label, agent, model) DO UPDATE SET
+    {_COUNTER_UPSERT.format(table="usage_rollups")}
+"""
+
+_UPSERT_FILE_SUMMARY_SQL = f"""
+INSERT INTO usage_file_summaries (
+    path, cwd, events, {_COUNTER_INSERT_COLUMNS},
+    latest_rate_limits_json, latest_rate_limits_index
+) VALUES (?, ?, ?, {_COUNTER_PLACEHOLDERS}, ?, ?)
+ON CONFLICT(path, cwd) DO UPDATE SET
+    events = usage_file_summaries.events + excluded.events,
+    {_COUNTER_UPSERT.format(table="usage_file_summaries")},
+    latest_rate_limits_json = COALESCE(
+        excluded.latest_rate_limits_json,
+        usage_file_summaries.latest_rate_limits_json
+    ),
+    latest_rate_limits_index = CASE
+        WHEN excluded.latest_rate_limits_json IS NOT NULL
+        THEN excluded.latest_rate_limits_index
+        ELSE usage_file_summaries.latest_rate_limits_index
+    END
+"""
+
+# Rate-limit snapshots are ordered by (session path, event index), matching the
+# ordering the legacy JSON cache used when merging per-file summaries.
+_SUMMARY_RATE_LIMITS_NEWER = """
+    excluded.latest_rate_limits_json IS NOT NULL
+    AND (
+        usage_summaries.latest_rate_limits_path IS NULL
+        OR excluded.latest_rate_limits_path > usage_summaries.latest_rate_limits_path
+        OR (
+            excluded.latest_rate_limits_path = usage_summaries.latest_rate_limits_path
+            AND excluded.latest_rate_limits_index
+                >= usage_summaries.latest_rate_limits_index
+        )
+    )
+"""
+
+_UPSERT_SUMMARY_SQL = f"""
+INSERT INTO usage_summaries (
+    cwd, events, {_COUNTER_INSERT_COLUMNS},
+    latest_rate_limits_json, latest_rate_limits_path, latest_rate_limits_index
+) VALUES (?, ?, {_COUNTER_PLACEHOLDERS}, ?, ?, ?)
+ON CONFLICT(cwd) DO UPDATE SET
+    events = usage_summaries.events + excluded.events,
+    {_COUNTER_UPSERT.format(table="usage_summaries")},
+    latest_rate_limits_json = CASE WHEN {_SUMMARY_RATE_LIMITS_NEWER}
+        THEN excluded.latest_rate_limits_json
+        ELSE usage_summaries.latest_rate_limits_json END,
+    latest_rate_limits_path = CASE WHEN {_SUMMARY_RATE_LIMITS_NEWER}
+        THEN excluded.latest_rate_limits_path
+        ELSE usage_summaries.latest_rate_limits_path END,
+    latest_rate_limits_index = CASE WHEN {_SUMMARY_RATE_LIMITS_NEWER}
+        THEN excluded.latest_rate_limits_index
+        ELSE usage_summaries.latest_rate_limits_index END
+"""
+
+
+def _usage_index_path(cache_path: Path) -> Path:
+    return cache_path.with_suffix(".sqlite3")
+
+
+@dataclasses.dataclass(frozen=True)
+class _SessionFileStat:
+    size: int
+    inode: int
+
+
+@dataclasses.dataclass
+class _SessionFileState:
+    inode: int
+    size: int
+    offset: int
+    cwd: Optional[str] = None
+    model: Optional[str] = None
+    last_totals: Optional[TokenTotals] = None
+    event_index: int = 0
+
+
+@dataclasses.dataclass
+class _SummaryDelta:
+    events: int = 0
+    totals: TokenTotals = dataclasses.field(default_factory=TokenTotals)
+    latest_rate_limits: Optional[Dict[str, Any]] = None
+    latest_rate_limits_index: Optional[int] = None
+
+
+def _scan_session_files(codex_home: Path) -> Dict[str, _SessionFileStat]:
+    """Stat every session log once, keyed the same way ``_iter_session_files`` is."""
+    sessions_dir = codex_home / "sessions"
+    found: Dict[str, _SessionFileStat] = {}
+    pending = [str(sessions_dir)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            pending.append(entry.path)
+                            continue
+                        if not entry.name.endswith(".jsonl") or not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError as exc:
+                        logger.debug("Failed to stat session file %s: %s", entry, exc)
+                        continue
+                    found[entry.path] = _SessionFileStat(
+                        size=stat.st_size, inode=stat.st_ino
+                    )
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            logger.debug("Failed to scan session directory %s: %s", directory, exc)
+    return found
+
+
+def _chunks(
+    values: List[str], size: int = _USAGE_INDEX_IN_CHUNK
+) -> Iterable[List[str]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _cwd_within(cwd: str, repo_root: Path) -> bool:
+    try:
+        cwd_path = Path(cwd)
+    except (TypeError, ValueError, OSError) as exc:
+        logger.debug("Failed to create Path from cwd %r: %s", cwd, exc)
+        return False
+    return cwd_path == repo_root or repo_root in cwd_path.parents
+
+
+def _summary_entry_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    rate_limits = None
+    raw_rate_limits = row["latest_rate_limits_json"]
+    if raw_rate_limits:
+        try:
+            rate_limits = json.loads(raw_rate_limits)
+        except json.JSONDecodeError as exc:
+            logger.debug("Failed to decode cached rate limits: %s", exc)
+    pos = None
+    if rate_limits is not None:
+        pos = {
+            "file": row["latest_rate_limits_path"],
+            "index": int(row["latest_rate_limits_index"] or 0),
+        }
+    return {
+        "events": int(row["events"] or 0),
+        "totals": {column: int(row[column] or 0) for column in _USAGE_COUNTER_COLUMNS},
+        "latest_rate_limits": rate_limits,
+        "latest_rate_limits_pos": pos,
+    }
+
+
 class UsageSeriesCache:
+    """SQLite-backed usage index over Codex CLI session logs.
+
+    ``usage_files`` tracks the tail offset and inode of every session log so a
+    refresh only parses bytes appended since the last pass. Token deltas land in
+    per-file rollup/summary rows (so a truncated or deleted log can be retracted)
+    and in per-cwd aggregates that the series and summary reads query by bucket
+    and label range.
+    """
+
     def __init__(self, codex_home: Path, cache_path: Path):
         self.codex_home = codex_home
         self.cache_path = cache_path
+        self.index_path = _usage_index_path(cache_path)
         self._lock = threading.Lock()
+        self._update_lock = threading.Lock()
         self._updating = False
-        self._cache: Optional[Dict[str, Any]] = None
-
-    def _load_cache(self) -> Dict[str, Any]:
-        if self._cache is not None:
-            return self._cache
-        if not self.cache_path.exists():
-            self._cache = {
-                "version": 3,
-                "files": {},
-                "file_rollups": {},
-                "file_summaries": {},
-                "rollups": {"by_cwd": {}},
-                "summary": {"by_cwd": {}},
-            }
-            return self._cache
-        try:
-            payload = cast(
-                Dict[str, Any], json.loads(self.cache_path.read_text(encoding="utf-8"))
-            )
-            if payload.get("version") != 3:
-                raise ValueError("Unsupported cache version")
-            payload.setdefault("files", {})
-            payload.setdefault("file_rollups", {})
-            payload.setdefault("file_summaries", {})
-            payload.setdefault("rollups", {}).setdefault("by_cwd", {})
-            payload.setdefault("summary", {}).setdefault("by_cwd", {})
-            self._cache = payload
-            return payload
-        except (OSError, json.JSONDecodeError, ValueError) as exc:
-            logger.debug("Failed to load usage cache: %s", exc)
-            self._cache = {
-                "version": 3,
-                "files": {},
-                "file_rollups": {},
-                "file_summaries": {},
-                "rollups": {"by_cwd": {}},
-                "summary": {"by_cwd": {}},
-            }
-            return self._cache
-
-    def _save_cache(self, payload: Dict[str, Any]) -> None:
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path = self.cache_path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
-        tmp_path.replace(self.cache_path)
-
-    def _needs_update(self, payload: Dict[str, Any]) -> bool:
-        files = cast(Dict[str, Any], payload.get("files", {}))
-        existing_paths = {str(path) for path in _iter_session_files(self.codex_home)}
-        for path_key in list(files.keys()):
-            if path_key not in existing_paths:
-                return True
-        for session_path in _iter_session_files(self.codex_home):
-            path_key = str(session_path)
-            file_state = files.get(path_key)
-            try:
-                size = session_path.stat().st_size
-            except OSError as exc:
-                logger.debug("Failed to stat session file %s: %s", session_path, exc)
-                continue
-            if not file_state:
-                return True
-            offset = int(file_state.get("offset", 0) or 0)
-            if size != offset:
+        self._schema_ready = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with open_sqlite(self.index_path) as conn:
+            if not self._schema_ready:
+                self._ensure_schema(conn)
+                self._schema_ready = True
+            yield conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        version = read_schema_version(conn)
+        if version is not None and version != _USAGE_INDEX_SCHEMA_VERSION:
+            # The index is derived from session logs; rebuild instead of migrating.
+            for table in _USAGE_INDEX_TABLES:
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.executescript(_USAGE_INDEX_SCHEMA)
+        write_schema_version(conn, _USAGE_INDEX_SCHEMA_VERSION)
+        conn.commit()
+
+    def _load_file_stats(self, conn: sqlite3.Connection) -> Dict[str, Tuple[int, int]]:
+        return {
+            str(row["path"]): (int(row["size"]), int(row["inode"]))
+            for row in conn.execute("SELECT path, size, inode FROM usage_files")
+        }
+
+    def _needs_update(
+        self,
+        indexed: Dict[str, Tuple[int, int]],
+        scan: Dict[str, _SessionFileStat],
+    ) -> bool:
+        if indexed.keys() - scan.keys():
+            return True
+        for path_key, stat in scan.items():
+            if indexed.get(path_key) != (stat.size, stat.inode):
                 return True
         return False
 
-    def _start_update(self, payload: Dict[str, Any]) -> None:
+    def _start_update(self, scan: Dict[str, _SessionFileStat]) -> None:
         if self._updating:
             return
-        cache_snapshot = copy.deepcopy(payload)
         self._updating = True
-        thread = threading.Thread(
-            target=self._update_cache, args=(cache_snapshot,), daemon=True
-        )
+        thread = threading.Thread(target=self._update_index, args=(scan,), daemon=True)
         thread.start()
 
     def request_update(self) -> str:
+        scan = _scan_session_files(self.codex_home)
         with self._lock:
-            payload = self._load_cache()
-            needs_update = self._needs_update(payload)
-            if needs_update:
-                self._start_update(payload)
+            if self._updating:
                 return "loading"
-            return "loading" if self._updating else "ready"
+            with self._connect() as conn:
+                indexed = self._load_file_stats(conn)
+            if self._needs_update(indexed, scan):
+                self._start_update(scan)
+                return "loading"
+            return "ready"
+
+    def refresh(self) -> None:
+        """Synchronously bring the index up to date with the session logs."""
+        with self._update_lock, self._connect() as conn:
+            self._apply_scan(conn, _scan_session_files(self.codex_home))
 
     def get_repo_series(
         self,
@@ -1936,10 +2190,9 @@ class UsageSeriesCache:
         segment: str = "none",
     ) -> Tuple[Dict[str, object], str]:
         status = self.request_update()
-        with self._lock:
-            payload = self._load_cache()
+        with self._connect() as conn:
             series = self._build_repo_series(
-                payload,
+                conn,
                 repo_root,
                 since=since,
                 until=until,
@@ -1958,10 +2211,9 @@ class UsageSeriesCache:
         segment: str = "none",
     ) -> Tuple[Dict[str, object], str]:
         status = self.request_update()
-        with self._lock:
-            payload = self._load_cache()
+        with self._connect() as conn:
             series = self._build_hub_series(
-                payload,
+                conn,
                 repo_map,
                 since=since,
                 until=until,
@@ -1978,10 +2230,9 @@ class UsageSeriesCache:
         until: Optional[datetime] = None,
     ) -> Tuple[UsageSummary, str]:
         status = self.request_update()
-        with self._lock:
-            payload = self._load_cache()
+        with self._connect() as conn:
             summary = self._build_repo_summary(
-                payload, repo_root, since=since, until=until
+                conn, repo_root, since=since, until=until
             )
         return summary, status
 
@@ -1993,104 +2244,166 @@ class UsageSeriesCache:
         until: Optional[datetime] = None,
     ) -> Tuple[Dict[str, UsageSummary], UsageSummary, str]:
         status = self.request_update()
-        with self._lock:
-            payload = self._load_cache()
+        with self._connect() as conn:
             per_repo, unmatched = self._build_hub_summary(
-                payload, repo_map, since=since, until=until
+                conn, repo_map, since=since, until=until
             )
         return per_repo, unmatched, status
 
-    def _update_cache(self, payload: Dict[str, Any]) -> None:
+    def _update_index(self, scan: Dict[str, _SessionFileStat]) -> None:
         try:
-            files = cast(Dict[str, Any], payload.setdefault("files", {}))
-            file_rollups = cast(Dict[str, Any], payload.setdefault("file_rollups", {}))
-            file_summaries = cast(
-                Dict[str, Any], payload.setdefault("file_summaries", {})
-            )
-            rollups = cast(
-                Dict[str, Any],
-                payload.setdefault("rollups", {}).setdefault("by_cwd", {}),
-            )
-            summary_rollups = cast(
-                Dict[str, Any],
-                payload.setdefault("summary", {}).setdefault("by_cwd", {}),
-            )
-            rebuild_rollups = False
-            rebuild_summary = False
-            existing_paths = {
-                str(path) for path in _iter_session_files(self.codex_home)
-            }
-            for path_key in list(files.keys()):
-                if path_key not in existing_paths:
-                    files.pop(path_key, None)
-                    file_rollups.pop(path_key, None)
-                    file_summaries.pop(path_key, None)
-                    rebuild_rollups = True
-                    rebuild_summary = True
-
-            for session_path in _iter_session_files(self.codex_home):
-                path_key = str(session_path)
-                file_state = files.get(path_key, {})
-                offset = int(file_state.get("offset", 0) or 0)
-                try:
-                    size = session_path.stat().st_size
-                except OSError as exc:
-                    logger.debug(
-                        "Failed to stat session file %s: %s", session_path, exc
-                    )
-                    continue
-                if size < offset:
-                    offset = 0
-                    file_state = {}
-                    file_rollups.pop(path_key, None)
-                    file_summaries.pop(path_key, None)
-                    rebuild_rollups = True
-                    rebuild_summary = True
-                if size == offset:
-                    continue
-                updated_state = self._ingest_session_file(
-                    session_path,
-                    offset,
-                    file_state,
-                    rollups,
-                    file_rollups,
-                    summary_rollups,
-                    file_summaries,
-                )
-                files[path_key] = updated_state
-            if rebuild_rollups:
-                payload["rollups"]["by_cwd"] = self._rebuild_rollups(file_rollups)
-            if rebuild_summary:
-                payload["summary"]["by_cwd"] = self._rebuild_summary(file_summaries)
-            payload["version"] = 3
-            self._save_cache(payload)
-            with self._lock:
-                self._cache = payload
+            with self._update_lock, self._connect() as conn:
+                self._apply_scan(conn, scan)
         finally:
             with self._lock:
                 self._updating = False
 
+    def _apply_scan(
+        self, conn: sqlite3.Connection, scan: Dict[str, _SessionFileStat]
+    ) -> None:
+        states = self._load_file_states(conn)
+        for path_key in sorted(states.keys() - scan.keys()):
+            self._retract_file(conn, path_key, forget=True)
+            conn.commit()
+        for path_key in sorted(scan):
+            stat = scan[path_key]
+            state = states.get(path_key)
+            if state is not None and (state.size, state.inode) == (
+                stat.size,
+                stat.inode,
+            ):
+                continue
+            # The scan may predate a concurrent refresh; decide on a fresh stat.
+            try:
+                current = os.stat(path_key)
+            except OSError as exc:
+                logger.debug("Failed to stat session file %s: %s", path_key, exc)
+                continue
+            stat = _SessionFileStat(size=current.st_size, inode=current.st_ino)
+            if state is not None and (
+                state.inode != stat.inode or stat.size < state.offset
+            ):
+                self._retract_file(conn, path_key, forget=True)
+                state = None
+            if state is not None and state.size == stat.size:
+                continue
+            self._ingest_session_file(conn, Path(path_key), stat, state)
+            # One transaction per file keeps progress durable across restarts.
+            conn.commit()
+
+    def _load_file_states(
+        self, conn: sqlite3.Connection
+    ) -> Dict[str, _SessionFileState]:
+        states: Dict[str, _SessionFileState] = {}
+        for row in conn.execute("SELECT * FROM usage_files"):
+            last_totals = None
+            if row["last_totals_json"]:
+                try:
+                    last_totals = _coerce_totals(json.loads(row["last_totals_json"]))
+                except json.JSONDecodeError as exc:
+                    logger.debug("Failed to decode cached totals: %s", exc)
+            states[str(row["path"])] = _SessionFileState(
+                inode=int(row["inode"]),
+                size=int(row["size"]),
+                offset=int(row["offset"]),
+                cwd=row["cwd"],
+                model=row["model"],
+                last_totals=last_totals,
+                event_index=int(row["event_index"] or 0),
+            )
+        return states
+
+    def _retract_file(
+        self, conn: sqlite3.Connection, path_key: str, *, forget: bool
+    ) -> None:
+        cwds = {
+            str(row["cwd"])
+            for row in conn.execute(
+                "SELECT DISTINCT cwd FROM usage_file_summaries WHERE path = ?",
+                (path_key,),
+            )
+        }
+        cwds.update(
+            str(row["cwd"])
+            for row in conn.execute(
+                "SELECT DISTINCT cwd FROM usage_file_rollups WHERE path = ?",
+                (path_key,),
+            )
+        )
+        conn.execute("DELETE FROM usage_file_rollups WHERE path = ?", (path_key,))
+        conn.execute("DELETE FROM usage_file_summaries WHERE path = ?", (path_key,))
+        if forget:
+            conn.execute("DELETE FROM usage_files WHERE path = ?", (path_key,))
+        for cwd in sorted(cwds):
+            self._recompute_cwd_aggregates(conn, cwd)
+
+    def _recompute_cwd_aggregates(self, conn: sqlite3.Connection, cwd: str) -> None:
+        conn.execute("DELETE FROM usage_rollups WHERE cwd = ?", (cwd,))
+        conn.execute(
+            f"""
+            INSERT INTO usage_rollups (
+                cwd, agent, model, bucket, bucket_label, {_COUNTER_INSERT_COLUMNS}
+            )
+            SELECT cwd, agent, model, bucket, bucket_label, {_COUNTER_SUMS}
+              FROM usage_file_rollups
+             WHERE cwd = ?
+             GROUP BY agent, model, bucket, bucket_label
+            """,
+            (cwd,),
+        )
+        conn.execute("DELETE FROM usage_summaries WHERE cwd = ?", (cwd,))
+        conn.execute(
+            f"""
+            INSERT INTO usage_summaries (cwd, events, {_COUNTER_INSERT_COLUMNS})
+            SELECT cwd, SUM(events), {_COUNTER_SUMS}
+              FROM usage_file_summaries
+             WHERE cwd = ?
+             GROUP BY cwd
+            """,
+            (cwd,),
+        )
+        latest = conn.execute(
+            """
+            SELECT path, latest_rate_limits_json, latest_rate_limits_index
+              FROM usage_file_summaries
+             WHERE cwd = ?
+               AND latest_rate_limits_json IS NOT NULL
+             ORDER BY path DESC
+             LIMIT 1
+            """,
+            (cwd,),
+        ).fetchone()
+        if latest is not None:
+            conn.execute(
+                """
+                UPDATE usage_summaries
+                   SET latest_rate_limits_json = ?,
+                       latest_rate_limits_path = ?,
+                       latest_rate_limits_index = ?
+                 WHERE cwd = ?
+                """,
+                (
+                    latest["latest_rate_limits_json"],
+                    latest["path"],
+                    latest["latest_rate_limits_index"],
+                    cwd,
+                ),
+            )
+
     def _ingest_session_file(
         self,
+        conn: sqlite3.Connection,
         session_path: Path,
-        offset: int,
-        state: Dict[str, Any],
-        rollups: Dict[str, Any],
-        file_rollups: Dict[str, Any],
-        summary_rollups: Dict[str, Any],
-        file_summaries: Dict[str, Any],
-    ) -> Dict[str, Any]:
-        cwd = state.get("cwd")
-        model = state.get("model")
-        last_totals_raw = state.get("last_totals")
-        last_totals = _coerce_totals(last_totals_raw) if last_totals_raw else None
-        event_index = int(state.get("event_index", 0) or 0)
-
+        stat: _SessionFileStat,
+        state: Optional[_SessionFileState],
+    ) -> None:
+        if state is None:
+            state = _SessionFileState(inode=stat.inode, size=0, offset=0)
+        offset = state.offset
         try:
             with session_path.open("rb") as handle:
                 handle.seek(offset)
-                data = handle.read()
-                new_offset = handle.tell()
+                data = handle.read(max(0, stat.size - offset))
         except OSError as exc:
             logger.debug(
                 "Failed to read session file %s at offset %d: %s",
@@ -2098,35 +2411,27 @@ class UsageSeriesCache:
                 offset,
                 exc,
             )
-            return state
-
-        if not data:
-            state["offset"] = offset
-            return state
+            return
 
+        # Leave a partially written trailing line for the next pass.
+        complete = data[: data.rfind(b"\n") + 1]
         try:
-            text = data.decode("utf-8")
+            text = complete.decode("utf-8")
         except UnicodeDecodeError as exc:
             logger.debug(
                 "Failed to decode session file %s as UTF-8: %s", session_path, exc
             )
-            text = data.decode("utf-8", errors="ignore")
-        lines = text.splitlines()
-
-        token_fields = [
-            ("input", "input_tokens"),
-            ("cached", "cached_input_tokens"),
-            ("output", "output_tokens"),
-            ("reasoning", "reasoning_output_tokens"),
-        ]
+            text = complete.decode("utf-8", errors="ignore")
 
         path_key = str(session_path)
-        file_entry = file_rollups.setdefault(path_key, {}).setdefault("by_cwd", {})
-        file_summary_entry = file_summaries.setdefault(path_key, {}).setdefault(
-            "by_cwd", {}
-        )
-
-        for line in lines:
+        cwd = state.cwd
+        model = state.model
+        last_totals = state.last_totals
+        event_index = state.event_index
+        rollup_deltas: Dict[Tuple[str, str, str, str], TokenTotals] = {}
+        summary_deltas: Dict[str, _SummaryDelta] = {}
+
+        for line in text.splitlines():
             try:
                 record = json.loads(line)
             except json.JSONDecodeError as exc:
@@ -2170,166 +2475,100 @@ class UsageSeriesCache:
                     else totals.diff(last_totals or TokenTotals())
                 )
                 last_totals = totals
-                for bucket_name in ("hour", "day", "week"):
-                    bucket_start = _bucket_start(timestamp, bucket_name)
-                    bucket_label = _bucket_label(bucket_start, bucket_name)
-                    self._apply_rollup_delta(
-                        rollups,
-                        cwd_key,
-                        bucket_name,
-                        bucket_label,
-                        model_key,
-                        delta,
-                        token_fields,
-                    )
-                    self._apply_rollup_delta(
-                        file_entry,
-                        cwd_key,
-                        bucket_name,
-                        bucket_label,
-                        model_key,
-                        delta,
-                        token_fields,
+                for bucket_name in _USAGE_ROLLUP_BUCKETS:
+                    bucket_label = _bucket_label(
+                        _bucket_start(timestamp, bucket_name), bucket_name
                     )
+                    rollup_deltas.setdefault(
+                        (cwd_key, model_key, bucket_name, bucket_label), TokenTotals()
+                    ).add(delta)
             else:
                 delta = TokenTotals()
 
             event_index += 1
-            pos = {"file": path_key, "index": event_index}
-            self._apply_summary_delta(
-                summary_rollups,
-                file_summary_entry,
-                cwd_key,
-                delta,
-                rate_limits,
-                pos,
+            summary_delta = summary_deltas.setdefault(cwd_key, _SummaryDelta())
+            summary_delta.events += 1
+            summary_delta.totals.add(delta)
+            if rate_limits is not None:
+                summary_delta.latest_rate_limits = rate_limits
+                summary_delta.latest_rate_limits_index = event_index
+
+        rollup_rows = [
+            (cwd_key, CODEX_AGENT_ID, model_key, bucket_name, bucket_label)
+            + tuple(getattr(delta, column) for column in _USAGE_COUNTER_COLUMNS)
+            for (cwd_key, model_key, bucket_name, bucket_label), delta in (
+                rollup_deltas.items()
             )
+        ]
+        conn.executemany(
+            _UPSERT_FILE_ROLLUP_SQL, [(path_key,) + row for row in rollup_rows]
+        )
+        conn.executemany(_UPSERT_ROLLUP_SQL, rollup_rows)
+        for cwd_key, summary_delta in summary_deltas.items():
+            counters = tuple(
+                getattr(summary_delta.totals, column)
+                for column in _USAGE_COUNTER_COLUMNS
+            )
+            rate_limits_json = (
+                json.dumps(summary_delta.latest_rate_limits)
+                if summary_delta.latest_rate_limits is not None
+                else None
+            )
+            conn.execute(
+                _UPSERT_FILE_SUMMARY_SQL,
+                (path_key, cwd_key, summary_delta.events)
+                + counters
+                + (rate_limits_json, summary_delta.latest_rate_limits_index),
+            )
+            conn.execute(
+                _UPSERT_SUMMARY_SQL,
+                (cwd_key, summary_delta.events)
+                + counters
+                + (
+                    rate_limits_json,
+                    path_key if rate_limits_json is not None else None,
+                    summary_delta.latest_rate_limits_index,
+                ),
+            )
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO usage_files (
+                path, inode, size, offset, cwd, model, last_totals_json, event_index
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                path_key,
+                stat.inode,
+                stat.size,
+                offset + len(complete),
+                cwd,
+                model,
+                json.dumps(last_totals.to_dict()) if last_totals else None,
+                event_index,
+            ),
+        )
 
-        state["offset"] = new_offset
-        state["cwd"] = cwd
-        state["model"] = model
-        state["last_totals"] = last_totals.to_dict() if last_totals else None
-        state["event_index"] = event_index
-        return state
-
-    def _apply_rollup_delta(
-        self,
-        rollups: Dict[str, Any],
-        cwd_key: str,
-        bucket_name: str,
-        bucket_label: str,
-        model_key: str,
-        delta: TokenTotals,
-        token_fields: List[Tuple[str, str]],
-    ) -> None:
-        cwd_rollups = rollups.setdefault(cwd_key, {})
-        bucket_rollups = cwd_rollups.setdefault(bucket_name, {})
-        entry = bucket_rollups.get(bucket_label)
-        if entry is None:
-            entry = _empty_rollup_bucket()
-            bucket_rollups[bucket_label] = entry
-
-        entry["total"] = int(entry.get("total", 0)) + delta.total_tokens
-
-        models = entry.setdefault("models", {})
-        models[model_key] = int(models.get(model_key, 0)) + delta.total_tokens
-
-        token_types = entry.setdefault("token_types", {})
-        model_token = entry.setdefault("model_token", {}).setdefault(model_key, {})
-        for label, field in token_fields:
-            value = getattr(delta, field)
-            if not value:
-                continue
-            token_types[label] = int(token_types.get(label, 0)) + value
-            model_token[label] = int(model_token.get(label, 0)) + value
+    def _indexed_cwds(self, conn: sqlite3.Connection) -> List[str]:
+        return [
+            str(row["cwd"]) for row in conn.execute("SELECT cwd FROM usage_summaries")
+        ]
 
-    def _apply_summary_delta(
+    def _bucket_label_range(
         self,
-        summary_rollups: Dict[str, Any],
-        file_summary_entry: Dict[str, Any],
-        cwd_key: str,
-        delta: TokenTotals,
-        rate_limits: Optional[Dict[str, Any]],
-        pos: Dict[str, Any],
-    ) -> None:
-        summary_entry = summary_rollups.setdefault(cwd_key, _empty_summary_entry())
-        file_entry = file_summary_entry.setdefault(cwd_key, _empty_summary_entry())
-
-        for entry in (summary_entry, file_entry):
-            totals = _coerce_totals(entry.get("totals"))
-            totals.add(delta)
-            entry["totals"] = totals.to_dict()
-            entry["events"] = int(entry.get("events", 0) or 0) + 1
-            if rate_limits is not None and _is_rate_limits_newer(
-                pos, entry.get("latest_rate_limits_pos")
-            ):
-                entry["latest_rate_limits"] = rate_limits
-                entry["latest_rate_limits_pos"] = pos
-
-    def _rebuild_rollups(self, file_rollups: Dict[str, Any]) -> Dict[str, Any]:
-        merged: Dict[str, Any] = {}
-        for file_entry in file_rollups.values():
-            cwd_rollups = file_entry.get("by_cwd", {})
-            for cwd_key, buckets in cwd_rollups.items():
-                target = merged.setdefault(cwd_key, {})
-                for bucket_name, bucket_map in buckets.items():
-                    target_bucket = target.setdefault(bucket_name, {})
-                    for bucket_label, entry in (bucket_map or {}).items():
-                        merged_entry = target_bucket.get(bucket_label)
-                        if merged_entry is None:
-                            merged_entry = _empty_rollup_bucket()
-                            target_bucket[bucket_label] = merged_entry
-                        merged_entry["total"] = int(merged_entry.get("total", 0)) + int(
-                            entry.get("total", 0)
-                        )
-                        for model_key, total in (entry.get("models") or {}).items():
-                            models = merged_entry.setdefault("models", {})
-                            models[model_key] = int(models.get(model_key, 0)) + int(
-                                total
-                            )
-                        for token_key, total in (
-                            entry.get("token_types") or {}
-                        ).items():
-                            token_types = merged_entry.setdefault("token_types", {})
-                            token_types[token_key] = int(
-                                token_types.get(token_key, 0)
-                            ) + int(total)
-                        for model_key, token_map in (
-                            entry.get("model_token") or {}
-                        ).items():
-                            model_token = merged_entry.setdefault(
-                                "model_token", {}
-                            ).setdefault(model_key, {})
-                            for token_key, total in (token_map or {}).items():
-                                model_token[token_key] = int(
-                                    model_token.get(token_key, 0)
-                                ) + int(total)
-        return merged
-
-    def _rebuild_summary(self, file_summaries: Dict[str, Any]) -> Dict[str, Any]:
-        merged: Dict[str, Any] = {}
-        for path_key in sorted(file_summaries.keys()):
-            file_entry = file_summaries.get(path_key, {})
-            cwd_map = file_entry.get("by_cwd", {})
-            for cwd_key, entry in (cwd_map or {}).items():
-                target = merged.setdefault(cwd_key, _empty_summary_entry())
-                target_totals = _coerce_totals(target.get("totals"))
-                target_totals.add(_coerce_totals(entry.get("totals")))
-                target["totals"] = target_totals.to_dict()
-                target["events"] = int(target.get("events", 0) or 0) + int(
-                    entry.get("events", 0) or 0
-                )
-                pos = entry.get("latest_rate_limits_pos")
-                if pos and _is_rate_limits_newer(
-                    pos, target.get("latest_rate_limits_pos")
-                ):
-                    target["latest_rate_limits"] = entry.get("latest_rate_limits")
-                    target["latest_rate_limits_pos"] = pos
-        return merged
+        *,
+        since: Optional[datetime],
+        until: Optional[datetime],
+        bucket: str,
+    ) -> Tuple[str, Tuple[str, ...]]:
+        if not (since and until):
+            return "", ()
+        start = _bucket_label(_bucket_start(since, bucket), bucket)
+        end = _bucket_label(_bucket_start(until, bucket), bucket)
+        return " AND bucket_label BETWEEN ? AND ?", (start, end)
 
     def _buckets_for_range(
         self,
-        bucket_rollups: Dict[str, Any],
+        labels: Iterable[str],
         *,
         since: Optional[datetime],
         until: Optional[datetime],
@@ -2343,7 +2582,7 @@ class UsageSeriesCache:
             ]
 
         times: List[datetime] = []
-        for label in bucket_rollups.keys():
+        for label in labels:
             dt = _parse_bucket_label(label, bucket)
             if dt:
                 times.append(dt)
@@ -2355,7 +2594,7 @@ class UsageSeriesCache:
 
     def _build_repo_summary(
         self,
-        payload: Dict[str, Any],
+        conn: sqlite3.Connection,
         repo_root: Path,
         *,
         since: Optional[datetime],
@@ -2369,17 +2608,11 @@ class UsageSeriesCache:
                 until=until,
             )
         repo_root = repo_root.resolve()
-        rollups = cast(Dict[str, Any], payload.get("summary", {}).get("by_cwd", {}))
         acc = _SummaryAccumulator()
-        for cwd, entry in rollups.items():
-            try:
-                cwd_path = Path(cwd)
-            except (TypeError, ValueError, OSError) as exc:
-                logger.debug("Failed to create Path from cwd %r: %s", cwd, exc)
+        for row in conn.execute("SELECT * FROM usage_summaries"):
+            if not _cwd_within(str(row["cwd"]), repo_root):
                 continue
-            if cwd_path != repo_root and repo_root not in cwd_path.parents:
-                continue
-            acc.add_entry(entry)
+            acc.add_entry(_summary_entry_from_row(row))
         return UsageSummary(
             totals=acc.totals,
             events=acc.events,
@@ -2389,7 +2622,7 @@ class UsageSeriesCache:
 
     def _build_hub_summary(
         self,
-        payload: Dict[str, Any],
+        conn: sqlite3.Connection,
         repo_map: List[Tuple[str, Path]],
         *,
         since: Optional[datetime],
@@ -2404,18 +2637,19 @@ class UsageSeriesCache:
             )
         _match_repo, _heuristic_match_base = _build_repo_matchers(repo_map)
 
-        rollups = cast(Dict[str, Any], payload.get("summary", {}).get("by_cwd", {}))
         per_repo: Dict[str, _SummaryAccumulator] = {
             repo_id: _SummaryAccumulator() for repo_id, _ in repo_map
         }
         unmatched = _SummaryAccumulator()
 
-        for cwd, entry in rollups.items():
+        for row in conn.execute("SELECT * FROM usage_summaries"):
+            cwd = str(row["cwd"])
             try:
-                cwd_path = Path(cwd)
+                cwd_path: Optional[Path] = Path(cwd)
             except (TypeError, ValueError, OSError) as exc:
                 logger.debug("Failed to create Path from cwd %r: %s", cwd, exc)
                 cwd_path = None
+            entry = _summary_entry_from_row(row)
             repo_id = _match_repo(cwd_path)
             matched_by_heuristic = False
             if repo_id is None:
@@ -2448,7 +2682,7 @@ class UsageSeriesCache:
 
     def _build_repo_series(
         self,
-        payload: Dict[str, Any],
+        conn: sqlite3.Connection,
         repo_root: Path,
         *,
         since: Optional[datetime],
@@ -2463,64 +2697,69 @@ class UsageSeriesCache:
         if segment not in allowed_segments:
             raise UsageError(f"Unsupported segment: {segment}")
         repo_root = repo_root.resolve()
-        rollups = cast(Dict[str, Any], payload.get("rollups", {}).get("by_cwd", {}))
+        cwds = [cwd for cwd in self._indexed_cwds(conn) if _cwd_within(cwd, repo_root)]
+        label_clause, label_params = self._bucket_label_range(
+            since=since, until=until, bucket=bucket
+        )
 
         series_map: Dict[Tuple[str, Optional[str], Optional[str]], Dict[str, int]] = {}
-        bucket_union: Dict[str, Any] = {}
-
-        for cwd, cwd_data in rollups.items():
-            try:
-                cwd_path = Path(cwd)
-            except (TypeError, ValueError, OSError) as exc:
-                logger.debug("Failed to create Path from cwd %r: %s", cwd, exc)
-                continue
-            if cwd_path != repo_root and repo_root not in cwd_path.parents:
-                continue
-            bucket_rollups = cwd_data.get(bucket, {})
-            if not bucket_rollups:
-                continue
-            bucket_union.update(bucket_rollups)
-            for bucket_label, entry in bucket_rollups.items():
+        labels: set[str] = set()
+
+        def _add(
+            key: Tuple[str, Optional[str], Optional[str]], label: str, value: int
+        ) -> None:
+            values = series_map.setdefault(key, {})
+            values[label] = values.get(label, 0) + value
+
+        for cwd_chunk in _chunks(cwds):
+            placeholders = ", ".join("?" for _ in cwd_chunk)
+            rows = conn.execute(
+                f"""
+                SELECT bucket_label, model, {_COUNTER_SUMS}
+                  FROM usage_rollups
+                 WHERE bucket = ?
+                   AND cwd IN ({placeholders}){label_clause}
+                 GROUP BY bucket_label, model
+                """,
+                (bucket, *cwd_chunk, *label_params),
+            ).fetchall()
+            for row in rows:
+                bucket_label = str(row[0])
+                model_key = str(row[1])
+                counters = {
+                    column: int(value or 0)
+                    for column, value in zip(
+                        _USAGE_COUNTER_COLUMNS, row[2:], strict=True
+                    )
+                }
+                labels.add(bucket_label)
                 if segment == "none":
-                    key = ("total", None, None)
-                    series_map.setdefault(key, {})
-                    series_map[key][bucket_label] = series_map[key].get(
-                        bucket_label, 0
-                    ) + int(entry.get("total", 0))
-                    continue
-
-                if segment == "model":
-                    for model_key, total in (entry.get("models") or {}).items():
-                        key = (model_key, model_key, None)
-                        series_map.setdefault(key, {})
-                        series_map[key][bucket_label] = series_map[key].get(
-                            bucket_label, 0
-                        ) + int(total)
-                    continue
-
-                if segment == "token_type":
-                    for token_key, total in (entry.get("token_types") or {}).items():
-                        key = (token_key, None, token_key)
-                        series_map.setdefault(key, {})
-                        series_map[key][bucket_label] = series_map[key].get(
-                            bucket_label, 0
-                        ) + int(total)
-                    continue
-
-                for model_key, token_map in (entry.get("model_token") or {}).items():
-                    for token_key, total in (token_map or {}).items():
-                        key = (
-                            f"{model_key}:{token_key}",
-                            model_key,
-                            token_key,
-                        )
-                        series_map.setdefault(key, {})
-                        series_map[key][bucket_label] = series_map[key].get(
-                            bucket_label, 0
-                        ) + int(total)
+                    _add(("total", None, None), bucket_label, counters["total_tokens"])
+                elif segment == "model":
+                    _add(
+                        (model_key, model_key, None),
+                        bucket_label,
+                        counters["total_tokens"],
+                    )
+                elif segment == "token_type":
+                    for token_key, field in _USAGE_TOKEN_FIELDS:
+                        if counters[field]:
+                            _add(
+                                (token_key, None, token_key),
+                                bucket_label,
+                                counters[field],
+                            )
+                else:
+                    for token_key, field in _USAGE_TOKEN_FIELDS:
+                        if counters[field]:
+                            _add(
+                                (f"{model_key}:{token_key}", model_key, token_key),
+                                bucket_label,
+                                counters[field],
+                            )
 
         buckets = self._buckets_for_range(
-            bucket_union, since=since, until=until, bucket=bucket
+            labels, since=since, until=until, bucket=bucket
         )
         series = _build_series_entries(buckets, series_map)
         return {
@@ -2532,7 +2771,7 @@ class UsageSeriesCache:
 
     def _build_hub_series(
         self,
-        payload: Dict[str, Any],
+        conn: sqlite3.Connection,
         repo_map: List[Tuple[str, Path]],
         *,
         since: Optional[datetime],
@@ -2547,46 +2786,45 @@ class UsageSeriesCache:
         if segment not in allowed_segments:
             raise UsageError(f"Unsupported segment: {segment}")
         _match_repo, _ = _build_repo_matchers(repo_map)
+        label_clause, label_params = self._bucket_label_range(
+            since=since, until=until, bucket=bucket
+        )
 
-        rollups = cast(Dict[str, Any], payload.get("rollups", {}).get("by_cwd", {}))
         series_map: Dict[Tuple[str, Optional[str], Optional[str]], Dict[str, int]] = {}
-        bucket_union: Dict[str, Any] = {}
-
-        for cwd, cwd_data in rollups.items():
-            bucket_rollups = cwd_data.get(bucket, {})
-            if not bucket_rollups:
-                continue
-            bucket_union.update(bucket_rollups)
-            try:
-                cwd_path = Path(cwd)
-            except (TypeError, ValueError, OSError) as exc:
-                logger.debug("Failed to create Path from cwd %r: %s", cwd, exc)
-                cwd_path = None
-
+        labels: set[str] = set()
+        repo_by_cwd: Dict[str, Optional[str]] = {}
+
+        rows = conn.execute(
+            f"""
+            SELECT cwd, bucket_label, SUM(total_tokens)
+              FROM usage_rollups
+             WHERE bucket = ?{label_clause}
+             GROUP BY cwd, bucket_label
+            """,
+            (bucket, *label_params),
+        ).fetchall()
+        for row in rows:
+            cwd = str(row[0])
+            bucket_label = str(row[1])
+            total = int(row[2] or 0)
+            labels.add(bucket_label)
             if segment == "none":
-                for bucket_label, entry in bucket_rollups.items():
-                    key = ("total", None, None)
-                    series_map.setdefault(key, {})
-                    series_map[key][bucket_label] = series_map[key].get(
-                        bucket_label, 0
-                    ) + int(entry.get("total", 0))
-                continue
-
-            repo_id = _match_repo(cwd_path)
-            label = repo_id or "other"
-            for bucket_label, entry in bucket_rollups.items():
-                repo_key: Tuple[str, Optional[str], Optional[str]] = (
-                    label,
-                    repo_id,
-                    None,
-                )
-                series_map.setdefault(repo_key, {})
-                series_map[repo_key][bucket_label] = series_map[repo_key].get(
-                    bucket_label, 0
-                ) + int(entry.get("total", 0))
+                key: Tuple[str, Optional[str], Optional[str]] = ("total", None, None)
+            else:
+                if cwd not in repo_by_cwd:
+                    try:
+                        cwd_path: Optional[Path] = Path(cwd)
+                    except (TypeError, ValueError, OSError) as exc:
+                        logger.debug("Failed to create Path from cwd %r: %s", cwd, exc)
+                        cwd_path = None
+                    repo_by_cwd[cwd] = _match_repo(cwd_path)
+                repo_id = repo_by_cwd[cwd]
+                key = (repo_id or "other", repo_id, None)
+            values = series_map.setdefault(key, {})
+            values[bucket_label] = values.get(bucket_label, 0) + total
 
         buckets = self._buckets_for_range(
-            bucket_union, since=since, until=until, bucket=bucket
+            labels, since=since, until=until, bucket=bucket
         )
         series = _build_series_entries(buckets, series_map)
         return {
@@ -2912,24 +3150,33 @@ def _maybe_migrate_usage_cache(cache_path: Path, global_cache_path: Path) -> Non
     if cache_key in _REPO_USAGE_CACHE_MIGRATED:
         return
     _REPO_USAGE_CACHE_MIGRATED.add(cache_key)
-    if cache_path.exists() or not global_cache_path.exists():
+    index_path = _usage_index_path(cache_path)
+    global_index_path = _usage_index_path(global_cache_path)
+    if index_path.exists() or not global_index_path.exists():
         return
     try:
-        payload = global_cache_path.read_text(encoding="utf-8")
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path = cache_path.with_suffix(".tmp")
-        tmp_path.write_text(payload, encoding="utf-8")
-        tmp_path.replace(cache_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_suffix(".tmp")
+        source = sqlite3.connect(global_index_path)
+        try:
+            target = sqlite3.connect(tmp_path)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+        finally:
+            source.close()
+        tmp_path.replace(index_path)
         logger.warning(
-            "Imported global usage cache into repo cache at %s from %s",
-            cache_path,
-            global_cache_path,
+            "Imported global usage index into repo index at %s from %s",
+            index_path,
+            global_index_path,
         )
-    except OSError as exc:
+    except (OSError, sqlite3.Error) as exc:
         logger.warning(
-            "Failed to import global usage cache from %s to %s: %s",
-            global_cache_path,
-            cache_path,
+            "Failed to import global usage index from %s to %s: %s",
+            global_index_path,
+            index_path,
             exc,
         )
 
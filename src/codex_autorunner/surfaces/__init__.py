@@ -1,5 +1,16 @@
 """Surface packages for codex-autorunner."""
 
-from . import cli, web
+from __future__ import annotations
+
+from importlib import import_module
 
 __all__ = ["cli", "web"]
+
+
+def __getattr__(name: str):
+    # Import surfaces on demand so `car` does not pay for the web app.
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(f".{name}", __name__)
+    globals()[name] = module
+    return module
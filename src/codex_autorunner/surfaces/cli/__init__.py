@@ -1,6 +1,23 @@
 """CLI surface (command-line interface)."""
 
-from ...core.utils import apply_codex_options, supports_reasoning
-from .cli import main as cli_main
+from __future__ import annotations
 
-__all__ = ["apply_codex_options", "cli_main", "supports_reasoning"]
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "apply_codex_options": ("...core.utils", "apply_codex_options"),
+    "cli_main": (".cli", "main"),
+    "supports_reasoning": ("...core.utils", "supports_reasoning"),
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = target
+    value = getattr(import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
@@ -1,165 +1,112 @@
+"""Top-level ``car`` command.
+
+Command groups are registered by name in :data:`_LAZY_COMMANDS` and their
+modules are imported only when the group is invoked; ``car --help`` lists
+them from the short help registered alongside each loader. Agents run small ``car`` subcommands many times per ticket, so
+keeping the web app, agent pool and flow machinery out of the import path of
+every invocation matters more than shaving any single command.
+"""
+
+import functools
 import logging
+from typing import Any, Callable, Optional
 
 import typer
-
-from ...adapters.agents.build_agent_pool import build_agent_pool
-from ...core.config import load_repo_config
-from ...flows.ticket_flow import build_ticket_flow_definition
-from .commands.apps import register_apps_commands
-from .commands.artifacts import register_artifacts_commands
-from .commands.chat import register_chat_commands
-from .commands.cleanup import register_cleanup_commands
-from .commands.describe import register_describe_commands
-from .commands.discord import register_discord_commands
-from .commands.dispatch import register_dispatch_commands
-from .commands.docs import register_docs_commands
-from .commands.doctor import (
-    register_doctor_commands,
-)
-from .commands.flow import register_flow_commands
-from .commands.hub import register_hub_commands
-from .commands.hub_runs import (
-    _archive_flow_run_artifacts,
-    _cleanup_stale_flow_runs,
-    register_hub_runs_commands,
-)
-from .commands.hub_tickets import register_hub_tickets_commands
-from .commands.inbox import register_inbox_commands
-from .commands.protocol import register_protocol_commands
-from .commands.render import register_render_commands
-from .commands.repos import register_repos_commands
-from .commands.root import register_root_commands
-from .commands.services import register_services_commands
-from .commands.telegram import register_telegram_commands
-from .commands.templates import (
-    register_template_index_commands,
-    register_templates_commands,
-)
-from .commands.tickets import register_tickets_commands
-from .commands.utils import (
-    build_hub_supervisor as _build_hub_supervisor,
-)
-from .commands.utils import (
-    build_server_url as _build_server_url,
-)
-from .commands.utils import (
-    enforce_bind_auth as _enforce_bind_auth,
-)
-from .commands.utils import (
-    fetch_template_with_scan as _fetch_template_with_scan,
-)
-from .commands.utils import (
-    get_car_version,
-    parse_bool_text,
-    parse_duration,
-)
-from .commands.utils import (
-    guard_unregistered_hub_repo as _guard_unregistered_hub_repo,
-)
-from .commands.utils import (
-    normalize_base_path as _normalize_base_path,
-)
-from .commands.utils import (
-    raise_exit as _raise_exit,
-)
-from .commands.utils import (
-    request_form_json as _request_form_json,
-)
-from .commands.utils import (
-    request_json as _request_json,
-)
-from .commands.utils import (
-    require_apps_enabled as _require_apps_enabled,
-)
-from .commands.utils import (
-    require_hub_config as _require_hub_config,
-)
-from .commands.utils import (
-    require_optional_feature as _require_optional_feature,
-)
-from .commands.utils import (
-    require_repo_config as _require_repo_config,
-)
-from .commands.utils import (
-    require_templates_enabled as _require_templates_enabled,
-)
-from .commands.utils import (
-    resolve_hub_config_path_for_cli as _resolve_hub_config_path_for_cli,
-)
-from .commands.worktree import register_worktree_commands
-from .hub_control_plane_client import resolve_hub_path as _resolve_pma_hub_path
-from .pma_cli import automation_app as automation_cli_app
-from .pma_cli import pma_app as pma_cli_app
+from typer.core import TyperCommand, TyperGroup
 
 logger = logging.getLogger("codex_autorunner.cli")
 
+_LAZY_COMMANDS: dict[str, Callable[[], typer.Typer]] = {}
+
+# Short help shown by ``car --help`` for commands that are not loaded yet; it
+# must match the help of the loaded command.
+_LAZY_HELP: dict[str, str] = {}
+
+_HELP_LISTING_KEY = "codex_autorunner.cli.help_listing"
+
+# Top-level commands (rather than groups) from ``commands/root.py`` and
+# ``commands/describe.py``; they share one loader.
+_ROOT_COMMAND_HELP = {
+    "init": "Initialize a repo for Codex autorunner.",
+    "status": "Show autorunner status.",
+    "sessions": "List active terminal sessions.",
+    "stop-session": "Stop a terminal session by id or repo path.",
+    "usage": (
+        "Show Codex/OpenCode token usage for a repo or hub by reading local "
+        "session logs."
+    ),
+    "kill": "Force-kill a running autorunner and clear stale lock/state.",
+    "log": "Show autorunner log output.",
+    "edit": "Open one of the docs in $EDITOR.",
+    "serve": "Start the hub web server and UI API.",
+    "describe": "Show CAR layout and behavior summary (human or JSON).",
+}
+
+
+class _LazyCommandGroup(TyperGroup):
+    """Root group that resolves registered command groups on first use."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        names = list(super().list_commands(ctx))
+        names.extend(name for name in _LAZY_COMMANDS if name not in names)
+        return names
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Optional[Any]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in _LAZY_COMMANDS:
+            return command
+        if ctx.meta.get(_HELP_LISTING_KEY):
+            # Listing ``car --help`` only needs the name and short help.
+            return TyperCommand(name=cmd_name, help=_LAZY_HELP[cmd_name])
+        command = _load_command(cmd_name)
+        if command is not None:
+            self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: Any, formatter: Any) -> None:
+        ctx.meta[_HELP_LISTING_KEY] = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            ctx.meta.pop(_HELP_LISTING_KEY, None)
+
+
+def _load_command(name: str) -> Optional[Any]:
+    # Typer may vendor its own click, so keep click types out of signatures.
+    # ``get_group`` (unlike ``get_command``) keeps a single-command app such as
+    # ``tickets`` as a group instead of collapsing it into that command.
+    command: Any = typer.main.get_group(_LAZY_COMMANDS[name]())
+    if name in _ROOT_COMMAND_HELP:
+        return command.commands.get(name)
+    command.name = name
+    return command
+
+
+def _lazy_command(
+    help_by_name: dict[str, str],
+) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+    def _decorator(loader: Callable[[], Any]) -> Callable[[], Any]:
+        cached = functools.lru_cache(maxsize=None)(loader)
+        for name, short_help in help_by_name.items():
+            _LAZY_COMMANDS[name] = cached
+            _LAZY_HELP[name] = short_help
+        return cached
+
+    return _decorator
+
+
 app = typer.Typer(
     add_completion=False,
+    cls=_LazyCommandGroup,
     help="Codex Autorunner CLI for repo and hub lifecycle workflows.",
 )
-hub_app = typer.Typer(
-    add_completion=False, help="Hub repo/worktree lifecycle commands."
-)
-dispatch_app = typer.Typer(
-    add_completion=False, help="Reply to and resolve hub dispatch handoffs."
-)
-inbox_app = typer.Typer(add_completion=False, help="Resolve and clear hub inbox items.")
-hub_runs_app = typer.Typer(
-    add_completion=False, help="Retire and prune stale flow runs."
-)
-telegram_app = typer.Typer(add_completion=False, help="Manage Telegram bot operations.")
-discord_app = typer.Typer(add_completion=False, help="Manage Discord bot operations.")
-apps_app = typer.Typer(
-    add_completion=False, help="Discover configured CAR app bundles."
-)
-artifacts_app = typer.Typer(
-    add_completion=False, help="Inspect and manage artifact deliveries."
-)
-templates_app = typer.Typer(
-    add_completion=False, help="Fetch, apply, and discover ticket templates."
-)
-tickets_app = typer.Typer(
-    add_completion=False, help="Validate and maintain repo tickets."
-)
-repos_app = typer.Typer(
-    add_completion=False, help="Manage trusted/untrusted template repositories."
-)
-render_app = typer.Typer(
-    add_completion=False, help="Rendering, export, and browser capture commands."
-)
-cleanup_app = typer.Typer(
-    add_completion=False, help="Cleanup managed processes and report artifacts."
-)
-chat_app = typer.Typer(add_completion=False, help="Inspect shared chat metadata.")
-docs_app = typer.Typer(add_completion=False, help="Discover and search CAR docs.")
-worktree_app = typer.Typer(
-    add_completion=False, help="Create, list, retire, and cleanup hub worktrees."
-)
-hub_tickets_app = typer.Typer(
-    add_completion=False, help="Import and maintain ticket packs in hub repos."
-)
-doctor_app = typer.Typer(
-    add_completion=False,
-    invoke_without_command=True,
-    help="Run health checks for repo, hub, and adapters.",
-)
-flow_app = typer.Typer(
-    add_completion=False, help="Flow lifecycle commands (worker + ticket_flow)."
-)
-ticket_flow_app = typer.Typer(
-    add_completion=False, help="Canonical ticket_flow workflow commands."
-)
-telemetry_app = typer.Typer(
-    add_completion=False, help="Flow telemetry export and cleanup commands."
-)
-services_app = typer.Typer(
-    add_completion=False, help="Discover and control Preview Services."
-)
 
 
 def _version_callback(value: bool) -> None:
     if not value:
         return
+    from .version import get_car_version
+
     typer.echo(f"codex-autorunner {get_car_version()}")
     raise typer.Exit(code=0)
 
@@ -185,177 +132,406 @@ def main() -> None:
     app()
 
 
-app.add_typer(hub_app, name="hub")
-register_hub_commands(
-    hub_app,
-    require_hub_config=_require_hub_config,
-    raise_exit=_raise_exit,
-    build_supervisor=_build_hub_supervisor,
-    enforce_bind_auth=_enforce_bind_auth,
-    build_server_url=_build_server_url,
-    request_json=_request_json,
-    normalize_base_path=_normalize_base_path,
-)
-hub_app.add_typer(dispatch_app, name="dispatch")
-register_dispatch_commands(
-    dispatch_app,
-    require_hub_config_func=_require_hub_config,
-    build_server_url_func=_build_server_url,
-    request_json_func=_request_json,
-    request_form_json_func=_request_form_json,
-)
-hub_app.add_typer(inbox_app, name="inbox")
-hub_app.add_typer(hub_runs_app, name="runs")
-register_hub_runs_commands(
-    hub_runs_app,
-    require_hub_config=_require_hub_config,
-    load_repo_config=load_repo_config,
-    parse_bool_text_func=parse_bool_text,
-    parse_duration_func=parse_duration,
-)
-hub_app.add_typer(worktree_app, name="worktree")
-register_worktree_commands(
-    worktree_app,
-    require_hub_config=_require_hub_config,
-    raise_exit=_raise_exit,
-    build_supervisor=_build_hub_supervisor,
-    build_server_url=_build_server_url,
-    request_json=_request_json,
-)
-hub_app.add_typer(hub_tickets_app, name="tickets")
-app.add_typer(telegram_app, name="telegram")
-register_telegram_commands(
-    telegram_app,
-    raise_exit=_raise_exit,
-    require_optional_feature=_require_optional_feature,
-)
-app.add_typer(discord_app, name="discord")
-register_discord_commands(
-    discord_app,
-    raise_exit=_raise_exit,
-    require_optional_feature=_require_optional_feature,
-)
-app.add_typer(render_app, name="render")
-register_render_commands(
-    render_app,
-    require_optional_feature=_require_optional_feature,
-    require_repo_config=_require_repo_config,
-    raise_exit=_raise_exit,
-)
-app.add_typer(apps_app, name="apps")
-app.add_typer(artifacts_app, name="artifacts")
-app.add_typer(templates_app, name="templates")
-app.add_typer(tickets_app, name="tickets")
-register_tickets_commands(tickets_app, raise_exit=_raise_exit)
-app.add_typer(cleanup_app, name="cleanup")
-app.add_typer(chat_app, name="chat")
-app.add_typer(docs_app, name="docs")
-register_docs_commands(docs_app)
-register_apps_commands(
-    apps_app,
-    require_repo_config=_require_repo_config,
-    require_apps_enabled=_require_apps_enabled,
-    raise_exit=_raise_exit,
-    resolve_hub_config_path_for_cli=_resolve_hub_config_path_for_cli,
-)
-register_artifacts_commands(artifacts_app)
-register_templates_commands(
-    templates_app,
-    require_repo_config=_require_repo_config,
-    require_templates_enabled=_require_templates_enabled,
-    raise_exit=_raise_exit,
-    resolve_hub_config_path_for_cli=_resolve_hub_config_path_for_cli,
-)
+@_lazy_command(_ROOT_COMMAND_HELP)
+def _load_root_commands() -> typer.Typer:
+    from .commands import utils
+    from .commands.describe import register_describe_commands
+    from .commands.root import register_root_commands
 
-register_template_index_commands(
-    templates_app,
-    require_repo_config=_require_repo_config,
-    require_hub_config=_require_hub_config,
-    raise_exit=_raise_exit,
-    resolve_hub_config_path_for_cli=_resolve_hub_config_path_for_cli,
-)
-templates_app.add_typer(repos_app, name="repos")
-register_repos_commands(
-    repos_app,
-    raise_exit=_raise_exit,
-)
-register_inbox_commands(
-    inbox_app,
-    require_hub_config=_require_hub_config,
-    build_server_url=_build_server_url,
-    request_json=_request_json,
-    raise_exit=_raise_exit,
-)
-register_cleanup_commands(
-    cleanup_app,
-    require_repo_config=_require_repo_config,
-)
-register_chat_commands(
-    chat_app,
-    resolve_hub_path=_resolve_pma_hub_path,
-)
-app.add_typer(doctor_app, name="doctor")
-register_doctor_commands(doctor_app)
-protocol_app = typer.Typer(
-    add_completion=False, help="Refresh and inspect protocol schema snapshots."
-)
-app.add_typer(protocol_app, name="protocol")
-register_protocol_commands(protocol_app)
-app.add_typer(flow_app, name="flow")
-app.add_typer(services_app, name="services")
-register_services_commands(
-    services_app,
-    require_hub_config=_require_hub_config,
-    build_server_url=_build_server_url,
-    request_json=_request_json,
-    raise_exit=_raise_exit,
-)
-app.add_typer(automation_cli_app, name="automation")
-app.add_typer(
-    ticket_flow_app,
-    name="ticket-flow",
-    help="Canonical ticket_flow command group.",
-)
-flow_app.add_typer(
-    telemetry_app,
-    name="telemetry",
-    help="Flow telemetry management.",
-)
-app.add_typer(pma_cli_app, name="pma")
-register_root_commands(app)
-register_describe_commands(
-    app,
-    require_repo_config=_require_repo_config,
-    raise_exit=_raise_exit,
+    root_app = typer.Typer(add_completion=False)
+    register_root_commands(root_app)
+    register_describe_commands(
+        root_app,
+        require_repo_config=utils.require_repo_config,
+        raise_exit=utils.raise_exit,
+    )
+    return root_app
+
+
+@_lazy_command({"hub": "Hub repo/worktree lifecycle commands."})
+def _load_hub_app() -> typer.Typer:
+    from ...core.config import load_repo_config
+    from .commands import utils
+    from .commands.dispatch import register_dispatch_commands
+    from .commands.hub import register_hub_commands
+    from .commands.hub_runs import (
+        register_hub_runs_commands,
+    )
+    from .commands.hub_tickets import register_hub_tickets_commands
+    from .commands.inbox import register_inbox_commands
+    from .commands.worktree import register_worktree_commands
+
+    hub_app = typer.Typer(
+        add_completion=False, help="Hub repo/worktree lifecycle commands."
+    )
+    register_hub_commands(
+        hub_app,
+        require_hub_config=utils.require_hub_config,
+        raise_exit=utils.raise_exit,
+        build_supervisor=utils.build_hub_supervisor,
+        enforce_bind_auth=utils.enforce_bind_auth,
+        build_server_url=utils.build_server_url,
+        request_json=utils.request_json,
+        normalize_base_path=utils.normalize_base_path,
+    )
+    dispatch_app = typer.Typer(
+        add_completion=False, help="Reply to and resolve hub dispatch handoffs."
+    )
+    hub_app.add_typer(dispatch_app, name="dispatch")
+    register_dispatch_commands(
+        dispatch_app,
+        require_hub_config_func=utils.require_hub_config,
+        build_server_url_func=utils.build_server_url,
+        request_json_func=utils.request_json,
+        request_form_json_func=utils.request_form_json,
+    )
+    inbox_app = typer.Typer(
+        add_completion=False, help="Resolve and clear hub inbox items."
+    )
+    hub_app.add_typer(inbox_app, name="inbox")
+    register_inbox_commands(
+        inbox_app,
+        require_hub_config=utils.require_hub_config,
+        build_server_url=utils.build_server_url,
+        request_json=utils.request_json,
+        raise_exit=utils.raise_exit,
+    )
+    hub_runs_app = typer.Typer(
+        add_completion=False, help="Retire and prune stale flow runs."
+    )
+    hub_app.add_typer(hub_runs_app, name="runs")
+    register_hub_runs_commands(
+        hub_runs_app,
+        require_hub_config=utils.require_hub_config,
+        load_repo_config=load_repo_config,
+        parse_bool_text_func=utils.parse_bool_text,
+        parse_duration_func=utils.parse_duration,
+    )
+    worktree_app = typer.Typer(
+        add_completion=False, help="Create, list, retire, and cleanup hub worktrees."
+    )
+    hub_app.add_typer(worktree_app, name="worktree")
+    register_worktree_commands(
+        worktree_app,
+        require_hub_config=utils.require_hub_config,
+        raise_exit=utils.raise_exit,
+        build_supervisor=utils.build_hub_supervisor,
+        build_server_url=utils.build_server_url,
+        request_json=utils.request_json,
+    )
+    hub_tickets_app = typer.Typer(
+        add_completion=False, help="Import and maintain ticket packs in hub repos."
+    )
+    hub_app.add_typer(hub_tickets_app, name="tickets")
+    register_hub_tickets_commands(
+        hub_tickets_app,
+        require_hub_config_func=utils.require_hub_config,
+        require_repo_config_func=utils.require_repo_config,
+        require_templates_enabled_func=utils.require_templates_enabled,
+        fetch_template_with_scan_func=utils.fetch_template_with_scan,
+        ticket_flow_preflight=_hub_ticket_flow_preflight,
+        print_preflight_report=_hub_print_preflight_report,
+        ticket_flow_start=_hub_ticket_flow_start,
+    )
+    return hub_app
+
+
+@_lazy_command({"telegram": "Manage Telegram bot operations."})
+def _load_telegram_app() -> typer.Typer:
+    from .commands import utils
+    from .commands.telegram import register_telegram_commands
+
+    telegram_app = typer.Typer(
+        add_completion=False, help="Manage Telegram bot operations."
+    )
+    register_telegram_commands(
+        telegram_app,
+        raise_exit=utils.raise_exit,
+        require_optional_feature=utils.require_optional_feature,
+    )
+    return telegram_app
+
+
+@_lazy_command({"discord": "Manage Discord bot operations."})
+def _load_discord_app() -> typer.Typer:
+    from .commands import utils
+    from .commands.discord import register_discord_commands
+
+    discord_app = typer.Typer(
+        add_completion=False, help="Manage Discord bot operations."
+    )
+    register_discord_commands(
+        discord_app,
+        raise_exit=utils.raise_exit,
+        require_optional_feature=utils.require_optional_feature,
+    )
+    return discord_app
+
+
+@_lazy_command({"render": "Rendering, export, and browser capture commands."})
+def _load_render_app() -> typer.Typer:
+    from .commands import utils
+    from .commands.render import register_render_commands
+
+    render_app = typer.Typer(
+        add_completion=False, help="Rendering, export, and browser capture commands."
+    )
+    register_render_commands(
+        render_app,
+        require_optional_feature=utils.require_optional_feature,
+        require_repo_config=utils.require_repo_config,
+        raise_exit=utils.raise_exit,
+    )
+    return render_app
+
+
+@_lazy_command({"apps": "Discover configured CAR app bundles."})
+def _load_apps_app() -> typer.Typer:
+    from .commands import utils
+    from .commands.apps import register_apps_commands
+
+    apps_app = typer.Typer(
+        add_completion=False, help="Discover configured CAR app bundles."
+    )
+    register_apps_commands(
+        apps_app,
+        require_repo_config=utils.require_repo_config,
+        require_apps_enabled=utils.require_apps_enabled,
+        raise_exit=utils.raise_exit,
+        resolve_hub_config_path_for_cli=utils.resolve_hub_config_path_for_cli,
+    )
+    return apps_app
+
+
+@_lazy_command({"artifacts": "Inspect and manage artifact deliveries."})
+def _load_artifacts_app() -> typer.Typer:
+    from .commands.artifacts import register_artifacts_commands
+
+    artifacts_app = typer.Typer(
+        add_completion=False, help="Inspect and manage artifact deliveries."
+    )
+    register_artifacts_commands(artifacts_app)
+    return artifacts_app
+
+
+@_lazy_command({"templates": "Fetch, apply, and discover ticket templates."})
+def _load_templates_app() -> typer.Typer:
+    from .commands import utils
+    from .commands.repos import register_repos_commands
+    from .commands.templates import (
+        register_template_index_commands,
+        register_templates_commands,
+    )
+
+    templates_app = typer.Typer(
+        add_completion=False, help="Fetch, apply, and discover ticket templates."
+    )
+    register_templates_commands(
+        templates_app,
+        require_repo_config=utils.require_repo_config,
+        require_templates_enabled=utils.require_templates_enabled,
+        raise_exit=utils.raise_exit,
+        resolve_hub_config_path_for_cli=utils.resolve_hub_config_path_for_cli,
+    )
+    register_template_index_commands(
+        templates_app,
+        require_repo_config=utils.require_repo_config,
+        require_hub_config=utils.require_hub_config,
+        raise_exit=utils.raise_exit,
+        resolve_hub_config_path_for_cli=utils.resolve_hub_config_path_for_cli,
+    )
+    repos_app = typer.Typer(
+        add_completion=False, help="Manage trusted/untrusted template repositories."
+    )
+    templates_app.add_typer(repos_app, name="repos")
+    register_repos_commands(repos_app, raise_exit=utils.raise_exit)
+    return templates_app
+
+
+@_lazy_command({"tickets": "Validate and maintain repo tickets."})
+def _load_tickets_app() -> typer.Typer:
+    from .commands import utils
+    from .commands.tickets import register_tickets_commands
+
+    tickets_app = typer.Typer(
+        add_completion=False, help="Validate and maintain repo tickets."
+    )
+    register_tickets_commands(tickets_app, raise_exit=utils.raise_exit)
+    return tickets_app
+
+
+@_lazy_command({"cleanup": "Cleanup managed processes and report artifacts."})
+def _load_cleanup_app() -> typer.Typer:
+    from .commands import utils
+    from .commands.cleanup import register_cleanup_commands
+
+    cleanup_app = typer.Typer(
+        add_completion=False, help="Cleanup managed processes and report artifacts."
+    )
+    register_cleanup_commands(
+        cleanup_app, require_repo_config=utils.require_repo_config
+    )
+    return cleanup_app
+
+
+@_lazy_command({"chat": "Inspect shared chat metadata."})
+def _load_chat_app() -> typer.Typer:
+    from .commands.chat import register_chat_commands
+    from .hub_control_plane_client import resolve_hub_path
+
+    chat_app = typer.Typer(add_completion=False, help="Inspect shared chat metadata.")
+    register_chat_commands(chat_app, resolve_hub_path=resolve_hub_path)
+    return chat_app
+
+
+@_lazy_command({"docs": "Discover and search CAR docs."})
+def _load_docs_app() -> typer.Typer:
+    from .commands.docs import register_docs_commands
+
+    docs_app = typer.Typer(add_completion=False, help="Discover and search CAR docs.")
+    register_docs_commands(docs_app)
+    return docs_app
+
+
+@_lazy_command({"doctor": "Run health checks for repo, hub, and adapters."})
+def _load_doctor_app() -> typer.Typer:
+    from .commands.doctor import register_doctor_commands
+
+    doctor_app = typer.Typer(
+        add_completion=False,
+        invoke_without_command=True,
+        help="Run health checks for repo, hub, and adapters.",
+    )
+    register_doctor_commands(doctor_app)
+    return doctor_app
+
+
+@_lazy_command({"protocol": "Refresh and inspect protocol schema snapshots."})
+def _load_protocol_app() -> typer.Typer:
+    from .commands.protocol import register_protocol_commands
+
+    protocol_app = typer.Typer(
+        add_completion=False, help="Refresh and inspect protocol schema snapshots."
+    )
+    register_protocol_commands(protocol_app)
+    return protocol_app
+
+
+@functools.lru_cache(maxsize=None)
+def _load_flow_apps() -> tuple[typer.Typer, typer.Typer]:
+    from ...adapters.agents.build_agent_pool import build_agent_pool
+    from ...flows.ticket_flow import build_ticket_flow_definition
+    from .commands import utils
+    from .commands.flow import register_flow_commands
+    from .commands.hub_runs import (
+        _archive_flow_run_artifacts,
+        _cleanup_stale_flow_runs,
+    )
+
+    flow_app = typer.Typer(
+        add_completion=False, help="Flow lifecycle commands (worker + ticket_flow)."
+    )
+    ticket_flow_app = typer.Typer(
+        add_completion=False, help="Canonical ticket_flow command group."
+    )
+    telemetry_app = typer.Typer(
+        add_completion=False, help="Flow telemetry export and cleanup commands."
+    )
+    flow_app.add_typer(
+        telemetry_app,
+        name="telemetry",
+        help="Flow telemetry management.",
+    )
+    globals()["FLOW_COMMANDS"] = register_flow_commands(
+        flow_app,
+        ticket_flow_app,
+        telemetry_app,
+        require_repo_config=utils.require_repo_config,
+        raise_exit=utils.raise_exit,
+        build_agent_pool=build_agent_pool,
+        build_ticket_flow_definition=build_ticket_flow_definition,
+        guard_unregistered_hub_repo=utils.guard_unregistered_hub_repo,
+        parse_bool_text=utils.parse_bool_text,
+        parse_duration=utils.parse_duration,
+        cleanup_stale_flow_runs=_cleanup_stale_flow_runs,
+        archive_flow_run_artifacts=_archive_flow_run_artifacts,
+    )
+    return flow_app, ticket_flow_app
+
+
+@_lazy_command({"flow": "Flow lifecycle commands (worker + ticket_flow)."})
+def _load_flow_app() -> typer.Typer:
+    return _load_flow_apps()[0]
+
+
+@_lazy_command({"services": "Discover and control Preview Services."})
+def _load_services_app() -> typer.Typer:
+    from .commands import utils
+    from .commands.services import register_services_commands
+
+    services_app = typer.Typer(
+        add_completion=False, help="Discover and control Preview Services."
+    )
+    register_services_commands(
+        services_app,
+        require_hub_config=utils.require_hub_config,
+        build_server_url=utils.build_server_url,
+        request_json=utils.request_json,
+        raise_exit=utils.raise_exit,
+    )
+    return services_app
+
+
+@_lazy_command(
+    {"automation": "Create, list, monitor, and run generalized automations."}
 )
+def _load_automation_app() -> typer.Typer:
+    from .pma_cli import automation_app
+
+    return automation_app
 
 
-FLOW_COMMANDS = register_flow_commands(
-    flow_app,
-    ticket_flow_app,
-    telemetry_app,
-    require_repo_config=_require_repo_config,
-    raise_exit=_raise_exit,
-    build_agent_pool=build_agent_pool,
-    build_ticket_flow_definition=build_ticket_flow_definition,
-    guard_unregistered_hub_repo=_guard_unregistered_hub_repo,
-    parse_bool_text=parse_bool_text,
-    parse_duration=parse_duration,
-    cleanup_stale_flow_runs=_cleanup_stale_flow_runs,
-    archive_flow_run_artifacts=_archive_flow_run_artifacts,
+@_lazy_command({"ticket-flow": "Canonical ticket_flow command group."})
+def _load_ticket_flow_app() -> typer.Typer:
+    return _load_flow_apps()[1]
+
+
+@_lazy_command(
+    {
+        "pma": "Project Management Assistant commands for chat, docs, and managed threads."
+    }
 )
+def _load_pma_app() -> typer.Typer:
+    from .pma_cli import pma_app
+
+    return pma_app
+
+
+def _flow_commands() -> Any:
+    # Read through globals() so tests that monkeypatch FLOW_COMMANDS win.
+    exports = globals().get("FLOW_COMMANDS")
+    if exports is None:
+        _load_flow_apps()
+        exports = globals()["FLOW_COMMANDS"]
+    return exports
+
+
+def __getattr__(name: str) -> Any:
+    if name == "FLOW_COMMANDS":
+        return _flow_commands()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _ticket_flow_preflight(engine, ticket_dir):
-    return FLOW_COMMANDS._ticket_flow_preflight(engine, ticket_dir)
+    return _flow_commands()._ticket_flow_preflight(engine, ticket_dir)
 
 
 def _print_preflight_report(report) -> None:
-    return FLOW_COMMANDS.ticket_flow_print_preflight_report(report)
+    _flow_commands().ticket_flow_print_preflight_report(report)
 
 
 def ticket_flow_start(*args, **kwargs):
-    return FLOW_COMMANDS.ticket_flow_start(*args, **kwargs)
+    return _flow_commands().ticket_flow_start(*args, **kwargs)
 
 
 def _hub_ticket_flow_preflight(*args, **kwargs):
@@ -370,15 +546,5 @@ def _hub_ticket_flow_start(*args, **kwargs):
     return ticket_flow_start(*args, **kwargs)
 
 
-register_hub_tickets_commands(
-    hub_tickets_app,
-    require_hub_config_func=_require_hub_config,
-    require_repo_config_func=_require_repo_config,
-    require_templates_enabled_func=_require_templates_enabled,
-    fetch_template_with_scan_func=_fetch_template_with_scan,
-    ticket_flow_preflight=_hub_ticket_flow_preflight,
-    print_preflight_report=_hub_print_preflight_report,
-    ticket_flow_start=_hub_ticket_flow_start,
-)
 if __name__ == "__main__":
     app()
@@ -1,27 +1,31 @@
-from .chat import register_chat_commands
-from .cleanup import register_cleanup_commands
-from .discord import register_discord_commands
-from .dispatch import register_dispatch_commands
-from .hub import register_hub_commands
-from .hub_tickets import register_hub_tickets_commands
-from .inbox import register_inbox_commands
-from .repos import register_repos_commands
-from .telegram import register_telegram_commands
-from .templates import register_templates_commands
-from .tickets import register_tickets_commands
-from .worktree import register_worktree_commands
+"""CLI command registrars, imported on first use."""
 
-__all__ = [
-    "register_chat_commands",
-    "register_cleanup_commands",
-    "register_discord_commands",
-    "register_dispatch_commands",
-    "register_hub_commands",
-    "register_hub_tickets_commands",
-    "register_inbox_commands",
-    "register_repos_commands",
-    "register_telegram_commands",
-    "register_templates_commands",
-    "register_tickets_commands",
-    "register_worktree_commands",
-]
+from __future__ import annotations
+
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "register_chat_commands": ".chat",
+    "register_cleanup_commands": ".cleanup",
+    "register_discord_commands": ".discord",
+    "register_dispatch_commands": ".dispatch",
+    "register_hub_commands": ".hub",
+    "register_hub_tickets_commands": ".hub_tickets",
+    "register_inbox_commands": ".inbox",
+    "register_repos_commands": ".repos",
+    "register_telegram_commands": ".telegram",
+    "register_templates_commands": ".templates",
+    "register_tickets_commands": ".tickets",
+    "register_worktree_commands": ".worktree",
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
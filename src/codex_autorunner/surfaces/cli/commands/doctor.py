@@ -40,7 +40,8 @@ from ....core.utils import (
     is_within,
     resolve_executable,
 )
-from .utils import get_car_version, raise_exit
+from ..version import get_car_version
+from .utils import raise_exit
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +37,7 @@ from ....core.orchestration import (
 )
 from ....core.orchestration.canary import run_execution_history_canary
 from ....core.orchestration.execution_history_maintenance import (
+    incremental_vacuum_execution_history,
     prune_execution_history_retention,
 )
 from ....core.orchestration.sqlite import open_orchestration_sqlite
@@ -602,6 +603,10 @@ def register_hub_commands(
             "tables": table_counts,
             "automation_migration": automation_migration,
         }
+        if automation_migration["status"] == "complete":
+            payload["automation_queue"] = (
+                AutomationStore(config.root).queue_metrics().to_dict()
+            )
         if output_json:
             typer.echo(json.dumps(payload, indent=2))
             return
@@ -627,6 +632,15 @@ def register_hub_commands(
                     message=diagnostic.get("message"),
                 )
             )
+        automation_queue = payload.get("automation_queue")
+        if isinstance(automation_queue, dict):
+            typer.echo(
+                "automation_queue: "
+                f"due={automation_queue['due_pending']} "
+                f"active={automation_queue['active']} "
+                f"oldest_due_age_seconds={automation_queue['oldest_due_age_seconds']} "
+                f"jobs_per_minute={automation_queue['jobs_per_minute']}"
+            )
         for table, count in sorted(table_counts.items()):
             typer.echo(f"  {table}: {count}")
 
@@ -796,7 +810,8 @@ def register_hub_commands(
             + f"hot_rows_deleted={summary.hot_rows_deleted} "
             + f"checkpoints_deleted={summary.checkpoints_deleted} "
             + f"manifests_deleted={summary.manifests_deleted} "
-            + f"bytes_reclaimed={summary.bytes_reclaimed}"
+            + f"bytes_reclaimed={summary.bytes_reclaimed} "
+            + f"batches={len(summary.slices)}"
         )
 
     @orchestration_app.command("export-history")
@@ -832,20 +847,35 @@ def register_hub_commands(
     @orchestration_app.command("vacuum")
     def orchestration_vacuum(
         path: Optional[Path] = typer.Option(None, "--path", help="Hub root path"),
+        incremental: bool = typer.Option(
+            False,
+            "--incremental",
+            help="Reclaim free pages in short incremental_vacuum slices instead of a full VACUUM.",
+        ),
         output_json: bool = typer.Option(
             False, "--json", help="Emit JSON payload for scripting"
         ),
     ) -> None:
         """Vacuum orchestration.sqlite3 after migration/compaction cleanup."""
         config = require_hub_config(path)
-        summary = vacuum_execution_history(config.root)
+        if incremental:
+            summary = incremental_vacuum_execution_history(
+                config.root, is_idle=lambda: True
+            )
+        else:
+            summary = vacuum_execution_history(config.root)
         if output_json:
             typer.echo(json.dumps(summary.to_dict(), indent=2))
             return
         typer.echo(
-            "vacuum: "
+            f"vacuum ({summary.mode}): "
             f"before={summary.size_before} after={summary.size_after} "
             + f"reclaimed={summary.reclaimed_bytes}"
+            + (
+                f" free_pages_remaining={summary.free_pages_remaining}"
+                if summary.mode == "incremental"
+                else ""
+            )
         )
 
     @orchestration_app.command("canary")
@@ -18,7 +18,6 @@ from ....core.config import (
     ACTIVE_HUB_ROOT_ENV,
     CONFIG_FILENAME,
     ConfigError,
-    HubConfig,
     ensure_hub_config_at,
     find_nearest_hub_config_path,
     load_hub_config,
@@ -85,15 +84,6 @@ def _require_repo_config(repo: Optional[Path], hub: Optional[Path]) -> RuntimeCo
         _raise_exit(str(exc), cause=exc)
 
 
-def _require_hub_config(path: Optional[Path]) -> HubConfig:
-    try:
-        config = load_hub_config(path or Path.cwd())
-        os.environ[ACTIVE_HUB_ROOT_ENV] = str(config.root)
-        return config
-    except ConfigError as exc:
-        _raise_exit(str(exc), cause=exc)
-
-
 def _build_server_url(
     config: object, path: str, *, base_path_override: Optional[str] = None
 ) -> str:
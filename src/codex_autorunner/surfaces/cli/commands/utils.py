@@ -11,7 +11,6 @@ from urllib.parse import urlsplit
 
 import httpx
 import typer
-import yaml
 
 from ....core.config import (
     ACTIVE_HUB_ROOT_ENV,
@@ -30,12 +29,6 @@ from ....core.utils import (
     find_template_repo,
     is_within,
 )
-from ....manifest import load_manifest
-from ....tickets.files import list_ticket_paths, read_ticket, safe_relpath
-from ....tickets.frontmatter import render_markdown_frontmatter
-from ....tickets.ingest_state import INGEST_STATE_FILENAME
-from ....tickets.lint import lint_ticket_directory, parse_ticket_index
-from ...web.services.browser_auth import ensure_bootstrap_token
 
 if TYPE_CHECKING:
     from ....core.hub import HubSupervisor
@@ -43,15 +36,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger("codex_autorunner.cli")
 
 
-def get_car_version() -> str:
-    import importlib.metadata
-
-    try:
-        return importlib.metadata.version("codex-autorunner")
-    except (ValueError, OSError, TypeError, RuntimeError):
-        return "unknown"
-
-
 def normalize_base_path(base_path: Optional[str]) -> str:
     return _normalize_base_path_impl(base_path)
 
@@ -94,6 +78,8 @@ def enforce_bind_auth(
     if resolve_auth_token(token_env):
         return
     if hub_root is not None:
+        from ...web.services.browser_auth import ensure_bootstrap_token
+
         ensure_bootstrap_token(hub_root)
         return
     raise_exit(
@@ -529,6 +515,8 @@ def apply_agent_override(content: str, agent: str) -> str:
     fm_yaml, body = split_markdown_frontmatter(content)
     if fm_yaml is None:
         raise_exit("Template is missing YAML frontmatter; cannot set agent.")
+    import yaml
+
     try:
         data = yaml.safe_load(fm_yaml)
     except yaml.YAMLError as exc:
@@ -541,6 +529,8 @@ def apply_agent_override(content: str, agent: str) -> str:
 
 
 def resolve_hub_repo_root(config: HubConfig, repo_id: str) -> Path:
+    from ....manifest import load_manifest
+
     manifest = load_manifest(config.manifest_path, config.root)
     entry = manifest.get(repo_id)
     if entry is None:
@@ -578,6 +568,10 @@ def parse_renumber(value: Optional[str]) -> Optional[dict[str, int]]:
 
 
 def ticket_lint_details(ticket_dir: Path) -> dict[str, list[str]]:
+    from ....tickets.files import list_ticket_paths, read_ticket, safe_relpath
+    from ....tickets.ingest_state import INGEST_STATE_FILENAME
+    from ....tickets.lint import lint_ticket_directory, parse_ticket_index
+
     details: dict[str, list[str]] = {
         "invalid_filenames": [],
         "duplicate_indices": [],
@@ -626,6 +620,8 @@ def validate_tickets(ticket_dir: Path) -> list[str]:
 
 
 def render_ticket_markdown(frontmatter: dict, body: str) -> str:
+    from ....tickets.frontmatter import render_markdown_frontmatter
+
     return render_markdown_frontmatter(frontmatter, body)
 
 
@@ -644,6 +640,8 @@ def guard_unregistered_hub_repo(repo_root: Path, hub: Optional[Path]) -> None:
     if not (under_repos or under_worktrees):
         return
 
+    from ....manifest import load_manifest
+
     manifest = load_manifest(hub_config.manifest_path, hub_config.root)
     if manifest.get_by_path(hub_config.root, repo_root) is not None:
         return
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+
+def get_car_version() -> str:
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("codex-autorunner")
+    except (ValueError, OSError, TypeError, RuntimeError):
+        return "unknown"
+
+
+__all__ = ["get_car_version"]
@@ -11,9 +11,14 @@ from typing import Dict, Optional
 
 from ptyprocess import PtyProcess
 
+from .terminal_screen import TerminalScreen
+
 logger = logging.getLogger("codex_autorunner.web.pty_session")
 
 REPLAY_END = object()
+# Queued for a subscriber that fell behind while the screen model is enabled;
+# the consumer answers it with ``take_resync`` instead of the dropped output.
+SCREEN_RESYNC = object()
 
 ALT_SCREEN_ENTER_SEQS = (
     b"\x1b[?1049h",
@@ -128,10 +133,21 @@ class PTYSession:
 
 class ActiveSession:
     def __init__(
-        self, session_id: str, pty: PTYSession, loop: asyncio.AbstractEventLoop
+        self,
+        session_id: str,
+        pty: PTYSession,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        screen_model: bool = False,
     ):
         self.id = session_id
         self.pty = pty
+        # With the screen model enabled, reconnects get a rendered snapshot of
+        # the current screen instead of a replay of the raw byte buffer.
+        self.screen: Optional[TerminalScreen] = (
+            TerminalScreen() if screen_model else None
+        )
+        self._resyncing: set[asyncio.Queue[object]] = set()
         # Keep a bounded scrollback buffer for reconnects.
         # This is sized in bytes (not chunks) so behavior is predictable.
         self._buffer_max_bytes = 512 * 1024  # 512KB
@@ -246,21 +262,33 @@ class ActiveSession:
             except BlockingIOError:
                 return
             if data:
-                self._update_alt_screen_state(data)
                 now = time.time()
                 self.pty.last_active = now
                 self.last_output_at = now
                 self._output_since_idle = True
                 self._idle_notified_at = None
-                self.buffer.append(data)
-                self._buffer_bytes += len(data)
-                while self._buffer_bytes > self._buffer_max_bytes and self.buffer:
-                    dropped = self.buffer.popleft()
-                    self._buffer_bytes -= len(dropped)
+                if self.screen is not None:
+                    self.screen.feed(data)
+                    self._alt_screen_active = self.screen.alt_screen_active
+                else:
+                    self._update_alt_screen_state(data)
+                    self.buffer.append(data)
+                    self._buffer_bytes += len(data)
+                    while self._buffer_bytes > self._buffer_max_bytes and self.buffer:
+                        dropped = self.buffer.popleft()
+                        self._buffer_bytes -= len(dropped)
                 for queue in list(self.subscribers):
+                    if queue in self._resyncing:
+                        continue
                     try:
                         queue.put_nowait(data)
                     except asyncio.QueueFull:
+                        if self.screen is not None:
+                            # Coalesce the backlog into one snapshot rather
+                            # than disconnecting the slow subscriber.
+                            self._resyncing.add(queue)
+                            self._enqueue_replay_chunk(queue, SCREEN_RESYNC)
+                            continue
                         logger.debug(
                             "Subscriber queue full, dropping data for session %s",
                             self.id,
@@ -282,6 +310,8 @@ class ActiveSession:
             self.subscribers.discard(stale)
             self._enqueue_close_sentinel(stale)
         q: asyncio.Queue[object] = asyncio.Queue(maxsize=PTY_SUBSCRIBER_QUEUE_MAX)
+        if self.screen is not None:
+            self._enqueue_replay_chunk(q, self.screen.snapshot())
         for chunk in self.buffer:
             self._enqueue_replay_chunk(q, chunk)
         if include_replay_end:
@@ -290,6 +320,22 @@ class ActiveSession:
         self._subscriber_order.append(q)
         return q
 
+    def take_resync(self, queue: asyncio.Queue[object]) -> bytes:
+        """Resume live output for ``queue`` after ``SCREEN_RESYNC``.
+
+        Returns a snapshot of the current screen for the subscriber to write
+        in place of the output it missed.
+        """
+        self._resyncing.discard(queue)
+        if self.screen is None:
+            return b""
+        return self.screen.snapshot()
+
+    def resize(self, cols: int, rows: int) -> None:
+        self.pty.resize(cols, rows)
+        if self.screen is not None:
+            self.screen.resize(cols, rows)
+
     def _enqueue_replay_chunk(
         self, queue: asyncio.Queue[object], chunk: object
     ) -> None:
@@ -315,6 +361,9 @@ class ActiveSession:
                     return
 
     def refresh_alt_screen_state(self) -> None:
+        if self.screen is not None:
+            self._alt_screen_active = self.screen.alt_screen_active
+            return
         state = self._alt_screen_active
         tail = b""
         for chunk in self.buffer:
@@ -357,6 +406,7 @@ class ActiveSession:
 
     def remove_subscriber(self, q: asyncio.Queue[object]):
         self.subscribers.discard(q)
+        self._resyncing.discard(q)
         try:
             self._subscriber_order.remove(q)
         except ValueError:
@@ -381,6 +431,7 @@ class ActiveSession:
             self._enqueue_close_sentinel(queue)
         self.subscribers.clear()
         self._subscriber_order.clear()
+        self._resyncing.clear()
 
     def mark_input_activity(self) -> None:
         now = time.time()
@@ -24,7 +24,7 @@ from ....core.state import (
     persist_session_registry,
 )
 from ....core.state_roots import resolve_repo_flows_db_path, resolve_repo_state_root
-from ..pty_session import REPLAY_END, ActiveSession, PTYSession
+from ..pty_session import REPLAY_END, SCREEN_RESYNC, ActiveSession, PTYSession
 from ..schemas import VersionResponse
 from ..services import terminal as terminal_service
 from .shared import (
@@ -296,7 +296,12 @@ def build_base_routes() -> APIRouter:
                 try:
                     pty = PTYSession(cmd, cwd=str(engine.repo_root), env=session_env)
                     active_session = ActiveSession(
-                        session_id, pty, asyncio.get_running_loop()
+                        session_id,
+                        pty,
+                        asyncio.get_running_loop(),
+                        screen_model=bool(
+                            getattr(engine.config, "terminal_screen_model", False)
+                        ),
                     )
                     session_agent = agent if not profile else f"{agent}@{profile}"
                     terminal_sessions[session_id] = active_session
@@ -364,7 +369,12 @@ def build_base_routes() -> APIRouter:
         if attach_only and active_session:
             active_session.refresh_alt_screen_state()
         await ws.send_text(json.dumps({"type": "hello", "session_id": session_id}))
-        if attach_only and active_session and active_session.alt_screen_active:
+        if (
+            attach_only
+            and active_session
+            and active_session.alt_screen_active
+            and active_session.screen is None
+        ):
             await ws.send_bytes(ALT_SCREEN_ENTER)
         if terminal_debug and active_session:
             buffer_bytes, buffer_chunks = active_session.get_buffer_stats()
@@ -391,6 +401,9 @@ def build_base_routes() -> APIRouter:
                     if data is REPLAY_END:
                         await ws.send_text(json.dumps({"type": "replay_end"}))
                         continue
+                    if data is SCREEN_RESYNC:
+                        await ws.send_bytes(active_session.take_resync(queue))
+                        continue
                     if data is None:
                         if active_session:
                             exit_code = active_session.pty.exit_code()
@@ -468,7 +481,7 @@ def build_base_routes() -> APIRouter:
                         cols = int(payload.get("cols", 0))
                         rows = int(payload.get("rows", 0))
                         if cols > 0 and rows > 0:
-                            active_session.pty.resize(cols, rows)
+                            active_session.resize(cols, rows)
                     elif payload.get("type") == "input":
                         input_id = payload.get("id")
                         data = payload.get("data")
@@ -0,0 +1,539 @@
+"""In-process fan-out of managed-thread tail deltas to SSE subscribers.
+
+Every browser tab and chat watcher attached to the same managed thread used to
+run its own poll loop, rebuilding the tail snapshot from SQLite once per second.
+``ManagedThreadTailBroker`` keeps one channel per thread and stream shape: a
+single producer task polls, each refreshed snapshot is published once as a
+``ManagedThreadTailDelta``, and subscribers read deltas from bounded queues.
+
+Recent deltas are kept in a ring buffer so a subscriber that overflowed its
+queue, or a client reconnecting with ``Last-Event-ID``, can catch up without
+another snapshot build. When the ring no longer covers a subscriber's cursor
+it is told to resync from the database instead.
+
+A channel can also be given a wake source (for example a notification bus
+subscription) that pokes the producer as soon as its thread changes; the poll
+interval then only covers changes nobody rings for.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAIL_BROKER_RING_SIZE = 256
+DEFAULT_TAIL_BROKER_QUEUE_SIZE = 32
+DEFAULT_TAIL_BROKER_IDLE_CHANNELS = 64
+
+
+@dataclass(frozen=True)
+class TailCursor:
+    """Position in a managed thread's tail; event ids restart with each turn."""
+
+    managed_turn_id: Optional[str] = None
+    event_id: int = 0
+
+    def includes(self, managed_turn_id: Optional[str], event_id: int) -> bool:
+        """Whether an event at this position was already seen by the cursor."""
+
+        if managed_turn_id != self.managed_turn_id:
+            return False
+        return event_id <= self.event_id
+
+
+@dataclass
+class ManagedThreadTailDelta:
+    """One producer refresh, shared by every subscriber of a channel.
+
+    ``snapshot`` is treated as immutable once published. Derived values that
+    are expensive to render (SSE frames, transcript snapshots) are computed on
+    first use through ``memo``/``shared`` and reused by later subscribers.
+    """
+
+    seq: int
+    after: TailCursor
+    cursor: TailCursor
+    snapshot: Mapping[str, Any]
+    extras: Mapping[str, Any] = field(default_factory=dict)
+    _memo: dict[Hashable, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def events(self) -> list[dict[str, Any]]:
+        raw = self.snapshot.get("events")
+        if not isinstance(raw, list):
+            return []
+        return [event for event in raw if isinstance(event, dict)]
+
+    def events_after(self, cursor: TailCursor) -> list[dict[str, Any]]:
+        """Return this delta's events the subscriber at ``cursor`` has not seen."""
+
+        return [
+            event
+            for event in self.events
+            if not cursor.includes(
+                self.cursor.managed_turn_id, int(event.get("event_id") or 0)
+            )
+            or int(event.get("event_id") or 0) <= 0
+        ]
+
+    def memo(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        if key not in self._memo:
+            self._memo[key] = factory()
+        return self._memo[key]
+
+    async def shared(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``factory`` once per delta, sharing the result between readers."""
+
+        task = self._memo.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._memo[key] = task
+        return await asyncio.shield(task)
+
+
+@dataclass(frozen=True)
+class TailResync:
+    """Returned instead of a delta when the ring no longer covers a subscriber."""
+
+    cursor: TailCursor
+
+
+TailProducer = Callable[[TailCursor], Awaitable[tuple[dict[str, Any], dict[str, Any]]]]
+# Called with a thread-safe ``poke`` callback; returns an unsubscribe callback.
+TailWakeSource = Callable[[Callable[[], None]], Callable[[], None]]
+
+
+def _snapshot_cursor(snapshot: Mapping[str, Any], fallback: TailCursor) -> TailCursor:
+    managed_turn_id = snapshot.get("managed_turn_id")
+    normalized_turn_id = (
+        str(managed_turn_id).strip() or None if managed_turn_id is not None else None
+    )
+    event_id = int(snapshot.get("last_event_id") or 0)
+    if normalized_turn_id == fallback.managed_turn_id:
+        event_id = max(event_id, fallback.event_id)
+    return TailCursor(managed_turn_id=normalized_turn_id, event_id=event_id)
+
+
+class TailSubscription:
+    """A subscriber's view of a channel: a bounded queue plus ring catch-up."""
+
+    def __init__(
+        self,
+        channel: "TailChannel",
+        *,
+        cursor: TailCursor,
+        last_seq: int,
+        queue_size: int,
+    ) -> None:
+        self._channel = channel
+        self.cursor = cursor
+        self.last_seq = last_seq
+        self._queue: asyncio.Queue[ManagedThreadTailDelta] = asyncio.Queue(
+            maxsize=max(1, queue_size)
+        )
+        self._backlog: deque[ManagedThreadTailDelta] = deque()
+        self._overflowed = False
+        self._closed = False
+        self.dropped = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _offer(self, delta: ManagedThreadTailDelta) -> None:
+        if self._overflowed:
+            self.dropped += 1
+            return
+        try:
+            self._queue.put_nowait(delta)
+        except asyncio.QueueFull:
+            # Stop queueing; ``next`` catches up from the ring once drained.
+            self._overflowed = True
+            self.dropped += 1
+            self._channel.dropped += 1
+
+    async def next(
+        self, *, timeout: Optional[float] = None
+    ) -> Optional[ManagedThreadTailDelta | TailResync]:
+        """Return the next delta, a ``TailResync``, or ``None`` on timeout/close."""
+
+        while True:
+            if self._backlog or not self._queue.empty():
+                delta = (
+                    self._backlog.popleft()
+                    if self._backlog
+                    else self._queue.get_nowait()
+                )
+                if delta.seq <= self.last_seq:
+                    continue
+                self.last_seq = delta.seq
+                return delta
+            if self._overflowed:
+                self._overflowed = False
+                missed = self._channel.deltas_after_seq(self.last_seq)
+                if missed is None:
+                    self.last_seq = self._channel.seq
+                    return TailResync(cursor=self.cursor)
+                self._backlog.extend(missed)
+                continue
+            if self._closed:
+                return None
+            wakeup = self._channel.wakeup
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+
+    def consume(self, delta: ManagedThreadTailDelta) -> list[dict[str, Any]]:
+        """Return the delta's events this subscriber has not seen and advance."""
+
+        events = delta.events_after(self.cursor)
+        self.cursor = _snapshot_cursor(delta.snapshot, self.cursor)
+        return events
+
+    def catch_up(self) -> Optional[list[dict[str, Any]]]:
+        """Return channel events published past this subscriber's cursor.
+
+        Used right after subscribing, when the subscriber built its initial
+        snapshot while the channel kept producing. ``None`` means the ring does
+        not cover the gap and the subscriber must resync.
+        """
+
+        channel_cursor = self._channel.cursor
+        if channel_cursor == self.cursor or (
+            channel_cursor.managed_turn_id == self.cursor.managed_turn_id
+            and channel_cursor.event_id <= self.cursor.event_id
+        ):
+            return []
+        if self._channel.latest_snapshot is None:
+            return []
+        events = self._channel.replay_after(self.cursor)
+        if events is not None:
+            self.cursor = channel_cursor
+        return events
+
+    def resynced(self, snapshot: Mapping[str, Any]) -> None:
+        """Record that the subscriber rebuilt its position from ``snapshot``."""
+
+        self.cursor = _snapshot_cursor(snapshot, self.cursor)
+
+    def close(self) -> None:
+        self._channel.unsubscribe(self)
+
+
+class TailChannel:
+    """One producer, its ring buffer, and the subscriptions it feeds."""
+
+    def __init__(
+        self,
+        key: Hashable,
+        *,
+        poll_interval_seconds: float,
+        ring_size: int,
+        on_idle: Optional[Callable[["TailChannel"], None]] = None,
+    ) -> None:
+        self.key = key
+        self._poll_interval_seconds = poll_interval_seconds
+        self._ring: deque[ManagedThreadTailDelta] = deque(maxlen=max(1, ring_size))
+        self._subscribers: set[TailSubscription] = set()
+        self._producer: Optional[TailProducer] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._poked = asyncio.Event()
+        self._unsubscribe_wake: Optional[Callable[[], None]] = None
+        self._on_idle = on_idle
+        self.cursor = TailCursor()
+        self.latest_snapshot: Optional[Mapping[str, Any]] = None
+        self.seq = 0
+        self.wakeup = asyncio.Event()
+        self.produced = 0
+        self.woken = 0
+        self.dropped = 0
+        self.failed = False
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def seed(self, snapshot: Mapping[str, Any]) -> None:
+        """Adopt a subscriber-built snapshot as the producer's starting point."""
+
+        if self.latest_snapshot is not None:
+            return
+        self.latest_snapshot = snapshot
+        self.cursor = _snapshot_cursor(snapshot, self.cursor)
+
+    def subscribe(
+        self,
+        producer: TailProducer,
+        *,
+        cursor: TailCursor,
+        queue_size: int,
+        wake: Optional[TailWakeSource] = None,
+    ) -> TailSubscription:
+        subscription = TailSubscription(
+            self, cursor=cursor, last_seq=self.seq, queue_size=queue_size
+        )
+        self._subscribers.add(subscription)
+        if not self.running:
+            self.failed = False
+            self._producer = producer
+            self._loop = asyncio.get_running_loop()
+            self._poked.clear()
+            self._stop_wake()
+            if wake is not None:
+                self._unsubscribe_wake = wake(self.poke)
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+    def unsubscribe(self, subscription: TailSubscription) -> None:
+        self._subscribers.discard(subscription)
+        subscription._closed = True
+        if self._subscribers:
+            return
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._producer = None
+        self._stop_wake()
+        if self._on_idle is not None:
+            self._on_idle(self)
+
+    def poke(self) -> None:
+        """Run the producer now instead of at the next poll; thread-safe."""
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._poked.set)
+        except RuntimeError:
+            # The loop closed between the check and the call.
+            return
+
+    def _stop_wake(self) -> None:
+        unsubscribe, self._unsubscribe_wake = self._unsubscribe_wake, None
+        if unsubscribe is not None:
+            unsubscribe()
+
+    def deltas_after_seq(self, seq: int) -> Optional[list[ManagedThreadTailDelta]]:
+        """Return ring deltas after ``seq``, or ``None`` if some were evicted."""
+
+        if seq >= self.seq:
+            return []
+        if not self._ring or self._ring[0].seq > seq + 1:
+            return None
+        return [delta for delta in self._ring if delta.seq > seq]
+
+    def replay_after(self, cursor: TailCursor) -> Optional[list[dict[str, Any]]]:
+        """Return buffered events after ``cursor``, or ``None`` if not covered.
+
+        Coverage requires a buffered delta that started at or before the cursor
+        within the same turn, so no event between the cursor and the ring can
+        have been evicted.
+        """
+
+        start_index: Optional[int] = None
+        for index, delta in enumerate(self._ring):
+            if (
+                delta.cursor.managed_turn_id == cursor.managed_turn_id
+                and delta.after.managed_turn_id == cursor.managed_turn_id
+                and delta.after.event_id <= cursor.event_id <= delta.cursor.event_id
+            ):
+                start_index = index
+                break
+        if start_index is None:
+            if (
+                self.latest_snapshot is not None
+                and self.cursor.managed_turn_id == cursor.managed_turn_id
+                and self.cursor.event_id == cursor.event_id
+            ):
+                return []
+            return None
+        events: list[dict[str, Any]] = []
+        position = cursor
+        for delta in list(self._ring)[start_index:]:
+            events.extend(delta.events_after(position))
+            position = delta.cursor
+        return events
+
+    def publish(
+        self, snapshot: dict[str, Any], extras: Optional[dict[str, Any]] = None
+    ) -> ManagedThreadTailDelta:
+        self.seq += 1
+        after = self.cursor
+        self.cursor = _snapshot_cursor(snapshot, after)
+        delta = ManagedThreadTailDelta(
+            seq=self.seq,
+            after=after,
+            cursor=self.cursor,
+            snapshot=snapshot,
+            extras=dict(extras or {}),
+        )
+        self._ring.append(delta)
+        self.latest_snapshot = snapshot
+        self.produced += 1
+        for subscription in list(self._subscribers):
+            subscription._offer(delta)
+        self._notify()
+        return delta
+
+    def _notify(self) -> None:
+        self.wakeup.set()
+        self.wakeup = asyncio.Event()
+
+    async def _run(self) -> None:
+        try:
+            while self._subscribers:
+                try:
+                    await asyncio.wait_for(
+                        self._poked.wait(), timeout=self._poll_interval_seconds
+                    )
+                    self.woken += 1
+                except asyncio.TimeoutError:
+                    pass
+                self._poked.clear()
+                producer = self._producer
+                if producer is None or not self._subscribers:
+                    return
+                snapshot, extras = await producer(self.cursor)
+                self.publish(snapshot, extras)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failed = True
+            logger.exception("Managed thread tail producer failed (key=%s)", self.key)
+            for subscription in list(self._subscribers):
+                subscription._closed = True
+            self._notify()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "subscribers": len(self._subscribers),
+            "running": self.running,
+            "seq": self.seq,
+            "buffered": len(self._ring),
+            "produced": self.produced,
+            "woken": self.woken,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+class ManagedThreadTailBroker:
+    """Per-process registry of shared managed-thread tail channels."""
+
+    def __init__(
+        self,
+        *,
+        poll_interval_seconds: float,
+        ring_size: int = DEFAULT_TAIL_BROKER_RING_SIZE,
+        queue_size: int = DEFAULT_TAIL_BROKER_QUEUE_SIZE,
+        max_idle_channels: int = DEFAULT_TAIL_BROKER_IDLE_CHANNELS,
+    ) -> None:
+        self._poll_interval_seconds = poll_interval_seconds
+        self._ring_size = ring_size
+        self._queue_size = queue_size
+        self._max_idle_channels = max(0, max_idle_channels)
+        self._channels: dict[Hashable, TailChannel] = {}
+        # Idle channels keep their ring so reconnecting clients can replay.
+        self._idle: OrderedDict[Hashable, None] = OrderedDict()
+
+    def owns(self, channel: TailChannel) -> bool:
+        return self._channels.get(channel.key) is channel
+
+    def channel(self, key: Hashable) -> TailChannel:
+        channel = self._channels.get(key)
+        if channel is None:
+            channel = TailChannel(
+                key,
+                poll_interval_seconds=self._poll_interval_seconds,
+                ring_size=self._ring_size,
+                on_idle=self._channel_idle,
+            )
+            self._channels[key] = channel
+        self._idle.pop(key, None)
+        return channel
+
+    def subscribe(
+        self,
+        channel: TailChannel,
+        producer: TailProducer,
+        *,
+        cursor: TailCursor,
+        wake: Optional[TailWakeSource] = None,
+    ) -> TailSubscription:
+        self._idle.pop(channel.key, None)
+        return channel.subscribe(
+            producer, cursor=cursor, queue_size=self._queue_size, wake=wake
+        )
+
+    def _channel_idle(self, channel: TailChannel) -> None:
+        if self._channels.get(channel.key) is not channel:
+            return
+        self._idle[channel.key] = None
+        self._idle.move_to_end(channel.key)
+        while len(self._idle) > self._max_idle_channels:
+            evicted, _ = self._idle.popitem(last=False)
+            self._channels.pop(evicted, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "channels": len(self._channels),
+            "idle_channels": len(self._idle),
+            "subscribers": sum(
+                channel.subscriber_count for channel in self._channels.values()
+            ),
+            "dropped": sum(channel.dropped for channel in self._channels.values()),
+        }
+
+
+def private_tail_channel(key: Hashable, *, poll_interval_seconds: float) -> TailChannel:
+    """Return an unshared channel: the per-connection poller fallback."""
+
+    return TailChannel(
+        key,
+        poll_interval_seconds=poll_interval_seconds,
+        ring_size=DEFAULT_TAIL_BROKER_RING_SIZE,
+    )
+
+
+def get_managed_thread_tail_broker(
+    app: Any, *, poll_interval_seconds: float
+) -> Optional[ManagedThreadTailBroker]:
+    """Return the app's tail broker, creating it on first use.
+
+    Returns ``None`` when ``app`` has no state to hold one, in which case the
+    caller polls on its own.
+    """
+
+    state = getattr(app, "state", None)
+    if state is None:
+        return None
+    broker = getattr(state, "managed_thread_tail_broker", None)
+    if not isinstance(broker, ManagedThreadTailBroker):
+        broker = ManagedThreadTailBroker(poll_interval_seconds=poll_interval_seconds)
+        state.managed_thread_tail_broker = broker
+    return broker
+
+
+__all__ = [
+    "ManagedThreadTailBroker",
+    "ManagedThreadTailDelta",
+    "TailChannel",
+    "TailCursor",
+    "TailResync",
+    "TailSubscription",
+    "TailWakeSource",
+    "get_managed_thread_tail_broker",
+    "private_tail_channel",
+]
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
@@ -18,13 +19,16 @@ from .....core.orchestration.managed_thread_timeline import (
 from .....core.orchestration.managed_thread_transcript import (
     build_managed_thread_transcript,
 )
+from .....core.orchestration.notification_bus import subscribe, thread_topic
 from .....core.orchestration.progress_projection import ProgressProjectionState
 from .....core.orchestration.runtime_thread_events import (
     RuntimeThreadRunEventState,
 )
+from .....core.orchestration.turn_event_buffer import is_turn_event_gap
 from .....core.orchestration.turn_timeline import list_turn_timeline
 from ...services.pma import get_pma_request_context
 from ...services.pma.common import normalize_optional_text
+from ...services.pma.managed_thread_runtime import _managed_thread_request_for_app
 from ...services.web_artifact_delivery import drain_web_artifact_deliveries_for_thread
 from ..shared import SSE_HEADERS
 from .managed_thread_tail_serializers import (
@@ -46,6 +50,18 @@ from .managed_threads import (
     _serialize_thread_target,
     build_managed_thread_orchestration_service,
 )
+from .tail_broker import (
+    DEFAULT_TAIL_BROKER_QUEUE_SIZE,
+    ManagedThreadTailDelta,
+    TailChannel,
+    TailCursor,
+    TailProducer,
+    TailResync,
+    TailSubscription,
+    TailWakeSource,
+    get_managed_thread_tail_broker,
+    private_tail_channel,
+)
 
 _PERSISTED_TAIL_POLL_SECONDS = 1.0
 _PERSISTED_TAIL_HEARTBEAT_SECONDS = 15.0
@@ -400,6 +416,7 @@ async def _build_managed_thread_tail_snapshot(
     if tail_events:
         persisted_max_event_id = max(int(e.get("event_id") or 0) for e in tail_events)
 
+    events_gap: Optional[dict[str, Any]] = None
     runtime_overlay_eligible = bool(
         include_runtime_overlay
         and has_backend_binding
@@ -436,6 +453,14 @@ async def _build_managed_thread_tail_snapshot(
             event_id_start = persisted_max_event_id
             overlay_floor = persisted_max_event_id
             for raw_event in raw_events:
+                if is_turn_event_gap(raw_event):
+                    # The harness evicted progress events past our cursor; tell
+                    # the client rather than silently skipping ahead.
+                    events_gap = {
+                        "after_id": raw_event.get("after_id"),
+                        "evicted_count": raw_event.get("evicted_count"),
+                    }
+                    continue
                 if isinstance(raw_event, dict):
                     activity_at = _event_received_at_iso(raw_event)
                     if activity_at is None:
@@ -543,6 +568,7 @@ async def _build_managed_thread_tail_snapshot(
         "activity": activity,
         "lifecycle_events": lifecycle_events,
         "events": tail_events,
+        "events_gap": events_gap,
         "last_event_id": last_event_id,
         "last_event_at": tail_events[-1].get("received_at") if tail_events else None,
         "last_activity_at": last_activity_at,
@@ -814,6 +840,199 @@ async def _build_managed_thread_transcript_snapshot(
     )
 
 
+def _tail_producer_request(request: Request) -> Any:
+    # Shared producers outlive the connection that started them, so they hold
+    # only the app, never that subscriber's request.
+    return _managed_thread_request_for_app(getattr(request, "app", None))
+
+
+def _thread_tail_wake(request: Request, managed_thread_id: str) -> TailWakeSource:
+    """Wake a tail producer when the thread's ``thread:<id>`` topic rings."""
+
+    hub_root = get_pma_request_context(request).hub_root
+
+    def _wake(poke: Callable[[], None]) -> Callable[[], None]:
+        return subscribe(
+            hub_root, thread_topic(managed_thread_id), lambda _topic: poke()
+        )
+
+    return _wake
+
+
+def _tail_channel_producer(
+    request: Request,
+    *,
+    managed_thread_id: str,
+    limit: int,
+    level: str,
+    since_ms: Optional[int],
+) -> TailProducer:
+    producer_request = _tail_producer_request(request)
+    service: Any = None
+
+    async def _produce(cursor: TailCursor) -> tuple[dict[str, Any], dict[str, Any]]:
+        nonlocal service
+        if service is None:
+            service = await _build_managed_thread_orchestration_service_async(
+                producer_request
+            )
+        # The harness is resolved from the thread row on every refresh.
+        refreshed = await _build_managed_thread_tail_snapshot(
+            request=producer_request,
+            service=service,
+            managed_thread_id=managed_thread_id,
+            limit=limit,
+            level=level,
+            since_ms=since_ms,
+            resume_after=cursor.event_id,
+            resume_after_managed_turn_id=cursor.managed_turn_id,
+            include_runtime_overlay=True,
+        )
+        _apply_sse_lifetime_to_snapshot(refreshed)
+        return refreshed, {}
+
+    return _produce
+
+
+def _transcript_channel_producer(
+    request: Request,
+    *,
+    managed_thread_id: str,
+    limit: int,
+    level: str,
+    runtime_projection_state: ProgressProjectionState,
+) -> TailProducer:
+    producer_request = _tail_producer_request(request)
+    service: Any = None
+    thread_target: Any = None
+
+    async def _produce(cursor: TailCursor) -> tuple[dict[str, Any], dict[str, Any]]:
+        nonlocal service, thread_target
+        if service is None:
+            service = await _build_managed_thread_orchestration_service_async(
+                producer_request
+            )
+        if thread_target is None:
+            thread_target = await asyncio.to_thread(
+                service.get_thread_target, managed_thread_id
+            )
+        extras: dict[str, Any] = {}
+        artifact_delivery_changed = False
+        try:
+            artifact_delivery_changed = await drain_web_artifact_deliveries_for_thread(
+                thread=thread_target,
+                managed_thread_id=managed_thread_id,
+                logger=logging.getLogger("codex_autorunner.web_artifact_delivery"),
+            )
+        except Exception:
+            logging.getLogger(__name__).exception(
+                "Failed to drain web artifact deliveries during transcript "
+                "stream (managed_thread_id=%s)",
+                managed_thread_id,
+            )
+        if artifact_delivery_changed:
+            # Drained deliveries are gone for every other subscriber, so the
+            # refreshed transcript travels with the shared delta.
+            extras["artifact_snapshot"] = (
+                await _build_managed_thread_transcript_snapshot(
+                    request=producer_request,
+                    service=service,
+                    managed_thread_id=managed_thread_id,
+                    limit=limit,
+                    level=level,
+                    runtime_projection_state=runtime_projection_state,
+                )
+            )
+        refreshed = await _build_managed_thread_tail_snapshot(
+            request=producer_request,
+            service=service,
+            managed_thread_id=managed_thread_id,
+            limit=limit,
+            level=level,
+            since_ms=None,
+            resume_after=cursor.event_id,
+            resume_after_managed_turn_id=cursor.managed_turn_id,
+            include_runtime_overlay=True,
+            runtime_projection_state=runtime_projection_state,
+        )
+        _apply_sse_lifetime_to_snapshot(refreshed)
+        return refreshed, extras
+
+    return _produce
+
+
+def _tail_stream_channel(
+    request: Request, key: tuple[Any, ...], *, shared: bool = True
+) -> TailChannel:
+    broker = (
+        get_managed_thread_tail_broker(
+            getattr(request, "app", None),
+            poll_interval_seconds=_PERSISTED_TAIL_POLL_SECONDS,
+        )
+        if shared
+        else None
+    )
+    if broker is None:
+        return private_tail_channel(
+            key, poll_interval_seconds=_PERSISTED_TAIL_POLL_SECONDS
+        )
+    return broker.channel(key)
+
+
+def _subscribe_tail_channel(
+    request: Request,
+    channel: TailChannel,
+    producer: TailProducer,
+    *,
+    cursor: TailCursor,
+    wake: Optional[TailWakeSource] = None,
+) -> TailSubscription:
+    broker = get_managed_thread_tail_broker(
+        getattr(request, "app", None),
+        poll_interval_seconds=_PERSISTED_TAIL_POLL_SECONDS,
+    )
+    if broker is not None and broker.owns(channel):
+        return broker.subscribe(channel, producer, cursor=cursor, wake=wake)
+    return channel.subscribe(
+        producer,
+        cursor=cursor,
+        queue_size=DEFAULT_TAIL_BROKER_QUEUE_SIZE,
+        wake=wake,
+    )
+
+
+def _progress_sse_frame(snapshot: dict[str, Any]) -> str:
+    return (
+        "event: progress\ndata: "
+        f"{json.dumps(_progress_stream_payload(snapshot), ensure_ascii=True)}\n\n"
+    )
+
+
+def _transcript_patch_payload(snapshot: dict[str, Any]) -> str:
+    return json.dumps({"status": _progress_stream_payload(snapshot)}, ensure_ascii=True)
+
+
+def _delta_tail_event_frames(
+    managed_thread_id: str,
+    delta: ManagedThreadTailDelta,
+    events: list[dict[str, Any]],
+) -> list[str]:
+    """Render ``events`` from a shared delta, serializing each event once."""
+
+    rendered: dict[int, list[str]] = delta.memo(
+        "tail_event_frames",
+        lambda: {
+            id(event): _tail_event_sse_frames(
+                managed_thread_id=managed_thread_id,
+                managed_turn_id=delta.snapshot.get("managed_turn_id"),
+                events=[event],
+            )
+            for event in delta.events
+        },
+    )
+    return [frame for event in events for frame in rendered.get(id(event), [])]
+
+
 def build_managed_thread_tail_routes(
     router: APIRouter,
     get_runtime_state,
@@ -928,6 +1147,7 @@ def build_managed_thread_tail_routes(
         if limit <= 0:
             raise HTTPException(status_code=400, detail="limit must be greater than 0")
         normalized_level = normalize_tail_level(level)
+        bounded_limit = min(limit, _TRANSCRIPT_STREAM_LIMIT)
         service = await _build_managed_thread_orchestration_service_async(request)
         thread_target = await asyncio.to_thread(
             service.get_thread_target,
@@ -952,11 +1172,29 @@ def build_managed_thread_tail_routes(
             service=service,
             managed_thread_id=managed_thread_id,
             harness=harness,
-            limit=min(limit, _TRANSCRIPT_STREAM_LIMIT),
+            limit=bounded_limit,
             level=normalized_level,
             runtime_projection_state=runtime_projection_state,
         )
 
+        _produce = _transcript_channel_producer(
+            request,
+            managed_thread_id=managed_thread_id,
+            limit=bounded_limit,
+            level=normalized_level,
+            runtime_projection_state=runtime_projection_state,
+        )
+
+        async def _terminal_transcript_snapshot() -> dict[str, Any]:
+            return await _build_managed_thread_transcript_snapshot(
+                request=request,
+                service=service,
+                managed_thread_id=managed_thread_id,
+                harness=harness,
+                limit=bounded_limit,
+                level=normalized_level,
+            )
+
         async def _stream() -> Any:
             raw_initial_progress = initial.get("status")
             initial_progress: dict[str, Any] = (
@@ -993,107 +1231,112 @@ def build_managed_thread_tail_routes(
             if sse_close:
                 return
 
+            channel = _tail_stream_channel(
+                request,
+                ("transcript", managed_thread_id, bounded_limit, normalized_level),
+            )
+            channel.seed(
+                {
+                    "managed_turn_id": last_managed_turn_id,
+                    "last_event_id": last_event_id,
+                }
+            )
+            subscription = _subscribe_tail_channel(
+                request,
+                channel,
+                _produce,
+                cursor=TailCursor(last_managed_turn_id, last_event_id),
+                wake=_thread_tail_wake(request, managed_thread_id),
+            )
             last_heartbeat_at = asyncio.get_running_loop().time()
             terminal_transcript_snapshots_sent: set[str] = set()
-            while True:
-                await asyncio.sleep(_PERSISTED_TAIL_POLL_SECONDS)
-                if await request.is_disconnected():
-                    return
-                artifact_delivery_changed = False
-                try:
-                    artifact_delivery_changed = (
-                        await drain_web_artifact_deliveries_for_thread(
-                            thread=thread_target,
-                            managed_thread_id=managed_thread_id,
-                            logger=logging.getLogger(
-                                "codex_autorunner.web_artifact_delivery"
-                            ),
-                        )
-                    )
-                except Exception:
-                    logging.getLogger(__name__).exception(
-                        "Failed to drain web artifact deliveries during transcript "
-                        "stream (managed_thread_id=%s)",
-                        managed_thread_id,
-                    )
-                if artifact_delivery_changed:
-                    artifact_snapshot = await _build_managed_thread_transcript_snapshot(
-                        request=request,
-                        service=service,
-                        managed_thread_id=managed_thread_id,
-                        harness=harness,
-                        limit=min(limit, _TRANSCRIPT_STREAM_LIMIT),
-                        level=normalized_level,
-                        runtime_projection_state=runtime_projection_state,
+            try:
+                while True:
+                    item = await subscription.next(
+                        timeout=_PERSISTED_TAIL_HEARTBEAT_SECONDS
                     )
-                    artifact_id_line = (
+                    if await request.is_disconnected():
+                        return
+                    if item is None:
+                        if subscription.closed:
+                            return
+                        yield ": keep-alive\n\n"
+                        last_heartbeat_at = asyncio.get_running_loop().time()
+                        continue
+                    if isinstance(item, TailResync):
+                        refreshed, _extras = await _produce(item.cursor)
+                        subscription.resynced(refreshed)
+                        delta: Optional[ManagedThreadTailDelta] = None
+                    else:
+                        delta = item
+                        subscription.consume(delta)
+                        refreshed = dict(delta.snapshot)
+                        artifact_snapshot = delta.extras.get("artifact_snapshot")
+                        if artifact_snapshot is not None:
+                            artifact_id_line = (
+                                f"id: {subscription.cursor.event_id}\n"
+                                if subscription.cursor.event_id > 0
+                                else ""
+                            )
+                            yield (
+                                "event: transcript.snapshot\n"
+                                f"{artifact_id_line}"
+                                "data: "
+                                f"{json.dumps(artifact_snapshot, ensure_ascii=True)}\n\n"
+                            )
+                    last_event_id = subscription.cursor.event_id
+                    terminal_turn_id = _successful_terminal_turn_id(refreshed)
+                    if (
+                        terminal_turn_id
+                        and terminal_turn_id not in terminal_transcript_snapshots_sent
+                    ):
+                        terminal_snapshot = (
+                            await delta.shared(
+                                ("terminal_transcript", terminal_turn_id),
+                                _terminal_transcript_snapshot,
+                            )
+                            if delta is not None
+                            else await _terminal_transcript_snapshot()
+                        )
+                        if _transcript_has_completed_turn_row(
+                            terminal_snapshot,
+                            terminal_turn_id,
+                        ):
+                            terminal_id_line = (
+                                f"id: {last_event_id}\n" if last_event_id > 0 else ""
+                            )
+                            yield (
+                                "event: transcript.snapshot\n"
+                                f"{terminal_id_line}"
+                                "data: "
+                                f"{json.dumps(terminal_snapshot, ensure_ascii=True)}\n\n"
+                            )
+                            terminal_transcript_snapshots_sent.add(terminal_turn_id)
+                    patch_id_line = (
                         f"id: {last_event_id}\n" if last_event_id > 0 else ""
                     )
-                    yield (
-                        "event: transcript.snapshot\n"
-                        f"{artifact_id_line}"
-                        "data: "
-                        f"{json.dumps(artifact_snapshot, ensure_ascii=True)}\n\n"
+                    patch_payload = (
+                        delta.memo(
+                            "transcript_patch_payload",
+                            functools.partial(_transcript_patch_payload, refreshed),
+                        )
+                        if delta is not None
+                        else _transcript_patch_payload(refreshed)
                     )
-                refreshed = await _build_managed_thread_tail_snapshot(
-                    request=request,
-                    service=service,
-                    managed_thread_id=managed_thread_id,
-                    harness=harness,
-                    limit=min(limit, _TRANSCRIPT_STREAM_LIMIT),
-                    level=normalized_level,
-                    since_ms=None,
-                    resume_after=last_event_id,
-                    resume_after_managed_turn_id=last_managed_turn_id,
-                    include_runtime_overlay=True,
-                    runtime_projection_state=runtime_projection_state,
-                )
-                _apply_sse_lifetime_to_snapshot(refreshed)
-                last_event_id = int(refreshed.get("last_event_id") or last_event_id)
-                last_managed_turn_id = normalize_optional_text(
-                    refreshed.get("managed_turn_id")
-                )
-                terminal_turn_id = _successful_terminal_turn_id(refreshed)
-                if (
-                    terminal_turn_id
-                    and terminal_turn_id not in terminal_transcript_snapshots_sent
-                ):
-                    terminal_snapshot = await _build_managed_thread_transcript_snapshot(
-                        request=request,
-                        service=service,
-                        managed_thread_id=managed_thread_id,
-                        harness=harness,
-                        limit=min(limit, _TRANSCRIPT_STREAM_LIMIT),
-                        level=normalized_level,
+                    yield (
+                        "event: transcript.patch\n"
+                        f"{patch_id_line}"
+                        f"data: {patch_payload}\n\n"
                     )
-                    if _transcript_has_completed_turn_row(
-                        terminal_snapshot,
-                        terminal_turn_id,
-                    ):
-                        terminal_id_line = (
-                            f"id: {last_event_id}\n" if last_event_id > 0 else ""
-                        )
-                        yield (
-                            "event: transcript.snapshot\n"
-                            f"{terminal_id_line}"
-                            "data: "
-                            f"{json.dumps(terminal_snapshot, ensure_ascii=True)}\n\n"
-                        )
-                        terminal_transcript_snapshots_sent.add(terminal_turn_id)
-                patch_id_line = f"id: {last_event_id}\n" if last_event_id > 0 else ""
-                yield (
-                    "event: transcript.patch\n"
-                    f"{patch_id_line}"
-                    "data: "
-                    f"{json.dumps({'status': _progress_stream_payload(refreshed)}, ensure_ascii=True)}\n\n"
-                )
-                sse_close, _ = _sse_stream_should_terminate(refreshed)
-                if sse_close:
-                    return
-                now = asyncio.get_running_loop().time()
-                if now - last_heartbeat_at >= _PERSISTED_TAIL_HEARTBEAT_SECONDS:
-                    yield ": keep-alive\n\n"
-                    last_heartbeat_at = now
+                    sse_close, _ = _sse_stream_should_terminate(refreshed)
+                    if sse_close:
+                        return
+                    now = asyncio.get_running_loop().time()
+                    if now - last_heartbeat_at >= _PERSISTED_TAIL_HEARTBEAT_SECONDS:
+                        yield ": keep-alive\n\n"
+                        last_heartbeat_at = now
+            finally:
+                subscription.close()
 
         return StreamingResponse(
             _stream(),
@@ -1116,6 +1359,7 @@ def build_managed_thread_tail_routes(
         if limit <= 0:
             raise HTTPException(status_code=400, detail="limit must be greater than 0")
         normalized_level = normalize_tail_level(level)
+        bounded_limit = min(limit, 200)
         since_ms = since_ms_from_duration(since)
         service = await _build_managed_thread_orchestration_service_async(request)
         thread_target = await asyncio.to_thread(
@@ -1133,27 +1377,67 @@ def build_managed_thread_tail_routes(
             since_event_id=since_event_id,
             since_managed_turn_id=since_managed_turn_id,
         )
-        snapshot = await _build_managed_thread_tail_snapshot(
-            request=request,
-            service=service,
+        # ``since`` resolves to an absolute timestamp per request, so those
+        # streams cannot share a channel with anyone else.
+        channel = (
+            None
+            if once
+            else _tail_stream_channel(
+                request,
+                ("tail", managed_thread_id, bounded_limit, normalized_level),
+                shared=since_ms is None,
+            )
+        )
+        snapshot: Optional[dict[str, Any]] = None
+        ring_replay_events: Optional[list[dict[str, Any]]] = None
+        if channel is not None and channel.running and channel.latest_snapshot:
+            # A live producer already holds a current snapshot: attach to it
+            # instead of rebuilding one from the database.
+            if not replay_initial_events:
+                snapshot = dict(channel.latest_snapshot)
+            elif not replay and resume_after is not None:
+                ring_replay_events = channel.replay_after(
+                    TailCursor(
+                        normalize_optional_text(since_managed_turn_id)
+                        or channel.cursor.managed_turn_id,
+                        resume_after,
+                    )
+                )
+                if ring_replay_events is not None:
+                    snapshot = dict(channel.latest_snapshot)
+        if snapshot is None:
+            snapshot = await _build_managed_thread_tail_snapshot(
+                request=request,
+                service=service,
+                managed_thread_id=managed_thread_id,
+                harness=harness,
+                limit=bounded_limit,
+                level=normalized_level,
+                since_ms=since_ms,
+                resume_after=resume_after,
+                resume_after_managed_turn_id=since_managed_turn_id,
+                # Live UI needs harness-buffered deltas (OpenCode) while the
+                # durable turn journal may lag; JSON GET /tail already uses the
+                # default True.
+                include_runtime_overlay=True,
+            )
+
+        _produce = _tail_channel_producer(
+            request,
             managed_thread_id=managed_thread_id,
-            harness=harness,
-            limit=min(limit, 200),
+            limit=bounded_limit,
             level=normalized_level,
             since_ms=since_ms,
-            resume_after=resume_after,
-            resume_after_managed_turn_id=since_managed_turn_id,
-            # Live UI needs harness-buffered deltas (OpenCode) while the durable
-            # turn journal may lag; JSON GET /tail already uses the default True.
-            include_runtime_overlay=True,
         )
 
         async def _stream() -> Any:
-            initial_snapshot = (
-                snapshot
-                if replay_initial_events
-                else _tail_snapshot_without_replay(snapshot)
-            )
+            if ring_replay_events is not None:
+                initial_snapshot = _tail_snapshot_without_replay(snapshot)
+                initial_snapshot["events"] = ring_replay_events
+            elif replay_initial_events:
+                initial_snapshot = snapshot
+            else:
+                initial_snapshot = _tail_snapshot_without_replay(snapshot)
             _apply_sse_lifetime_to_snapshot(initial_snapshot)
             yield (
                 "event: state\ndata: "
@@ -1174,51 +1458,83 @@ def build_managed_thread_tail_routes(
                 "event: progress\ndata: "
                 f"{json.dumps(_progress_stream_payload(initial_snapshot), ensure_ascii=True)}\n\n"
             )
-            if once:
+            if once or channel is None:
                 return
             sse_close, _ = _sse_stream_should_terminate(initial_snapshot)
             if sse_close:
                 return
 
+            channel.seed(initial_snapshot)
+            subscription = _subscribe_tail_channel(
+                request,
+                channel,
+                _produce,
+                cursor=TailCursor(last_managed_turn_id, last_event_id),
+                wake=_thread_tail_wake(request, managed_thread_id),
+            )
             last_heartbeat_at = asyncio.get_running_loop().time()
-            while True:
-                await asyncio.sleep(_PERSISTED_TAIL_POLL_SECONDS)
-                if await request.is_disconnected():
-                    return
-                refreshed = await _build_managed_thread_tail_snapshot(
-                    request=request,
-                    service=service,
-                    managed_thread_id=managed_thread_id,
-                    harness=harness,
-                    limit=min(limit, 200),
-                    level=normalized_level,
-                    since_ms=since_ms,
-                    resume_after=last_event_id,
-                    resume_after_managed_turn_id=last_managed_turn_id,
-                    include_runtime_overlay=True,
-                )
-                _apply_sse_lifetime_to_snapshot(refreshed)
-                for frame in _tail_event_sse_frames(
-                    managed_thread_id=managed_thread_id,
-                    managed_turn_id=refreshed.get("managed_turn_id"),
-                    events=refreshed.get("events", []),
-                ):
-                    yield frame
-                last_event_id = int(refreshed.get("last_event_id") or last_event_id)
-                last_managed_turn_id = normalize_optional_text(
-                    refreshed.get("managed_turn_id")
-                )
-                yield (
-                    "event: progress\ndata: "
-                    f"{json.dumps(_progress_stream_payload(refreshed), ensure_ascii=True)}\n\n"
-                )
-                sse_close, _ = _sse_stream_should_terminate(refreshed)
-                if sse_close:
-                    return
-                now = asyncio.get_running_loop().time()
-                if now - last_heartbeat_at >= _PERSISTED_TAIL_HEARTBEAT_SECONDS:
-                    yield ": keep-alive\n\n"
-                    last_heartbeat_at = now
+            try:
+                missed = subscription.catch_up()
+                if missed is None:
+                    missed_item: Optional[TailResync] = TailResync(
+                        cursor=subscription.cursor
+                    )
+                else:
+                    missed_item = None
+                    for frame in _tail_event_sse_frames(
+                        managed_thread_id=managed_thread_id,
+                        managed_turn_id=subscription.cursor.managed_turn_id,
+                        events=missed,
+                    ):
+                        yield frame
+                while True:
+                    if missed_item is not None:
+                        item: Optional[ManagedThreadTailDelta | TailResync] = (
+                            missed_item
+                        )
+                        missed_item = None
+                    else:
+                        item = await subscription.next(
+                            timeout=_PERSISTED_TAIL_HEARTBEAT_SECONDS
+                        )
+                    if await request.is_disconnected():
+                        return
+                    if item is None:
+                        if subscription.closed:
+                            return
+                        yield ": keep-alive\n\n"
+                        last_heartbeat_at = asyncio.get_running_loop().time()
+                        continue
+                    if isinstance(item, TailResync):
+                        refreshed, _extras = await _produce(item.cursor)
+                        subscription.resynced(refreshed)
+                        for frame in _tail_event_sse_frames(
+                            managed_thread_id=managed_thread_id,
+                            managed_turn_id=refreshed.get("managed_turn_id"),
+                            events=refreshed.get("events", []),
+                        ):
+                            yield frame
+                        progress_frame = _progress_sse_frame(refreshed)
+                    else:
+                        for frame in _delta_tail_event_frames(
+                            managed_thread_id, item, subscription.consume(item)
+                        ):
+                            yield frame
+                        refreshed = dict(item.snapshot)
+                        progress_frame = item.memo(
+                            "progress_frame",
+                            functools.partial(_progress_sse_frame, refreshed),
+                        )
+                    yield progress_frame
+                    sse_close, _ = _sse_stream_should_terminate(refreshed)
+                    if sse_close:
+                        return
+                    now = asyncio.get_running_loop().time()
+                    if now - last_heartbeat_at >= _PERSISTED_TAIL_HEARTBEAT_SECONDS:
+                        yield ": keep-alive\n\n"
+                        last_heartbeat_at = now
+            finally:
+                subscription.close()
 
         return StreamingResponse(
             _stream(),
@@ -0,0 +1,781 @@
+"""Server-side VT screen model for terminal reconnects.
+
+Without it, ``ActiveSession`` keeps up to 512KB of raw PTY output and replays
+every byte to each new subscriber, so reconnecting to a busy TUI ships a
+long history of escape sequences the browser has to re-render.
+``TerminalScreen`` interprets the output stream instead. It keeps the current
+primary and alternate grids plus a bounded scrollback, and ``snapshot()``
+renders one compact write that repaints the same state: scrollback, screen
+contents with colors, cursor, scroll region, and the input modes the client
+must honor.
+
+Only the VT100/xterm sequences that affect layout, attributes, or input modes
+are interpreted. Everything else is consumed and dropped, including OSC
+titles, DCS strings, charset designations, and device queries.
+"""
+
+from __future__ import annotations
+
+import codecs
+import collections
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Optional
+
+DEFAULT_COLS = 80
+DEFAULT_ROWS = 24
+DEFAULT_SCROLLBACK_LINES = 2000
+
+_Attr = tuple[str, ...]
+_BLANK_ATTR: _Attr = ()
+
+# Private modes replayed in snapshots because they change how the client
+# encodes input (cursor keys, mouse reporting, bracketed paste, focus events).
+_REPLAYED_PRIVATE_MODES = frozenset({1, 1000, 1002, 1003, 1004, 1005, 1006, 1015, 2004})
+_ALT_SCREEN_MODES = frozenset({47, 1047, 1049})
+# A client resynced after dropped output may still have modes enabled that the
+# dropped bytes turned off, so snapshots first return every tracked mode to its
+# default (cursor shown, autowrap on, numeric keypad, replayed modes off).
+_MODE_RESET = "\x1b[?25h\x1b[?7h\x1b>" + "".join(
+    f"\x1b[?{mode}l" for mode in sorted(_REPLAYED_PRIVATE_MODES)
+)
+_ZERO_WIDTH = frozenset("\u200b\u200c\u200d\ufe0f")
+_TEXT_RUN_RE = re.compile(r"[^\x00-\x1f\x7f-\x9f]+")
+# A complete CSI sequence; split sequences fall back to the state machine.
+_CSI_RE = re.compile(r"\x1b\[([\x20-\x3f]*)([\x40-\x7e])")
+_INTERMEDIATE_RE = re.compile(r"[\x20-\x2f]")
+_SGR_OFF_CATEGORIES = {
+    22: "intensity",
+    23: "italic",
+    24: "underline",
+    25: "blink",
+    27: "inverse",
+    28: "hidden",
+    29: "strike",
+    39: "fg",
+    49: "bg",
+    55: "overline",
+    59: "underline_color",
+}
+_SGR_ON_CATEGORIES = {
+    1: "intensity",
+    2: "intensity",
+    3: "italic",
+    4: "underline",
+    5: "blink",
+    6: "blink",
+    7: "inverse",
+    8: "hidden",
+    9: "strike",
+    21: "underline",
+    53: "overline",
+}
+
+_GROUND = 0
+_ESCAPE = 1
+_ESCAPE_SKIP_ONE = 2
+_CSI = 3
+_STRING = 4
+_STRING_ESCAPE = 5
+
+
+class _Line:
+    __slots__ = ("chars", "attrs")
+
+    def __init__(self, cols: int, attr: _Attr = _BLANK_ATTR) -> None:
+        self.chars: list[str] = [" "] * cols
+        self.attrs: list[_Attr] = [attr] * cols
+
+    def resize(self, cols: int) -> None:
+        current = len(self.chars)
+        if cols < current:
+            del self.chars[cols:]
+            del self.attrs[cols:]
+        elif cols > current:
+            self.chars.extend([" "] * (cols - current))
+            self.attrs.extend([_BLANK_ATTR] * (cols - current))
+
+    def erase(self, start: int, end: int, attr: _Attr) -> None:
+        for x in range(max(start, 0), min(end, len(self.chars))):
+            self.chars[x] = " "
+            self.attrs[x] = attr
+
+    def is_blank(self) -> bool:
+        return all(ch == " " for ch in self.chars) and all(
+            attr == _BLANK_ATTR for attr in self.attrs
+        )
+
+
+@dataclass
+class _SavedCursor:
+    x: int = 0
+    y: int = 0
+    pen: Optional[dict[str, str]] = None
+    autowrap: bool = True
+
+
+@dataclass(frozen=True)
+class TerminalScreenStats:
+    cols: int
+    rows: int
+    scrollback_lines: int
+    alt_screen_active: bool
+    bytes_fed: int
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "cols": self.cols,
+            "rows": self.rows,
+            "scrollback_lines": self.scrollback_lines,
+            "alt_screen_active": self.alt_screen_active,
+            "bytes_fed": self.bytes_fed,
+        }
+
+
+class TerminalScreen:
+    def __init__(
+        self,
+        cols: int = DEFAULT_COLS,
+        rows: int = DEFAULT_ROWS,
+        *,
+        scrollback_lines: int = DEFAULT_SCROLLBACK_LINES,
+    ) -> None:
+        self.cols = max(1, cols)
+        self.rows = max(1, rows)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.scrollback: collections.deque[_Line] = collections.deque(
+            maxlen=max(0, scrollback_lines)
+        )
+        self._bytes_fed = 0
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self._primary = self._blank_grid()
+        self._alt = self._blank_grid()
+        self._grid = self._primary
+        self.alt_screen_active = False
+        self.x = 0
+        self.y = 0
+        self._pending_wrap = False
+        self._pen: dict[str, str] = {}
+        self._attr: _Attr = _BLANK_ATTR
+        self._top = 0
+        self._bottom = self.rows - 1
+        self._autowrap = True
+        self.cursor_visible = True
+        self._keypad_application = False
+        self._private_modes: set[int] = set()
+        self._saved_primary = _SavedCursor()
+        self._saved_alt = _SavedCursor()
+        self._last_char = " "
+        self._state = _GROUND
+        self._params = ""
+        self._string_is_osc = False
+
+    def _blank_grid(self) -> list[_Line]:
+        return [_Line(self.cols) for _ in range(self.rows)]
+
+    # -- input -----------------------------------------------------------
+
+    def feed(self, data: bytes) -> None:
+        """Interpret a chunk of PTY output."""
+        if not data:
+            return
+        self._bytes_fed += len(data)
+        text = self._decoder.decode(data)
+        index = 0
+        length = len(text)
+        while index < length:
+            if self._state == _GROUND:
+                match = _TEXT_RUN_RE.match(text, index)
+                if match is not None:
+                    self._put_text(match.group())
+                    index = match.end()
+                    continue
+                if text[index] == "\x1b":
+                    match = _CSI_RE.match(text, index)
+                    if match is not None:
+                        self._csi(match.group(1), match.group(2))
+                        index = match.end()
+                        continue
+                self._control(text[index])
+            else:
+                self._sequence_char(text[index])
+            index += 1
+
+    def _control(self, ch: str) -> None:
+        if ch == "\x1b":
+            self._state = _ESCAPE
+        elif ch == "\r":
+            self.x = 0
+            self._pending_wrap = False
+        elif ch in "\n\x0b\x0c":
+            self._index()
+        elif ch == "\x08":
+            if self.x > 0:
+                self.x -= 1
+            self._pending_wrap = False
+        elif ch == "\t":
+            self.x = min(self.cols - 1, (self.x // 8 + 1) * 8)
+            self._pending_wrap = False
+        elif ch == "\x9b":
+            self._begin_csi()
+
+    def _sequence_char(self, ch: str) -> None:
+        state = self._state
+        if state == _ESCAPE:
+            self._escape(ch)
+        elif state == _CSI:
+            if "\x20" <= ch <= "\x3f":
+                self._params += ch
+            elif "\x40" <= ch <= "\x7e":
+                self._state = _GROUND
+                self._csi(self._params, ch)
+            elif ch == "\x1b":
+                self._state = _ESCAPE
+            elif ch in "\x18\x1a":
+                self._state = _GROUND
+            else:
+                self._control(ch)
+        elif state == _STRING:
+            if ch == "\x07" and self._string_is_osc:
+                self._state = _GROUND
+            elif ch == "\x1b":
+                self._state = _STRING_ESCAPE
+            elif ch == "\x9c":
+                self._state = _GROUND
+        elif state == _STRING_ESCAPE:
+            self._state = _GROUND if ch == "\\" else _STRING
+        elif state == _ESCAPE_SKIP_ONE:
+            self._state = _GROUND
+
+    def _escape(self, ch: str) -> None:
+        self._state = _GROUND
+        if ch == "[":
+            self._begin_csi()
+        elif ch in "]PX^_":
+            self._state = _STRING
+            self._string_is_osc = ch == "]"
+        elif ch in "()*+-./#% ":
+            self._state = _ESCAPE_SKIP_ONE
+        elif ch == "7":
+            self._save_cursor()
+        elif ch == "8":
+            self._restore_cursor()
+        elif ch == "D":
+            self._index()
+        elif ch == "E":
+            self.x = 0
+            self._index()
+        elif ch == "M":
+            self._reverse_index()
+        elif ch == "c":
+            self._reset_state()
+            self.scrollback.clear()
+        elif ch == "=":
+            self._keypad_application = True
+        elif ch == ">":
+            self._keypad_application = False
+        elif ch == "\x1b":
+            self._state = _ESCAPE
+
+    def _begin_csi(self) -> None:
+        self._state = _CSI
+        self._params = ""
+
+    # -- text ------------------------------------------------------------
+
+    def _put_text(self, text: str) -> None:
+        if text.isascii():
+            self._put_ascii(text)
+            return
+        for ch in text:
+            if unicodedata.combining(ch) or ch in _ZERO_WIDTH:
+                self._append_combining(ch)
+                continue
+            width = 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+            self._put_char(ch, width)
+
+    def _put_ascii(self, text: str) -> None:
+        index = 0
+        length = len(text)
+        cols = self.cols
+        attr = self._attr
+        while index < length:
+            if self._pending_wrap:
+                self._wrap()
+            line = self._grid[self.y]
+            room = cols - self.x
+            take = min(room, length - index)
+            end = self.x + take
+            line.chars[self.x : end] = text[index : index + take]
+            line.attrs[self.x : end] = [attr] * take
+            index += take
+            if end >= cols:
+                self.x = cols - 1
+                self._pending_wrap = self._autowrap
+                if not self._autowrap and index < length:
+                    # Without autowrap the rest overwrites the last column.
+                    line.chars[cols - 1] = text[length - 1]
+                    index = length
+            else:
+                self.x = end
+        self._last_char = text[-1]
+
+    def _put_char(self, ch: str, width: int) -> None:
+        if self._pending_wrap:
+            self._wrap()
+        if width == 2 and self.x == self.cols - 1:
+            if self._autowrap:
+                self._grid[self.y].erase(self.x, self.x + 1, self._attr)
+                self._wrap()
+            else:
+                width = 1
+        line = self._grid[self.y]
+        line.chars[self.x] = ch
+        line.attrs[self.x] = self._attr
+        if width == 2 and self.x + 1 < self.cols:
+            line.chars[self.x + 1] = ""
+            line.attrs[self.x + 1] = self._attr
+        self._last_char = ch
+        next_x = self.x + width
+        if next_x >= self.cols:
+            self.x = self.cols - 1
+            self._pending_wrap = self._autowrap
+        else:
+            self.x = next_x
+
+    def _append_combining(self, ch: str) -> None:
+        line = self._grid[self.y]
+        x = self.x if self._pending_wrap else self.x - 1
+        while x > 0 and line.chars[x] == "":
+            x -= 1
+        if x >= 0:
+            line.chars[x] += ch
+
+    def _wrap(self) -> None:
+        self._pending_wrap = False
+        self.x = 0
+        self._index()
+
+    # -- movement and scrolling -------------------------------------------
+
+    def _index(self) -> None:
+        self._pending_wrap = False
+        if self.y == self._bottom:
+            self._scroll_up(1)
+        elif self.y < self.rows - 1:
+            self.y += 1
+
+    def _reverse_index(self) -> None:
+        self._pending_wrap = False
+        if self.y == self._top:
+            self._scroll_down(1)
+        elif self.y > 0:
+            self.y -= 1
+
+    def _erase_attr(self) -> _Attr:
+        bg = self._pen.get("bg")
+        return (bg,) if bg else _BLANK_ATTR
+
+    def _scroll_up(self, count: int) -> None:
+        top, bottom = self._top, self._bottom
+        count = min(count, bottom - top + 1)
+        grid = self._grid
+        keep_history = grid is self._primary and top == 0
+        for _ in range(count):
+            line = grid.pop(top)
+            if keep_history and self.scrollback.maxlen:
+                self.scrollback.append(line)
+            grid.insert(bottom, _Line(self.cols, self._erase_attr()))
+
+    def _scroll_down(self, count: int) -> None:
+        top, bottom = self._top, self._bottom
+        count = min(count, bottom - top + 1)
+        grid = self._grid
+        for _ in range(count):
+            grid.pop(bottom)
+            grid.insert(top, _Line(self.cols, self._erase_attr()))
+
+    def _move_to(self, x: int, y: int) -> None:
+        self.x = min(max(x, 0), self.cols - 1)
+        self.y = min(max(y, 0), self.rows - 1)
+        self._pending_wrap = False
+
+    def _save_cursor(self) -> None:
+        saved = self._saved_alt if self.alt_screen_active else self._saved_primary
+        saved.x, saved.y = self.x, self.y
+        saved.pen = dict(self._pen)
+        saved.autowrap = self._autowrap
+
+    def _restore_cursor(self) -> None:
+        saved = self._saved_alt if self.alt_screen_active else self._saved_primary
+        self._move_to(saved.x, saved.y)
+        if saved.pen is not None:
+            self._pen = dict(saved.pen)
+            self._attr = _pen_attr(self._pen)
+        self._autowrap = saved.autowrap
+
+    # -- CSI -------------------------------------------------------------
+
+    def _csi(self, raw: str, final: str) -> None:
+        private = raw[:1] if raw[:1] in ("?", ">", "<", "=") else ""
+        body = raw[1:] if private else raw
+        if _INTERMEDIATE_RE.search(body):
+            # Intermediate bytes (DECSTR, DECSCUSR, ...) do not affect the grid.
+            return
+        params = _parse_params(body)
+        if private == "?":
+            if final in "hl":
+                self._set_private_modes(params, final == "h")
+            return
+        if private:
+            return
+
+        def arg(index: int = 0, default: int = 1) -> int:
+            value = params[index] if index < len(params) else 0
+            return value if value > 0 else default
+
+        if final == "m":
+            self._sgr(body)
+        elif final in "Hf":
+            self._move_to(arg(1) - 1, arg(0) - 1)
+        elif final == "A":
+            self._move_to(
+                self.x, max(self.y - arg(), self._top if self.y >= self._top else 0)
+            )
+        elif final in "Be":
+            limit = self._bottom if self.y <= self._bottom else self.rows - 1
+            self._move_to(self.x, min(self.y + arg(), limit))
+        elif final in "Ca":
+            self._move_to(self.x + arg(), self.y)
+        elif final == "D":
+            self._move_to(self.x - arg(), self.y)
+        elif final == "E":
+            self._move_to(0, self.y + arg())
+        elif final == "F":
+            self._move_to(0, self.y - arg())
+        elif final in "G`":
+            self._move_to(arg() - 1, self.y)
+        elif final == "d":
+            self._move_to(self.x, arg() - 1)
+        elif final == "J":
+            self._erase_display(params[0] if params else 0)
+        elif final == "K":
+            self._erase_line(params[0] if params else 0)
+        elif final == "X":
+            self._grid[self.y].erase(self.x, self.x + arg(), self._erase_attr())
+            self._pending_wrap = False
+        elif final == "@":
+            self._insert_chars(arg())
+        elif final == "P":
+            self._delete_chars(arg())
+        elif final == "L":
+            self._insert_lines(arg())
+        elif final == "M":
+            self._delete_lines(arg())
+        elif final == "S":
+            self._scroll_up(arg())
+        elif final == "T":
+            self._scroll_down(arg())
+        elif final == "b":
+            self._put_text(self._last_char * min(arg(), self.cols * self.rows))
+        elif final == "r":
+            top = arg(0) - 1
+            bottom = arg(1, self.rows) - 1
+            if 0 <= top < bottom < self.rows:
+                self._top, self._bottom = top, bottom
+                self._move_to(0, 0)
+        elif final == "s":
+            self._save_cursor()
+        elif final == "u":
+            self._restore_cursor()
+
+    def _erase_display(self, mode: int) -> None:
+        attr = self._erase_attr()
+        grid = self._grid
+        if mode == 0:
+            grid[self.y].erase(self.x, self.cols, attr)
+            for line in grid[self.y + 1 :]:
+                line.erase(0, self.cols, attr)
+        elif mode == 1:
+            for line in grid[: self.y]:
+                line.erase(0, self.cols, attr)
+            grid[self.y].erase(0, self.x + 1, attr)
+        elif mode == 2:
+            for line in grid:
+                line.erase(0, self.cols, attr)
+        elif mode == 3:
+            self.scrollback.clear()
+        self._pending_wrap = False
+
+    def _erase_line(self, mode: int) -> None:
+        line = self._grid[self.y]
+        attr = self._erase_attr()
+        if mode == 0:
+            line.erase(self.x, self.cols, attr)
+        elif mode == 1:
+            line.erase(0, self.x + 1, attr)
+        elif mode == 2:
+            line.erase(0, self.cols, attr)
+        self._pending_wrap = False
+
+    def _insert_chars(self, count: int) -> None:
+        line = self._grid[self.y]
+        count = min(count, self.cols - self.x)
+        attr = self._erase_attr()
+        line.chars[self.x : self.x] = [" "] * count
+        line.attrs[self.x : self.x] = [attr] * count
+        del line.chars[self.cols :]
+        del line.attrs[self.cols :]
+        self._pending_wrap = False
+
+    def _delete_chars(self, count: int) -> None:
+        line = self._grid[self.y]
+        count = min(count, self.cols - self.x)
+        del line.chars[self.x : self.x + count]
+        del line.attrs[self.x : self.x + count]
+        line.chars.extend([" "] * count)
+        line.attrs.extend([self._erase_attr()] * count)
+        self._pending_wrap = False
+
+    def _insert_lines(self, count: int) -> None:
+        if not self._top <= self.y <= self._bottom:
+            return
+        top = self._top
+        self._top = self.y
+        self._scroll_down(count)
+        self._top = top
+        self.x = 0
+        self._pending_wrap = False
+
+    def _delete_lines(self, count: int) -> None:
+        if not self._top <= self.y <= self._bottom:
+            return
+        top = self._top
+        self._top = self.y
+        count = min(count, self._bottom - self.y + 1)
+        grid = self._grid
+        for _ in range(count):
+            grid.pop(self.y)
+            grid.insert(self._bottom, _Line(self.cols, self._erase_attr()))
+        self._top = top
+        self.x = 0
+        self._pending_wrap = False
+
+    def _set_private_modes(self, params: list[int], enabled: bool) -> None:
+        for mode in params:
+            if mode in _ALT_SCREEN_MODES:
+                self._set_alt_screen(enabled, save_cursor=mode == 1049)
+            elif mode == 25:
+                self.cursor_visible = enabled
+            elif mode == 7:
+                self._autowrap = enabled
+            elif mode in _REPLAYED_PRIVATE_MODES:
+                if enabled:
+                    self._private_modes.add(mode)
+                else:
+                    self._private_modes.discard(mode)
+
+    def _set_alt_screen(self, enabled: bool, *, save_cursor: bool) -> None:
+        if enabled == self.alt_screen_active:
+            return
+        if enabled:
+            if save_cursor:
+                self._save_cursor()
+            self._alt = self._blank_grid()
+            self._grid = self._alt
+            self.alt_screen_active = True
+        else:
+            self._grid = self._primary
+            self.alt_screen_active = False
+            if save_cursor:
+                self._restore_cursor()
+        self._top, self._bottom = 0, self.rows - 1
+        self._pending_wrap = False
+
+    def _sgr(self, body: str) -> None:
+        pen = self._pen
+        if not body:
+            pen.clear()
+            self._attr = _BLANK_ATTR
+            return
+        parts = body.split(";")
+        index = 0
+        while index < len(parts):
+            part = parts[index]
+            index += 1
+            if ":" in part:
+                # Colon sub-parameters (4:3 curly underline, 38:2::r:g:b).
+                head = part.split(":", 1)[0]
+                code = int(head) if head.isdigit() else -1
+                if code in (38, 48, 58):
+                    pen[_color_category(code)] = part
+                elif code == 4:
+                    if part in ("4:0",):
+                        pen.pop("underline", None)
+                    else:
+                        pen["underline"] = part
+                continue
+            code = int(part) if part.isdigit() else 0
+            if code == 0:
+                pen.clear()
+            elif code in (38, 48, 58):
+                mode = parts[index] if index < len(parts) else ""
+                take = 2 if mode == "5" else 4 if mode == "2" else 0
+                if take:
+                    pen[_color_category(code)] = ";".join(
+                        parts[index - 1 : index + take]
+                    )
+                index += take
+            elif code in _SGR_ON_CATEGORIES:
+                pen[_SGR_ON_CATEGORIES[code]] = part
+            elif code in _SGR_OFF_CATEGORIES:
+                pen.pop(_SGR_OFF_CATEGORIES[code], None)
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                pen["fg"] = part
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                pen["bg"] = part
+        self._attr = _pen_attr(pen)
+
+    # -- geometry ----------------------------------------------------------
+
+    def resize(self, cols: int, rows: int) -> None:
+        cols = max(1, cols)
+        rows = max(1, rows)
+        if cols == self.cols and rows == self.rows:
+            return
+        for grid in (self._primary, self._alt):
+            for line in grid:
+                line.resize(cols)
+        for line in self.scrollback:
+            line.resize(cols)
+        old_rows = self.rows
+        self.cols = cols
+        self.rows = rows
+        if rows < old_rows:
+            excess = old_rows - rows
+            for grid in (self._primary, self._alt):
+                is_active = grid is self._grid
+                cursor_y = self.y if is_active else rows - 1
+                # Drop blank lines below the cursor before pushing history up.
+                while excess and len(grid) > rows and len(grid) - 1 > cursor_y:
+                    if not grid[-1].is_blank():
+                        break
+                    grid.pop()
+                while len(grid) > rows:
+                    line = grid.pop(0)
+                    if grid is self._primary and self.scrollback.maxlen:
+                        self.scrollback.append(line)
+                    if is_active:
+                        self.y -= 1
+        for grid in (self._primary, self._alt):
+            while len(grid) < rows:
+                grid.append(_Line(cols))
+        self._top, self._bottom = 0, rows - 1
+        for saved in (self._saved_primary, self._saved_alt):
+            saved.x = min(saved.x, cols - 1)
+            saved.y = min(max(saved.y, 0), rows - 1)
+        self._move_to(self.x, self.y)
+
+    # -- output ------------------------------------------------------------
+
+    def snapshot(self) -> bytes:
+        """Render the scrollback and screens as one write that rebuilds them."""
+        out: list[str] = [
+            "\x1b[?1049l\x1b[0m\x1b[r",
+            _MODE_RESET,
+            "\x1b[H\x1b[2J\x1b[3J",
+        ]
+        for line in self.scrollback:
+            out.append(_render_line(line))
+            out.append("\r\n")
+        last = self.rows - 1
+        for index, line in enumerate(self._primary):
+            out.append(_render_line(line))
+            if index < last:
+                out.append("\r\n")
+        if self.alt_screen_active:
+            saved = self._saved_primary
+            out.append(f"\x1b[{saved.y + 1};{saved.x + 1}H\x1b[?1049h")
+            for index, line in enumerate(self._alt):
+                rendered = _render_line(line)
+                if rendered:
+                    out.append(f"\x1b[{index + 1};1H{rendered}")
+        if self._top != 0 or self._bottom != self.rows - 1:
+            out.append(f"\x1b[{self._top + 1};{self._bottom + 1}r")
+        if not self._autowrap:
+            out.append("\x1b[?7l")
+        for mode in sorted(self._private_modes):
+            out.append(f"\x1b[?{mode}h")
+        if self._keypad_application:
+            out.append("\x1b=")
+        if not self.cursor_visible:
+            out.append("\x1b[?25l")
+        out.append(f"\x1b[{self.y + 1};{self.x + 1}H")
+        if self._attr:
+            out.append(f"\x1b[0;{';'.join(self._attr)}m")
+        return "".join(out).encode("utf-8")
+
+    def display_lines(self) -> list[str]:
+        """Return the visible grid as plain text, one string per row."""
+        return ["".join(line.chars).rstrip() for line in self._grid]
+
+    def stats(self) -> TerminalScreenStats:
+        return TerminalScreenStats(
+            cols=self.cols,
+            rows=self.rows,
+            scrollback_lines=len(self.scrollback),
+            alt_screen_active=self.alt_screen_active,
+            bytes_fed=self._bytes_fed,
+        )
+
+
+def _parse_params(body: str) -> list[int]:
+    if not body:
+        return []
+    params: list[int] = []
+    for part in body.split(";"):
+        head = part.split(":", 1)[0]
+        params.append(int(head) if head.isdigit() else 0)
+    return params
+
+
+def _color_category(code: int) -> str:
+    return {38: "fg", 48: "bg", 58: "underline_color"}[code]
+
+
+def _pen_attr(pen: dict[str, str]) -> _Attr:
+    return tuple(pen[key] for key in sorted(pen))
+
+
+def _render_line(line: _Line) -> str:
+    chars = line.chars
+    attrs = line.attrs
+    end = len(chars)
+    while end > 0 and chars[end - 1] == " " and attrs[end - 1] == _BLANK_ATTR:
+        end -= 1
+    out: list[str] = []
+    current: _Attr = _BLANK_ATTR
+    for x in range(end):
+        ch = chars[x]
+        if ch == "":
+            continue
+        attr = attrs[x]
+        if attr != current:
+            out.append(f"\x1b[0;{';'.join(attr)}m" if attr else "\x1b[0m")
+            current = attr
+        out.append(ch)
+    if current:
+        out.append("\x1b[0m")
+    return "".join(out)
+
+
+__all__ = [
+    "DEFAULT_COLS",
+    "DEFAULT_ROWS",
+    "DEFAULT_SCROLLBACK_LINES",
+    "TerminalScreen",
+    "TerminalScreenStats",
+]
@@ -4,64 +4,48 @@ This package provides a simple, file-backed orchestration layer built around
 markdown tickets with YAML frontmatter.
 """
 
-from .agent_pool import AgentPool, AgentTurnRequest, AgentTurnResult
-from .models import (
-    DEFAULT_MAX_TOTAL_TURNS,
-    TicketContextEntry,
-    TicketDoc,
-    TicketFrontmatter,
-    TicketResult,
-    TicketRunConfig,
-)
-from .runner import TicketRunner
-from .runner_commit import process_commit_required
-from .runner_execution import (
-    capture_git_state,
-    capture_git_state_after,
-    compute_loop_guard,
-    execute_turn,
-    should_pause_for_loop,
-)
-from .runner_post_turn import (
-    archive_dispatch_and_create_summary,
-    build_pause_result,
-    check_ticket_frontmatter,
-    checkpoint_git,
-    create_runner_pause_dispatch,
-    handle_frontmatter_recheck,
-)
-from .runner_prompt import build_prompt
-from .runner_selection import (
-    TicketSelectionError,
-    select_ticket,
-    validate_ticket_for_execution,
-)
+from __future__ import annotations
 
-__all__ = [
-    "DEFAULT_MAX_TOTAL_TURNS",
-    "AgentPool",
-    "AgentTurnRequest",
-    "AgentTurnResult",
-    "TicketContextEntry",
-    "TicketDoc",
-    "TicketFrontmatter",
-    "TicketResult",
-    "TicketRunConfig",
-    "TicketRunner",
-    "TicketSelectionError",
-    "archive_dispatch_and_create_summary",
-    "build_pause_result",
-    "build_prompt",
-    "capture_git_state",
-    "capture_git_state_after",
-    "check_ticket_frontmatter",
-    "checkpoint_git",
-    "compute_loop_guard",
-    "create_runner_pause_dispatch",
-    "execute_turn",
-    "handle_frontmatter_recheck",
-    "process_commit_required",
-    "select_ticket",
-    "should_pause_for_loop",
-    "validate_ticket_for_execution",
-]
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "AgentPool": ".agent_pool",
+    "AgentTurnRequest": ".agent_pool",
+    "AgentTurnResult": ".agent_pool",
+    "DEFAULT_MAX_TOTAL_TURNS": ".models",
+    "TicketContextEntry": ".models",
+    "TicketDoc": ".models",
+    "TicketFrontmatter": ".models",
+    "TicketResult": ".models",
+    "TicketRunConfig": ".models",
+    "TicketRunner": ".runner",
+    "TicketSelectionError": ".runner_selection",
+    "archive_dispatch_and_create_summary": ".runner_post_turn",
+    "build_pause_result": ".runner_post_turn",
+    "build_prompt": ".runner_prompt",
+    "capture_git_state": ".runner_execution",
+    "capture_git_state_after": ".runner_execution",
+    "check_ticket_frontmatter": ".runner_post_turn",
+    "checkpoint_git": ".runner_post_turn",
+    "compute_loop_guard": ".runner_execution",
+    "create_runner_pause_dispatch": ".runner_post_turn",
+    "execute_turn": ".runner_execution",
+    "handle_frontmatter_recheck": ".runner_post_turn",
+    "process_commit_required": ".runner_commit",
+    "select_ticket": ".runner_selection",
+    "should_pause_for_loop": ".runner_execution",
+    "validate_ticket_for_execution": ".runner_selection",
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    # Submodules pull in the flow and agent stacks; load them on first use so
+    # light consumers such as ``tickets.lint`` stay cheap to import.
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -3,9 +3,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from .frontmatter import deterministic_ticket_id, parse_markdown_frontmatter
-from .lint import lint_ticket_frontmatter, parse_ticket_index
+from .lint import parse_ticket_index
 from .models import TicketDoc, TicketFrontmatter
+from .ticket_index import ticket_index_entry
 
 
 def list_ticket_paths(ticket_dir: Path) -> list[Path]:
@@ -27,51 +27,20 @@ def read_ticket(path: Path) -> tuple[Optional[TicketDoc], list[str]]:
     """Read and validate a ticket file.
 
     Returns (ticket_doc, lint_errors). When lint errors are present, ticket_doc will
-    be None.
+    be None. The parsed file is served from the shared ``TicketIndex`` cache.
     """
 
-    try:
-        raw = path.read_text(encoding="utf-8")
-    except OSError:
-        return None, ["Failed to read ticket"]
-
-    data, body = parse_markdown_frontmatter(raw)
-    idx = parse_ticket_index(path.name)
-    if idx is None:
-        return None, [
-            "Invalid ticket filename; expected TICKET-<number>[suffix].md (e.g. TICKET-001-foo.md)"
-        ]
-
-    frontmatter, errors = lint_ticket_frontmatter(
-        data,
-        fallback_ticket_id=deterministic_ticket_id(path),
-    )
-    if errors:
-        return None, errors
-    assert frontmatter is not None
-    return TicketDoc(path=path, index=idx, frontmatter=frontmatter, body=body), []
+    return ticket_index_entry(path).ticket_doc()
 
 
 def read_ticket_frontmatter(
     path: Path,
 ) -> tuple[Optional[TicketFrontmatter], list[str]]:
-    try:
-        raw = path.read_text(encoding="utf-8")
-    except OSError:
-        return None, ["Failed to read ticket"]
-    data, _ = parse_markdown_frontmatter(raw)
-    frontmatter, errors = lint_ticket_frontmatter(
-        data,
-        fallback_ticket_id=deterministic_ticket_id(path),
-    )
-    return frontmatter, errors
+    return ticket_index_entry(path).frontmatter()
 
 
 def ticket_is_done(path: Path) -> bool:
-    frontmatter, errors = read_ticket_frontmatter(path)
-    if errors or not frontmatter:
-        return False
-    return bool(frontmatter.done)
+    return ticket_index_entry(path).done
 
 
 def safe_relpath(path: Path, root: Path) -> str:
@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Any, Iterable, Optional, Tuple
 
 from ..agents.hermes_identity import canonicalize_hermes_identity
 from ..agents.registry import validate_agent_id
@@ -239,25 +239,43 @@ def lint_ticket_directory(ticket_dir: Path) -> list[str]:
     if not ticket_dir.exists() or not ticket_dir.is_dir():
         return []
 
-    errors: list[str] = []
-    index_to_paths: dict[int, list[str]] = defaultdict(list)
-    ticket_id_to_paths: dict[str, list[str]] = defaultdict(list)
-
+    rows: list[tuple[int, str, Optional[dict[str, Any]]]] = []
     for path in ticket_dir.iterdir():
         if not path.is_file():
             continue
         idx = parse_ticket_index(path.name)
         if idx is None:
             continue
-        index_to_paths[idx].append(path.name)
         try:
             raw = path.read_text(encoding="utf-8")
         except OSError:
+            rows.append((idx, path.name, None))
             continue
         data, _body = parse_markdown_frontmatter(raw)
+        rows.append((idx, path.name, data))
+    return ticket_directory_duplicate_errors(rows)
+
+
+def ticket_directory_duplicate_errors(
+    rows: Iterable[tuple[int, str, Optional[dict[str, Any]]]],
+) -> list[str]:
+    """Report duplicate indices and ticket_ids from ``(index, name, frontmatter)``.
+
+    Rows are expected in directory listing order; ``frontmatter`` is None when
+    the file could not be read.
+    """
+
+    errors: list[str] = []
+    index_to_paths: dict[int, list[str]] = defaultdict(list)
+    ticket_id_to_paths: dict[str, list[str]] = defaultdict(list)
+
+    for idx, name, data in rows:
+        index_to_paths[idx].append(name)
+        if data is None:
+            continue
         ticket_id = sanitize_ticket_id(data.get("ticket_id"))
         if ticket_id:
-            ticket_id_to_paths[ticket_id].append(path.name)
+            ticket_id_to_paths[ticket_id].append(name)
 
     for idx, filenames in index_to_paths.items():
         if len(filenames) > 1:
@@ -13,7 +13,6 @@ from .files import (
     ticket_is_done,
 )
 from .frontmatter import parse_markdown_frontmatter
-from .lint import lint_ticket_directory
 from .models import TicketContextEntry, TicketDoc, TicketFrontmatter, TicketRunConfig
 from .runner_commit import process_commit_required
 from .runner_prompt import _truncate_text_by_bytes, build_prompt_variants
@@ -31,6 +30,7 @@ from .runner_types import (
     TicketValidationResult,
     ValidatedTicket,
 )
+from .ticket_index import ticket_index_for
 
 _logger = logging.getLogger(__name__)
 
@@ -53,15 +53,15 @@ def select_ticket(
 
     Returns TicketSelectionResult with selected ticket, state updates, and status.
     """
-    ticket_paths = list_ticket_paths(ticket_dir)
-    if not ticket_paths:
+    ticket_snapshot = ticket_index_for(ticket_dir).scan()
+    if not ticket_snapshot.entries:
         return TicketSelectionResult(
             status="paused",
             pause_reason=f"No tickets found. Create tickets under {safe_relpath(ticket_dir, workspace_root)} and resume.",
             pause_reason_code="no_tickets",
         )
 
-    dir_lint_errors = lint_ticket_directory(ticket_dir)
+    dir_lint_errors = list(ticket_snapshot.directory_lint_errors)
     if dir_lint_errors:
         return TicketSelectionResult(
             status="paused",
@@ -166,7 +166,7 @@ def select_ticket(
             _clear_per_ticket_state()
 
     if current_path is None:
-        next_path = _find_next_ticket(ticket_paths)
+        next_path = ticket_snapshot.next_ticket()
         if next_path is None:
             return TicketSelectionResult(
                 status="completed",
@@ -318,14 +318,6 @@ def _validate_ticket_lint_retry(
     )
 
 
-def _find_next_ticket(ticket_paths: list[Path]) -> Optional[Path]:
-    for path in ticket_paths:
-        if ticket_is_done(path):
-            continue
-        return path
-    return None
-
-
 def _git_status_porcelain(workspace_root: Path) -> Optional[str]:
     try:
         proc = run_git(["status", "--porcelain"], cwd=workspace_root, check=True)
@@ -0,0 +1,242 @@
+"""Stat-keyed cache of parsed ticket files.
+
+Ticket selection, flow summaries, and hub read models all look at every
+ticket's frontmatter, often several times per runner step or hub poll.
+``TicketIndex`` keeps the parsed frontmatter mapping and body of each ticket
+file keyed by ``(mtime_ns, size, inode)`` so unchanged tickets are read and
+YAML-parsed once. Frontmatter linting still runs on access because agent
+validation depends on the live agent registry, not only on file content.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Optional
+
+from .frontmatter import deterministic_ticket_id, parse_markdown_frontmatter
+from .lint import (
+    lint_ticket_frontmatter,
+    parse_ticket_index,
+    ticket_directory_duplicate_errors,
+)
+from .models import TicketDoc, TicketFrontmatter
+
+# Files modified this close to the moment they were parsed are re-read on the
+# next lookup: a same-size rewrite inside one timestamp tick would otherwise
+# keep its stat key.
+_RACY_WINDOW_NS = 2_000_000_000
+_MAX_CACHED_DIRECTORIES = 256
+
+_StatKey = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class TicketIndexEntry:
+    """Parsed view of one ticket file.
+
+    ``data`` is None when the file could not be read. The mapping is shared
+    between readers and must be treated as read-only.
+    """
+
+    path: Path
+    index: Optional[int]
+    data: Optional[dict[str, Any]] = field(repr=False)
+    body: str = field(repr=False)
+
+    def frontmatter(self) -> tuple[Optional[TicketFrontmatter], list[str]]:
+        if self.data is None:
+            return None, ["Failed to read ticket"]
+        return lint_ticket_frontmatter(
+            self.data,
+            fallback_ticket_id=deterministic_ticket_id(self.path),
+        )
+
+    def ticket_doc(self) -> tuple[Optional[TicketDoc], list[str]]:
+        if self.data is None:
+            return None, ["Failed to read ticket"]
+        if self.index is None:
+            return None, [
+                "Invalid ticket filename; expected TICKET-<number>[suffix].md (e.g. TICKET-001-foo.md)"
+            ]
+        frontmatter, errors = self.frontmatter()
+        if errors:
+            return None, errors
+        assert frontmatter is not None
+        return (
+            TicketDoc(
+                path=self.path,
+                index=self.index,
+                frontmatter=frontmatter,
+                body=self.body,
+            ),
+            [],
+        )
+
+    @property
+    def done(self) -> bool:
+        frontmatter, errors = self.frontmatter()
+        if errors or not frontmatter:
+            return False
+        return bool(frontmatter.done)
+
+
+@dataclass(frozen=True)
+class TicketIndexSnapshot:
+    """Ticket files of one directory at a point in time, ordered by index."""
+
+    entries: tuple[TicketIndexEntry, ...]
+    directory_lint_errors: tuple[str, ...]
+
+    @property
+    def paths(self) -> list[Path]:
+        return [entry.path for entry in self.entries]
+
+    @cached_property
+    def done_flags(self) -> tuple[bool, ...]:
+        return tuple(entry.done for entry in self.entries)
+
+    @property
+    def done_count(self) -> int:
+        return sum(self.done_flags)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self.entries) - self.done_count
+
+    def next_ticket(self) -> Optional[Path]:
+        for entry, done in zip(self.entries, self.done_flags, strict=True):
+            if not done:
+                return entry.path
+        return None
+
+
+@dataclass(frozen=True)
+class _CachedTicketFile:
+    stat_key: _StatKey
+    parsed_at_ns: int
+    data: dict[str, Any]
+    body: str
+
+
+class TicketIndex:
+    """Cache of parsed ticket files for one ticket directory."""
+
+    def __init__(self, ticket_dir: Path) -> None:
+        self._ticket_dir = ticket_dir
+        self._lock = threading.Lock()
+        self._files: dict[str, _CachedTicketFile] = {}
+
+    @property
+    def ticket_dir(self) -> Path:
+        return self._ticket_dir
+
+    def scan(self) -> TicketIndexSnapshot:
+        """Stat every ticket file and re-parse only those that changed."""
+        ticket_dir = self._ticket_dir
+        if not ticket_dir.exists() or not ticket_dir.is_dir():
+            with self._lock:
+                self._files.clear()
+            return TicketIndexSnapshot(entries=(), directory_lint_errors=())
+        listed: list[TicketIndexEntry] = []
+        for path in ticket_dir.iterdir():
+            if not path.is_file():
+                continue
+            idx = parse_ticket_index(path.name)
+            if idx is None:
+                continue
+            listed.append(self._load(path, idx))
+        with self._lock:
+            names = {entry.path.name for entry in listed}
+            for name in [name for name in self._files if name not in names]:
+                del self._files[name]
+        lint_errors = ticket_directory_duplicate_errors(
+            (entry.index or 0, entry.path.name, entry.data) for entry in listed
+        )
+        return TicketIndexSnapshot(
+            entries=tuple(sorted(listed, key=lambda entry: entry.index or 0)),
+            directory_lint_errors=tuple(lint_errors),
+        )
+
+    def entry(self, path: Path) -> TicketIndexEntry:
+        """Return the parsed entry for ``path`` (which must live in this directory)."""
+        return self._load(path, parse_ticket_index(path.name))
+
+    def _load(self, path: Path, idx: Optional[int]) -> TicketIndexEntry:
+        name = path.name
+        try:
+            stat = path.stat()
+        except OSError:
+            with self._lock:
+                self._files.pop(name, None)
+            return TicketIndexEntry(path=path, index=idx, data=None, body="")
+        stat_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self._lock:
+            cached = self._files.get(name)
+        if (
+            cached is None
+            or cached.stat_key != stat_key
+            or stat.st_mtime_ns + _RACY_WINDOW_NS >= cached.parsed_at_ns
+        ):
+            parsed_at_ns = time.time_ns()
+            try:
+                raw = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                with self._lock:
+                    self._files.pop(name, None)
+                return TicketIndexEntry(path=path, index=idx, data=None, body="")
+            data, body = parse_markdown_frontmatter(raw)
+            cached = _CachedTicketFile(
+                stat_key=stat_key,
+                parsed_at_ns=parsed_at_ns,
+                data=data,
+                body=body,
+            )
+            with self._lock:
+                self._files[name] = cached
+        return TicketIndexEntry(
+            path=path, index=idx, data=cached.data, body=cached.body
+        )
+
+
+_INDEXES: "OrderedDict[tuple[str, str], TicketIndex]" = OrderedDict()
+_INDEXES_LOCK = threading.Lock()
+
+
+def ticket_index_for(ticket_dir: Path) -> TicketIndex:
+    """Return the process-wide ``TicketIndex`` shared by all readers of ``ticket_dir``.
+
+    Indexes are keyed by the spelling of ``ticket_dir`` as well as its absolute
+    path because entry paths (and the fallback ticket ids derived from them)
+    keep the caller's relative or absolute form.
+    """
+    key = (os.path.abspath(ticket_dir), str(ticket_dir))
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = TicketIndex(ticket_dir)
+            _INDEXES[key] = index
+            while len(_INDEXES) > _MAX_CACHED_DIRECTORIES:
+                _INDEXES.popitem(last=False)
+        else:
+            _INDEXES.move_to_end(key)
+        return index
+
+
+def ticket_index_entry(path: Path) -> TicketIndexEntry:
+    """Return the cached parsed entry for one ticket file."""
+    return ticket_index_for(path.parent).entry(path)
+
+
+__all__ = [
+    "TicketIndex",
+    "TicketIndexEntry",
+    "TicketIndexSnapshot",
+    "ticket_index_entry",
+    "ticket_index_for",
+]
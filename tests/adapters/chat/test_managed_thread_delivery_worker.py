@@ -93,6 +93,7 @@ def _register_pending(
     turn_id: str = "turn-1",
     final_status: str = "ok",
     assistant_text: str = "Hello!",
+    created_at: Optional[str] = None,
 ) -> str:
     target = _make_target(adapter_key=adapter_key, surface_key=surface_key)
     envelope = _make_envelope(final_status=final_status, assistant_text=assistant_text)
@@ -115,6 +116,7 @@ def _register_pending(
         idempotency_key=idempotency_key,
         target=target,
         envelope=envelope,
+        created_at=created_at,
         not_before=datetime.now(timezone.utc).isoformat(),
     )
     reg = engine.create_intent(intent)
@@ -483,3 +485,121 @@ async def test_worker_scopes_claims_to_adapter_key(tmp_path: Path) -> None:
 
     assert len(adapter.delivered_records) == 1
     assert adapter.delivered_records[0].target.adapter_key == "test"
+
+
+class _ConcurrencyTrackingAdapter(_RecordingAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def deliver_managed_thread_record(
+        self, record: Any, *, claim: Any
+    ) -> ManagedThreadDeliveryAttemptResult:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+            return await super().deliver_managed_thread_record(record, claim=claim)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.anyio
+async def test_worker_delivers_batch_concurrently_in_conversation_order(
+    tmp_path: Path,
+) -> None:
+    engine = _make_engine(tmp_path)
+    for index, turn in enumerate(("turn-1", "turn-2")):
+        created_at = f"2026-01-01T00:00:0{index}Z"
+        _register_pending(engine, surface_key="s1", turn_id=turn, created_at=created_at)
+        _register_pending(
+            engine,
+            surface_key="s2",
+            thread_id="thread-2",
+            turn_id=turn,
+            created_at=created_at,
+        )
+    adapter = _ConcurrencyTrackingAdapter()
+    worker = ManagedThreadDeliveryWorker(
+        engine=engine,
+        adapter=adapter,
+        logger=logging.getLogger("test"),
+        config=ManagedThreadDeliveryWorkerConfig(
+            max_concurrent_deliveries=4, claim_batch_size=4
+        ),
+    )
+
+    await worker.run_once()
+
+    assert worker.stats.deliveries_succeeded == 4
+    assert adapter.max_in_flight == 2
+    for surface_key in ("s1", "s2"):
+        turns = [
+            record.managed_turn_id
+            for record in adapter.delivered_records
+            if record.target.surface_key == surface_key
+        ]
+        assert turns == ["turn-1", "turn-2"]
+    assert worker.stats.queue_depth == 0
+    assert worker.stats.peak_queue_depth == 4
+    percentiles = worker.stats.claim_to_delivery_percentiles()
+    assert percentiles["p50"] is not None
+    assert percentiles["p99"] is not None and percentiles["p99"] >= 50
+
+
+@pytest.mark.anyio
+async def test_worker_loop_wakes_when_intent_is_registered(tmp_path: Path) -> None:
+    engine = _make_engine(tmp_path)
+    adapter = _RecordingAdapter()
+    worker = ManagedThreadDeliveryWorker(
+        engine=engine,
+        adapter=adapter,
+        logger=logging.getLogger("test"),
+        config=ManagedThreadDeliveryWorkerConfig(poll_interval_seconds=30),
+    )
+
+    task = asyncio.create_task(worker.run_loop())
+    try:
+        await asyncio.sleep(0.1)
+        await asyncio.to_thread(_register_pending, engine)
+        for _ in range(100):
+            if adapter.delivered_records:
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert len(adapter.delivered_records) == 1
+    assert worker.stats.wakeups >= 1
+
+
+@pytest.mark.anyio
+async def test_worker_loop_wakes_on_notification_bus_ring(tmp_path: Path) -> None:
+    engine = _make_engine(tmp_path)
+    adapter = _RecordingAdapter()
+    worker = ManagedThreadDeliveryWorker(
+        engine=engine,
+        adapter=adapter,
+        logger=logging.getLogger("test"),
+        config=ManagedThreadDeliveryWorkerConfig(poll_interval_seconds=30),
+        hub_root=tmp_path / "hub",
+    )
+
+    task = asyncio.create_task(worker.run_loop())
+    try:
+        await asyncio.sleep(0.1)
+        await asyncio.to_thread(_register_pending, engine)
+        for _ in range(100):
+            if adapter.delivered_records:
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert len(adapter.delivered_records) == 1
+    assert worker.stats.wakeups >= 1
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 
 import pytest
@@ -10,6 +11,7 @@ from codex_autorunner.adapters.discord.gateway import (
     DISCORD_DISPATCH_CALLBACK_MAX_IN_FLIGHT,
     DiscordGatewayClient,
     GatewayDispatchWorker,
+    GatewayReconnectPolicy,
     build_identify_payload,
     calculate_reconnect_backoff,
     parse_gateway_frame,
@@ -674,3 +676,114 @@ async def test_stop_does_not_turn_dispatch_worker_cancellation_into_gateway_erro
     await client.stop()
 
     assert await asyncio.wait_for(run_task, timeout=1.0) is False
+
+
+class _ScriptedGatewaySocket:
+    def __init__(self, frames: list[dict[str, object]]) -> None:
+        self.sent: list[dict[str, object]] = []
+        self._frames = iter(frames)
+
+    async def recv(self) -> dict[str, object]:
+        return {"op": 10, "d": {"heartbeat_interval": 60000}}
+
+    async def send(self, payload: str) -> None:
+        self.sent.append(json.loads(payload))
+
+    def __aiter__(self) -> "_ScriptedGatewaySocket":
+        return self
+
+    async def __anext__(self) -> dict[str, object]:
+        try:
+            return next(self._frames)
+        except StopIteration as exc:
+            raise StopAsyncIteration from exc
+
+
+@pytest.mark.anyio
+async def test_run_connection_resumes_session_and_replays_missed_dispatches() -> None:
+    client = DiscordGatewayClient(
+        bot_token="token",
+        intents=0,
+        logger=logging.getLogger("test.gateway"),
+    )
+    dispatched: list[str] = []
+
+    async def _dispatch(event_type: str, payload: dict[str, object]) -> None:
+        dispatched.append(event_type)
+
+    first = _ScriptedGatewaySocket(
+        [
+            {
+                "op": 0,
+                "s": 1,
+                "t": "READY",
+                "d": {
+                    "session_id": "sess-1",
+                    "resume_gateway_url": "wss://resume.discord.test",
+                },
+            },
+            {"op": 0, "s": 2, "t": "MESSAGE_CREATE", "d": {"id": "m1"}},
+            {"op": 7, "d": None},
+        ]
+    )
+    assert await client._run_connection(first, _dispatch) is True
+    assert first.sent[0]["op"] == 2
+    assert await client._resolve_gateway_url() == (
+        "wss://resume.discord.test/?v=10&encoding=json"
+    )
+
+    second = _ScriptedGatewaySocket(
+        [
+            {"op": 0, "s": 3, "t": "MESSAGE_CREATE", "d": {"id": "m2"}},
+            {"op": 0, "s": 4, "t": "RESUMED", "d": {}},
+        ]
+    )
+    assert await client._run_connection(second, _dispatch) is True
+    assert second.sent[0] == {
+        "op": 6,
+        "d": {"token": "token", "session_id": "sess-1", "seq": 2},
+    }
+    assert dispatched == ["READY", "MESSAGE_CREATE", "MESSAGE_CREATE", "RESUMED"]
+    stats = client.session_stats()
+    assert stats.identifies_total == 1
+    assert stats.resumes_succeeded_total == 1
+    assert stats.replayed_dispatches_total == 1
+
+
+@pytest.mark.anyio
+async def test_run_connection_reidentifies_after_non_resumable_invalid_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from codex_autorunner.adapters.discord import gateway as gateway_module
+
+    monkeypatch.setattr(gateway_module, "INVALID_SESSION_MIN_DELAY_SECONDS", 0.0)
+    monkeypatch.setattr(gateway_module, "INVALID_SESSION_JITTER_SECONDS", 0.0)
+    client = DiscordGatewayClient(
+        bot_token="token",
+        intents=0,
+        logger=logging.getLogger("test.gateway"),
+        gateway_url="wss://gateway.discord.test",
+    )
+    client._session.session_id = "stale"
+    client._session.resume_gateway_url = "wss://resume.discord.test"
+    client._session.sequence = 9
+
+    websocket = _ScriptedGatewaySocket([{"op": 9, "d": False}])
+    assert await client._run_connection(websocket, _noop_dispatch) is False
+
+    assert websocket.sent[0]["op"] == 6
+    assert client._session.resumable is False
+    assert await client._resolve_gateway_url() == "wss://gateway.discord.test"
+    assert client.session_stats().invalid_sessions_total == 1
+
+
+def test_reconnect_policy_marks_session_invalidating_close_codes() -> None:
+    policy = GatewayReconnectPolicy(logger=logging.getLogger("test.gateway"))
+
+    class _FakeClose(Exception):
+        def __init__(self, code: int) -> None:
+            self.code = code
+
+    assert policy.classify_connection_closed(_FakeClose(4009)).resumable is False
+    assert policy.classify_connection_closed(_FakeClose(4007)).resumable is False
+    assert policy.classify_connection_closed(_FakeClose(1001)).resumable is True
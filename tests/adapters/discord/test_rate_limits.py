@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from codex_autorunner.adapters.discord import doctor as discord_doctor
+from codex_autorunner.adapters.discord.rate_limits import (
+    DiscordRateLimiter,
+    discord_route,
+)
+from codex_autorunner.adapters.discord.rest import DiscordRestClient
+
+
+def test_discord_route_keeps_major_parameter_and_templates_ids() -> None:
+    assert discord_route("PATCH", "/channels/111111111111/messages/222222222222") == (
+        "PATCH /channels/{channels}/messages/{id}",
+        "channels/111111111111",
+    )
+    assert discord_route("POST", "/webhooks/333333/tok-en/messages/@original") == (
+        "POST /webhooks/{webhooks}/{token}/messages/@original",
+        "webhooks/333333/tok-en",
+    )
+    assert discord_route("GET", "/gateway/bot") == ("GET /gateway/bot", "")
+
+
+def _bucket_headers(
+    *, remaining: int, reset_after: float = 5.0, bucket: str = "abc"
+) -> dict[str, str]:
+    return {
+        "X-RateLimit-Bucket": bucket,
+        "X-RateLimit-Limit": "2",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset-After": str(reset_after),
+    }
+
+
+@pytest.mark.anyio
+async def test_exhausted_bucket_waits_only_for_its_own_channel() -> None:
+    limiter = DiscordRateLimiter()
+    request = httpx.Request("POST", "https://discord.test")
+    limiter.observe(
+        "POST",
+        "/channels/111111/messages",
+        httpx.Response(200, headers=_bucket_headers(remaining=0), request=request),
+    )
+
+    await asyncio.wait_for(limiter.acquire("POST", "/channels/222222/messages"), 0.1)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            limiter.acquire("POST", "/channels/111111/messages"), 0.05
+        )
+
+    stats = limiter.stats()
+    assert stats.routes_mapped == 1
+    assert stats.exhausted_buckets == 1
+    assert stats.preemptive_waits_total == 1
+
+
+@pytest.mark.anyio
+async def test_global_rate_limit_pauses_every_bucket() -> None:
+    limiter = DiscordRateLimiter()
+    request = httpx.Request("POST", "https://discord.test")
+    limiter.observe(
+        "POST",
+        "/channels/111111/messages",
+        httpx.Response(
+            429,
+            headers={"Retry-After": "5", "X-RateLimit-Global": "true"},
+            json={"retry_after": 5, "global": True},
+            request=request,
+        ),
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            limiter.acquire("POST", "/channels/222222/messages"), 0.05
+        )
+    assert limiter.stats().global_rate_limited_total == 1
+
+
+@pytest.mark.anyio
+async def test_rest_client_reserves_remaining_and_writes_doctor_snapshot(
+    tmp_path: Path,
+) -> None:
+    sent: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(
+            200,
+            headers=_bucket_headers(remaining=len(sent) % 2, reset_after=0.05),
+            json={"id": "m"},
+        )
+
+    snapshot_path = tmp_path / "discord_rate_limits.json"
+    client = DiscordRestClient(
+        bot_token="abc123",
+        base_url="https://discord.test/api/v10",
+        rate_limit_snapshot_path=snapshot_path,
+    )
+    await client._client.aclose()
+    client._client = httpx.AsyncClient(
+        base_url="https://discord.test/api/v10",
+        transport=httpx.MockTransport(handler),
+    )
+    try:
+        await client.create_channel_message(
+            channel_id="111111", payload={"content": "a"}
+        )
+        # Two concurrent sends share the one remaining slot; the second
+        # waits for the bucket to reset instead of drawing a 429.
+        await asyncio.gather(
+            client.create_channel_message(
+                channel_id="111111", payload={"content": "b"}
+            ),
+            client.create_channel_message(
+                channel_id="111111", payload={"content": "c"}
+            ),
+        )
+    finally:
+        await client.close()
+
+    assert len(sent) == 3
+    assert client.rate_limit_stats().preemptive_waits_total == 1
+    snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    assert snapshot["buckets"][0]["major"] == "channels/111111"
+    assert snapshot["buckets"][0]["routes"] == ["POST /channels/{channels}/messages"]
+
+    check = discord_doctor._rate_limit_snapshot_check(snapshot_path)
+    assert check is not None
+    assert check.check_id == "discord.rate_limits"
+    assert "1 buckets tracked" in check.message
@@ -589,6 +589,62 @@ def test_mutation_invalidation_clears_pr_view_cache(
     assert len(runner_calls) == cache_hits + 2
 
 
+def test_expired_rest_read_revalidates_with_etag(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CAR_GLOBAL_STATE_ROOT", str(tmp_path / "global-state"))
+    monkeypatch.setattr(github_broker, "_SCM_READ_CACHE_TTL_SECONDS", 0)
+    runner_calls: list[list[str]] = []
+    review = {
+        "id": 12345,
+        "state": "CHANGES_REQUESTED",
+        "body": "Please add coverage.",
+        "user": {"login": "reviewer"},
+    }
+
+    def _runner(
+        args: list[str], *, cwd: Path, timeout_seconds: int, check: bool
+    ) -> subprocess.CompletedProcess[str]:
+        _ = cwd, timeout_seconds, check
+        runner_calls.append(list(args))
+        assert "--include" in args
+        if 'If-None-Match: W/"reviews-v1"' in args:
+            # gh exits non-zero for 304 but still prints the status line.
+            return subprocess.CompletedProcess(
+                args,
+                1,
+                stdout='HTTP/2.0 304 Not Modified\r\nEtag: W/"reviews-v1"\r\n\r\n',
+                stderr="gh: HTTP 304",
+            )
+        return subprocess.CompletedProcess(
+            args,
+            0,
+            stdout=(
+                "HTTP/2.0 200 OK\r\nContent-Type: application/json\r\n"
+                'Etag: W/"reviews-v1"\r\n\r\n' + json.dumps([review])
+            ),
+            stderr="",
+        )
+
+    svc = GitHubService(
+        tmp_path / "repo",
+        raw_config={},
+        traffic_class="polling",
+        gh_runner=_runner,
+    )
+
+    first = svc.pr_reviews(owner="acme", repo="widgets", number=17)
+    second = svc.pr_reviews(owner="acme", repo="widgets", number=17)
+
+    assert first == second
+    assert first[0]["review_id"] == "12345"
+    assert len(runner_calls) == 2
+    assert 'If-None-Match: W/"reviews-v1"' not in runner_calls[0]
+    assert 'If-None-Match: W/"reviews-v1"' in runner_calls[1]
+    assert svc.request_counts == {"requests": 2, "cache_hits": 0, "not_modified": 1}
+
+
 class TestLooksLikeRateLimitIsSharedClassifier:
     def test_broker_exports_shared_classifier(self) -> None:
         from codex_autorunner.adapters.github.broker import looks_like_rate_limit
@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import json
 import sqlite3
+import subprocess
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
@@ -46,7 +47,11 @@ pytestmark = pytest.mark.integration
 from codex_autorunner.adapters.github.publisher import (
     build_react_pr_review_comment_executor,
 )
-from codex_autorunner.adapters.github.service import GitHubError, RepoInfo
+from codex_autorunner.adapters.github.service import (
+    GitHubError,
+    GitHubService,
+    RepoInfo,
+)
 
 
 class _GitHubServiceStub:
@@ -4085,6 +4090,152 @@ def test_process_due_watches_continues_after_rate_limited_watch(
     assert result["rate_limited_skipped"] == 1
 
 
+def _graphql_poll_node(number: int) -> dict[str, object]:
+    return {
+        "number": number,
+        "state": "OPEN",
+        "isDraft": False,
+        "createdAt": "2026-03-29T00:00:00Z",
+        "headRefOid": f"sha-{number}",
+        "author": {"login": "author"},
+        "reviews": {
+            "nodes": [
+                {
+                    "databaseId": 1000 + number,
+                    "state": "CHANGES_REQUESTED",
+                    "body": "Please add coverage.",
+                    "url": f"https://example.invalid/reviews/{number}",
+                    "submittedAt": "2026-03-30T00:10:00Z",
+                    "commit": {"oid": f"sha-{number}"},
+                    "author": {"login": "reviewer"},
+                }
+            ]
+        },
+        "comments": {"pageInfo": {"hasPreviousPage": False}, "nodes": []},
+        "reviewThreads": {"nodes": []},
+        "commits": {
+            "nodes": [
+                {
+                    "commit": {
+                        "oid": f"sha-{number}",
+                        "statusCheckRollup": {"contexts": {"nodes": []}},
+                    }
+                }
+            ]
+        },
+    }
+
+
+def test_process_due_watches_batches_prs_into_one_graphql_request_per_repo(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CAR_GLOBAL_STATE_ROOT", str(tmp_path / "global-state"))
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    watch_store = ScmPollingWatchStore(tmp_path)
+    for pr_number in (17, 18, 19):
+        binding = PrBindingStore(tmp_path).upsert_binding(
+            provider="github",
+            repo_slug="acme/widgets",
+            pr_number=pr_number,
+            pr_state="open",
+            head_branch=f"feature/{pr_number}",
+            base_branch="main",
+        )
+        watch_store.upsert_watch(
+            provider="github",
+            binding_id=binding.binding_id,
+            repo_slug=binding.repo_slug,
+            pr_number=binding.pr_number,
+            workspace_root=str(repo_root.resolve()),
+            poll_interval_seconds=90,
+            next_poll_at="2026-03-30T00:00:00Z",
+            expires_at="2099-03-30T01:00:00Z",
+            reaction_config={"enabled": True},
+            snapshot={"head_sha": f"sha-{pr_number}", "pr_state": "open"},
+        )
+
+    gh_calls: list[list[str]] = []
+
+    def _runner(
+        args: list[str], *, cwd: Path, timeout_seconds: int, check: bool
+    ) -> subprocess.CompletedProcess[str]:
+        _ = cwd, timeout_seconds, check
+        gh_calls.append(args)
+        if args[1:3] == ["api", "rate_limit"]:
+            payload: dict[str, object] = _rate_limit_payload(graphql_remaining=5000)
+        elif args[1:3] == ["api", "graphql"]:
+            query = next(arg for arg in args if arg.startswith("query="))
+            repository = {
+                f"pr{number}": _graphql_poll_node(number)
+                for number in (17, 18, 19)
+                if f"pullRequest(number:{number})" in query
+            }
+            payload = {
+                "data": {
+                    "rateLimit": {
+                        "cost": 1,
+                        "remaining": 4999,
+                        "resetAt": "2026-03-30T01:00:00Z",
+                    },
+                    "repository": repository,
+                }
+            }
+        else:
+            raise AssertionError(f"unexpected gh call: {args}")
+        return subprocess.CompletedProcess(args, 0, stdout=json.dumps(payload))
+
+    def _factory(repo_root_arg: Path, raw_config=None) -> GitHubService:
+        return GitHubService(
+            repo_root_arg,
+            raw_config,
+            config_root=tmp_path,
+            traffic_class="polling",
+            gh_runner=_runner,
+        )
+
+    _AutomationServiceFake.ingested_events = []
+    _AutomationServiceFake.process_calls = 0
+    monkeypatch.setattr(
+        GitHubScmPollingService,
+        "_build_automation_service",
+        lambda self, reaction_config=None, checkout_root=None: _AutomationServiceFake(  # type: ignore[misc]
+            tmp_path,
+            reaction_config=reaction_config,
+        ),
+    )
+    service = GitHubScmPollingService(
+        tmp_path,
+        raw_config=_polling_config(),
+        github_service_factory=_factory,
+        watch_store=watch_store,
+        event_store=ScmEventStore(tmp_path),
+    )
+
+    result = service.process_due_watches(limit=10)
+
+    assert result["polled"] == 3
+    assert result["events_emitted"] == 3
+    assert result["graphql_requests"] == 1
+    assert result["graphql_cost"] == 1
+    assert result["rest_fallbacks"] == 0
+    assert [call[1:3] for call in gh_calls] == [
+        ["api", "rate_limit"],
+        ["api", "graphql"],
+    ]
+    events = ScmEventStore(tmp_path).list_events(limit=10)
+    assert sorted(
+        event.pr_number for event in events if event.event_type == "pull_request_review"
+    ) == [17, 18, 19]
+    recorded = json.loads(
+        (tmp_path / ".codex-autorunner" / "github_polling_state.json").read_text()
+    )["last_cycle_quota_cost"]
+    assert recorded["graphql_cost"] == 1
+    assert recorded["graphql_remaining"] == 4999
+    assert recorded["rest_fallbacks"] == 0
+
+
 def test_process_throttles_discovery_to_one_workspace_per_cycle(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Optional
+
+import pytest
+
+from codex_autorunner.agents.opencode.client import OpenCodeApiProfile, OpenCodeClient
+from codex_autorunner.agents.opencode.event_stream import OpenCodeEventPump
+from codex_autorunner.core.sse import SSEEvent
+
+
+class _QueuedStreamResponse:
+    status_code = 200
+
+    def __init__(self, lines: "asyncio.Queue[Optional[str]]") -> None:
+        self._lines = lines
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def aiter_lines(self):
+        while True:
+            line = await self._lines.get()
+            if line is None:
+                return
+            yield line
+
+
+class _QueuedStreamContext:
+    def __init__(self, response: _QueuedStreamResponse) -> None:
+        self._response = response
+
+    async def __aenter__(self) -> _QueuedStreamResponse:
+        return self._response
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+
+class _FakeHttpClient:
+    def __init__(self) -> None:
+        self.stream_calls: list[tuple[str, dict[str, Any]]] = []
+        self.streams: list[asyncio.Queue[Optional[str]]] = []
+
+    def stream(self, method: str, path: str, **kwargs: Any) -> _QueuedStreamContext:
+        self.stream_calls.append((path, kwargs))
+        lines: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self.streams.append(lines)
+        return _QueuedStreamContext(_QueuedStreamResponse(lines))
+
+    async def send(self, payload: dict[str, Any], *, event_id: str) -> None:
+        lines = self.streams[-1]
+        await lines.put(f"id: {event_id}")
+        await lines.put(f"data: {json.dumps(payload)}")
+        await lines.put("")
+
+    async def aclose(self) -> None:
+        return None
+
+
+def _client() -> tuple[OpenCodeClient, _FakeHttpClient]:
+    fake = _FakeHttpClient()
+    client = OpenCodeClient(base_url="http://test")
+    client._client = fake  # type: ignore[assignment]
+    client._api_profile = OpenCodeApiProfile(supports_global_endpoints=True)
+    return client, fake
+
+
+async def _collect(
+    client: OpenCodeClient,
+    session_id: Optional[str],
+    ready: asyncio.Event,
+    seen: list[str],
+) -> None:
+    async for event in client.stream_events(
+        directory="/workspace", session_id=session_id, ready_event=ready
+    ):
+        seen.append(json.loads(event.data)["tag"])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_share_one_stream_and_are_demultiplexed() -> None:
+    client, fake = _client()
+    seen: dict[Optional[str], list[str]] = {"s1": [], "s2": [], None: []}
+    readies = {key: asyncio.Event() for key in seen}
+    tasks = [
+        asyncio.create_task(_collect(client, key, readies[key], seen[key]))
+        for key in seen
+    ]
+    for ready in readies.values():
+        await asyncio.wait_for(ready.wait(), timeout=1)
+
+    await fake.send({"type": "a", "sessionID": "s1", "tag": "s1"}, event_id="1")
+    await fake.send({"type": "a", "sessionID": "s2", "tag": "s2"}, event_id="2")
+    await fake.send({"type": "server.heartbeat", "tag": "global"}, event_id="3")
+    await fake.send(
+        {
+            "type": "session.created",
+            "properties": {"info": {"id": "child", "parentID": "s1"}},
+            "sessionID": "child",
+            "tag": "child-created",
+        },
+        event_id="4",
+    )
+    await fake.send({"type": "a", "sessionID": "child", "tag": "child"}, event_id="5")
+    await fake.send({"type": "a", "sessionID": "other", "tag": "other"}, event_id="6")
+    await fake.streams[0].put(None)
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+    assert [path for path, _kwargs in fake.stream_calls] == ["/global/event"]
+    assert seen["s1"] == ["s1", "global", "child-created", "child", "other"]
+    assert seen["s2"] == ["s2", "global", "other"]
+    assert seen[None] == ["s1", "s2", "global", "child-created", "child", "other"]
+    assert client.event_stream_stats() == []
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resumes_from_last_event_id() -> None:
+    client, fake = _client()
+    ready = asyncio.Event()
+    seen: list[str] = []
+    task = asyncio.create_task(_collect(client, "s1", ready, seen))
+    await asyncio.wait_for(ready.wait(), timeout=1)
+    await fake.send({"type": "a", "sessionID": "s1", "tag": "first"}, event_id="41")
+    await fake.streams[0].put(None)
+    await asyncio.wait_for(task, timeout=1)
+
+    ready = asyncio.Event()
+    task = asyncio.create_task(_collect(client, "s1", ready, seen))
+    await asyncio.wait_for(ready.wait(), timeout=1)
+    await fake.streams[1].put(None)
+    await asyncio.wait_for(task, timeout=1)
+
+    assert seen == ["first"]
+    assert "headers" not in fake.stream_calls[0][1]
+    assert fake.stream_calls[1][1]["headers"] == {"Last-Event-ID": "41"}
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_events_and_reports_lag() -> None:
+    release = asyncio.Event()
+
+    async def _source(on_connected):
+        on_connected()
+        for idx in range(5):
+            yield SSEEvent(event="a", data=str(idx)), {"sessionID": "s1"}
+        await release.wait()
+
+    pump = OpenCodeEventPump(_source, max_queue=2)
+    subscription = pump.subscribe("s1")
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    [stats] = pump.stats()
+    assert stats.session_id == "s1"
+    assert stats.lag_events == 2
+    assert stats.dropped_total == 3
+    first = await subscription.get()
+    assert first is not None and first.data == "3"
+    assert pump.stats()[0].to_dict()["delivered_total"] == 1
+
+    await pump.unsubscribe(subscription)
+    assert pump.finished
@@ -2003,6 +2003,258 @@ def test_chat_index_snapshot_reads_rebuilt_sql_projection_without_reprojecting(
     assert archived["rows"][0]["effective_status"] == "archived"
 
 
+def _projection_rows_by_id(hub_root: Path) -> dict[str, str]:
+    with open_orchestration_sqlite(hub_root, durable=False, migrate=True) as conn:
+        return {
+            str(row["row_id"]): str(row["row_json"])
+            for row in conn.execute(
+                "SELECT row_id, row_json FROM orch_chat_index_projection"
+            ).fetchall()
+        }
+
+
+def _projection_surface_rows(hub_root: Path) -> set[tuple[str, str, str]]:
+    with open_orchestration_sqlite(hub_root, durable=False, migrate=True) as conn:
+        return {
+            (str(row["surface_kind"]), str(row["surface_key"]), str(row["row_id"]))
+            for row in conn.execute(
+                "SELECT * FROM orch_chat_index_projection_surfaces"
+            ).fetchall()
+        }
+
+
+def test_chat_index_projection_applies_source_changes_incrementally(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    hub_root = tmp_path / "hub"
+    for thread_id in ("thread-a", "thread-b", "thread-c"):
+        _seed_thread(hub_root, thread_id=thread_id)
+    service = ChatSurfaceReadService(hub_root, durable=False)
+    rebuilt = service.rebuild_chat_index_projection()
+
+    with open_orchestration_sqlite(hub_root, durable=False, migrate=True) as conn:
+        conn.execute("""
+            UPDATE orch_thread_targets
+               SET runtime_status = 'running',
+                   updated_at = '2026-05-11T00:00:30Z'
+             WHERE thread_target_id = 'thread-b'
+            """)
+    SQLiteChatSurfaceEventJournal(hub_root, durable=False).append_event(
+        idempotency_key="discord-bound-thread-c",
+        event_type="surface.bound",
+        surface_kind="discord",
+        surface_key="channel-c",
+        managed_thread_id="thread-c",
+        status="bound",
+        occurred_at="2026-05-11T00:00:40Z",
+    )
+    status = service.chat_index_projection_status()
+    assert status["needs_rebuild"] is False
+    assert status["needs_refresh"] is True
+    assert status["pending_events"] == 1
+    assert status["pending_changes"] >= 1
+
+    scopes = []
+    projected_surfaces = service._projected_surfaces
+
+    def record_projected_surfaces(*, limit, scope=None):
+        assert scope is not None, "incremental refresh must not reproject all rows"
+        scopes.append(scope)
+        return projected_surfaces(limit=limit, scope=scope)
+
+    monkeypatch.setattr(service, "_projected_surfaces", record_projected_surfaces)
+    active = service.chat_index_snapshot(view="active", limit=20)
+    monkeypatch.undo()
+
+    assert [row["managed_thread_id"] for row in active["rows"]] == ["thread-b"]
+    assert len(scopes) == 1
+    assert scopes[0].thread_ids == frozenset({"thread-b", "thread-c"})
+    assert service.latest_chat_index_projection_revision() == (
+        rebuilt["projection_revision"] + 1
+    )
+    status = service.chat_index_projection_status()
+    assert status["needs_refresh"] is False
+    assert status["pending_events"] == 0
+    assert status["pending_changes"] == 0
+
+    incremental_rows = _projection_rows_by_id(hub_root)
+    service.rebuild_chat_index_projection()
+    assert _projection_rows_by_id(hub_root) == incremental_rows
+
+
+def test_chat_index_projection_rebind_refreshes_previous_thread_row(
+    tmp_path: Path,
+) -> None:
+    hub_root = tmp_path / "hub"
+    _seed_thread(hub_root, thread_id="thread-old")
+    _seed_thread(hub_root, thread_id="thread-new")
+    bindings = OrchestrationBindingStore(hub_root, durable=False)
+    binding = bindings.upsert_binding(
+        surface_kind="discord",
+        surface_key="channel-1",
+        thread_target_id="thread-old",
+        metadata={"display_name": "discord chat"},
+    )
+    service = ChatSurfaceReadService(hub_root, durable=False)
+    service.rebuild_chat_index_projection()
+    assert ("discord", "channel-1", "thread:thread-old") in _projection_surface_rows(
+        hub_root
+    )
+
+    bindings.disable_binding(binding_id=binding.binding_id)
+    bindings.upsert_binding(
+        surface_kind="discord",
+        surface_key="channel-1",
+        thread_target_id="thread-new",
+        metadata={"display_name": "discord chat"},
+    )
+    rows = service.chat_index_snapshot(view="all", surface_kind="discord", limit=20)[
+        "rows"
+    ]
+
+    assert [row["managed_thread_id"] for row in rows] == ["thread-new"]
+    memberships = _projection_surface_rows(hub_root)
+    assert ("discord", "channel-1", "thread:thread-new") in memberships
+    assert ("discord", "channel-1", "thread:thread-old") not in memberships
+
+    incremental_rows = _projection_rows_by_id(hub_root)
+    service.rebuild_chat_index_projection()
+    assert _projection_rows_by_id(hub_root) == incremental_rows
+
+
+def test_chat_index_projection_refreshes_rows_when_ticket_file_changes(
+    tmp_path: Path,
+) -> None:
+    hub_root = tmp_path / "hub"
+    repo_root = tmp_path / "repo"
+    ticket_path = repo_root / ".codex-autorunner" / "tickets" / "TICKET-001.md"
+    _write_ticket(ticket_path, done=False)
+    _seed_thread(
+        hub_root,
+        thread_id="ticket-thread",
+        metadata={
+            "flow_type": "ticket_flow",
+            "run_id": "run-1",
+            "ticket_id": "TICKET-001",
+            "ticket_path": str(ticket_path),
+            "workspace_root": str(repo_root),
+        },
+    )
+    service = ChatSurfaceReadService(hub_root, durable=False)
+    service.rebuild_chat_index_projection()
+    assert (
+        service.chat_index_snapshot(view="all", limit=20)["rows"][0]["ticket_done"]
+        is False
+    )
+
+    _write_ticket(ticket_path, done=True)
+    row = service.chat_index_snapshot(view="all", limit=20)["rows"][0]
+
+    assert row["ticket_done"] is True
+    assert row["ticket_status"] == "done"
+
+
+def test_chat_index_projection_idle_poll_skips_projection_writes(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    hub_root = tmp_path / "hub"
+    _seed_thread(hub_root, thread_id="thread-idle")
+    service = ChatSurfaceReadService(hub_root, durable=False)
+    service.rebuild_chat_index_projection()
+    revision = service.latest_chat_index_projection_revision()
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("an idle poll must not touch the projection")
+
+    monkeypatch.setattr(service, "rebuild_chat_index_projection", fail)
+    monkeypatch.setattr(service, "_apply_chat_index_projection_delta", fail)
+
+    for _ in range(3):
+        rows = service.chat_index_snapshot(view="all", limit=20)["rows"]
+        assert [row["managed_thread_id"] for row in rows] == ["thread-idle"]
+    assert service.latest_chat_index_projection_revision() == revision
+
+
+def test_chat_index_search_ranks_prefix_matches_with_highlighted_snippets(
+    tmp_path: Path,
+) -> None:
+    hub_root = tmp_path / "hub"
+    _seed_thread(
+        hub_root,
+        thread_id="thread-preview",
+        display_name="Refactor scheduler",
+        last_message_preview="Investigating the checkout flake in CI",
+        updated_at="2026-05-11T00:00:30Z",
+    )
+    _seed_thread(
+        hub_root,
+        thread_id="thread-title",
+        display_name="Checkout flake triage",
+        last_message_preview="Reran the suite",
+        updated_at="2026-05-11T00:00:10Z",
+    )
+    _seed_thread(
+        hub_root,
+        thread_id="thread-other",
+        display_name="Docs cleanup",
+        last_message_preview="Nothing to see",
+    )
+    service = ChatSurfaceReadService(hub_root, durable=False)
+
+    search = service.chat_index_snapshot(query="check fla", limit=20)
+
+    assert [row["managed_thread_id"] for row in search["rows"]] == [
+        "thread-title",
+        "thread-preview",
+    ]
+    assert search["window"]["total_count"] == 2
+    title_match = search["rows"][0]["search_match"]
+    assert title_match["column"] == "title"
+    assert [
+        segment["text"] for segment in title_match["snippet"] if segment["match"]
+    ] == ["Checkout", "flake"]
+    preview_match = search["rows"][1]["search_match"]
+    assert preview_match["column"] == "preview"
+    assert "".join(segment["text"] for segment in preview_match["snippet"]) == (
+        "Investigating the checkout flake in CI"
+    )
+
+
+def test_chat_index_search_index_follows_incremental_projection_updates(
+    tmp_path: Path,
+) -> None:
+    hub_root = tmp_path / "hub"
+    _seed_thread(hub_root, thread_id="thread-a", display_name="Alpha release")
+    service = ChatSurfaceReadService(hub_root, durable=False)
+    assert [
+        row["managed_thread_id"]
+        for row in service.chat_index_snapshot(query="alpha", limit=20)["rows"]
+    ] == ["thread-a"]
+
+    with open_orchestration_sqlite(hub_root, durable=False, migrate=True) as conn:
+        conn.execute("""
+            UPDATE orch_thread_targets
+               SET display_name = 'Beta release'
+             WHERE thread_target_id = 'thread-a'
+            """)
+
+    assert service.chat_index_snapshot(query="alpha", limit=20)["rows"] == []
+    assert [
+        row["managed_thread_id"]
+        for row in service.chat_index_snapshot(query="beta", limit=20)["rows"]
+    ] == ["thread-a"]
+    with open_orchestration_sqlite(hub_root, durable=False, migrate=True) as conn:
+        fts_rows = conn.execute(
+            "SELECT COUNT(*) AS row_count FROM orch_chat_index_projection_fts"
+        ).fetchone()
+        projection_rows = conn.execute(
+            "SELECT COUNT(*) AS row_count FROM orch_chat_index_projection"
+        ).fetchone()
+    assert fts_rows["row_count"] == projection_rows["row_count"]
+
+
 def test_chat_index_snapshot_repairs_missing_facet_projection_columns(
     tmp_path: Path,
 ) -> None:
@@ -2042,7 +2294,7 @@ def test_chat_index_snapshot_repairs_missing_facet_projection_columns(
             """).fetchone()["value"]
 
     assert set(facet_columns).issubset(columns)
-    assert stored_schema_version == "chat.index.projection.facets.v1"
+    assert stored_schema_version == "chat.index.projection.fts.v1"
 
 
 def test_chat_index_rebuild_repairs_stale_archived_bound_surface_projection(
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import dataclasses
 import gzip
 import json
 from pathlib import Path
 
 import pytest
 
+from codex_autorunner.core.orchestration import cold_trace_store
 from codex_autorunner.core.orchestration.cold_trace_store import (
     ColdTraceReader,
     ColdTraceStore,
     ColdTraceWriter,
+    cold_trace_index_path,
 )
 from codex_autorunner.core.orchestration.execution_history import (
     ExecutionCheckpoint,
@@ -69,8 +72,8 @@ class TestColdTraceWriter:
         assert manifest.execution_id == execution_id
         assert manifest.event_count == 2
         assert manifest.status == "finalized"
-        assert manifest.trace_format == "gzipped_jsonl"
-        assert manifest.schema_version == 1
+        assert manifest.trace_format == "gzipped_jsonl_blocks"
+        assert manifest.schema_version == 2
         assert "tool_call" in manifest.includes_families
         assert "output_delta" in manifest.includes_families
         assert manifest.byte_count > 0
@@ -229,6 +232,146 @@ class TestColdTraceReader:
         assert events[0]["seq"] == 1
         assert events[2]["seq"] == 3
 
+    def test_read_events_seeks_to_indexed_block(
+        self, hub_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _init_orchestration_db(hub_root)
+        monkeypatch.setattr(cold_trace_store, "_TRACE_BLOCK_MAX_EVENTS", 4)
+        with ColdTraceWriter(hub_root=hub_root, execution_id="exec-blocks") as writer:
+            for i in range(10):
+                writer.append(
+                    event_family="output_delta",
+                    event_type="OutputDelta",
+                    payload={"content": f"chunk-{i}"},
+                )
+            manifest = writer.finalize()
+
+        artifact_path = resolve_hub_traces_root(hub_root) / manifest.artifact_relpath
+        index = [
+            json.loads(line)
+            for line in cold_trace_index_path(artifact_path).read_text().splitlines()
+        ]
+        assert [(entry["first_seq"], entry["last_seq"]) for entry in index] == [
+            (1, 4),
+            (5, 8),
+            (9, 10),
+        ]
+        with gzip.open(artifact_path, "rt", encoding="utf-8") as f:
+            assert len([line for line in f if line.strip()]) == 10
+
+        read_offsets: list[int] = []
+        real_segment = cold_trace_store._iter_trace_segment
+
+        def _recording_segment(path: Path, **kwargs):
+            read_offsets.append(kwargs["offset"])
+            return real_segment(path, **kwargs)
+
+        monkeypatch.setattr(cold_trace_store, "_iter_trace_segment", _recording_segment)
+        events = ColdTraceReader.read_events(hub_root, manifest, offset=5, limit=2)
+
+        assert [event["seq"] for event in events] == [6, 7]
+        assert read_offsets == [index[1]["offset"]]
+
+    def test_open_trace_tails_without_rereading_closed_blocks(
+        self, hub_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _init_orchestration_db(hub_root)
+        monkeypatch.setattr(cold_trace_store, "_TRACE_BLOCK_MAX_EVENTS", 3)
+        store = ColdTraceStore(hub_root)
+        writer = ColdTraceWriter(hub_root=hub_root, execution_id="exec-tail").open()
+        try:
+            for i in range(7):
+                writer.append(
+                    event_family="output_delta",
+                    event_type="OutputDelta",
+                    payload={"content": f"chunk-{i}"},
+                )
+            manifest = store.get_manifest("exec-tail")
+            assert manifest is not None
+            assert manifest.event_count == 7
+
+            read_offsets: list[int] = []
+            real_segment = cold_trace_store._iter_trace_segment
+
+            def _recording_segment(path: Path, **kwargs):
+                read_offsets.append(kwargs["offset"])
+                return real_segment(path, **kwargs)
+
+            monkeypatch.setattr(
+                cold_trace_store, "_iter_trace_segment", _recording_segment
+            )
+            tail = ColdTraceReader.read_events(hub_root, manifest, offset=6)
+            assert [event["seq"] for event in tail] == [7]
+            assert len(read_offsets) == 1
+
+            writer.append(
+                event_family="run_notice",
+                event_type="RunNotice",
+                payload={"kind": "info"},
+            )
+            tail = ColdTraceReader.read_events(hub_root, manifest, offset=7)
+            assert [event["seq"] for event in tail] == [8]
+        finally:
+            writer.close()
+
+    def test_reads_legacy_single_stream_traces(self, hub_root: Path) -> None:
+        artifact_path = (
+            resolve_hub_traces_root(hub_root) / "exec-legacy/legacy.trace.jsonl.gz"
+        )
+        artifact_path.parent.mkdir(parents=True)
+        with gzip.open(artifact_path, "wt", encoding="utf-8") as f:
+            for seq in range(1, 6):
+                f.write(json.dumps({"seq": seq, "event_family": "tool_call"}) + "\n")
+        manifest = ExecutionTraceManifest(
+            trace_id="legacy",
+            execution_id="exec-legacy",
+            artifact_relpath="exec-legacy/legacy.trace.jsonl.gz",
+            trace_format="gzipped_jsonl",
+            event_count=5,
+            status="finalized",
+        )
+
+        events = ColdTraceReader.read_events(hub_root, manifest, offset=3)
+        assert [event["seq"] for event in events] == [4, 5]
+        open_manifest = dataclasses.replace(manifest, status="open")
+        events = ColdTraceReader.read_events(hub_root, open_manifest, offset=1, limit=2)
+        assert [event["seq"] for event in events] == [2, 3]
+
+    def test_reopened_writer_indexes_block_left_by_crashed_writer(
+        self, hub_root: Path
+    ) -> None:
+        _init_orchestration_db(hub_root)
+        crashed = ColdTraceWriter(
+            hub_root=hub_root, execution_id="exec-crash", trace_id="trace-crash"
+        ).open()
+        for i in range(3):
+            crashed.append(
+                event_family="output_delta",
+                event_type="OutputDelta",
+                payload={"content": f"before-{i}"},
+            )
+        # Drop the open gzip member without writing its trailer or index entry.
+        assert crashed._file is not None
+        crashed._block = None
+        crashed._file.close()
+        crashed._file = None
+
+        with ColdTraceWriter(
+            hub_root=hub_root, execution_id="exec-crash", trace_id="trace-crash"
+        ) as writer:
+            writer.append(
+                event_family="output_delta",
+                event_type="OutputDelta",
+                payload={"content": "after"},
+            )
+            manifest = writer.finalize()
+
+        events = ColdTraceReader.read_events(hub_root, manifest, offset=2)
+        assert [event["payload"]["content"] for event in events] == [
+            "before-2",
+            "after",
+        ]
+
 
 class TestColdTraceStore:
     def test_write_read_roundtrip(self, store: ColdTraceStore) -> None:
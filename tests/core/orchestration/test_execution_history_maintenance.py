@@ -22,9 +22,11 @@ from codex_autorunner.core.orchestration.execution_history_maintenance import (
     compact_completed_execution_history,
     execution_history_database_size_bytes,
     export_execution_history_bundle,
+    incremental_vacuum_execution_history,
     prune_execution_history_retention,
     resolve_execution_history_maintenance_policy,
     run_execution_history_housekeeping_once,
+    vacuum_execution_history,
 )
 from codex_autorunner.core.orchestration.sqlite import (
     initialize_orchestration_sqlite,
@@ -696,6 +698,147 @@ def test_prune_execution_history_retention_clears_checkpoint_trace_manifest_json
     assert checkpoint.trace_manifest_id is None
 
 
+def test_prune_execution_history_retention_resumes_from_persisted_cursor(
+    tmp_path: Path,
+) -> None:
+    hub_root = tmp_path / "hub"
+    hub_root.mkdir()
+    for idx in range(3):
+        _seed_execution(
+            hub_root,
+            execution_id=f"exec-old-{idx}",
+            started_at=f"2000-01-0{idx + 1}T00:00:00Z",
+            finished_at=f"2000-01-0{idx + 1}T00:05:00Z",
+            output_chunks=2,
+        )
+    _seed_execution(hub_root, execution_id="exec-new", output_chunks=2)
+    policy = ExecutionHistoryMaintenancePolicy(
+        hot_history_retention_days=30,
+        cold_trace_retention_days=10_000,
+    )
+
+    first = prune_execution_history_retention(
+        hub_root, policy=policy, batch_size=2, time_budget_seconds=0
+    )
+    assert first.complete is False
+    assert first.resumed_from_cursor is False
+    assert first.pruned_execution_ids == ("exec-old-0", "exec-old-1")
+    assert [item.executions_scanned for item in first.slices] == [2]
+    assert first.slices[0].cursor_execution_id == "exec-old-1"
+
+    second = prune_execution_history_retention(
+        hub_root, policy=policy, batch_size=2, time_budget_seconds=0
+    )
+    assert second.complete is True
+    assert second.resumed_from_cursor is True
+    assert second.pruned_execution_ids == ("exec-old-2",)
+    assert second.hot_rows_deleted == second.slices[0].hot_rows_deleted > 0
+
+    third = prune_execution_history_retention(hub_root, policy=policy)
+    assert third.resumed_from_cursor is False
+    assert third.pruned_execution_ids == ()
+    assert third.hot_rows_deleted == 0
+
+    with open_orchestration_sqlite(hub_root, durable=False) as conn:
+        remaining = {str(row["execution_id"]) for row in conn.execute("""
+                SELECT DISTINCT execution_id
+                  FROM orch_event_projections
+                 WHERE event_family = 'turn.timeline'
+                """).fetchall()}
+    assert remaining == {"exec-new"}
+
+
+def test_prune_execution_history_retention_clears_cursor_after_full_pass(
+    tmp_path: Path,
+) -> None:
+    hub_root = tmp_path / "hub"
+    hub_root.mkdir()
+    for idx in range(3):
+        _seed_execution(
+            hub_root,
+            execution_id=f"exec-old-{idx}",
+            started_at=f"2000-01-0{idx + 1}T00:00:00Z",
+            finished_at=f"2000-01-0{idx + 1}T00:05:00Z",
+            output_chunks=2,
+        )
+    policy = ExecutionHistoryMaintenancePolicy(
+        hot_history_retention_days=30,
+        cold_trace_retention_days=10_000,
+    )
+    cursor_path = maintenance_module._retention_cursor_path(hub_root)
+
+    first = prune_execution_history_retention(
+        hub_root, policy=policy, batch_size=2, time_budget_seconds=0
+    )
+    assert first.complete is False
+    assert cursor_path.exists()
+
+    # A terminal execution without finished_at is keyed by started_at, which
+    # sorts below the saved cursor.
+    _seed_execution(
+        hub_root,
+        execution_id="exec-late",
+        status="failed",
+        started_at="2000-01-01T12:00:00Z",
+        finished_at="2000-01-01T12:05:00Z",
+        output_chunks=2,
+    )
+    with open_orchestration_sqlite(hub_root, durable=False) as conn:
+        with conn:
+            conn.execute("""
+                UPDATE orch_thread_executions
+                   SET finished_at = NULL
+                 WHERE execution_id = 'exec-late'
+                """)
+
+    second = prune_execution_history_retention(
+        hub_root, policy=policy, batch_size=2, time_budget_seconds=0
+    )
+    assert second.complete is True
+    assert second.resumed_from_cursor is True
+    assert second.pruned_execution_ids == ("exec-old-2",)
+    assert not cursor_path.exists()
+
+    third = prune_execution_history_retention(hub_root, policy=policy)
+    assert third.resumed_from_cursor is False
+    assert third.pruned_execution_ids == ("exec-late",)
+    assert not cursor_path.exists()
+
+
+def test_incremental_vacuum_reclaims_free_pages_in_slices(tmp_path: Path) -> None:
+    hub_root = tmp_path / "hub"
+    hub_root.mkdir()
+    _seed_execution(hub_root, execution_id="exec-vacuum", output_chunks=400)
+
+    deferred = incremental_vacuum_execution_history(hub_root, is_idle=lambda: False)
+    assert deferred.deferred is True
+    assert deferred.slices == ()
+
+    converted = incremental_vacuum_execution_history(hub_root)
+    assert converted.mode == "full"
+    with open_orchestration_sqlite(hub_root, durable=False) as conn:
+        assert int(conn.execute("PRAGMA auto_vacuum").fetchone()[0]) == 2
+        with conn:
+            conn.execute("DELETE FROM orch_event_projections")
+        free_pages = int(conn.execute("PRAGMA freelist_count").fetchone()[0])
+    assert free_pages > 4
+
+    partial = incremental_vacuum_execution_history(
+        hub_root, pages_per_slice=2, time_budget_seconds=0
+    )
+    assert partial.mode == "incremental"
+    assert partial.complete is False
+    assert [item.pages_freed for item in partial.slices] == [2]
+    assert partial.reclaimed_bytes == partial.slices[0].reclaimed_bytes > 0
+    assert partial.free_pages_remaining == free_pages - 2
+
+    rest = incremental_vacuum_execution_history(hub_root, pages_per_slice=free_pages)
+    assert rest.complete is True
+    assert rest.free_pages_remaining == 0
+    assert sum(item.pages_freed for item in rest.slices) == free_pages - 2
+    assert vacuum_execution_history(hub_root).mode == "full"
+
+
 def test_run_execution_history_housekeeping_once_runs_compaction_and_vacuum(
     tmp_path: Path,
 ) -> None:
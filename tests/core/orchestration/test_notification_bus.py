@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from codex_autorunner.core.orchestration.notification_bus import (
+    TOPIC_LIFECYCLE,
+    notification_bus_dir,
+    notification_bus_stats,
+    queue_topic,
+    ring,
+    subscribe,
+)
+
+
+def _sockets(hub_root: Path) -> list[Path]:
+    directory = notification_bus_dir(hub_root)
+    if not directory.exists():
+        return []
+    return sorted(directory.glob("*.sock"))
+
+
+def test_ring_dispatches_to_exact_and_prefix_subscribers(tmp_path: Path) -> None:
+    seen: list[tuple[str, str]] = []
+    unsubscribe_exact = subscribe(
+        tmp_path, TOPIC_LIFECYCLE, lambda topic: seen.append(("exact", topic))
+    )
+    unsubscribe_prefix = subscribe(
+        tmp_path, "queue:*", lambda topic: seen.append(("prefix", topic))
+    )
+    try:
+        ring(tmp_path, queue_topic("pma:default"))
+        ring(tmp_path, TOPIC_LIFECYCLE, "delivery")
+        ring(tmp_path / "other-hub", TOPIC_LIFECYCLE)
+    finally:
+        unsubscribe_exact()
+        unsubscribe_prefix()
+
+    assert seen == [("prefix", "queue:pma:default"), ("exact", TOPIC_LIFECYCLE)]
+
+
+def test_ring_from_another_process_wakes_subscriber(tmp_path: Path) -> None:
+    rung = threading.Event()
+    before = notification_bus_stats().datagrams_received
+    unsubscribe = subscribe(tmp_path, queue_topic("lane-1"), lambda _t: rung.set())
+    try:
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from pathlib import Path; "
+                "from codex_autorunner.core.orchestration.notification_bus "
+                "import ring; ring(Path(sys.argv[1]), 'queue:lane-1')",
+                str(tmp_path),
+            ],
+            check=True,
+            timeout=30,
+        )
+        assert rung.wait(timeout=5.0)
+    finally:
+        unsubscribe()
+
+    assert notification_bus_stats().datagrams_received > before
+
+
+def test_ring_removes_sockets_left_by_exited_processes(tmp_path: Path) -> None:
+    directory = notification_bus_dir(tmp_path)
+    directory.mkdir(parents=True, exist_ok=True)
+    stale_path = directory / "999999-deadbeef.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    stale.bind(str(stale_path))
+    stale.close()
+
+    ring(tmp_path, TOPIC_LIFECYCLE)
+
+    assert not stale_path.exists()
+
+
+def test_last_unsubscribe_releases_the_socket(tmp_path: Path) -> None:
+    first = subscribe(tmp_path, TOPIC_LIFECYCLE, lambda _t: None)
+    second = subscribe(tmp_path, queue_topic("lane-1"), lambda _t: None)
+    assert len(_sockets(tmp_path)) == 1
+
+    first()
+    assert len(_sockets(tmp_path)) == 1
+    second()
+    assert _sockets(tmp_path) == []
+
+
+@pytest.fixture
+def runtime_dir(monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    # pytest's tmp_path is too deep for AF_UNIX socket paths.
+    with tempfile.TemporaryDirectory(prefix="car-") as raw:
+        monkeypatch.setenv("XDG_RUNTIME_DIR", raw)
+        yield Path(raw)
+
+
+def test_subscribe_stays_in_process_when_base_dir_is_a_symlink(
+    tmp_path: Path, runtime_dir: Path
+) -> None:
+    hub_root = tmp_path / "hub"
+    planted = tmp_path / "planted"
+    planted.mkdir()
+    notification_bus_dir(hub_root).parent.symlink_to(planted)
+
+    seen: list[str] = []
+    unsubscribe = subscribe(hub_root, TOPIC_LIFECYCLE, seen.append)
+    try:
+        assert list(planted.iterdir()) == []
+        ring(hub_root, TOPIC_LIFECYCLE)
+    finally:
+        unsubscribe()
+
+    assert seen == [TOPIC_LIFECYCLE]
+
+
+def test_subscribe_tightens_a_loose_base_dir(tmp_path: Path, runtime_dir: Path) -> None:
+    hub_root = tmp_path / "hub"
+    base = notification_bus_dir(hub_root).parent
+    base.mkdir(mode=0o755)
+    base.chmod(0o755)
+
+    unsubscribe = subscribe(hub_root, TOPIC_LIFECYCLE, lambda _t: None)
+    try:
+        assert stat.S_IMODE(base.stat().st_mode) == 0o700
+        assert len(_sockets(hub_root)) == 1
+    finally:
+        unsubscribe()
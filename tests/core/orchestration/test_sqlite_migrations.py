@@ -1009,6 +1009,7 @@ def test_failed_migration_attempt_is_observable_without_schema_metadata(
         apply=_raise,
     )
     monkeypatch.setattr(migrations_module, "_MIGRATIONS", (failing_step,))
+    monkeypatch.setattr(migrations_module, "REGISTERED_MIGRATIONS", ())
     monkeypatch.setattr(migrations_module, "ORCHESTRATION_SCHEMA_VERSION", 1)
 
     with _connect(db_path) as conn:
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from codex_autorunner.core.orchestration.sqlite import (
+    collect_orchestration_control_plane_status,
+    open_orchestration_sqlite,
+    resolve_orchestration_sqlite_path,
+)
+from codex_autorunner.core.orchestration.sqlite_pool import OrchestrationSqlitePool
+
+
+def test_open_orchestration_sqlite_reuses_connection_and_skips_schema_probe(
+    tmp_path: Path,
+) -> None:
+    hub_root = tmp_path / "hub"
+    with open_orchestration_sqlite(hub_root, durable=False):
+        pass  # creates and migrates the database on a dedicated connection
+    with open_orchestration_sqlite(hub_root, durable=False) as first:
+        pass
+    before = collect_orchestration_control_plane_status(hub_root)["connection_pool"]
+
+    with open_orchestration_sqlite(hub_root, durable=False) as second:
+        assert second is first
+        assert second.row_factory is sqlite3.Row
+
+    after = collect_orchestration_control_plane_status(hub_root)["connection_pool"]
+    assert after["connections_reused_total"] > before["connections_reused_total"]
+    assert after["schema_check_skips_total"] > before["schema_check_skips_total"]
+    assert after["checkouts_total"] > before["checkouts_total"]
+
+
+def test_nested_and_cross_thread_checkouts_get_distinct_connections(
+    tmp_path: Path,
+) -> None:
+    hub_root = tmp_path / "hub"
+    seen: list[sqlite3.Connection] = []
+
+    def _open_in_thread() -> None:
+        with open_orchestration_sqlite(hub_root, durable=False) as conn:
+            seen.append(conn)
+
+    with open_orchestration_sqlite(hub_root, durable=False) as outer:
+        with open_orchestration_sqlite(hub_root, durable=False) as inner:
+            assert inner is not outer
+        thread = threading.Thread(target=_open_in_thread)
+        thread.start()
+        thread.join()
+
+    assert seen and seen[0] is not outer
+
+
+def test_pooled_connection_commits_and_rolls_back_like_open_sqlite(
+    tmp_path: Path,
+) -> None:
+    hub_root = tmp_path / "hub"
+    with open_orchestration_sqlite(hub_root, durable=False) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS pool_probe (value TEXT)")
+        conn.execute("INSERT INTO pool_probe (value) VALUES ('kept')")
+
+    with pytest.raises(RuntimeError):
+        with open_orchestration_sqlite(hub_root, durable=False) as conn:
+            conn.execute("INSERT INTO pool_probe (value) VALUES ('dropped')")
+            raise RuntimeError("boom")
+
+    with open_orchestration_sqlite(hub_root, durable=False) as conn:
+        assert not conn.in_transaction
+        rows = conn.execute("SELECT value FROM pool_probe").fetchall()
+    assert [row["value"] for row in rows] == ["kept"]
+
+
+def test_replaced_database_file_is_not_reused(tmp_path: Path) -> None:
+    hub_root = tmp_path / "hub"
+    with open_orchestration_sqlite(hub_root, durable=False):
+        pass
+    with open_orchestration_sqlite(hub_root, durable=False) as first:
+        first.execute("CREATE TABLE IF NOT EXISTS pool_probe (value TEXT)")
+    db_path = resolve_orchestration_sqlite_path(hub_root)
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+    with open_orchestration_sqlite(hub_root, durable=False) as second:
+        assert second is not first
+        tables = {
+            row["name"]
+            for row in second.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            ).fetchall()
+        }
+    assert "orch_schema_migrations" in tables
+    assert "pool_probe" not in tables
+
+
+def test_pool_closes_connections_beyond_idle_limit(tmp_path: Path) -> None:
+    pool = OrchestrationSqlitePool(max_idle_per_database=1)
+    db_path = tmp_path / "pool.sqlite3"
+
+    with pool.lease(db_path, durable=False, busy_timeout_ms=100) as outer:
+        with pool.lease(db_path, durable=False, busy_timeout_ms=100) as inner:
+            assert pool.stats().connections_in_use == 2
+    assert pool.stats().connections_open == 1
+
+    with pool.lease(db_path, durable=False, busy_timeout_ms=100) as lease:
+        assert lease.conn is outer.conn or lease.conn is inner.conn
+    pool.close_idle()
+    stats = pool.stats()
+    assert stats.connections_open == 0
+    assert stats.connections_opened_total == 2
+    assert stats.to_dict()["checkouts_total"] == 3
@@ -4,7 +4,12 @@ import asyncio
 
 import pytest
 
-from codex_autorunner.core.orchestration.turn_event_buffer import TurnEventBuffer
+from codex_autorunner.core.orchestration import turn_event_buffer
+from codex_autorunner.core.orchestration.turn_event_buffer import (
+    TURN_EVENT_GAP_TYPE,
+    TurnEventBuffer,
+    is_turn_event_gap,
+)
 
 
 @pytest.mark.asyncio
@@ -141,3 +146,77 @@ async def test_turn_event_buffer_append_copies_event_dict() -> None:
     await buf.append(original)
     original["k"] = 99
     assert buf.snapshot() == [{"k": 1}]
+
+
+@pytest.mark.asyncio
+async def test_turn_event_buffer_bounded_ring_spills_evicted_events() -> None:
+    spilled: list[dict] = []
+    buf = TurnEventBuffer(max_events=3, spill=spilled.append)
+    for idx in range(1, 8):
+        await buf.append({"id": idx})
+
+    assert buf.snapshot() == [{"id": 5}, {"id": 6}, {"id": 7}]
+    assert spilled == [{"id": idx} for idx in range(1, 5)]
+    assert buf.evicted_count == 4
+    assert buf.snapshot(after_id=4, limit=2) == [{"id": 5}, {"id": 6}]
+    assert buf.snapshot(after_id=6) == [{"id": 7}]
+    await buf.close()
+    assert [e async for e in buf.tail()] == [{"id": 5}, {"id": 6}, {"id": 7}]
+
+
+@pytest.mark.asyncio
+async def test_turn_event_buffer_compacts_evicted_slots(monkeypatch) -> None:
+    monkeypatch.setattr(turn_event_buffer, "_COMPACT_MIN_EVICTED", 4)
+    buf = TurnEventBuffer(max_events=4)
+    for idx in range(1, 101):
+        await buf.append({"id": idx})
+
+    assert len(buf._events) <= 8
+    assert buf.snapshot(after_id=98) == [{"id": 99}, {"id": 100}]
+    assert buf.snapshot(limit=1) == [{"id": 100}]
+
+
+@pytest.mark.asyncio
+async def test_turn_event_buffer_readers_share_buffered_payloads() -> None:
+    buf = TurnEventBuffer()
+    await buf.append({"id": 1, "text": "hello"})
+    await buf.close()
+
+    tailed = [e async for e in buf.tail()]
+    assert buf.snapshot()[0] is buf.snapshot(after_id=0)[0]
+    assert tailed[0] is buf.snapshot()[0]
+
+
+@pytest.mark.asyncio
+async def test_turn_event_buffer_filters_out_of_order_ids_without_bisect() -> None:
+    buf = TurnEventBuffer()
+    for event_id in (5, 2, 7, 3):
+        await buf.append({"id": event_id})
+
+    assert buf.snapshot(after_id=4) == [{"id": 5}, {"id": 7}]
+
+
+@pytest.mark.asyncio
+async def test_turn_event_buffer_tail_skips_events_evicted_while_reading() -> None:
+    buf = TurnEventBuffer(max_events=2)
+    reader = buf.tail()
+    await buf.append({"id": 1})
+    assert await reader.__anext__() == {"id": 1}
+    for idx in range(2, 6):
+        await buf.append({"id": idx})
+    await buf.close()
+
+    assert [e async for e in reader] == [{"id": 4}, {"id": 5}]
+
+
+@pytest.mark.asyncio
+async def test_turn_event_buffer_snapshot_marks_gap_for_evicted_cursor() -> None:
+    buf = TurnEventBuffer(max_events=3)
+    for idx in range(1, 8):
+        await buf.append({"id": idx})
+
+    gap = {"type": TURN_EVENT_GAP_TYPE, "after_id": 2, "evicted_count": 4}
+    assert buf.snapshot(after_id=2, limit=2) == [gap, {"id": 5}, {"id": 6}]
+    assert is_turn_event_gap(buf.snapshot(after_id=2)[0])
+    assert not any(is_turn_event_gap(event) for event in buf.snapshot(after_id=4))
+    assert not any(is_turn_event_gap(event) for event in buf.snapshot())
@@ -7,6 +7,7 @@ from codex_autorunner.core.automation import (
     AutomationStore,
     render_template,
 )
+from codex_autorunner.core.automation.engine import compile_template
 from codex_autorunner.core.automation.models import (
     EXECUTOR_AGENT_TASK_TURN,
     TARGET_POLICY_HUB,
@@ -200,3 +201,73 @@ def test_rule_engine_rejects_non_matching_event_type_and_filter(tmp_path) -> Non
 
     assert result.matched_rules == 0
     assert store.list_jobs() == []
+
+
+def test_compiled_template_matches_render_template() -> None:
+    template = {
+        "message": "PR {{ pr.number }} by {{ event.payload.author }}",
+        "labels": ["{{ repo.repo_id }}", 3, None],
+        "plain": "no placeholders",
+        "nested": {"pr": "{{ pr }}"},
+    }
+    context = {
+        "event": {"payload": {"author": "dev"}},
+        "repo": {"repo_id": "repo-1"},
+        "pr": {"number": 42},
+    }
+
+    rendered = compile_template(template)(context)
+
+    assert rendered == render_template(template, context)
+    assert rendered["nested"] == {"pr": '{"number":42}'}
+    assert compile_template(template)(context) is not rendered
+
+
+def test_rule_index_buckets_rules_and_tracks_rule_edits(tmp_path) -> None:
+    store = AutomationStore(tmp_path)
+    for index in range(20):
+        store.upsert_rule(
+            _rule(
+                rule_id=f"rule-{index:02d}",
+                filters={"repo_id": f"repo-{index}"},
+                policy={"dedupe_key": "{{ event.event_id }}:{{ metadata.rule }}"},
+                metadata={"rule": index},
+            )
+        )
+    store.upsert_rule(
+        _rule(
+            rule_id="rule-author",
+            trigger={
+                "event_types": [
+                    "scm.github.pull_request.opened",
+                    "scm.github.pull_request_review.submitted",
+                ]
+            },
+            filters={"author": {"in": ["dev"]}},
+            policy={"dedupe_key": "any:{{ event.event_id }}"},
+        )
+    )
+    engine = AutomationRuleEngine(store)
+
+    first = engine.record_event_and_enqueue_jobs(_event("event-1"))
+
+    assert first.matched_rules == 2
+    assert sorted(job.rule_id for job in store.list_jobs()) == [
+        "rule-01",
+        "rule-author",
+    ]
+    assert store.list_jobs(rule_id="rule-01")[0].dedupe_key == "event-1:1"
+
+    store.set_rule_enabled("rule-01", False)
+    store.upsert_rule(_rule(rule_id="rule-new", policy={"dedupe_key": "new"}))
+    with open_orchestration_sqlite(tmp_path) as conn:
+        with conn:
+            conn.execute(
+                "UPDATE orch_automation_rules SET enabled = 0 WHERE rule_id = ?",
+                ("rule-author",),
+            )
+
+    second = engine.record_event_and_enqueue_jobs(_event("event-2"))
+
+    assert second.matched_rules == 1
+    assert store.list_jobs(rule_id="rule-new")[0].dedupe_key == "new"
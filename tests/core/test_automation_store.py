@@ -11,6 +11,8 @@ from codex_autorunner.core.automation import (
     AutomationRule,
     AutomationSchedule,
     AutomationStore,
+    add_job_enqueued_listener,
+    remove_job_enqueued_listener,
 )
 from codex_autorunner.core.automation.models import (
     AUTOMATION_CHILD_KIND_AGENT_TASK,
@@ -357,6 +359,68 @@ def test_claim_next_job_leaves_concurrency_to_worker(tmp_path) -> None:
     assert store.count_active_jobs(rule_id="rule-1") == 2
 
 
+def test_claim_jobs_claims_a_batch_and_reports_queue_metrics(tmp_path) -> None:
+    store = AutomationStore(tmp_path)
+    store.upsert_rule(_rule())
+    store.record_event(_event())
+    enqueued: list[str] = []
+
+    def _listener(job: AutomationJob) -> None:
+        enqueued.append(job.job_id)
+
+    add_job_enqueued_listener(_listener)
+    try:
+        for index, available_at in enumerate(
+            [
+                "2026-01-01T00:00:00Z",
+                "2026-01-01T00:01:00Z",
+                "2026-01-01T00:02:00Z",
+                "2026-01-01T01:00:00Z",
+            ]
+        ):
+            store.enqueue_job(
+                AutomationJob.create(
+                    job_id=f"job-{index}",
+                    rule_id="rule-1",
+                    event_id="event-1",
+                    dedupe_key="dedupe-0" if index == 0 else f"dedupe-{index}",
+                    available_at=available_at,
+                    target={"repo_id": "repo-1"},
+                    executor={"kind": LEGACY_EXECUTOR_MANAGED_THREAD_TURN},
+                )
+            )
+        store.enqueue_job(
+            AutomationJob.create(
+                job_id="job-dup",
+                rule_id="rule-1",
+                event_id="event-1",
+                dedupe_key="dedupe-0",
+                target={"repo_id": "repo-1"},
+                executor={"kind": LEGACY_EXECUTOR_MANAGED_THREAD_TURN},
+            )
+        )
+    finally:
+        remove_job_enqueued_listener(_listener)
+
+    assert enqueued == ["job-0", "job-1", "job-2", "job-3"]
+    metrics = store.queue_metrics(now="2026-01-01T00:05:00Z")
+    assert metrics.due_pending == 3
+    assert metrics.scheduled_pending == 1
+    assert metrics.oldest_due_age_seconds == 300.0
+
+    claimed = store.claim_jobs(limit=2, lock_key="worker", now="2026-01-01T00:05:00Z")
+
+    assert [job.job_id for job in claimed] == ["job-0", "job-1"]
+    assert {job.state for job in claimed} == {JOB_CLAIMED}
+    store.start_job("job-0", now="2026-01-01T00:05:00Z")
+    store.complete_job("job-0", now="2026-01-01T00:06:00Z")
+    metrics = store.queue_metrics(now="2026-01-01T00:10:00Z", window_seconds=600)
+    assert metrics.due_pending == 1
+    assert metrics.active == 1
+    assert metrics.finished_in_window == 1
+    assert metrics.to_dict()["jobs_per_minute"] == 0.1
+
+
 def test_release_stale_claims_recovers_claimed_and_running_jobs(tmp_path) -> None:
     store = AutomationStore(tmp_path)
     store.upsert_rule(_rule())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+
 from codex_autorunner.core.automation import (
     AutomationEvent,
     AutomationExecutorRegistry,
@@ -56,6 +58,15 @@ class _FailOnceExecutor:
         return AutomationExecutorResult(summary="recovered")
 
 
+class _BarrierExecutor:
+    def __init__(self, parties: int) -> None:
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def execute(self, job):
+        self.barrier.wait()
+        return AutomationExecutorResult(summary=f"ok:{job.job_id}")
+
+
 def _store_with_rule_and_event(tmp_path) -> AutomationStore:
     store = AutomationStore(tmp_path)
     store.upsert_rule(
@@ -374,3 +385,45 @@ def test_worker_unblocks_when_blocker_child_edge_becomes_terminal(tmp_path) -> N
     assert pending.blocked_by_job_id is None
     assert pending.blocked_reason is None
     assert pending.blocked_at is None
+
+
+def test_worker_pool_executes_batch_claims_in_parallel(tmp_path) -> None:
+    store = _store_with_rule_and_event(tmp_path)
+    policy = {"max_concurrent_per_rule": 3, "max_concurrent_per_target": 3}
+    for index in range(3):
+        store.enqueue_job(
+            _job(f"job-{index}", dedupe_key=f"job-{index}", policy=policy)
+        )
+    registry = AutomationExecutorRegistry()
+    registry.register(LEGACY_EXECUTOR_MANAGED_THREAD_TURN, _BarrierExecutor(3))
+
+    result = AutomationJobWorker(store, registry, max_workers=3).process_once(
+        now="2026-01-01T00:00:00Z"
+    )
+
+    assert result.claimed == 3
+    assert result.succeeded == 3
+    assert {job.state for job in store.list_jobs()} == {JOB_SUCCEEDED}
+
+
+def test_worker_pool_defers_batch_mates_beyond_rule_concurrency(tmp_path) -> None:
+    store = _store_with_rule_and_event(tmp_path)
+    policy = {"max_concurrent_per_rule": 1, "max_concurrent_per_target": 1}
+    for index in range(2):
+        store.enqueue_job(
+            _job(f"job-{index}", dedupe_key=f"job-{index}", policy=policy)
+        )
+    registry = AutomationExecutorRegistry()
+    registry.register(LEGACY_EXECUTOR_MANAGED_THREAD_TURN, _RunningExecutor())
+
+    result = AutomationJobWorker(store, registry, max_workers=2).process_once(
+        now="2026-01-01T00:00:00Z"
+    )
+
+    assert result.claimed == 2
+    assert result.running == 1
+    assert result.skipped == 1
+    deferred = store.get_job("job-1")
+    assert store.get_job("job-0").state == JOB_RUNNING
+    assert deferred.state == JOB_PENDING
+    assert deferred.blocked_by_job_id == "job-0"
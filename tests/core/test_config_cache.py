@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+import yaml
+
+from codex_autorunner.bootstrap import seed_hub_files
+from codex_autorunner.core.config import (
+    REPO_OVERRIDE_FILENAME,
+    clear_config_cache,
+    config_cache_stats,
+    load_hub_config,
+    load_repo_config,
+)
+
+
+def _backdate(root: Path) -> None:
+    past = time.time() - 60
+    for path in root.rglob("*"):
+        if path.is_file():
+            os.utime(path, (past, past))
+
+
+@pytest.fixture
+def settled_hub(tmp_path: Path) -> Iterator[tuple[Path, Path]]:
+    clear_config_cache()
+    seed_hub_files(tmp_path)
+    repo_root = tmp_path / "repos" / "demo"
+    (repo_root / ".git").mkdir(parents=True)
+    (repo_root / ".codex-autorunner").mkdir()
+    _backdate(tmp_path)
+    yield tmp_path, repo_root
+    clear_config_cache()
+
+
+def test_repeat_loads_hit_the_cache_and_return_private_copies(
+    settled_hub: tuple[Path, Path],
+) -> None:
+    hub_root, repo_root = settled_hub
+
+    first = load_repo_config(repo_root)
+    first.raw["runner"]["sleep_seconds"] = 999
+    second = load_repo_config(repo_root)
+    hub = load_hub_config(hub_root)
+
+    assert load_hub_config(hub_root) == hub
+
+    stats = config_cache_stats()
+    # One hub, manifest, and repo build each; everything else is a hit.
+    assert stats.misses == 3
+    assert stats.hits == 4
+    assert second is not first
+    assert second.raw["runner"]["sleep_seconds"] != 999
+    assert hub.root == hub_root.resolve()
+
+
+def test_editing_a_source_invalidates_only_dependent_entries(
+    settled_hub: tuple[Path, Path],
+) -> None:
+    hub_root, repo_root = settled_hub
+    load_repo_config(repo_root)
+
+    override = repo_root / REPO_OVERRIDE_FILENAME
+    override.write_text(
+        yaml.safe_dump({"runner": {"sleep_seconds": 42}}), encoding="utf-8"
+    )
+    _backdate(repo_root)
+    reloaded = load_repo_config(repo_root)
+
+    assert reloaded.runner_sleep_seconds == 42
+    stats = config_cache_stats()
+    # The hub and manifest entries are reused; only the repo is rebuilt.
+    assert stats.misses == 4
+    assert stats.hits == 2
+
+
+def test_recently_modified_sources_are_not_cached(tmp_path: Path) -> None:
+    clear_config_cache()
+    seed_hub_files(tmp_path)
+
+    load_hub_config(tmp_path)
+    load_hub_config(tmp_path)
+
+    stats = config_cache_stats()
+    assert stats.hits == 0
+    assert stats.uncacheable == 2
+    clear_config_cache()
+
+
+def test_environment_overrides_are_part_of_the_key(
+    settled_hub: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    hub_root, _repo_root = settled_hub
+    monkeypatch.setenv("CAR_CODEX_APP_SERVER_COMMAND", "codex-env app-server")
+    from_env = load_hub_config(hub_root)
+    monkeypatch.delenv("CAR_CODEX_APP_SERVER_COMMAND")
+    default = load_hub_config(hub_root)
+
+    assert from_env.app_server.command != default.app_server.command
+    assert config_cache_stats().hits == 0
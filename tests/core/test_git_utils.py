@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import subprocess
 from contextlib import contextmanager
 from pathlib import Path
 from subprocess import CompletedProcess
@@ -367,3 +369,120 @@ def test_clean_untracked_worktree_cleans_submodules_when_present(
             True,
         ),
     ]
+
+
+def _init_fingerprint_repo(repo: Path) -> None:
+    def _git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+    repo.mkdir()
+    _git("init", "-q")
+    _git("config", "user.email", "test@example.com")
+    _git("config", "user.name", "Test")
+    (repo / "tracked.txt").write_text("one\n", encoding="utf-8")
+    (repo / "staged.txt").write_text("one\n", encoding="utf-8")
+    _git("add", "tracked.txt", "staged.txt")
+    _git("commit", "-q", "-m", "init")
+
+
+def test_content_fingerprint_tracks_staged_worktree_and_untracked_content(
+    tmp_path: Path,
+) -> None:
+    repo = tmp_path / "repo"
+    _init_fingerprint_repo(repo)
+    clean = git_utils.git_content_sensitive_repo_fingerprint(repo)
+    assert clean is not None
+    assert git_utils.git_content_sensitive_repo_fingerprint(repo) == clean
+
+    seen = {clean}
+    (repo / "tracked.txt").write_text("two\n", encoding="utf-8")
+    dirty = git_utils.git_content_sensitive_repo_fingerprint(repo)
+    assert dirty not in seen and " M tracked.txt" in str(dirty)
+    seen.add(dirty)
+
+    # Same status line, different content: still a new fingerprint.
+    (repo / "tracked.txt").write_text("three\n", encoding="utf-8")
+    redirty = git_utils.git_content_sensitive_repo_fingerprint(repo)
+    assert redirty not in seen
+    seen.add(redirty)
+
+    (repo / "staged.txt").write_text("two\n", encoding="utf-8")
+    subprocess.run(["git", "add", "staged.txt"], cwd=repo, check=True)
+    staged = git_utils.git_content_sensitive_repo_fingerprint(repo)
+    assert staged not in seen
+    seen.add(staged)
+
+    (repo / "new.txt").write_text("a\n", encoding="utf-8")
+    untracked = git_utils.git_content_sensitive_repo_fingerprint(repo)
+    assert untracked not in seen and "?? new.txt" in str(untracked)
+    seen.add(untracked)
+    (repo / "new.txt").write_text("b\n", encoding="utf-8")
+    assert git_utils.git_content_sensitive_repo_fingerprint(repo) not in seen
+
+    control_plane = repo / ".codex-autorunner"
+    control_plane.mkdir()
+    before = git_utils.git_content_sensitive_repo_fingerprint(repo)
+    (control_plane / "state.json").write_text("{}", encoding="utf-8")
+    assert git_utils.git_content_sensitive_repo_fingerprint(repo) == before
+
+
+def test_content_fingerprint_rehashes_only_paths_whose_stat_changed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = tmp_path / "repo"
+    _init_fingerprint_repo(repo)
+    hashed: list[str] = []
+    real_hash = git_utils._path_content_fingerprint
+
+    def _recording_hash(path: Path, stat: os.stat_result) -> str:
+        hashed.append(path.name)
+        return real_hash(path, stat)
+
+    monkeypatch.setattr(git_utils, "_path_content_fingerprint", _recording_hash)
+    old_ns = 1_000_000_000_000_000_000
+    for name in ("tracked.txt", "big.bin"):
+        path = repo / name
+        path.write_bytes(b"x" * 4096)
+        os.utime(path, ns=(old_ns, old_ns))
+
+    first = git_utils.git_content_sensitive_repo_fingerprint(repo)
+    assert sorted(hashed) == ["big.bin", "tracked.txt"]
+    hashed.clear()
+    assert git_utils.git_content_sensitive_repo_fingerprint(repo) == first
+    assert hashed == []
+
+    (repo / "tracked.txt").write_bytes(b"y" * 4096)
+    os.utime(repo / "tracked.txt", ns=(old_ns + 1, old_ns + 1))
+    changed = git_utils.git_content_sensitive_repo_fingerprint(repo)
+    assert changed != first
+    assert hashed == ["tracked.txt"]
+
+
+def test_content_fingerprint_rehashes_recently_modified_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = tmp_path / "repo"
+    _init_fingerprint_repo(repo)
+    (repo / "tracked.txt").write_text("two\n", encoding="utf-8")
+    calls = 0
+    real_hash = git_utils._path_content_fingerprint
+
+    def _counting_hash(path, stat):
+        nonlocal calls
+        calls += 1
+        return real_hash(path, stat)
+
+    monkeypatch.setattr(git_utils, "_path_content_fingerprint", _counting_hash)
+    git_utils.git_content_sensitive_repo_fingerprint(repo)
+    git_utils.git_content_sensitive_repo_fingerprint(repo)
+
+    # Freshly written files sit inside the racy window and are never trusted.
+    assert calls == 2
+
+
+def test_content_fingerprint_returns_none_without_commits(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    assert git_utils.git_content_sensitive_repo_fingerprint(repo) is None
+    assert git_utils.git_content_sensitive_repo_fingerprint(tmp_path / "nope") is None
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import Path
+
+from codex_autorunner.core import hub_topology
+from codex_autorunner.core.hub_topology import (
+    GitStateCache,
+    HubTopologyRepository,
+    RepoSnapshotTiming,
+    build_repo_snapshots,
+)
+from codex_autorunner.manifest import Manifest, ManifestRepo, save_manifest
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _init_repo(repo: Path) -> None:
+    repo.mkdir(parents=True, exist_ok=True)
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    (repo / "README.md").write_text("hello\n", encoding="utf-8")
+    _git(repo, "add", "README.md")
+    _git(repo, "commit", "-q", "-m", "init")
+
+
+def _repository_with_repos(
+    hub_root: Path, repo_ids: list[str]
+) -> HubTopologyRepository:
+    manifest_path = hub_root / ".codex-autorunner" / "manifest.yml"
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    save_manifest(
+        manifest_path,
+        Manifest(
+            version=3,
+            repos=[
+                ManifestRepo(id=repo_id, path=Path("workspace") / repo_id, kind="base")
+                for repo_id in repo_ids
+            ],
+        ),
+        hub_root,
+    )
+    return HubTopologyRepository(hub_root=hub_root, manifest_path=manifest_path)
+
+
+def test_git_state_cache_skips_git_until_index_or_head_changes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    repo = tmp_path / "repo"
+    _init_repo(repo)
+    calls: list[Path] = []
+    real_is_clean = hub_topology.git_is_clean
+
+    def _counting_is_clean(path: Path) -> bool:
+        calls.append(path)
+        return real_is_clean(path)
+
+    monkeypatch.setattr(hub_topology, "git_is_clean", _counting_is_clean)
+    cache = GitStateCache()
+
+    assert cache.is_clean(repo) == (True, False)
+    assert cache.is_clean(repo) == (True, True)
+    assert len(calls) == 1
+
+    (repo / "README.md").write_text("changed\n", encoding="utf-8")
+    _git(repo, "add", "README.md")
+    assert cache.is_clean(repo) == (False, False)
+    assert len(calls) == 2
+
+    assert GitStateCache(ttl_seconds=0).is_clean(repo) == (False, False)
+    assert cache.is_clean(tmp_path / "not-a-repo") == (None, False)
+
+
+def test_build_repo_snapshots_fans_out_and_keeps_manifest_order(
+    tmp_path: Path, monkeypatch
+) -> None:
+    hub_root = tmp_path / "hub"
+    repo_ids = [f"repo-{idx}" for idx in range(6)]
+    for repo_id in repo_ids:
+        _init_repo(hub_root / "workspace" / repo_id)
+    repository = _repository_with_repos(hub_root, repo_ids)
+    _manifest, records = repository.manifest_records()
+
+    threads: set[str] = set()
+    real_read_lock_status = hub_topology.read_lock_status
+
+    def _recording_read_lock_status(path: Path):
+        threads.add(threading.current_thread().name)
+        return real_read_lock_status(path)
+
+    monkeypatch.setattr(hub_topology, "read_lock_status", _recording_read_lock_status)
+    timings: list[RepoSnapshotTiming] = []
+    cache = GitStateCache()
+    snapshots = build_repo_snapshots(
+        records, max_workers=3, git_state_cache=cache, timings=timings
+    )
+
+    assert [snapshot.id for snapshot in snapshots] == repo_ids
+    assert all(snapshot.is_clean is True for snapshot in snapshots)
+    assert [timing.repo_id for timing in timings] == repo_ids
+    assert not any(timing.git_cache_hit for timing in timings)
+    assert threads and all(name.startswith("car-repo-snapshot") for name in threads)
+
+    timings.clear()
+    build_repo_snapshots(records, git_state_cache=cache, timings=timings)
+    assert all(timing.git_cache_hit for timing in timings)
+
+
+def test_build_hub_state_records_last_snapshot_timings(tmp_path: Path) -> None:
+    hub_root = tmp_path / "hub"
+    _init_repo(hub_root / "workspace" / "alpha")
+    repository = _repository_with_repos(hub_root, ["alpha"])
+
+    state = repository.build_hub_state(
+        existing_pinned_parent_repo_ids=[], last_scan_at=None
+    )
+
+    assert [repo.id for repo in state.repos] == ["alpha"]
+    timings = repository.last_snapshot_timings()
+    assert [timing.repo_id for timing in timings] == ["alpha"]
+    assert timings[0].to_dict()["elapsed_ms"] >= 0
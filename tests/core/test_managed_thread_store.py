@@ -3,6 +3,10 @@ from __future__ import annotations
 from pathlib import Path
 
 from codex_autorunner.core.managed_thread_store import ManagedThreadStore
+from codex_autorunner.core.orchestration.notification_bus import (
+    subscribe,
+    thread_topic,
+)
 from codex_autorunner.core.runtime_identity import (
     RUNTIME_STAGE_EFFECTIVE,
     RuntimeIdentityStage,
@@ -69,3 +73,21 @@ def test_mark_turn_finished_persists_provider_reported_effective_runtime(
         runtime_identity["effective"]["canonical_model_label"]
         == "zai-coding-plan/glm-5.1"
     )
+
+
+def test_turn_transitions_ring_the_thread_topic(tmp_path: Path) -> None:
+    hub_root = tmp_path / "hub"
+    store = ManagedThreadStore(hub_root)
+    thread = store.create_thread("codex", tmp_path)
+    managed_thread_id = str(thread["managed_thread_id"])
+    rung: list[str] = []
+    unsubscribe = subscribe(hub_root, thread_topic(managed_thread_id), rung.append)
+    try:
+        turn = store.create_turn(managed_thread_id, prompt="work")
+        assert rung == [thread_topic(managed_thread_id)]
+        store.mark_turn_finished(
+            str(turn["managed_turn_id"]), status="ok", assistant_text="done"
+        )
+        assert len(rung) == 2
+    finally:
+        unsubscribe()
@@ -402,3 +402,52 @@ async def test_lane_write_cancellation_waits_for_offloaded_store_call(
         await update_task
     await asyncio.wait_for(waiter, timeout=1.0)
     assert lock_reacquired.is_set() is True
+
+
+@pytest.mark.anyio
+async def test_wait_for_lane_item_wakes_on_ring_before_poll_interval(
+    tmp_path: Path,
+) -> None:
+    lane_id = "pma:default"
+    worker_queue = PmaQueue(tmp_path)
+    producer_queue = PmaQueue(tmp_path)
+
+    waiter = asyncio.create_task(
+        worker_queue.wait_for_lane_item(lane_id, poll_interval_seconds=30.0)
+    )
+    await asyncio.sleep(0.1)
+    await asyncio.to_thread(
+        producer_queue.enqueue_sync, lane_id, "ring-key-1", {"message": "hello"}
+    )
+
+    assert await asyncio.wait_for(waiter, timeout=5.0) is True
+
+
+@pytest.mark.anyio
+async def test_wait_for_lane_item_subscribes_once_per_lane(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from codex_autorunner.core import pma_queue as pma_queue_module
+
+    topics: list[str] = []
+    real_subscribe = pma_queue_module.subscribe
+
+    def _counting_subscribe(hub_root, topic, callback):  # type: ignore[no-untyped-def]
+        topics.append(topic)
+        return real_subscribe(hub_root, topic, callback)
+
+    monkeypatch.setattr(pma_queue_module, "subscribe", _counting_subscribe)
+    queue = PmaQueue(tmp_path)
+    cancelled = asyncio.Event()
+    cancelled.set()
+
+    for _ in range(3):
+        assert (
+            await queue.wait_for_lane_item(
+                "pma:default", cancelled, poll_interval_seconds=0.1
+            )
+            is False
+        )
+    await queue.wait_for_lane_item("pma:other", cancelled, poll_interval_seconds=0.1)
+
+    assert topics == ["queue:pma:default", "queue:pma:other"]
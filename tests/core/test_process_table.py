@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from codex_autorunner.core import process_table
+from codex_autorunner.core.diagnostics.process_snapshot import collect_processes
+
+pytestmark = pytest.mark.skipif(
+    not process_table.procfs_available(), reason="requires Linux procfs"
+)
+
+
+def test_read_processes_reads_procfs_for_pid_batch() -> None:
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        entries = process_table.read_processes([os.getpid(), child.pid, 2**22 + 7])
+    finally:
+        child.kill()
+        child.wait()
+
+    assert set(entries) == {os.getpid(), child.pid}
+    entry = entries[child.pid]
+    assert entry.ppid == os.getpid()
+    assert entry.pgid == os.getpgid(os.getpid())
+    assert entry.argv[-1] == "import time; time.sleep(30)"
+    assert entry.rss_kb and entry.rss_kb > 0
+    assert entry.elapsed_seconds is not None and entry.elapsed_seconds < 30
+
+
+def test_processes_in_group_lists_members_without_ps(monkeypatch) -> None:
+    def _no_ps(*_args, **_kwargs):
+        raise AssertionError("ps should not be spawned when procfs is available")
+
+    child = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(30)"],
+        start_new_session=True,
+    )
+    try:
+        monkeypatch.setattr(subprocess, "run", _no_ps)
+        monkeypatch.setattr(subprocess, "check_output", _no_ps)
+        members = process_table.processes_in_group(child.pid)
+        cmdline = process_table.read_cmdline(child.pid)
+        zombie = process_table.pid_is_zombie(child.pid)
+    finally:
+        child.kill()
+        child.wait()
+
+    assert [entry.pid for entry in members] == [child.pid]
+    assert cmdline is not None and cmdline[0] == sys.executable
+    assert zombie is False
+
+
+def test_cpu_sampler_reports_usage_between_samples() -> None:
+    sampler = process_table.ProcessCpuSampler()
+    pid = os.getpid()
+    sampler.sample([pid])
+
+    deadline = time.monotonic() + 0.3
+    while time.monotonic() < deadline:
+        pass
+    cpu_percent, rss_mb = sampler.sample([pid])[pid]
+
+    assert cpu_percent > 5.0
+    assert rss_mb > 0
+    assert sampler.sample([2**22 + 7]) == {}
+
+
+def test_collect_processes_builds_snapshot_from_procfs() -> None:
+    snapshot = collect_processes()
+    pids = {
+        proc.pid
+        for group in (
+            snapshot.car_service_processes,
+            snapshot.opencode_processes,
+            snapshot.app_server_processes,
+            snapshot.other_processes,
+        )
+        for proc in group
+    }
+
+    assert os.getpid() in pids
+
+
+def test_elapsed_round_trips_ps_format() -> None:
+    assert process_table.format_elapsed(5) == "00:05"
+    assert process_table.format_elapsed(3 * 3600 + 61) == "03:01:01"
+    assert process_table.format_elapsed(2 * 86400 + 59) == "2-00:00:59"
+    assert process_table.parse_elapsed("2-00:00:59") == 2 * 86400 + 59
+    assert process_table.parse_elapsed("bogus") is None
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+
+import codex_autorunner.core.flows.store as flow_store_module
+from codex_autorunner.core.flows.definition import FlowDefinition, StepOutcome
+from codex_autorunner.core.flows.event_batch import FlowEventBatch
+from codex_autorunner.core.flows.models import FlowEvent, FlowEventType
+from codex_autorunner.core.flows.runtime import FlowRuntime
+from codex_autorunner.core.flows.store import FlowStore
+
+
+def _make_store(tmp_path) -> FlowStore:
+    store = FlowStore(tmp_path / "flows.db")
+    store.initialize()
+    return store
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return
+        time.sleep(0.01)
+    raise AssertionError("condition not met before timeout")
+
+
+def test_event_batch_buffers_until_flush(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    run_id = store.create_flow_run("run-batch", "ticket_flow", input_data={}).id
+    flushed: list[FlowEvent] = []
+
+    with store.event_batch(
+        max_events=100, max_latency_ms=60_000, on_flush=flushed.extend
+    ) as batch:
+        for idx in range(5):
+            batch.add_event(
+                event_id=f"evt-{idx}",
+                run_id=run_id,
+                event_type=FlowEventType.AGENT_STREAM_DELTA,
+                data={"delta": f"chunk-{idx}"},
+            )
+        batch.add_telemetry(
+            telemetry_id="tel-0",
+            run_id=run_id,
+            event_type=FlowEventType.APP_SERVER_EVENT,
+            data={"message": {"method": "turn/started"}},
+        )
+        assert batch.pending_count == 6
+        assert store.get_events(run_id) == []
+
+        events = batch.flush()
+
+        assert [event.id for event in events] == [
+            "evt-0",
+            "evt-1",
+            "evt-2",
+            "evt-3",
+            "evt-4",
+            "tel-0",
+        ]
+        assert all(event.seq for event in events)
+        metrics = batch.metrics()
+        assert metrics["flushes"] == 1
+        assert metrics["rows_written"] == 6
+        assert metrics["largest_batch"] == 6
+        assert metrics["pending"] == 0
+
+    assert [event.id for event in flushed] == [event.id for event in events]
+    persisted = store.get_events_by_type(run_id, FlowEventType.AGENT_STREAM_DELTA)
+    assert [event.data["delta"] for event in persisted] == [
+        f"chunk-{idx}" for idx in range(5)
+    ]
+
+
+def test_event_batch_writer_commits_on_size_and_latency(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    run_id = store.create_flow_run("run-writer", "ticket_flow", input_data={}).id
+
+    with store.event_batch(max_events=3, max_latency_ms=60_000) as batch:
+        for idx in range(3):
+            batch.add_event(
+                event_id=f"size-{idx}",
+                run_id=run_id,
+                event_type=FlowEventType.AGENT_STREAM_DELTA,
+                data={"delta": str(idx)},
+            )
+        _wait_for(lambda: len(store.get_events(run_id)) == 3)
+
+    with store.event_batch(max_events=100, max_latency_ms=20) as batch:
+        batch.add_event(
+            event_id="latency-0",
+            run_id=run_id,
+            event_type=FlowEventType.AGENT_STREAM_DELTA,
+            data={"delta": "late"},
+        )
+        _wait_for(lambda: len(store.get_events(run_id)) == 4)
+        assert batch.metrics()["flushes"] == 1
+
+
+def test_event_batch_prunes_live_caps_once_per_batch(tmp_path, monkeypatch) -> None:
+    monkeypatch.setitem(
+        flow_store_module._FLOW_EVENT_TYPE_LIVE_CAPS,
+        FlowEventType.AGENT_STREAM_DELTA.value,
+        3,
+    )
+    store = _make_store(tmp_path)
+    run_id = store.create_flow_run("run-capped", "ticket_flow", input_data={}).id
+    prune_calls: list[str] = []
+    original_prune = store._prune_rows_for_run_event_type
+
+    def _counting_prune(conn, **kwargs):
+        prune_calls.append(kwargs["event_type"])
+        return original_prune(conn, **kwargs)
+
+    monkeypatch.setattr(store, "_prune_rows_for_run_event_type", _counting_prune)
+
+    with store.event_batch(max_events=100, max_latency_ms=60_000) as batch:
+        for idx in range(6):
+            batch.add_event(
+                event_id=f"evt-{idx}",
+                run_id=run_id,
+                event_type=FlowEventType.AGENT_STREAM_DELTA,
+                data={"delta": str(idx)},
+            )
+        batch.flush()
+        assert batch.metrics()["rows_pruned"] == 3
+
+    assert prune_calls == [FlowEventType.AGENT_STREAM_DELTA.value]
+    kept = store.get_events_by_type(run_id, FlowEventType.AGENT_STREAM_DELTA)
+    assert [event.id for event in kept] == ["evt-3", "evt-4", "evt-5"]
+
+
+def test_runtime_batches_stream_deltas_in_emit_order(tmp_path) -> None:
+    store = _make_store(tmp_path)
+    seen: list[FlowEvent] = []
+
+    async def stream_step(record, input_data, emit) -> StepOutcome:
+        emit(FlowEventType.AGENT_STREAM_DELTA, {"delta": "a"})
+        emit(FlowEventType.AGENT_STREAM_DELTA, {"delta": "b"})
+        emit(FlowEventType.STEP_PROGRESS, {"progress": 1})
+        emit(FlowEventType.AGENT_STREAM_DELTA, {"delta": "c"})
+        return StepOutcome.complete()
+
+    definition = FlowDefinition(
+        flow_type="test_flow",
+        initial_step="stream",
+        steps={"stream": stream_step},
+    )
+    definition.validate()
+    record = store.create_flow_run("run-stream", "test_flow", input_data={})
+    runtime = FlowRuntime(definition=definition, store=store, emit_event=seen.append)
+
+    asyncio.run(runtime.run_flow(record.id))
+
+    events = [
+        event
+        for event in store.get_events(record.id)
+        if event.event_type
+        in {FlowEventType.AGENT_STREAM_DELTA, FlowEventType.STEP_PROGRESS}
+    ]
+    assert [event.data for event in events] == [
+        {"delta": "a"},
+        {"delta": "b"},
+        {"progress": 1},
+        {"delta": "c"},
+    ]
+    assert (
+        sum(1 for event in seen if event.event_type == FlowEventType.AGENT_STREAM_DELTA)
+        == 3
+    )
+    assert runtime.event_batch_metrics["rows_written"] == 3
+
+
+def test_runtime_keeps_step_exception_when_batch_close_fails(
+    tmp_path, monkeypatch
+) -> None:
+    store = _make_store(tmp_path)
+    original_close = FlowEventBatch.close
+
+    def _failing_close(self) -> None:
+        original_close(self)
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(FlowEventBatch, "close", _failing_close)
+
+    async def failing_step(record, input_data, emit) -> StepOutcome:
+        emit(FlowEventType.AGENT_STREAM_DELTA, {"delta": "a"})
+        raise ValueError("step exploded")
+
+    definition = FlowDefinition(
+        flow_type="test_flow",
+        initial_step="explode",
+        steps={"explode": failing_step},
+    )
+    definition.validate()
+    record = store.create_flow_run("run-close-error", "test_flow", input_data={})
+    runtime = FlowRuntime(definition=definition, store=store)
+
+    finished = asyncio.run(runtime.run_flow(record.id))
+
+    assert finished.status.is_terminal()
+    assert "step exploded" in (finished.error_message or "")
+    assert runtime.event_batch_metrics["rows_written"] == 1
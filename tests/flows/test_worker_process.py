@@ -8,6 +8,7 @@ from pathlib import Path
 
 import pytest
 
+from codex_autorunner.core import process_table
 from codex_autorunner.core.flows import worker_process
 
 
@@ -21,6 +22,7 @@ def _disable_proc_cmdline_probe(monkeypatch) -> None:  # type: ignore[no-untyped
         return original_exists(path_obj)
 
     monkeypatch.setattr(worker_process.Path, "exists", fake_exists)
+    monkeypatch.setattr(process_table, "procfs_available", lambda: False)
 
 
 def test_check_worker_health_prefers_metadata_cmdline(monkeypatch, tmp_path):
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import inspect
+import json
+import subprocess
+import sys
+
+import pytest
+
+from codex_autorunner.cli import app
+
+HEAVY_MODULES = (
+    "fastapi",
+    "uvicorn",
+    "codex_autorunner.surfaces.web.app",
+    "codex_autorunner.adapters.agents.build_agent_pool",
+    "codex_autorunner.flows.ticket_flow",
+)
+
+# Runs a CLI path in a fresh interpreter and reports what it imported. Import
+# time is only reported (visible with ``-s``); wall-clock budgets flake on
+# loaded CI hosts, so the module list is the guard.
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from codex_autorunner.cli import app
+elapsed = time.perf_counter() - started
+app(sys.argv[1:], standalone_mode=False)
+print(json.dumps({"modules": sorted(sys.modules), "import_seconds": elapsed}))
+"""
+
+
+def _loaded_modules(*cli_args: str) -> set[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE, *cli_args],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    report = json.loads(proc.stdout.strip().splitlines()[-1])
+    print(
+        f"car {' '.join(cli_args)}: codex_autorunner.cli imported in "
+        f"{report['import_seconds'] * 1000:.0f} ms"
+    )
+    return set(report["modules"])
+
+
+@pytest.mark.parametrize(
+    "cli_args",
+    [
+        ("--help",),
+        ("--version",),
+        ("tickets", "--help"),
+        ("tickets", "lint", "--help"),
+    ],
+)
+def test_common_cli_paths_skip_heavy_imports(cli_args: tuple[str, ...]) -> None:
+    loaded = _loaded_modules(*cli_args)
+
+    assert "codex_autorunner.cli" in loaded
+    loaded_heavy = [name for name in HEAVY_MODULES if name in loaded]
+    assert loaded_heavy == []
+
+
+def test_help_lists_lazily_registered_groups() -> None:
+    from typer.testing import CliRunner
+
+    result = CliRunner().invoke(app, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ("init", "describe", "hub", "tickets", "ticket-flow", "pma"):
+        assert name in result.output
+
+
+def test_lazy_help_matches_loaded_commands() -> None:
+    from codex_autorunner.surfaces.cli import cli as cli_module
+
+    mismatched = {}
+    for name, short_help in cli_module._LAZY_HELP.items():
+        command = cli_module._load_command(name)
+        assert command is not None, name
+        loaded = inspect.cleandoc(command.short_help or command.help or "")
+        first_paragraph = loaded.split("\n\n")[0].replace("\n", " ").strip()
+        if first_paragraph != short_help:
+            mismatched[name] = first_paragraph
+
+    assert mismatched == {}
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from codex_autorunner.surfaces.web.routes.pma_routes.tail_broker import (
+    ManagedThreadTailBroker,
+    ManagedThreadTailDelta,
+    TailCursor,
+    TailResync,
+    get_managed_thread_tail_broker,
+)
+
+
+class _CountingProducer:
+    """Emit one new event per poll and record the cursors it was asked for."""
+
+    def __init__(self, *, turn_id: str = "turn-1") -> None:
+        self.turn_id = turn_id
+        self.cursors: list[TailCursor] = []
+
+    async def __call__(self, cursor: TailCursor) -> tuple[dict[str, Any], dict]:
+        self.cursors.append(cursor)
+        next_id = cursor.event_id + 1 if cursor.managed_turn_id == self.turn_id else 1
+        return (
+            {
+                "managed_turn_id": self.turn_id,
+                "last_event_id": next_id,
+                "events": [{"event_id": next_id, "summary": f"event {next_id}"}],
+            },
+            {},
+        )
+
+
+async def _next_delta(subscription: Any) -> ManagedThreadTailDelta:
+    item = await subscription.next(timeout=2.0)
+    assert isinstance(item, ManagedThreadTailDelta)
+    return item
+
+
+async def test_subscribers_share_one_producer_per_channel() -> None:
+    broker = ManagedThreadTailBroker(poll_interval_seconds=0.01)
+    channel = broker.channel(("tail", "thread-1"))
+    producer = _CountingProducer()
+    channel.seed({"managed_turn_id": "turn-1", "last_event_id": 0})
+    first = broker.subscribe(channel, producer, cursor=TailCursor("turn-1", 0))
+    second = broker.subscribe(channel, producer, cursor=TailCursor("turn-1", 0))
+
+    deltas_a = [await _next_delta(first) for _ in range(3)]
+    deltas_b = [await _next_delta(second) for _ in range(3)]
+
+    assert [delta.seq for delta in deltas_a] == [1, 2, 3]
+    assert [id(delta) for delta in deltas_a] == [id(delta) for delta in deltas_b]
+    assert [
+        [event["event_id"] for event in first.consume(delta)] for delta in deltas_a
+    ] == [[1], [2], [3]]
+    # Both subscribers together cost one snapshot build per tick.
+    assert len(producer.cursors) <= channel.seq + 1
+
+    first.close()
+    second.close()
+    assert not channel.running
+    assert broker.stats()["subscribers"] == 0
+
+
+async def test_overflowed_subscriber_recovers_from_ring_or_resyncs() -> None:
+    broker = ManagedThreadTailBroker(
+        poll_interval_seconds=3600, ring_size=4, queue_size=2
+    )
+    channel = broker.channel(("tail", "thread-1"))
+    subscription = broker.subscribe(
+        channel, _CountingProducer(), cursor=TailCursor("turn-1", 0)
+    )
+    for event_id in range(1, 4):
+        channel.publish(
+            {
+                "managed_turn_id": "turn-1",
+                "last_event_id": event_id,
+                "events": [{"event_id": event_id}],
+            }
+        )
+
+    assert subscription.dropped == 1
+    assert [(await _next_delta(subscription)).seq for _ in range(3)] == [1, 2, 3]
+
+    for event_id in range(4, 11):
+        channel.publish(
+            {
+                "managed_turn_id": "turn-1",
+                "last_event_id": event_id,
+                "events": [{"event_id": event_id}],
+            }
+        )
+    assert [(await _next_delta(subscription)).seq for _ in range(2)] == [4, 5]
+    resync = await subscription.next(timeout=1.0)
+    assert isinstance(resync, TailResync)
+    assert subscription.last_seq == channel.seq
+    subscription.close()
+
+
+async def test_replay_after_uses_ring_within_turn_and_reports_gaps() -> None:
+    broker = ManagedThreadTailBroker(poll_interval_seconds=3600, ring_size=3)
+    channel = broker.channel(("tail", "thread-1"))
+    channel.seed({"managed_turn_id": "turn-1", "last_event_id": 2})
+    for event_id in (4, 6):
+        channel.publish(
+            {
+                "managed_turn_id": "turn-1",
+                "last_event_id": event_id,
+                "events": [
+                    {"event_id": event_id - 1},
+                    {"event_id": event_id},
+                ],
+            }
+        )
+
+    replay = channel.replay_after(TailCursor("turn-1", 3))
+    assert [event["event_id"] for event in replay or []] == [4, 5, 6]
+    assert channel.replay_after(TailCursor("turn-1", 6)) == []
+    assert channel.replay_after(TailCursor("turn-1", 1)) is None
+    assert channel.replay_after(TailCursor("turn-0", 3)) is None
+
+    channel.publish(
+        {
+            "managed_turn_id": "turn-2",
+            "last_event_id": 1,
+            "events": [{"event_id": 1}],
+        }
+    )
+    replay = channel.replay_after(TailCursor("turn-1", 5))
+    assert [event["event_id"] for event in replay or []] == [6, 1]
+
+
+async def test_shared_memo_runs_factory_once_per_delta() -> None:
+    broker = ManagedThreadTailBroker(poll_interval_seconds=3600)
+    channel = broker.channel(("transcript", "thread-1"))
+    delta = channel.publish({"managed_turn_id": "turn-1", "last_event_id": 1})
+    calls = 0
+
+    async def _build() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return {"calls": calls}
+
+    results = await asyncio.gather(
+        delta.shared("terminal", _build), delta.shared("terminal", _build)
+    )
+
+    assert results == [{"calls": 1}, {"calls": 1}]
+    assert delta.memo("frame", lambda: "a") == delta.memo("frame", lambda: "b")
+
+
+async def test_failed_producer_closes_subscribers() -> None:
+    broker = ManagedThreadTailBroker(poll_interval_seconds=0.01)
+    channel = broker.channel(("tail", "thread-1"))
+
+    async def _fail(_cursor: TailCursor) -> tuple[dict[str, Any], dict]:
+        raise RuntimeError("boom")
+
+    subscription = broker.subscribe(channel, _fail, cursor=TailCursor())
+
+    assert await subscription.next(timeout=2.0) is None
+    assert subscription.closed
+    assert channel.failed
+    subscription.close()
+
+
+def test_idle_channels_are_bounded_and_broker_lives_on_app_state() -> None:
+    broker = ManagedThreadTailBroker(poll_interval_seconds=1.0, max_idle_channels=1)
+    first = broker.channel("first")
+    second = broker.channel("second")
+    broker._channel_idle(first)
+    broker._channel_idle(second)
+
+    assert broker.channel("second") is second
+    assert broker.channel("first") is not first
+
+    app = SimpleNamespace(state=SimpleNamespace())
+    created = get_managed_thread_tail_broker(app, poll_interval_seconds=1.0)
+    assert created is get_managed_thread_tail_broker(app, poll_interval_seconds=1.0)
+    assert get_managed_thread_tail_broker(object(), poll_interval_seconds=1.0) is None
+
+
+async def test_wake_source_runs_producer_before_poll_and_unsubscribes() -> None:
+    broker = ManagedThreadTailBroker(poll_interval_seconds=3600)
+    channel = broker.channel(("tail", "thread-1"))
+    pokes: list[Any] = []
+    unsubscribed: list[bool] = []
+
+    def _wake(poke: Any) -> Any:
+        pokes.append(poke)
+        return lambda: unsubscribed.append(True)
+
+    subscription = broker.subscribe(
+        channel, _CountingProducer(), cursor=TailCursor("turn-1", 0), wake=_wake
+    )
+    assert len(pokes) == 1
+    # Bus callbacks run on the receiver thread.
+    await asyncio.to_thread(pokes[0])
+
+    delta = await _next_delta(subscription)
+
+    assert delta.seq == 1
+    assert channel.stats()["woken"] == 1
+    subscription.close()
+    assert unsubscribed == [True]
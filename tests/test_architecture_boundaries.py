@@ -237,6 +237,7 @@ ALLOWED_BOUNDARY_IMPORTS: dict[str, set[str]] = {
         "codex_autorunner.tickets.files",
     },
     "codex_autorunner.core.flows.worker_process": {
+        "codex_autorunner.core.process_table",
         "codex_autorunner.core.text_utils",
         "codex_autorunner.core.utils",
     },
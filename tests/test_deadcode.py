@@ -49,3 +49,23 @@ def test_scan_python_does_not_flag_top_level_all_exports(tmp_path: Path) -> None
     findings = module.scan_python(src_root)
 
     assert all(finding.symbol != "exported_symbol" for finding in findings)
+
+
+def test_scan_python_does_not_flag_lazy_export_table_entries(tmp_path: Path) -> None:
+    module = _load_deadcode_module()
+    module.REPO_ROOT = tmp_path
+    package = tmp_path / "src" / "pkg"
+    package.mkdir(parents=True)
+    (package / "impl.py").write_text(
+        "def lazily_exported():\n    return None\n",
+        encoding="utf-8",
+    )
+    (package / "__init__.py").write_text(
+        "_LAZY_EXPORTS = {'lazily_exported': '.impl'}\n\n"
+        "__all__ = sorted(_LAZY_EXPORTS)\n",
+        encoding="utf-8",
+    )
+
+    findings = module.scan_python(tmp_path / "src")
+
+    assert all(finding.symbol != "lazily_exported" for finding in findings)
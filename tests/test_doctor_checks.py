@@ -56,6 +56,7 @@ from codex_autorunner.core.diagnostics.hermes import hermes_doctor_checks
 from codex_autorunner.core.diagnostics.hub import (
     hub_control_plane_doctor_checks,
     hub_destination_doctor_checks,
+    hub_repo_snapshot_doctor_checks,
     hub_worktree_doctor_checks,
 )
 from codex_autorunner.core.diagnostics.opencode import summarize_opencode_lifecycle
@@ -68,6 +69,7 @@ from codex_autorunner.core.diagnostics.repository import doctor
 from codex_autorunner.core.diagnostics.types import (
     DoctorCheck,
 )
+from codex_autorunner.core.hub_topology import RepoSnapshotTiming
 from codex_autorunner.core.managed_processes.registry import ProcessRecord
 from codex_autorunner.core.orchestration.legacy_backfill_gate import (
     LEGACY_ORCHESTRATION_BACKFILL_KEY,
@@ -1249,6 +1251,62 @@ def test_hub_worktree_doctor_checks_detects_orphans(tmp_path: Path):
     assert "car hub worktree retire" in check.fix
 
 
+def test_hub_repo_snapshot_doctor_checks_reports_slow_repos(
+    tmp_path: Path, monkeypatch
+):
+    hub_root = tmp_path / "hub"
+    hub_root.mkdir()
+    seed_hub_files(hub_root, force=True)
+    manifest_path = hub_root / ".codex-autorunner" / "manifest.yml"
+    manifest_path.write_text(
+        "\n".join(
+            [
+                "version: 2",
+                "repos:",
+                "  - id: fast",
+                "    path: workspace/fast",
+                "    kind: base",
+                "  - id: slow",
+                "    path: workspace/slow",
+                "    kind: base",
+            ]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    hub_config = load_hub_config(hub_root)
+
+    def _fake_build(records, *, git_state_cache, timings):
+        timings.extend(
+            [
+                RepoSnapshotTiming(
+                    repo_id="fast", elapsed_ms=12.0, git_cache_hit=False
+                ),
+                RepoSnapshotTiming(
+                    repo_id="slow", elapsed_ms=4500.0, git_cache_hit=False
+                ),
+            ]
+        )
+        return []
+
+    monkeypatch.setattr(
+        "codex_autorunner.core.diagnostics.hub.build_repo_snapshots", _fake_build
+    )
+    checks = hub_repo_snapshot_doctor_checks(hub_config)
+
+    assert checks[0].check_id == "hub.repo_snapshots"
+    assert checks[0].passed is True
+    assert "Built 2 repo snapshot(s)" in checks[0].message
+    assert checks[0].message.index("slow (4500ms)") < checks[0].message.index(
+        "fast (12ms)"
+    )
+    assert len(checks) == 2
+    assert checks[1].passed is False
+    assert checks[1].severity == "warning"
+    assert "slow (4500ms)" in checks[1].message
+    assert "fast" not in checks[1].message
+
+
 def test_hub_destination_doctor_checks_reports_effective_destination(
     tmp_path: Path, monkeypatch
 ):
@@ -813,3 +813,213 @@ def test_sync_pr_arms_polling_watch_from_hub_root_for_hub_repo(
     service.sync_pr(draft=False, title="Login flow", body="Initial body")
 
     assert armed_hub_roots == [hub_root]
+
+
+def test_pr_polling_batch_parses_aliases_and_skips_truncated_comment_pages(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = GitHubService(tmp_path, raw_config={})
+    queries: list[str] = []
+
+    def _node(number: int, *, more_comments: bool = False) -> dict:
+        return {
+            "number": number,
+            "state": "OPEN",
+            "isDraft": False,
+            "headRefOid": "abc123",
+            "author": {"login": "author"},
+            "reviews": {
+                "nodes": [
+                    {
+                        "databaseId": 12345,
+                        "state": "CHANGES_REQUESTED",
+                        "body": "Please add dedupe coverage.",
+                        "url": "https://example.invalid/reviews/12345",
+                        "submittedAt": "2026-03-30T00:10:00Z",
+                        "commit": {"oid": "abc123"},
+                        "author": {"login": "reviewer"},
+                    }
+                ]
+            },
+            "comments": {
+                "pageInfo": {"hasPreviousPage": more_comments},
+                "nodes": [
+                    {
+                        "databaseId": 77,
+                        "body": "looks good",
+                        "url": "https://example.invalid/comments/77",
+                        "authorAssociation": "MEMBER",
+                        "updatedAt": "2026-03-30T00:20:00Z",
+                        "author": {"__typename": "User", "login": "user-77"},
+                    }
+                ],
+            },
+            "reviewThreads": {"nodes": []},
+            "commits": {
+                "nodes": [
+                    {
+                        "commit": {
+                            "oid": "abc123",
+                            "statusCheckRollup": {
+                                "contexts": {
+                                    "nodes": [
+                                        {
+                                            "__typename": "CheckRun",
+                                            "name": "unit-tests",
+                                            "status": "COMPLETED",
+                                            "conclusion": "FAILURE",
+                                            "detailsUrl": "https://example.invalid/checks/1",
+                                            "checkSuite": {"commit": {"oid": "abc123"}},
+                                        }
+                                    ]
+                                }
+                            },
+                        }
+                    }
+                ]
+            },
+        }
+
+    def _fake_gh(
+        args: list[str], *, cwd=None, check=True, timeout_seconds=None
+    ):  # type: ignore[no-untyped-def]
+        _ = cwd, check, timeout_seconds
+        assert args[:2] == ["api", "graphql"]
+        assert "owner=acme" in args and "name=widgets" in args
+        queries.append(next(arg for arg in args if arg.startswith("query=")))
+        payload = {
+            "data": {
+                "rateLimit": {"cost": 2, "remaining": 4900, "resetAt": None},
+                "repository": {
+                    "pr17": _node(17),
+                    "pr18": _node(18, more_comments=True),
+                    "pr19": None,
+                },
+            }
+        }
+        return type("Proc", (), {"returncode": 0, "stdout": json.dumps(payload)})()
+
+    monkeypatch.setattr(service, "_gh", _fake_gh)
+
+    batch = service.pr_polling_batch(repo_slug="acme/widgets", numbers=[19, 17, 18])
+
+    assert len(queries) == 1
+    assert batch.requests == 1
+    assert batch.cost == 2
+    assert batch.remaining == 4900
+    assert sorted(batch.pull_requests) == [17]
+    parts = batch.pull_requests[17]
+    assert parts["pr"]["headRefOid"] == "abc123"
+    assert parts["reviews"] == [
+        {
+            "review_id": "12345",
+            "review_state": "CHANGES_REQUESTED",
+            "body": "Please add dedupe coverage.",
+            "html_url": "https://example.invalid/reviews/12345",
+            "author_login": "reviewer",
+            "commit_id": "abc123",
+            "submitted_at": "2026-03-30T00:10:00Z",
+        }
+    ]
+    assert parts["checks"][0]["head_sha"] == "abc123"
+    assert parts["issue_comments"][0]["comment_id"] == "77"
+    assert parts["issue_comments"][0]["issue_number"] == 17
+
+
+def test_pr_polling_batch_matches_rest_logins_for_bot_authors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = GitHubService(tmp_path, raw_config={})
+    bot = {"__typename": "Bot", "login": "coderabbitai"}
+    graphql_node = {
+        "number": 17,
+        "state": "OPEN",
+        "isDraft": False,
+        "headRefOid": "abc123",
+        "author": {"login": "author"},
+        "reviews": {
+            "nodes": [
+                {
+                    "databaseId": 12345,
+                    "state": "COMMENTED",
+                    "body": "Summary of changes",
+                    "url": "https://example.invalid/reviews/12345",
+                    "submittedAt": "2026-03-30T00:10:00Z",
+                    "commit": {"oid": "abc123"},
+                    "author": bot,
+                }
+            ]
+        },
+        "comments": {
+            "pageInfo": {"hasPreviousPage": False},
+            "nodes": [
+                {
+                    "databaseId": 77,
+                    "body": "Walkthrough",
+                    "url": "https://example.invalid/comments/77",
+                    "authorAssociation": "NONE",
+                    "createdAt": "2026-03-30T00:20:00Z",
+                    "updatedAt": "2026-03-30T00:20:00Z",
+                    "author": bot,
+                }
+            ],
+        },
+        "reviewThreads": {"nodes": []},
+        "commits": {"nodes": []},
+    }
+    rest_user = {"login": "coderabbitai[bot]", "type": "Bot"}
+    rest_payloads = {
+        "repos/acme/widgets/pulls/17/reviews": [
+            {
+                "id": 12345,
+                "state": "COMMENTED",
+                "body": "Summary of changes",
+                "html_url": "https://example.invalid/reviews/12345",
+                "commit_id": "abc123",
+                "submitted_at": "2026-03-30T00:10:00Z",
+                "user": rest_user,
+            }
+        ],
+        "repos/acme/widgets/issues/17/comments": [
+            {
+                "id": 77,
+                "body": "Walkthrough",
+                "html_url": "https://example.invalid/comments/77",
+                "author_association": "NONE",
+                "created_at": "2026-03-30T00:20:00Z",
+                "updated_at": "2026-03-30T00:20:00Z",
+                "user": rest_user,
+            }
+        ],
+    }
+
+    def _fake_gh(
+        args: list[str], *, cwd=None, check=True, timeout_seconds=None
+    ):  # type: ignore[no-untyped-def]
+        _ = cwd, check, timeout_seconds
+        if args[:2] == ["api", "graphql"]:
+            payload: object = {
+                "data": {
+                    "rateLimit": {"cost": 1, "remaining": 4999, "resetAt": None},
+                    "repository": {"pr17": graphql_node},
+                }
+            }
+        elif "page=2" in args:
+            payload = []
+        else:
+            payload = rest_payloads[args[1]]
+        return type("Proc", (), {"returncode": 0, "stdout": json.dumps(payload)})()
+
+    monkeypatch.setattr(service, "_gh", _fake_gh)
+
+    parts = service.pr_polling_batch(
+        repo_slug="acme/widgets", numbers=[17]
+    ).pull_requests[17]
+    rest_reviews = service.pr_reviews(owner="acme", repo="widgets", number=17)
+    rest_comments = service.issue_comments(owner="acme", repo="widgets", number=17)
+
+    assert parts["reviews"] == rest_reviews
+    assert parts["reviews"][0]["author_login"] == "coderabbitai[bot]"
+    assert parts["issue_comments"] == rest_comments
+    assert parts["issue_comments"][0]["author_login"] == "coderabbitai[bot]"
+    assert parts["issue_comments"][0]["author_type"] == "Bot"
@@ -512,3 +512,27 @@ def test_reaper_reaps_sigterm_ignoring_process_group(tmp_path: Path) -> None:
             process.stdout.close()
         if process.stderr is not None:
             process.stderr.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="requires killpg")
+def test_pgid_is_running_stays_conservative_when_ps_cannot_run(monkeypatch) -> None:
+    def _missing_ps(*_args, **_kwargs):
+        raise FileNotFoundError("ps")
+
+    monkeypatch.setattr(reaper_module.process_table, "procfs_available", lambda: False)
+    monkeypatch.setattr(reaper_module.os, "killpg", lambda _pgid, _sig: None)
+    monkeypatch.setattr(subprocess, "run", _missing_ps)
+
+    assert reaper_module._pgid_is_running(424242) is True
+
+
+@pytest.mark.skipif(not hasattr(os, "killpg"), reason="requires killpg")
+def test_pgid_is_running_reports_empty_ps_group_as_stopped(monkeypatch) -> None:
+    def _no_matches(args, **_kwargs):
+        return subprocess.CompletedProcess(args, 1, stdout="", stderr="")
+
+    monkeypatch.setattr(reaper_module.process_table, "procfs_available", lambda: False)
+    monkeypatch.setattr(reaper_module.os, "killpg", lambda _pgid, _sig: None)
+    monkeypatch.setattr(subprocess, "run", _no_matches)
+
+    assert reaper_module._pgid_is_running(424242) is False
@@ -20,6 +20,7 @@ from codex_autorunner.core.orchestration.managed_thread_timeline import (
 from codex_autorunner.core.orchestration.progress_projection import (
     ProgressProjectionState,
 )
+from codex_autorunner.core.orchestration.turn_event_buffer import TURN_EVENT_GAP_TYPE
 from codex_autorunner.core.orchestration.turn_timeline import persist_turn_timeline
 from codex_autorunner.core.ports.run_event import OutputDelta
 from codex_autorunner.server import create_hub_app
@@ -791,6 +792,68 @@ def test_managed_thread_tail_snapshot_includes_opencode_list_progress_events(
     assert "Working" in str(first.get("summary") or "")
 
 
+def test_managed_thread_tail_snapshot_reports_evicted_progress_gap(
+    hub_env, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _enable_pma(hub_env.hub_root)
+
+    class _OpenCodeHarnessWithGap:
+        def supports(self, capability: str) -> bool:
+            return capability == "event_streaming"
+
+        def allows_parallel_event_stream(self) -> bool:
+            return True
+
+        def stream_events(
+            self,
+            workspace_root: Path,
+            conversation_id: str,
+            turn_id: str,
+        ):
+            _ = workspace_root, conversation_id, turn_id
+
+            async def _stream():
+                if False:
+                    yield None
+
+            return _stream()
+
+        async def list_progress_events(
+            self, conversation_id: str, turn_id: str, **kwargs: Any
+        ) -> list[dict[str, Any]]:
+            _ = conversation_id, turn_id, kwargs
+            return [
+                {"type": TURN_EVENT_GAP_TYPE, "after_id": 0, "evicted_count": 12},
+                {"method": "prompt/progress", "params": {"text": "Working..."}},
+            ]
+
+    harness = _OpenCodeHarnessWithGap()
+    monkeypatch.setattr(
+        tail_stream,
+        "_managed_thread_harness",
+        lambda service, agent_id: harness,
+    )
+    app = create_hub_app(hub_env.hub_root)
+
+    with TestClient(app) as client:
+        managed_thread_id, _ = _seed_running_managed_thread(
+            hub_env,
+            app,
+            agent="opencode",
+            backend_thread_id="opencode-session-gap",
+            backend_turn_id="opencode-turn-gap",
+            name="opencode progress gap",
+        )
+        resp = client.get(f"/hub/pma/threads/{managed_thread_id}/tail")
+
+    assert resp.status_code == 200
+    payload = resp.json()
+    assert payload["events_gap"] == {"after_id": 0, "evicted_count": 12}
+    assert [event.get("event_type") for event in payload["events"]] == [
+        "assistant_update"
+    ]
+
+
 def test_managed_thread_tail_snapshot_passes_cursor_and_caps_runtime_overlay(
     hub_env, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -1521,3 +1584,47 @@ def test_managed_thread_tail_stream_preserves_since_filter_for_live_events(
         assert "event: tail" in body
         assert "\nid: 2\n" in body
         assert "\nid: 1\n" not in body
+
+
+def test_tail_channel_producer_holds_only_the_app(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = SimpleNamespace(state=SimpleNamespace())
+    subscriber_request = SimpleNamespace(app=app)
+    service_requests: list[Any] = []
+    snapshot_calls: list[dict[str, Any]] = []
+
+    async def _fake_service(request: Any) -> Any:
+        service_requests.append(request)
+        return object()
+
+    async def _fake_snapshot(**kwargs: Any) -> dict[str, Any]:
+        snapshot_calls.append(kwargs)
+        return {"managed_turn_id": "turn-1", "last_event_id": 3, "events": []}
+
+    monkeypatch.setattr(
+        tail_stream, "_build_managed_thread_orchestration_service_async", _fake_service
+    )
+    monkeypatch.setattr(
+        tail_stream, "_build_managed_thread_tail_snapshot", _fake_snapshot
+    )
+    produce = tail_stream._tail_channel_producer(
+        subscriber_request,  # type: ignore[arg-type]
+        managed_thread_id="thread-1",
+        limit=50,
+        level="info",
+        since_ms=None,
+    )
+
+    async def _run() -> None:
+        await produce(tail_stream.TailCursor("turn-1", 1))
+        await produce(tail_stream.TailCursor("turn-1", 2))
+
+    asyncio.run(_run())
+
+    assert len(service_requests) == 1
+    assert service_requests[0] is not subscriber_request
+    assert service_requests[0].app is app
+    assert all(call["request"] is service_requests[0] for call in snapshot_calls)
+    assert all("harness" not in call for call in snapshot_calls)
+    assert [call["resume_after"] for call in snapshot_calls] == [1, 2]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from codex_autorunner.adapters.telegram.client import TelegramBotClient
+from codex_autorunner.adapters.telegram.rate_limiter import (
+    TelegramRateLimiter,
+    TelegramSendPriority,
+)
+
+
+@pytest.mark.anyio
+async def test_chat_bucket_throttles_bursts_beyond_capacity() -> None:
+    limiter = TelegramRateLimiter(chat_messages_per_second=50.0, chat_burst=2)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    for _ in range(4):
+        await limiter.acquire(123)
+
+    assert loop.time() - started >= 0.035
+    stats = limiter.stats()
+    assert stats.admitted_total == 4
+    assert stats.throttled_total == 2
+    assert stats.queued == 0
+
+
+@pytest.mark.anyio
+async def test_group_chats_share_a_per_minute_budget() -> None:
+    limiter = TelegramRateLimiter(
+        chat_messages_per_second=1000.0, group_messages_per_minute=2
+    )
+
+    await limiter.acquire(-100)
+    await limiter.acquire(-100)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(limiter.acquire(-100), timeout=0.05)
+    await asyncio.wait_for(limiter.acquire(100), timeout=0.05)
+
+    assert limiter.stats().queued == 0
+
+
+@pytest.mark.anyio
+async def test_replies_preempt_queued_progress_for_the_same_chat() -> None:
+    limiter = TelegramRateLimiter(chat_messages_per_second=50.0, chat_burst=1)
+    order: list[str] = []
+
+    async def _send(label: str, priority: TelegramSendPriority) -> None:
+        await limiter.acquire(123, priority=priority)
+        order.append(label)
+
+    await _send("first", TelegramSendPriority.REPLY)
+    progress = [
+        asyncio.create_task(_send(f"edit-{idx}", TelegramSendPriority.PROGRESS))
+        for idx in range(2)
+    ]
+    await asyncio.sleep(0)
+    reply = asyncio.create_task(_send("final", TelegramSendPriority.REPLY))
+    await asyncio.wait_for(asyncio.gather(reply, *progress), timeout=1)
+
+    assert order == ["first", "final", "edit-0", "edit-1"]
+
+
+@pytest.mark.anyio
+async def test_queued_edits_to_one_message_are_coalesced() -> None:
+    sent: list[dict[str, object]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        sent.append(payload)
+        return httpx.Response(
+            200, json={"ok": True, "result": {"message_id": payload["message_id"]}}
+        )
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    bot = TelegramBotClient(
+        "test-token",
+        client=http_client,
+        rate_limiter=TelegramRateLimiter(chat_messages_per_second=20.0, chat_burst=1),
+    )
+    try:
+        await bot.edit_message_text(123, 7, "step 1")
+        edits = [
+            asyncio.create_task(bot.edit_message_text(123, 7, f"step {idx}"))
+            for idx in range(2, 5)
+        ]
+        results = await asyncio.wait_for(asyncio.gather(*edits), timeout=1)
+    finally:
+        await bot.close()
+
+    assert [payload["text"] for payload in sent] == ["step 1", "step 4"]
+    assert results == [{"message_id": 7}] * 3
+    stats = bot.rate_limit_stats().to_dict()
+    assert stats["coalesced_total"] == 2
+    assert stats["throttled_total"] == 1
@@ -0,0 +1,175 @@
+import asyncio
+
+import codex_autorunner.surfaces.web.pty_session as pty_session
+from codex_autorunner.surfaces.web.pty_session import (
+    REPLAY_END,
+    SCREEN_RESYNC,
+    ActiveSession,
+)
+from codex_autorunner.surfaces.web.terminal_screen import TerminalScreen
+
+
+class DummyLoop:
+    def add_reader(self, _fd, _cb):
+        return None
+
+
+class DummyPTY:
+    fd = 0
+
+    def __init__(self):
+        self.closed = False
+        self.last_active = 0.0
+        self.size = None
+
+    def resize(self, cols, rows):
+        self.size = (cols, rows)
+
+
+def _session(screen_model: bool = True) -> ActiveSession:
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return ActiveSession(
+            "s", DummyPTY(), DummyLoop(), screen_model=screen_model  # type: ignore[arg-type]
+        )
+    finally:
+        loop.close()
+
+
+def _feed(monkeypatch, session: ActiveSession, data: bytes) -> None:
+    monkeypatch.setattr(pty_session.os, "read", lambda _fd, _n: data)
+    session._read_callback()
+
+
+def _drain(queue: asyncio.Queue) -> list[object]:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_screen_tracks_scrollback_cursor_and_attributes():
+    screen = TerminalScreen(20, 3, scrollback_lines=2)
+    for index in range(5):
+        screen.feed(f"line {index}\r\n".encode())
+    screen.feed(b"\x1b[1;31mhot\x1b[0m \xe4\xb8")
+    screen.feed(b"\xad")
+
+    assert screen.display_lines() == ["line 3", "line 4", "hot 中"]
+    assert ["".join(line.chars).rstrip() for line in screen.scrollback] == [
+        "line 1",
+        "line 2",
+    ]
+    snapshot = screen.snapshot()
+    assert b"\x1b[0;31;1mhot\x1b[0m" in snapshot
+    assert snapshot.endswith(b"\x1b[3;7H")
+
+
+def test_snapshot_rebuilds_alt_screen_and_input_modes():
+    screen = TerminalScreen(20, 4)
+    screen.feed(b"shell$ vim\r\n")
+    screen.feed(b"\x1b[?1049h\x1b[?2004h\x1b[?1h\x1b[H\x1b[2Jtop\x1b[4;1H~ bottom")
+
+    replica = TerminalScreen(20, 4)
+    replica.feed(screen.snapshot())
+
+    assert replica.alt_screen_active is True
+    assert replica.display_lines() == screen.display_lines()
+    assert (replica.x, replica.y) == (screen.x, screen.y)
+    assert b"\x1b[?2004h" in screen.snapshot()
+    replica.feed(b"\x1b[?1049l")
+    screen.feed(b"\x1b[?1049l")
+    assert replica.display_lines() == screen.display_lines()
+    assert replica.display_lines()[0] == "shell$ vim"
+
+
+def test_screen_erase_scroll_region_and_resize():
+    screen = TerminalScreen(10, 4)
+    screen.feed(b"aaaa\r\nbbbb\r\ncccc\r\ndddd")
+    screen.feed(b"\x1b[2;3r\x1b[3;1H\n")
+    assert screen.display_lines() == ["aaaa", "cccc", "", "dddd"]
+    screen.feed(b"\x1b[r\x1b[1;3H\x1b[K")
+    assert screen.display_lines()[0] == "aa"
+
+    screen.resize(6, 2)
+    assert screen.display_lines() == ["", "dddd"]
+    assert screen.cols == 6
+    assert 0 <= screen.y < 2
+
+
+def test_active_session_replays_snapshot_instead_of_raw_buffer(monkeypatch):
+    session = _session()
+    _feed(monkeypatch, session, b"\x1b[2Jhello\r\n" * 50)
+    _feed(monkeypatch, session, b"\x1b[?1049hfull screen app")
+
+    assert session.buffer == type(session.buffer)()
+    session.refresh_alt_screen_state()
+    assert session.alt_screen_active is True
+
+    queue = session.add_subscriber()
+    items = _drain(queue)
+    assert len(items) == 2
+    assert items[1] is REPLAY_END
+    assert isinstance(items[0], bytes)
+    assert b"full screen app" in items[0]
+
+
+def test_slow_subscriber_is_resynced_instead_of_dropped(monkeypatch):
+    session = _session()
+    queue = session.add_subscriber(include_replay_end=False)
+    for index in range(pty_session.PTY_SUBSCRIBER_QUEUE_MAX + 20):
+        _feed(monkeypatch, session, f"row {index}\r\n".encode())
+
+    assert queue in session.subscribers
+    items = _drain(queue)
+    assert items[-1] is SCREEN_RESYNC
+    assert None not in items
+
+    _feed(monkeypatch, session, b"suppressed")
+    assert queue.empty()
+    snapshot = session.take_resync(queue)
+    assert b"suppressed" in snapshot
+    _feed(monkeypatch, session, b"live")
+    assert queue.get_nowait() == b"live"
+
+
+def test_resync_turns_off_modes_cleared_in_dropped_output(monkeypatch):
+    session = _session()
+    queue = session.add_subscriber(include_replay_end=False)
+    client = TerminalScreen()
+    _feed(monkeypatch, session, b"\x1b[?1000h\x1b[?2004h\x1b[?25l\x1b[?7l\x1b=")
+    for item in _drain(queue):
+        client.feed(item)
+    assert client._private_modes == {1000, 2004}
+
+    for index in range(pty_session.PTY_SUBSCRIBER_QUEUE_MAX + 20):
+        _feed(monkeypatch, session, f"row {index}\r\n".encode())
+    _feed(monkeypatch, session, b"\x1b[?1000l\x1b[?25h\x1b[?7h\x1b>")
+    assert _drain(queue)[-1] is SCREEN_RESYNC
+
+    client.feed(session.take_resync(queue))
+
+    assert client._private_modes == {2004}
+    assert client.cursor_visible is True
+    assert client._autowrap is True
+    assert client._keypad_application is False
+
+
+def test_resize_updates_pty_and_screen():
+    session = _session()
+    session.resize(100, 30)
+
+    assert session.pty.size == (100, 30)
+    assert session.screen is not None
+    assert (session.screen.cols, session.screen.rows) == (100, 30)
+
+
+def test_raw_buffer_mode_still_drops_slow_subscribers(monkeypatch):
+    session = _session(screen_model=False)
+    queue = session.add_subscriber(include_replay_end=False)
+    for index in range(pty_session.PTY_SUBSCRIBER_QUEUE_MAX + 1):
+        _feed(monkeypatch, session, f"row {index}\r\n".encode())
+
+    assert queue not in session.subscribers
+    assert _drain(queue)[-1] is None
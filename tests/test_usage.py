@@ -47,9 +47,7 @@ def _write_opencode_session(
 
 
 def _refresh_usage_cache(codex_home: Path) -> None:
-    cache = get_usage_series_cache(codex_home)
-    payload = cache._load_cache()
-    cache._update_cache(payload)
+    get_usage_series_cache(codex_home).refresh()
 
 
 def test_summarize_repo_usage_reads_token_deltas(tmp_path):
@@ -586,6 +584,112 @@ def test_hub_usage_summary_cache_matches_baseline(tmp_path):
     assert cached_unmatched.events == baseline_unmatched.events
 
 
+def _token_count_event(timestamp: str, total: int, rate_limits=None) -> dict:
+    payload: dict = {
+        "type": "token_count",
+        "info": {
+            "last_token_usage": {
+                "input_tokens": total,
+                "cached_input_tokens": 0,
+                "output_tokens": 0,
+                "reasoning_output_tokens": 0,
+                "total_tokens": total,
+            }
+        },
+    }
+    if rate_limits is not None:
+        payload["rate_limits"] = rate_limits
+    return {"timestamp": timestamp, "type": "event_msg", "payload": payload}
+
+
+def test_usage_index_tails_appended_bytes_only(tmp_path):
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    codex_home = tmp_path / "codex"
+    _write_session(
+        codex_home,
+        repo_root,
+        [_token_count_event("2025-12-01T01:00:00Z", 10)],
+        model="gpt-5",
+    )
+    session_path = next((codex_home / "sessions").glob("**/*.jsonl"))
+    cache = get_usage_series_cache(codex_home)
+    cache.refresh()
+
+    with session_path.open("a", encoding="utf-8") as handle:
+        handle.write(
+            json.dumps(
+                _token_count_event(
+                    "2025-12-02T01:00:00Z", 5, rate_limits={"primary": {"used": 1}}
+                )
+            )
+            + "\n"
+        )
+        # A partially flushed line must wait for the next pass.
+        handle.write('{"timestamp": "2025-12-03T01:00:00Z", "type": "event_')
+
+    assert cache.request_update() in {"loading", "ready"}
+    cache.refresh()
+    series, status = get_repo_usage_series_cached(
+        repo_root, codex_home=codex_home, bucket="day"
+    )
+    summary, _ = get_repo_usage_summary_cached(repo_root, codex_home=codex_home)
+
+    assert status == "ready"
+    assert series["buckets"] == ["2025-12-01", "2025-12-02"]
+    assert series["series"][0]["values"] == [10, 5]
+    assert summary.events == 2
+    assert summary.totals.total_tokens == 15
+    assert summary.latest_rate_limits == {"primary": {"used": 1}}
+
+    import sqlite3
+
+    with sqlite3.connect(cache.index_path) as conn:
+        offset, size = conn.execute(
+            "SELECT offset, size FROM usage_files WHERE path = ?",
+            (str(session_path),),
+        ).fetchone()
+    assert size == session_path.stat().st_size
+    assert offset < size
+
+
+def test_usage_index_retracts_truncated_and_deleted_sessions(tmp_path):
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    codex_home = tmp_path / "codex"
+    _write_session(
+        codex_home,
+        repo_root,
+        [
+            _token_count_event("2025-12-01T01:00:00Z", 10),
+            _token_count_event("2025-12-01T02:00:00Z", 20),
+        ],
+    )
+    _write_session(
+        codex_home, repo_root, [_token_count_event("2025-12-02T01:00:00Z", 7)]
+    )
+    first, second = sorted((codex_home / "sessions").glob("**/*.jsonl"))
+    cache = get_usage_series_cache(codex_home)
+    cache.refresh()
+    summary, _ = get_repo_usage_summary_cached(repo_root, codex_home=codex_home)
+    assert summary.totals.total_tokens == 37
+
+    lines = first.read_text(encoding="utf-8").splitlines()
+    first.write_text("\n".join(lines[:2]) + "\n", encoding="utf-8")
+    second.unlink()
+    cache.refresh()
+
+    summary, status = get_repo_usage_summary_cached(repo_root, codex_home=codex_home)
+    series, _ = get_repo_usage_series_cached(
+        repo_root, codex_home=codex_home, bucket="day"
+    )
+    assert status == "ready"
+    assert summary.events == 1
+    assert summary.totals.total_tokens == 10
+    assert series["buckets"] == ["2025-12-01"]
+    assert series["series"][0]["values"] == [10]
+
+
 def test_summarize_repo_usage_skips_malformed_codex_timestamps(tmp_path):
     repo_root = tmp_path / "repo"
     repo_root.mkdir()
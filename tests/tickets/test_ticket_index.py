@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from codex_autorunner.tickets import ticket_index as ticket_index_module
+from codex_autorunner.tickets.files import read_ticket, ticket_is_done
+from codex_autorunner.tickets.lint import lint_ticket_directory
+from codex_autorunner.tickets.ticket_index import TicketIndex, ticket_index_for
+
+_OLD_NS = 1_000_000_000_000_000_000
+
+
+def _write_ticket(path: Path, *, done: bool, extra: str = "") -> None:
+    path.write_text(
+        f"---\nagent: codex\ndone: {str(done).lower()}\n{extra}---\nBody\n",
+        encoding="utf-8",
+    )
+    os.utime(path, ns=(_OLD_NS, _OLD_NS))
+
+
+@pytest.fixture
+def counted_parses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    parsed: list[str] = []
+    real_parse = ticket_index_module.parse_markdown_frontmatter
+
+    def _counting_parse(raw: str):
+        parsed.append(raw)
+        return real_parse(raw)
+
+    monkeypatch.setattr(
+        ticket_index_module, "parse_markdown_frontmatter", _counting_parse
+    )
+    return parsed
+
+
+def test_scan_reparses_only_changed_tickets(
+    tmp_path: Path, counted_parses: list[str]
+) -> None:
+    ticket_dir = tmp_path / "tickets"
+    ticket_dir.mkdir()
+    _write_ticket(ticket_dir / "TICKET-002.md", done=False)
+    _write_ticket(ticket_dir / "TICKET-001.md", done=True)
+    (ticket_dir / "notes.md").write_text("ignore", encoding="utf-8")
+    index = TicketIndex(ticket_dir)
+
+    snapshot = index.scan()
+    assert [path.name for path in snapshot.paths] == ["TICKET-001.md", "TICKET-002.md"]
+    assert snapshot.done_count == 1
+    assert snapshot.next_ticket() == ticket_dir / "TICKET-002.md"
+    assert len(counted_parses) == 2
+
+    counted_parses.clear()
+    assert index.scan().done_count == 1
+    assert counted_parses == []
+
+    _write_ticket(ticket_dir / "TICKET-002.md", done=True)
+    os.utime(ticket_dir / "TICKET-002.md", ns=(_OLD_NS + 1, _OLD_NS + 1))
+    snapshot = index.scan()
+    assert len(counted_parses) == 1
+    assert snapshot.pending_count == 0
+    assert snapshot.next_ticket() is None
+
+
+def test_recently_modified_tickets_are_not_trusted(
+    tmp_path: Path, counted_parses: list[str]
+) -> None:
+    ticket_dir = tmp_path / "tickets"
+    ticket_dir.mkdir()
+    (ticket_dir / "TICKET-001.md").write_text(
+        "---\nagent: codex\ndone: false\n---\n", encoding="utf-8"
+    )
+    index = TicketIndex(ticket_dir)
+
+    index.scan()
+    index.scan()
+
+    assert len(counted_parses) == 2
+
+
+def test_directory_lint_matches_uncached_lint(tmp_path: Path) -> None:
+    ticket_dir = tmp_path / "tickets"
+    ticket_dir.mkdir()
+    _write_ticket(
+        ticket_dir / "TICKET-001-a.md", done=False, extra="ticket_id: tkt_dup001\n"
+    )
+    _write_ticket(
+        ticket_dir / "TICKET-001-b.md", done=False, extra="ticket_id: tkt_dup001\n"
+    )
+    _write_ticket(ticket_dir / "TICKET-002.md", done=False)
+
+    snapshot = TicketIndex(ticket_dir).scan()
+
+    assert list(snapshot.directory_lint_errors) == lint_ticket_directory(ticket_dir)
+    assert len(snapshot.directory_lint_errors) == 2
+
+
+def test_file_helpers_share_the_directory_index(tmp_path: Path) -> None:
+    ticket_dir = tmp_path / "tickets"
+    ticket_dir.mkdir()
+    ticket_path = ticket_dir / "TICKET-001.md"
+    _write_ticket(ticket_path, done=True)
+
+    assert ticket_is_done(ticket_path) is True
+    doc, errors = read_ticket(ticket_path)
+    assert errors == [] and doc is not None and doc.body.strip() == "Body"
+    assert ticket_index_for(ticket_dir) is ticket_index_for(ticket_dir)
+
+    ticket_path.unlink()
+    assert ticket_is_done(ticket_path) is False
+    assert read_ticket(ticket_path) == (None, ["Failed to read ticket"])
+    assert TicketIndex(tmp_path / "missing").scan().entries == ()
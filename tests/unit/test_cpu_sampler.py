@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from codex_autorunner.core import process_table
 from codex_autorunner.core.diagnostics.cpu_sampler import (
     CpuSample,
     aggregate_samples,
@@ -17,6 +18,10 @@ from codex_autorunner.core.diagnostics.process_snapshot import ProcessCategory
 
 
 class TestSampleCpuForPids:
+    @pytest.fixture(autouse=True)
+    def _use_ps_fallback(self, monkeypatch):
+        monkeypatch.setattr(process_table, "procfs_available", lambda: False)
+
     def test_empty_pids_returns_empty(self):
         assert sample_cpu_for_pids([]) == {}
 